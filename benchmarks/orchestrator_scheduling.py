@@ -0,0 +1,114 @@
+"""Compares the makespan of the DAG ready-queue scheduler with the legacy wave-barrier scheduler.
+
+Every synthetic pipeline sleeps for a random duration and depends on one or two pipelines of the
+previous layer. Run from the repository root:
+
+    python -m benchmarks.orchestrator_scheduling --width 20 --depth 6 --concurrency 4
+"""
+
+# Standard Imports
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+from typing import Self
+
+# Project Imports
+from pipeline_flow.core.models.phases import ExtractPhase, LoadPhase, TransformPhase
+from pipeline_flow.core.models.pipeline import Pipeline
+from pipeline_flow.core.orchestrator import PipelineOrchestrator
+from pipeline_flow.core.parsers.yaml_parser import YamlConfig
+from pipeline_flow.plugins import IExtractPlugin, ILoadPlugin
+
+
+class SleepExtractor(IExtractPlugin, plugin_name="benchmark_sleep_extractor"):
+    def __init__(self: Self, plugin_id: str, delay: float) -> None:
+        super().__init__(plugin_id)
+        self.delay = delay
+
+    async def __call__(self: Self) -> str:
+        await asyncio.sleep(self.delay)
+        return "data"
+
+
+class NoopLoader(ILoadPlugin, plugin_name="benchmark_noop_loader"):
+    async def __call__(self: Self, data: str) -> None:
+        pass
+
+
+def build_dag(width: int, depth: int, seed: int) -> list[Pipeline]:
+    """Builds `depth` layers of `width` pipelines, each depending on up to two pipelines of the previous layer."""
+    rng = random.Random(seed)
+    pipelines = []
+    previous_layer: list[str] = []
+
+    for layer in range(depth):
+        current_layer = []
+        for index in range(width):
+            name = f"L{layer}_P{index}"
+            needs = rng.sample(previous_layer, k=min(2, len(previous_layer))) if previous_layer else None
+            # Long-tailed durations: most pipelines are quick, a few are stragglers.
+            delay = rng.choice([0.01, 0.02, 0.03, 0.05, 0.2])
+
+            phases = {
+                "extract": ExtractPhase.model_construct(steps=[SleepExtractor(plugin_id=f"{name}_e", delay=delay)]),
+                "transform": TransformPhase.model_construct(steps=[]),
+                "load": LoadPhase.model_construct(steps=[NoopLoader(plugin_id=f"{name}_l")]),
+            }
+            pipelines.append(Pipeline(name=name, type="ETL", needs=needs, phases=phases))  # type: ignore[reportArgumentType]
+            current_layer.append(name)
+
+        previous_layer = current_layer
+
+    return pipelines
+
+
+async def run_wave_barrier(orchestrator: PipelineOrchestrator, pipelines: list[Pipeline]) -> None:
+    """Re-implementation of the legacy scheduler: run every executable pipeline, wait for all, repeat."""
+    semaphore = asyncio.Semaphore(orchestrator.concurrency)
+    executed: set[str] = set()
+
+    async def run(pipeline: Pipeline) -> None:
+        async with semaphore:
+            await orchestrator._execute_pipeline(pipeline)  # noqa: SLF001
+
+    remaining = list(pipelines)
+    while remaining:
+        wave = [p for p in remaining if all(need in executed for need in orchestrator._get_dependencies(p))]  # noqa: SLF001
+        async with asyncio.TaskGroup() as tg:
+            for pipeline in wave:
+                tg.create_task(run(pipeline))
+        executed.update(p.name for p in wave)
+        remaining = [p for p in remaining if p.name not in executed]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--width", type=int, default=20)
+    parser.add_argument("--depth", type=int, default=6)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    config = YamlConfig(concurrency=args.concurrency)
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    await run_wave_barrier(PipelineOrchestrator(config), build_dag(args.width, args.depth, args.seed))
+    wave_makespan = loop.time() - start
+
+    start = loop.time()
+    await PipelineOrchestrator(config).execute_pipelines(build_dag(args.width, args.depth, args.seed))
+    dag_makespan = loop.time() - start
+
+    print(
+        f"Pipelines: {args.width * args.depth} (width={args.width}, depth={args.depth}), concurrency={config.concurrency}"
+    )  # noqa: T201
+    print(f"Wave-barrier scheduler makespan: {wave_makespan:.3f}s")  # noqa: T201
+    print(f"DAG ready-queue scheduler makespan: {dag_makespan:.3f}s")  # noqa: T201
+    print(f"Speed-up: {wave_makespan / dag_makespan:.2f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,158 @@
+"""Compares the REST extractor over HTTP/1.1, with and without keep-alive, and over HTTP/2 for many small pages.
+
+Local HTTP/1.1 and cleartext HTTP/2 servers serve the pages of a page-number paginated endpoint
+after a fixed latency. The extractor requests up to `--concurrency` pages at once over at most
+`--connections` connections: HTTP/1.1 sends one request per connection at a time, while HTTP/2
+multiplexes all of them over a single connection. Without keep-alive, every request also pays for
+opening a connection. The client and the servers share one process, so at low latencies the CPU
+cost per request caps the throughput. The HTTP/2 server needs the `h2` package. Run from the
+repository root:
+
+    python -m benchmarks.rest_http2 --pages 1000 --latency 0.05 --connections 6 --concurrency 64
+"""
+
+# Standard Imports
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlsplit
+
+# Third Party Imports
+import h2.config
+import h2.connection
+import h2.events
+
+# Project Imports
+from pipeline_flow.core.connection_pools import ConnectionPools
+from pipeline_flow.plugins.extract import RestApiAsyncExtractor
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def page_body(path: str, args: argparse.Namespace) -> bytes:
+    page = int(parse_qs(urlsplit(path).query).get("page", ["1"])[0])
+    records = [{"id": (page - 1) * args.page_size + row, "name": f"item {row}"} for row in range(args.page_size)]
+    return json.dumps({"data": records, "total_pages": args.pages}).encode()
+
+
+async def serve_http1(args: argparse.Namespace) -> asyncio.Server:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while request_line := await reader.readline():
+            while await reader.readline() not in {b"\r\n", b""}:
+                pass
+
+            await asyncio.sleep(args.latency)
+            body = page_body(request_line.split()[1].decode(), args)
+            header = f"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+            writer.write(header.encode() + body)
+            await writer.drain()
+        writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+class Http2Protocol(asyncio.Protocol):
+    """A minimal cleartext HTTP/2 server answering every stream after the latency."""
+
+    def __init__(self, respond: Callable[[str], bytes], latency: float) -> None:
+        self.respond = respond
+        self.latency = latency
+        self.connection = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+        self.window_updated = asyncio.Event()
+        self.tasks: set[asyncio.Task] = set()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport: asyncio.Transport = transport  # type: ignore[reportAttributeAccessIssue]
+        self.connection.initiate_connection()
+        self.transport.write(self.connection.data_to_send())
+
+    def data_received(self, data: bytes) -> None:
+        for event in self.connection.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                headers = {name.decode(): value.decode() for name, value in event.headers}  # type: ignore[reportAttributeAccessIssue]
+                task = asyncio.create_task(self.send_response(event.stream_id, headers[":path"]))  # type: ignore[reportArgumentType]
+                self.tasks.add(task)
+                task.add_done_callback(self.tasks.discard)
+            elif isinstance(event, h2.events.WindowUpdated):
+                self.window_updated.set()
+            elif isinstance(event, h2.events.ConnectionTerminated):
+                self.transport.close()
+        self.transport.write(self.connection.data_to_send())
+
+    async def send_response(self, stream_id: int, path: str) -> None:
+        await asyncio.sleep(self.latency)
+        body = self.respond(path)
+        headers = [(":status", "200"), ("content-type", "application/json"), ("content-length", str(len(body)))]
+        self.connection.send_headers(stream_id, headers)
+
+        while self.connection.local_flow_control_window(stream_id) < len(body):
+            self.window_updated.clear()
+            await self.window_updated.wait()
+        self.connection.send_data(stream_id, body, end_stream=True)
+        self.transport.write(self.connection.data_to_send())
+
+
+async def run_extractor(plugin_id: str, base_url: str, args: argparse.Namespace, **options: Any) -> float:  # noqa: ANN401
+    extractor = RestApiAsyncExtractor(
+        plugin_id,
+        base_url,
+        "items",
+        pagination_type="page_number",
+        concurrency_limit=args.concurrency,
+        max_connections=args.connections,
+        **options,
+    )
+    start = time.perf_counter()
+    records = await extractor()
+    elapsed = time.perf_counter() - start
+
+    await ConnectionPools.dispose()
+    assert len(records) == args.pages * args.page_size  # noqa: S101
+    return elapsed
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    loop = asyncio.get_running_loop()
+    http1_server = await serve_http1(args)
+    http2_server = await loop.create_server(
+        lambda: Http2Protocol(lambda path: page_body(path, args), args.latency), "127.0.0.1", 0
+    )
+    http1_url = f"http://127.0.0.1:{http1_server.sockets[0].getsockname()[1]}"
+    http2_url = f"http://127.0.0.1:{http2_server.sockets[0].getsockname()[1]}"
+
+    async with http1_server, http2_server:
+        results = {
+            "HTTP/1.1 without keep-alive": await run_extractor(
+                "http1_close", http1_url, args, max_keepalive_connections=0
+            ),
+            "HTTP/1.1 with keep-alive": await run_extractor(
+                "http1", http1_url, args, max_keepalive_connections=args.connections
+            ),
+            "HTTP/2": await run_extractor("http2", http2_url, args, http2=True),
+        }
+
+    print(  # noqa: T201
+        f"Pages: {args.pages} x {args.page_size} records, latency: {args.latency * 1000:.0f} ms, "
+        f"connections: {args.connections}, concurrency: {args.concurrency}"
+    )
+    for label, elapsed in results.items():
+        print(f"{label:<28} {elapsed:6.2f}s, {args.pages / elapsed:8.0f} pages/s")  # noqa: T201
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--connections", type=int, default=6)
+    parser.add_argument("--concurrency", type=int, default=64)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Compares the peak memory of parsing a large REST page whole with decoding its records incrementally.
+
+A server process streams a single page of records, and each parsing mode runs in a fresh
+process consuming the records page by page (`stream_pages`) and discarding them, as a
+streaming pipeline would. The peak resident set size of the process is reported relative to
+its size before the extraction. Decoding record by record in Python trades some speed for the
+bounded memory. Run from the repository root:
+
+    python -m benchmarks.rest_incremental_json --records 1000000
+"""
+
+# Standard Imports
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import resource
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from multiprocessing.queues import Queue
+
+CHUNK_RECORDS = 1000
+
+
+def current_rss_mib() -> float:
+    with open("/proc/self/statm") as statm:  # noqa: PTH123
+        return int(statm.read().split()[1]) * resource.getpagesize() / 2**20
+
+
+def peak_rss_mib() -> float:
+    # Linux reports the peak resident set size in KiB.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+
+
+def generate_body(records: int) -> Iterator[bytes]:
+    yield b'{"pagination": {"has_more": false}, "data": ['
+    for start in range(0, records, CHUNK_RECORDS):
+        rows = range(start, min(start + CHUNK_RECORDS, records))
+        body = ", ".join(json.dumps({"id": row, "name": f"customer {row}", "score": row / 7}) for row in rows)
+        yield body.encode() + (b", " if rows.stop < records else b"")
+    yield b"]}"
+
+
+def serve(records: int, ports: Queue) -> None:
+    # The body is generated upfront, so that the server is never slower than the client.
+    body = [f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n" for chunk in generate_body(records)]
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while await reader.readline():
+            while await reader.readline() not in {b"\r\n", b""}:
+                pass
+
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nTransfer-Encoding: chunked\r\n\r\n")
+            for chunk in body:
+                writer.write(chunk)
+                await writer.drain()
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+        writer.close()
+
+    async def main() -> None:
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        ports.put(server.sockets[0].getsockname()[1])
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(main())
+
+
+def measure(base_url: str, incremental: bool, results: Queue) -> None:  # noqa: FBT001
+    # Project Imports
+    from pipeline_flow.core.connection_pools import ConnectionPools  # noqa: PLC0415
+    from pipeline_flow.plugins.extract import RestApiAsyncExtractor  # noqa: PLC0415
+
+    async def extract() -> int:
+        extractor = RestApiAsyncExtractor(
+            "benchmark", base_url, "records", stream_pages=True, incremental_json=incremental
+        )
+        count = 0
+        async for batch in extractor():
+            count += len(batch)
+        await ConnectionPools.dispose()
+        return count
+
+    baseline = current_rss_mib()
+    start = time.perf_counter()
+    count = asyncio.run(extract())
+    results.put((count, time.perf_counter() - start, peak_rss_mib() - baseline))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    ports = context.Queue()
+    server = context.Process(target=serve, args=(args.records, ports), daemon=True)
+    server.start()
+    base_url = f"http://127.0.0.1:{ports.get()}"
+
+    try:
+        for label, incremental in (("Buffered response.json()", False), ("Incremental parsing", True)):
+            results = context.Queue()
+            process = context.Process(target=measure, args=(base_url, incremental, results))
+            process.start()
+            process.join()
+            if process.exitcode:
+                error_msg = f"{label} failed with exit code {process.exitcode}."
+                raise SystemExit(error_msg)
+
+            count, elapsed, peak = results.get()
+            assert count == args.records  # noqa: S101
+            print(f"{label:<25} {elapsed:6.2f}s, peak RSS +{peak:8.1f} MiB")  # noqa: T201
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Compares sequential next-page pagination with concurrent page-number pagination of the REST extractor.
+
+A local HTTP server serves the pages of a paginated endpoint after a fixed latency, both with
+a `next_page` link and with the total number of pages. The speed-up grows with the latency; at
+very low latencies the client overhead per request dominates. Run from the repository root:
+
+    python -m benchmarks.rest_pagination --pages 200 --latency 0.1 --concurrency 32
+"""
+
+# Standard Imports
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from urllib.parse import parse_qs, urlsplit
+
+# Project Imports
+from pipeline_flow.core.connection_pools import ConnectionPools
+from pipeline_flow.plugins.extract import RestApiAsyncExtractor
+
+
+async def run_extractor(extractor: RestApiAsyncExtractor) -> tuple[float, int]:
+    start = time.perf_counter()
+    records = await extractor()
+    return time.perf_counter() - start, len(records)
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    port = 0
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while request_line := await reader.readline():
+            while await reader.readline() not in {b"\r\n", b""}:
+                pass
+
+            query = parse_qs(urlsplit(request_line.split()[1].decode()).query)
+            page = int(query.get("page", ["1"])[0])
+            await asyncio.sleep(args.latency)
+
+            body = json.dumps(
+                {
+                    "data": [{"id": (page - 1) * args.page_size + row} for row in range(args.page_size)],
+                    "total_pages": args.pages,
+                    "pagination": {
+                        "has_more": page < args.pages,
+                        "next_page": f"http://127.0.0.1:{port}/items?page={page + 1}",
+                    },
+                }
+            ).encode()
+            header = f"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+            writer.write(header.encode() + body)
+            await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    base_url = f"http://127.0.0.1:{port}"
+
+    async with server:
+        pool_options = {"max_connections": args.concurrency, "max_keepalive_connections": args.concurrency}
+        sequential = RestApiAsyncExtractor(
+            "sequential", base_url, "items", pagination_type="page_based", **pool_options
+        )
+        concurrent = RestApiAsyncExtractor(
+            "concurrent",
+            base_url,
+            "items",
+            pagination_type="page_number",
+            concurrency_limit=args.concurrency,
+            **pool_options,
+        )
+
+        sequential_elapsed, sequential_records = await run_extractor(sequential)
+        concurrent_elapsed, concurrent_records = await run_extractor(concurrent)
+        await ConnectionPools.dispose()
+
+    assert sequential_records == concurrent_records == args.pages * args.page_size  # noqa: S101
+
+    print(f"Pages: {args.pages}, latency: {args.latency * 1000:.0f} ms, concurrency: {args.concurrency}")  # noqa: T201
+    print(f"Sequential next-page links: {sequential_elapsed:.2f}s")  # noqa: T201
+    print(f"Concurrent page numbers:    {concurrent_elapsed:.2f}s")  # noqa: T201
+    print(f"Speed-up: {sequential_elapsed / concurrent_elapsed:.1f}x")  # noqa: T201
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--concurrency", type=int, default=32)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
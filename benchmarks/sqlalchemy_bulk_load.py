@@ -0,0 +1,149 @@
+"""Compares loading a DataFrame with a dictionary per row against the columnar paths of the SQLAlchemy loader.
+
+The row path is the loader's previous implementation: each batch is converted with
+`DataFrame.to_dict("records")` and executed through `Session.execute(text(query), rows)`. The
+columnar path compiles the query once for the driver and passes each batch to its `executemany`
+as tuples zipped from the column arrays, and the `insert_many` load mode sends multi-row `INSERT`
+statements instead. All load the same rows into a fresh SQLite database through `aiosqlite`, one
+batch at a time as SQLite has a single writer. The time spent preparing the batches of the first
+two, without executing them, is reported separately. `COPY` and `LOAD DATA` need a PostgreSQL or
+MySQL server and are not covered. Run from the repository root:
+
+    python -m benchmarks.sqlalchemy_bulk_load --rows 500000 --batch-size 100000
+"""
+
+# Standard Imports
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+# Third Party Imports
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+
+# Project Imports
+from pipeline_flow.core.connection_pools import ConnectionPools
+from pipeline_flow.plugins.load import AsyncSQLAlchemyQueryLoader
+from pipeline_flow.plugins.utils.bulk_load import LoadMode
+from pipeline_flow.plugins.utils.columnar import as_table
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from typing import Self
+
+QUERY = "INSERT INTO events (id, user_id, amount, country, status) VALUES (:id, :user_id, :amount, :country, :status)"
+SCHEMA = "CREATE TABLE events (id INTEGER, user_id INTEGER, amount REAL, country TEXT, status TEXT)"
+
+
+class RowLoader(AsyncSQLAlchemyQueryLoader, plugin_name="benchmark_row_loader"):
+    """The loader as it was before the columnar path, building a dictionary per row."""
+
+    def chunk_dataframe(self: Self, df: pd.DataFrame) -> Generator[list[dict]]:
+        for i in range(0, len(df), self._batch_size):
+            yield df.iloc[i : i + self._batch_size].to_dict("records")
+
+    async def execute_rows(self: Self, batch: list[dict]) -> None:
+        async with self._semaphore, self.get_async_session() as session:
+            await session.execute(text(self._query), batch)
+
+    async def __call__(self: Self, data: pd.DataFrame) -> None:
+        async with asyncio.TaskGroup() as tg:
+            for batch in self.chunk_dataframe(data):
+                tg.create_task(self.execute_rows(batch))
+
+
+def generate_events(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    return pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "user_id": rng.integers(0, 100_000, rows),
+            "amount": rng.random(rows) * 100,
+            "country": rng.choice(np.array(["PL", "DE", "FR", "US", "GB"], dtype=object), rows),
+            "status": rng.choice(np.array(["paid", "refunded", "pending"], dtype=object), rows),
+        }
+    )
+
+
+def time_preparation(loader: AsyncSQLAlchemyQueryLoader, data: pd.DataFrame) -> float | None:
+    if loader._load_mode is not LoadMode.QUERY:  # noqa: SLF001
+        return None
+
+    start = time.perf_counter()
+    if isinstance(loader, RowLoader):
+        for _ in loader.chunk_dataframe(data):
+            pass
+    else:
+        table = as_table(data)
+        batch_size = loader._batch_size  # noqa: SLF001
+        for i in range(0, table.num_rows, batch_size):
+            loader.batch_parameters(
+                table.column_names, [values[i : i + batch_size] for values in table.columns.values()]
+            )
+    return time.perf_counter() - start
+
+
+async def run_loader(loader: AsyncSQLAlchemyQueryLoader, data: pd.DataFrame) -> float:
+    engine = ConnectionPools.get_async_engine(loader._build_connection_string())  # noqa: SLF001
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql(SCHEMA)
+
+    start = time.perf_counter()
+    await loader(data)
+    elapsed = time.perf_counter() - start
+
+    async with engine.connect() as conn:
+        count = (await conn.exec_driver_sql("SELECT COUNT(*) FROM events")).scalar()
+    await ConnectionPools.dispose()
+    assert count == len(data)  # noqa: S101
+    return elapsed
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    data = generate_events(args.rows)
+    results = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        for label, loader_class, load_mode in (
+            ("Row dicts", RowLoader, LoadMode.QUERY),
+            ("Columnar", AsyncSQLAlchemyQueryLoader, LoadMode.QUERY),
+            ("Insert many", AsyncSQLAlchemyQueryLoader, LoadMode.INSERT_MANY),
+        ):
+            database = Path(directory) / f"{load_mode}_{loader_class.__name__}.db"
+            loader = loader_class(
+                label,
+                "",
+                "",
+                "",
+                "",
+                str(database),
+                QUERY,
+                concurrency_limit=1,
+                batch_size=args.batch_size,
+                driver="sqlite+aiosqlite",
+                load_mode=load_mode,
+                table="events",
+            )
+            results[label] = (time_preparation(loader, data), await run_loader(loader, data))
+
+    print(f"Rows: {args.rows}, batch size: {args.batch_size}, columns: {len(data.columns)}")  # noqa: T201
+    for label, (preparation, elapsed) in results.items():
+        prepared = "" if preparation is None else f"prepare {preparation:6.2f}s, "
+        print(f"{label:<12} {prepared:<17}load {elapsed:6.2f}s, {args.rows / elapsed:10.0f} rows/s")  # noqa: T201
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--batch-size", type=int, default=100_000)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
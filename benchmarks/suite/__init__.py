@@ -0,0 +1,12 @@
+"""Reproducible benchmarks of whole workflows, gated against a baseline.
+
+Every scenario builds pipelines of synthetic plugins whose latency, CPU cost and payload size are
+set by their parameters, and runs them through the orchestrator in a fresh process. It reports
+the makespan, the throughput, the peak RSS and the event-loop lag, and can be compared with the
+results of a previous run to flag regressions. Run from the repository root:
+
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --baseline results.json --threshold 0.1
+
+The command exits with status 1 when a scenario regressed by more than the threshold.
+"""
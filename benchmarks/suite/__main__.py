@@ -0,0 +1,63 @@
+# Standard Imports
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Project Imports
+from benchmarks.suite import __doc__ as suite_doc
+from benchmarks.suite.baseline import DEFAULT_THRESHOLD, compare
+from benchmarks.suite.runner import run_suite
+from benchmarks.suite.scenarios import SCENARIOS
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=suite_doc, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS, help="Defaults to every scenario.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario after a warm-up run.")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplies the pipeline counts and sizes.")
+    parser.add_argument("--output", type=Path, help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", type=Path, help="Compare the results with this JSON file of a previous run.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Relative change failing a gate.")
+    args = parser.parse_args()
+
+    results = run_suite(args.scenario or list(SCENARIOS), args.repeat, args.scale)
+
+    print(f"{'scenario':<22}{'makespan':>12}{'rows/s':>14}{'peak RSS':>12}{'lag p99':>11}{'lag max':>11}")  # noqa: T201
+    for name, measured in results["scenarios"].items():
+        print(  # noqa: T201
+            f"{name:<22}{measured['makespan_seconds']:>11.3f}s{measured['throughput_rows_per_second']:>14,.0f}"
+            f"{measured['peak_rss_bytes'] / 2**20:>9.1f}MiB{measured['loop_lag_p99_ms']:>9.2f}ms"
+            f"{measured['loop_lag_max_ms']:>9.2f}ms"
+        )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2))
+
+    if args.baseline is None:
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    if baseline["environment"] != results["environment"] or baseline["scale"] != results["scale"]:
+        print("Warning: the baseline was recorded on another environment or scale.")  # noqa: T201
+
+    comparisons = compare(results, baseline, args.threshold)
+    print(f"\n{'scenario':<22}{'metric':<20}{'baseline':>18}{'current':>18}{'change':>9}")  # noqa: T201
+    for comparison in comparisons:
+        print(  # noqa: T201
+            f"{comparison.scenario:<22}{comparison.metric:<20}{comparison.baseline:>18,.3f}"
+            f"{comparison.current:>18,.3f}{comparison.change:>+9.1%}{'  REGRESSED' if comparison.regressed else ''}"
+        )
+
+    regressions = [comparison for comparison in comparisons if comparison.regressed]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}.")  # noqa: T201
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Compares the results of a run with a baseline, flagging the scenarios that regressed."""
+
+# Standard Imports
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+DEFAULT_THRESHOLD = 0.1
+
+
+@dataclass(frozen=True)
+class Gate:
+    """A measurement that fails the comparison when it worsens by more than the threshold.
+
+    Args:
+        metric (str): The key of the measurement in the results of a scenario.
+        higher_is_better (bool): Whether an increase is an improvement rather than a regression.
+        noise_floor (float): Changes smaller than this are noise however large they are relative to the
+            baseline, e.g. a loop lag going from 0.1 to 0.3 ms.
+    """
+
+    metric: str
+    higher_is_better: bool
+    noise_floor: float
+
+
+# The throughput is the rows divided by the makespan, so it is reported but not gated twice.
+GATES = (
+    Gate("makespan_seconds", higher_is_better=False, noise_floor=0.01),
+    Gate("peak_rss_bytes", higher_is_better=False, noise_floor=16 * 1024 * 1024),
+    Gate("loop_lag_p99_ms", higher_is_better=False, noise_floor=2.0),
+)
+
+
+@dataclass(frozen=True)
+class Comparison:
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+    regressed: bool
+
+    @property
+    def change(self) -> float:
+        """The change relative to the baseline, e.g. 0.25 for a 25% increase."""
+        return (self.current - self.baseline) / self.baseline if self.baseline else 0.0
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> list[Comparison]:
+    """Compare every gated measurement of the scenarios found in both the results and the baseline.
+
+    Args:
+        results (dict[str, Any]): The results of the run, as returned by `run_suite`.
+        baseline (dict[str, Any]): The results of the run compared with.
+        threshold (float, optional): The relative change beyond which a measurement regressed. Defaults to 0.1.
+
+    Returns:
+        list[Comparison]: The comparisons, by scenario then gate.
+    """
+    comparisons = []
+    for scenario, measured in results["scenarios"].items():
+        expected = baseline["scenarios"].get(scenario)
+        if expected is None:
+            continue
+
+        for gate in GATES:
+            worsening = measured[gate.metric] - expected[gate.metric]
+            if gate.higher_is_better:
+                worsening = -worsening
+            regressed = worsening > max(gate.noise_floor, threshold * abs(expected[gate.metric]))
+            comparisons.append(
+                Comparison(scenario, gate.metric, expected[gate.metric], measured[gate.metric], regressed)
+            )
+    return comparisons
@@ -0,0 +1,62 @@
+"""Synthetic plugins whose latency, CPU cost and payload size are set by their parameters."""
+
+# Standard Imports
+from __future__ import annotations
+
+import asyncio
+from typing import Any, ClassVar, Self
+
+# Project Imports
+from pipeline_flow.plugins import IExtractPlugin, ILoadPlugin, ITransformPlugin
+
+type Records = list[dict[str, Any]]
+
+
+def burn_cpu(iterations: int) -> int:
+    """Spin a pure-Python loop, holding the GIL like a transform written in Python."""
+    total = 0
+    for value in range(iterations):
+        total = (total + value * value) % 1_000_003
+    return total
+
+
+class SyntheticExtractor(IExtractPlugin, plugin_name="benchmark_synthetic_extractor"):
+    """Waits `latency` seconds, like a request to a source, then returns `rows` records of `row_bytes` each."""
+
+    def __init__(self: Self, plugin_id: str, latency: float = 0.0, rows: int = 1, row_bytes: int = 0) -> None:
+        super().__init__(plugin_id)
+        self.latency = latency
+        self.rows = rows
+        self.row_bytes = row_bytes
+
+    async def __call__(self: Self) -> Records:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return [{"id": index, "payload": b"x" * self.row_bytes} for index in range(self.rows)]
+
+
+class SyntheticTransform(ITransformPlugin, plugin_name="benchmark_synthetic_transform"):
+    """Burns `cpu_iterations` of CPU, then copies every record like a transform deriving a column."""
+
+    def __init__(self: Self, plugin_id: str, cpu_iterations: int = 0) -> None:
+        super().__init__(plugin_id)
+        self.cpu_iterations = cpu_iterations
+
+    def __call__(self: Self, data: Records) -> Records:
+        burn_cpu(self.cpu_iterations)
+        return [{**record, "transformed": True} for record in data]
+
+
+class SyntheticLoader(ILoadPlugin, plugin_name="benchmark_synthetic_loader"):
+    """Waits `latency` seconds, like a write to a destination, and counts the rows it received."""
+
+    rows_loaded: ClassVar[int] = 0
+
+    def __init__(self: Self, plugin_id: str, latency: float = 0.0) -> None:
+        super().__init__(plugin_id)
+        self.latency = latency
+
+    async def __call__(self: Self, data: Records) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        SyntheticLoader.rows_loaded += len(data)
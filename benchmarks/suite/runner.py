@@ -0,0 +1,159 @@
+"""Runs the scenarios, measuring their makespan, throughput, peak RSS and event-loop lag."""
+
+# Standard Imports
+from __future__ import annotations
+
+import asyncio
+import math
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Self
+
+# Project Imports
+from benchmarks.suite.plugins import SyntheticLoader
+from benchmarks.suite.scenarios import SCENARIOS
+from pipeline_flow.core.metrics import Metrics
+from pipeline_flow.core.orchestrator import PipelineOrchestrator
+from pipeline_flow.core.parsers.yaml_parser import YamlConfig
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from benchmarks.suite.scenarios import Scenario
+
+# Short enough to catch the event loop being blocked for a few milliseconds.
+LAG_SAMPLE_INTERVAL = 0.005
+
+
+def percentile(values: list[float], quantile: float) -> float:
+    """Return the nearest-rank quantile of the values, or 0 if there are none."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(quantile * len(ordered)) - 1)]
+
+
+def peak_rss_bytes() -> int:
+    """Return the peak resident set size of the process so far."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and in kilobytes elsewhere.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def environment() -> dict[str, Any]:
+    """Describe the machine the benchmarks ran on, as results are only comparable on the same one."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+class LoopLagMonitor:
+    """Samples how late the event loop resumes a task sleeping for `interval` seconds.
+
+    The lag is how long callbacks wait behind code blocking the loop, e.g. CPU-bound work in an async
+    plugin or a transform holding the GIL, so it bounds how late every timer and I/O callback fires.
+    """
+
+    def __init__(self: Self, interval: float = LAG_SAMPLE_INTERVAL) -> None:
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task[None] | None = None
+
+    async def _sample(self: Self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - start - self.interval))
+
+    async def __aenter__(self: Self) -> Self:
+        self._task = asyncio.create_task(self._sample(), name="loop-lag-monitor")
+        return self
+
+    async def __aexit__(self: Self, *exc_info: object) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+
+
+async def run_once(scenario: Scenario, scale: float) -> dict[str, float]:
+    pipelines = scenario.build(scale)
+    orchestrator = PipelineOrchestrator(YamlConfig(concurrency=scenario.concurrency))
+    SyntheticLoader.rows_loaded = 0
+
+    async with LoopLagMonitor() as monitor:
+        start = time.perf_counter()
+        await orchestrator.execute_pipelines(pipelines)
+        makespan = time.perf_counter() - start
+
+    # The metrics of the workflow are not needed, and would otherwise pile up across runs.
+    Metrics.reset_metrics()
+    return {
+        "pipelines": len(pipelines),
+        "rows": SyntheticLoader.rows_loaded,
+        "makespan_seconds": makespan,
+        "loop_lag_p99_ms": percentile(monitor.samples, 0.99) * 1000,
+        "loop_lag_max_ms": max(monitor.samples, default=0.0) * 1000,
+    }
+
+
+async def _run_scenario(scenario: Scenario, repeat: int, scale: float) -> dict[str, Any]:
+    # The first run warms up the thread pool of the transforms and the modules imported lazily.
+    await run_once(scenario, scale)
+    runs = [await run_once(scenario, scale) for _ in range(repeat)]
+
+    makespan = statistics.median(run["makespan_seconds"] for run in runs)
+    return {
+        "description": scenario.description,
+        "concurrency": scenario.concurrency,
+        "pipelines": runs[0]["pipelines"],
+        "rows": runs[0]["rows"],
+        "makespan_seconds": round(makespan, 6),
+        "throughput_rows_per_second": round(runs[0]["rows"] / makespan, 2),
+        "pipelines_per_second": round(runs[0]["pipelines"] / makespan, 2),
+        "peak_rss_bytes": peak_rss_bytes(),
+        "loop_lag_p99_ms": round(statistics.median(run["loop_lag_p99_ms"] for run in runs), 3),
+        "loop_lag_max_ms": round(max(run["loop_lag_max_ms"] for run in runs), 3),
+        "runs_makespan_seconds": [round(run["makespan_seconds"], 6) for run in runs],
+    }
+
+
+def run_scenario(name: str, repeat: int, scale: float) -> dict[str, Any]:
+    """Run a scenario once to warm up, then `repeat` times, summarising the runs by their median.
+
+    Meant to run in a process of its own: the peak RSS is that of the whole process, and `YamlConfig`
+    is a singleton keeping the concurrency of the first scenario run.
+    """
+    return asyncio.run(_run_scenario(SCENARIOS[name], repeat, scale))
+
+
+def run_suite(names: Iterable[str], repeat: int, scale: float) -> dict[str, Any]:
+    """Run each scenario in a fresh process, so that none inherits the memory or warm caches of another."""
+    started_at = datetime.now(UTC).isoformat(timespec="seconds")
+    context = multiprocessing.get_context("spawn")
+
+    scenarios = {}
+    for name in names:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            scenarios[name] = pool.submit(run_scenario, name, repeat, scale).result()
+
+    return {
+        "started_at": started_at,
+        "environment": environment(),
+        "repeat": repeat,
+        "scale": scale,
+        "scenarios": scenarios,
+    }
@@ -0,0 +1,121 @@
+"""The workflows benchmarked, each stressing a different part of the orchestrator and the executor."""
+
+# Standard Imports
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+# Project Imports
+from benchmarks.suite.plugins import SyntheticExtractor, SyntheticLoader, SyntheticTransform
+from pipeline_flow.core.models.phases import ExtractPhase, LoadPhase, TransformPhase
+from pipeline_flow.core.models.pipeline import Pipeline
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A workflow to benchmark.
+
+    Args:
+        name (str): Identifies the scenario in the results and on the command line.
+        description (str): What the scenario stresses.
+        concurrency (int): The number of pipelines run at once.
+        build (Callable[[float], list[Pipeline]]): Builds fresh pipelines, their counts and sizes multiplied by a scale.
+    """
+
+    name: str
+    description: str
+    concurrency: int
+    build: Callable[[float], list[Pipeline]]
+
+
+def scaled(value: int, scale: float) -> int:
+    return max(1, round(value * scale))
+
+
+def synthetic_pipeline(  # noqa: PLR0913
+    name: str,
+    *,
+    needs: list[str] | None = None,
+    latency: float = 0.0,
+    rows: int = 1,
+    row_bytes: int = 0,
+    cpu_iterations: int = 0,
+) -> Pipeline:
+    """Build an ETL pipeline of one synthetic extractor, transform and loader."""
+    phases = {
+        "extract": ExtractPhase.model_construct(
+            steps=[SyntheticExtractor(plugin_id=f"{name}_e", latency=latency, rows=rows, row_bytes=row_bytes)]
+        ),
+        "transform": TransformPhase.model_construct(
+            steps=[SyntheticTransform(plugin_id=f"{name}_t", cpu_iterations=cpu_iterations)]
+        ),
+        "load": LoadPhase.model_construct(steps=[SyntheticLoader(plugin_id=f"{name}_l", latency=latency)]),
+    }
+    return Pipeline(name=name, type="ETL", needs=needs, phases=phases)  # type: ignore[reportArgumentType]
+
+
+def wide_dag(scale: float) -> list[Pipeline]:
+    width = scaled(48, scale)
+    branches = [f"branch_{index}" for index in range(width)]
+    return [
+        synthetic_pipeline("source", latency=0.02, rows=1_000, row_bytes=64),
+        *(
+            synthetic_pipeline(name, needs=["source"], latency=0.02, rows=1_000, row_bytes=64, cpu_iterations=20_000)
+            for name in branches
+        ),
+        synthetic_pipeline("sink", needs=branches, latency=0.02, rows=1_000, row_bytes=64),
+    ]
+
+
+def deep_chain(scale: float) -> list[Pipeline]:
+    depth = scaled(50, scale)
+    return [
+        synthetic_pipeline(f"link_{index}", needs=[f"link_{index - 1}"] if index else None, latency=0.002, rows=100)
+        for index in range(depth)
+    ]
+
+
+def large_payload(scale: float) -> list[Pipeline]:
+    return [
+        synthetic_pipeline(f"bulk_{index}", latency=0.01, rows=scaled(20_000, scale), row_bytes=1_024)
+        for index in range(4)
+    ]
+
+
+def many_small_pipelines(scale: float) -> list[Pipeline]:
+    return [synthetic_pipeline(f"small_{index}", rows=10) for index in range(scaled(500, scale))]
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario(
+            "wide_dag",
+            "A source fanning out to dozens of I/O-bound pipelines with CPU-bound transforms, joined by a sink.",
+            concurrency=16,
+            build=wide_dag,
+        ),
+        Scenario(
+            "deep_chain",
+            "A chain of quick pipelines each needing the previous one, dominated by the scheduling overhead.",
+            concurrency=4,
+            build=deep_chain,
+        ),
+        Scenario(
+            "large_payload",
+            "A few pipelines extracting, copying and loading tens of thousands of 1 KiB records each.",
+            concurrency=4,
+            build=large_payload,
+        ),
+        Scenario(
+            "many_small_pipelines",
+            "Hundreds of independent pipelines of a few rows and no latency, dominated by the per-pipeline overhead.",
+            concurrency=16,
+            build=many_small_pipelines,
+        ),
+    )
+}
@@ -0,0 +1,92 @@
+"""Compares transform throughput of the `inline`, `thread` and `process` transform executors.
+
+Runs N concurrent ETL pipelines whose transform step is a pure-Python CPU-bound loop, which holds
+the GIL and therefore cannot scale on threads. Run from the repository root:
+
+    python -m benchmarks.transform_executors --pipelines 8 --iterations 3000000
+"""
+
+# Standard Imports
+from __future__ import annotations
+
+import argparse
+import asyncio
+from typing import Self
+
+# Project Imports
+from pipeline_flow.core.models.phases import ExtractPhase, LoadPhase, TransformPhase
+from pipeline_flow.core.models.pipeline import Pipeline, TransformExecutorType
+from pipeline_flow.core.orchestrator import PipelineOrchestrator
+from pipeline_flow.core.parsers.yaml_parser import YamlConfig
+from pipeline_flow.core.transform_executors import get_process_pool, shutdown_process_pool
+from pipeline_flow.plugins import IExtractPlugin, ILoadPlugin, ITransformPlugin
+
+
+class ConstantExtractor(IExtractPlugin, plugin_name="benchmark_constant_extractor"):
+    async def __call__(self: Self) -> int:
+        return 1
+
+
+class CpuHeavyTransform(ITransformPlugin, plugin_name="benchmark_cpu_heavy_transform"):
+    def __init__(self: Self, plugin_id: str, iterations: int) -> None:
+        super().__init__(plugin_id)
+        self.iterations = iterations
+
+    def __call__(self: Self, data: int) -> int:
+        total = data
+        for value in range(self.iterations):
+            total = (total + value * value) % 1_000_003
+        return total
+
+
+class NoopLoader(ILoadPlugin, plugin_name="benchmark_noop_loader"):
+    async def __call__(self: Self, data: int) -> None:
+        pass
+
+
+def build_pipelines(count: int, iterations: int, transform_executor: TransformExecutorType) -> list[Pipeline]:
+    return [
+        Pipeline(
+            name=f"cpu_pipeline_{index}",
+            type="ETL",  # type: ignore[reportArgumentType]
+            transform_executor=transform_executor,
+            phases={  # type: ignore[reportArgumentType]
+                "extract": ExtractPhase.model_construct(steps=[ConstantExtractor(plugin_id=f"e{index}")]),
+                "transform": TransformPhase.model_construct(
+                    steps=[CpuHeavyTransform(plugin_id=f"t{index}", iterations=iterations)]
+                ),
+                "load": LoadPhase.model_construct(steps=[NoopLoader(plugin_id=f"l{index}")]),
+            },
+        )
+        for index in range(count)
+    ]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pipelines", type=int, default=8)
+    parser.add_argument("--iterations", type=int, default=3_000_000)
+    args = parser.parse_args()
+
+    config = YamlConfig(concurrency=args.pipelines)
+    loop = asyncio.get_running_loop()
+
+    # Warm up the process pool so that worker start-up is not billed to the first run.
+    await asyncio.gather(*(loop.run_in_executor(get_process_pool(), abs, 0) for _ in range(args.pipelines)))
+
+    print(f"{args.pipelines} concurrent pipelines, {args.iterations} iterations per transform")  # noqa: T201
+    try:
+        for transform_executor in TransformExecutorType:
+            pipelines = build_pipelines(args.pipelines, args.iterations, transform_executor)
+
+            start = loop.time()
+            await PipelineOrchestrator(config).execute_pipelines(pipelines)
+            elapsed = loop.time() - start
+
+            print(f"{transform_executor:>8}: {elapsed:.3f}s, {args.pipelines / elapsed:.2f} pipelines/s")  # noqa: T201
+    finally:
+        shutdown_process_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,73 @@
+"""Compares a chain of native transforms run step by step with the same chain fused into one pass.
+
+The chain filters a wide table twice, derives and casts a column and finally keeps a few
+columns. Peak memory is measured with tracemalloc, which tracks NumPy allocations. Run from
+the repository root:
+
+    python -m benchmarks.transform_fusion --rows 2000000 --columns 16
+"""
+
+# Standard Imports
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+
+# Third Party Imports
+import numpy as np
+
+# Project Imports
+from pipeline_flow.core.executor import run_transformer
+from pipeline_flow.core.models.phases import TransformPhase
+from pipeline_flow.plugins.transform.native import NativeCast, NativeDerive, NativeFilter, NativeProject
+from pipeline_flow.plugins.utils.columnar import ColumnarTable
+from pipeline_flow.plugins.utils.fusion import explain_transform_steps
+
+
+def build_table(rows: int, columns: int, seed: int) -> ColumnarTable:
+    rng = np.random.default_rng(seed)
+    return ColumnarTable({f"c{index}": rng.random(rows) for index in range(columns)})
+
+
+def measure(table: ColumnarTable, transformations: TransformPhase) -> tuple[float, float, ColumnarTable]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = run_transformer(table, transformations)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--columns", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    table = build_table(args.rows, args.columns, args.seed)
+    steps = [
+        NativeFilter("filter_c0", condition="c0 > 0.2"),
+        NativeDerive("derive_score", column="score", expression="c1 * c2 + c3"),
+        NativeFilter("filter_score", condition="score > 0.5"),
+        NativeCast("cast_score", columns={"score": "float32"}),
+        NativeProject("project", columns=["c0", "c1", "score"]),
+    ]
+    print(explain_transform_steps(steps))  # noqa: T201
+
+    unfused_elapsed, unfused_peak, unfused_result = measure(
+        table, TransformPhase.model_construct(steps=steps, fuse=False)
+    )
+    fused_elapsed, fused_peak, fused_result = measure(table, TransformPhase.model_construct(steps=steps, fuse=True))
+    assert fused_result == unfused_result  # noqa: S101
+
+    print(f"Rows: {args.rows}, columns: {args.columns}")  # noqa: T201
+    print(f"Step by step: {unfused_elapsed:.3f}s, peak memory {unfused_peak:.1f} MiB")  # noqa: T201
+    print(f"Fused:        {fused_elapsed:.3f}s, peak memory {fused_peak:.1f} MiB")  # noqa: T201
+    print(f"Speed-up: {unfused_elapsed / fused_elapsed:.2f}x, memory: {unfused_peak / fused_peak:.2f}x lower")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,12 @@
-from .helpers import SingletonMeta, async_time_it, sync_time_it
+from .helpers import SingletonMeta
 from .logger import setup_logger
-from .validation import serialize_plugin, serialize_plugins, unique_id_validator
+from .validation import picklable_plugins_validator, serialize_plugin, serialize_plugins, unique_id_validator
 
 __all__ = [
     "SingletonMeta",
-    "async_time_it",
+    "picklable_plugins_validator",
     "serialize_plugin",
     "serialize_plugins",
     "setup_logger",
-    "sync_time_it",
     "unique_id_validator",
 ]
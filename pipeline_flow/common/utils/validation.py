@@ -2,21 +2,23 @@
 from __future__ import annotations
 
 import logging
+import pickle
 from typing import TYPE_CHECKING
 
 # Project Imports
-from pipeline_flow.core.registry import PluginRegistry
+# The module rather than the class, as the registry imports these utilities and may not be initialised yet.
+from pipeline_flow.core import registry
 
 if TYPE_CHECKING:
     from pipeline_flow.plugins import IPlugin
 
 
 def serialize_plugin(value: dict) -> IPlugin:
-    return PluginRegistry.instantiate_plugin(value)
+    return registry.PluginRegistry.instantiate_plugin(value)
 
 
 def serialize_plugins(value: list) -> list[IPlugin]:
-    return [PluginRegistry.instantiate_plugin(plugin_dict) for plugin_dict in value]
+    return [registry.PluginRegistry.instantiate_plugin(plugin_dict) for plugin_dict in value]
 
 
 def unique_id_validator(steps: list[IPlugin]) -> list[IPlugin]:
@@ -33,3 +35,15 @@ def unique_id_validator(steps: list[IPlugin]) -> list[IPlugin]:
         ids[step.id] = 1
 
     return steps
+
+
+def picklable_plugins_validator(plugins: list[IPlugin]) -> list[IPlugin]:
+    """Ensures plugins can be sent to a worker process by the process transform executor."""
+    for plugin in plugins:
+        try:
+            pickle.dumps(plugin)
+        except (pickle.PicklingError, TypeError, AttributeError) as error:
+            error_msg = f"Plugin `{plugin.id}` cannot be pickled to run in the process transform executor: {error}"
+            raise ValueError(error_msg) from error
+
+    return plugins
@@ -0,0 +1,189 @@
+# Standard Imports
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+# Third Party Imports
+import aiofiles
+
+# Project Imports
+from pipeline_flow.core.models.phases import PipelinePhase
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from pipeline_flow.common.type_def import ETLData
+
+MANIFEST_FILE = "manifest.json"
+
+# The phases in the order they run, each checkpoint key chains the key of the phase before it.
+PHASE_ORDER = (
+    PipelinePhase.EXTRACT_PHASE,
+    PipelinePhase.TRANSFORM_PHASE,
+    PipelinePhase.LOAD_PHASE,
+    PipelinePhase.TRANSFORM_AT_LOAD_PHASE,
+)
+# Phases whose output is persisted, the others only record that they completed.
+DATA_PHASES = frozenset({PipelinePhase.EXTRACT_PHASE, PipelinePhase.TRANSFORM_PHASE})
+# Marks a pipeline whose phases all completed, including streaming pipelines without phase checkpoints.
+PIPELINE_COMPLETED = "completed"
+
+
+def _digest(*parts: Any) -> str:  # noqa: ANN401
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _write_atomically(path: Path, content: bytes) -> None:
+    temporary_path = path.with_suffix(path.suffix + ".tmp")
+    temporary_path.write_bytes(content)
+    os.replace(temporary_path, path)  # noqa: PTH105
+
+
+class CheckpointStore:
+    """Persists the outputs of the phases of each pipeline, so that a resumed workflow skips the work that completed.
+
+    Each phase is checkpointed under a key hashing its configuration and the key of the phase before it. The first
+    phase hashes the settings of the pipeline and the keys of the pipelines it needs. Changing a phase, or anything
+    upstream of it, invalidates its checkpoint and the checkpoints of the phases after it.
+
+    The outputs of the extract and transform phases are pickled into `<directory>/<pipeline>/<phase>.pkl`, with their
+    SHA-256 digest in the manifest of the pipeline. The load phases only record that they completed. Checkpoints are
+    only read when `resume` is set, and a file that no longer matches its digest is ignored.
+
+    Args:
+        directory (str): The directory the checkpoints are written to.
+        pipelines_config (dict[str, dict]): The configuration of the pipelines, as parsed from YAML.
+        resume (bool, optional): Whether to restore the phases checkpointed by a previous run. Defaults to False.
+    """
+
+    def __init__(
+        self: Self,
+        directory: str,
+        pipelines_config: dict[str, dict],
+        resume: bool = False,  # noqa: FBT001, FBT002
+    ) -> None:
+        self.directory = Path(directory)
+        # Copied before the plugins are instantiated, which pops their `plugin` and `id` from the configuration.
+        self.pipelines_config = copy.deepcopy(pipelines_config)
+        self.resume = resume
+
+        self._keys: dict[str, dict[str, str]] = {}
+        self._manifests: dict[str, dict[str, dict[str, str]]] = {}
+
+    def phase_keys(self: Self, pipeline_name: str) -> dict[str, str]:
+        """Return the checkpoint key of every phase of the pipeline, and of its completion."""
+        if pipeline_name in self._keys:
+            return self._keys[pipeline_name]
+
+        config = self.pipelines_config[pipeline_name]
+        phases = config.get("phases") or {}
+        needs = config.get("needs") or []
+        needs = [needs] if isinstance(needs, str) else needs
+
+        settings = {name: value for name, value in config.items() if name != "phases"}
+        key = _digest(settings, [self.phase_keys(need)[PIPELINE_COMPLETED] for need in needs])
+        if config.get("lazy"):
+            # The filters and projections of the transform phase are pushed down into the extract phase.
+            key = _digest(key, phases.get(PipelinePhase.TRANSFORM_PHASE.value))
+
+        keys = {}
+        for phase in PHASE_ORDER:
+            key = keys[phase.value] = _digest(key, phase.value, phases.get(phase.value))
+        keys[PIPELINE_COMPLETED] = _digest(key, PIPELINE_COMPLETED)
+
+        self._keys[pipeline_name] = keys
+        return keys
+
+    def _pipeline_directory(self: Self, pipeline_name: str) -> Path:
+        return self.directory / re.sub(r"[^\w.-]", "_", pipeline_name)
+
+    async def _manifest(self: Self, pipeline_name: str) -> dict[str, dict[str, str]]:
+        """Load the manifest of the pipeline, ignoring a missing or corrupted file."""
+        if pipeline_name in self._manifests:
+            return self._manifests[pipeline_name]
+
+        manifest = {}
+        path = self._pipeline_directory(pipeline_name) / MANIFEST_FILE
+        try:
+            async with aiofiles.open(path, encoding="utf-8") as file:
+                manifest = json.loads(await file.read())
+        except FileNotFoundError:
+            logging.debug("No checkpoints found for pipeline `%s`.", pipeline_name)
+        except ValueError:
+            logging.warning("Checkpoint manifest `%s` is corrupted and will be overwritten.", path)
+
+        self._manifests[pipeline_name] = manifest
+        return manifest
+
+    async def restore(self: Self, pipeline_name: str, phase: str) -> tuple[bool, ETLData]:
+        """Return whether the phase completed with the same key in the run being resumed, and its output."""
+        if not self.resume:
+            return False, None
+
+        entry = (await self._manifest(pipeline_name)).get(phase)
+        if entry is None or entry["key"] != self.phase_keys(pipeline_name)[phase]:
+            return False, None
+        if "file" not in entry:
+            return True, None
+
+        try:
+            async with aiofiles.open(self._pipeline_directory(pipeline_name) / entry["file"], mode="rb") as file:
+                content = await file.read()
+        except FileNotFoundError:
+            content = b""
+        if hashlib.sha256(content).hexdigest() != entry["sha256"]:
+            logging.warning("Checkpoint of the `%s` phase of `%s` is missing or corrupted.", phase, pipeline_name)
+            return False, None
+
+        logging.info("Restored the `%s` phase of `%s` from its checkpoint.", phase, pipeline_name)
+        # The file was written by this store and matches the digest recorded in the manifest.
+        return True, await asyncio.to_thread(pickle.loads, content)
+
+    async def save(self: Self, pipeline_name: str, phase: str, data: ETLData = None) -> None:
+        """Record that the phase completed, with its output for the extract and transform phases."""
+        directory = self._pipeline_directory(pipeline_name)
+        await asyncio.to_thread(directory.mkdir, parents=True, exist_ok=True)
+
+        entry = {"key": self.phase_keys(pipeline_name)[phase]}
+        if phase in DATA_PHASES:
+            content = await asyncio.to_thread(pickle.dumps, data, pickle.HIGHEST_PROTOCOL)
+            entry["file"] = f"{phase}.pkl"
+            entry["sha256"] = hashlib.sha256(content).hexdigest()
+            await asyncio.to_thread(_write_atomically, directory / entry["file"], content)
+
+        manifest = await self._manifest(pipeline_name)
+        manifest[phase] = entry
+        await asyncio.to_thread(
+            _write_atomically, directory / MANIFEST_FILE, json.dumps(manifest, indent=2, sort_keys=True).encode()
+        )
+
+    async def run_phase(self: Self, pipeline_name: str, phase: str, run: Callable[[], Awaitable[ETLData]]) -> ETLData:
+        """Restore the output of the phase from its checkpoint, or run it and checkpoint its output."""
+        restored, data = await self.restore(pipeline_name, phase)
+        if restored:
+            return data
+
+        data = await run()
+        await self.save(pipeline_name, phase, data)
+        return data
+
+    async def is_completed(self: Self, pipeline_name: str) -> bool:
+        return (await self.restore(pipeline_name, PIPELINE_COMPLETED))[0]
+
+    async def complete(self: Self, pipeline_name: str) -> None:
+        await self.save(pipeline_name, PIPELINE_COMPLETED)
+
+    async def clear(self: Self) -> None:
+        """Delete every checkpoint, once a workflow completed or before a run that does not resume."""
+        await asyncio.to_thread(shutil.rmtree, self.directory, ignore_errors=True)
+        self._manifests = {}
@@ -0,0 +1,271 @@
+# Standard Imports
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from typing import TYPE_CHECKING, Any, ClassVar, Self
+
+# Third Party Imports
+import httpx
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+# Project Imports
+from pipeline_flow.common.utils import SingletonMeta
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+    from sqlalchemy.pool import Pool
+
+type PoolKey = tuple[str, str]
+type SharedResource = AsyncEngine | httpx.AsyncClient
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
+
+class PoolUsage:
+    """Utilisation counters of a shared connection pool.
+
+    Args:
+        name (str): The connection identity shown in metrics, without credentials.
+        kind (str): Either `engine` or `http`.
+        options (dict[str, Any]): The pool options the pool was created with.
+    """
+
+    __slots__ = ("acquired", "capacity", "in_use", "kind", "name", "options", "peak_in_use")
+
+    def __init__(self: Self, name: str, kind: str, options: dict[str, Any]) -> None:
+        self.name = name
+        self.kind = kind
+        self.options = options
+        self.capacity: int | None = None
+        self.acquired = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+
+    def acquire(self: Self) -> None:
+        self.acquired += 1
+        self.in_use += 1
+        self.peak_in_use = max(self.peak_in_use, self.in_use)
+
+    def release(self: Self) -> None:
+        self.in_use = max(self.in_use - 1, 0)
+
+    def as_dict(self: Self) -> dict[str, Any]:
+        utilisation = round(self.peak_in_use / self.capacity, 4) if self.capacity else None
+        return {
+            "kind": self.kind,
+            "capacity": self.capacity,
+            "in_use": self.in_use,
+            "peak_in_use": self.peak_in_use,
+            "acquired": self.acquired,
+            "peak_utilisation": utilisation,
+        }
+
+
+class _MeteredStream(httpx.AsyncByteStream):
+    """Releases the connection of a response once its body is closed, as it stays checked out until then."""
+
+    def __init__(self: Self, stream: httpx.AsyncByteStream, usage: PoolUsage) -> None:
+        self.stream = stream
+        self.usage = usage
+        self._released = False
+
+    async def __aiter__(self: Self) -> AsyncIterator[bytes]:
+        async for chunk in self.stream:
+            yield chunk
+
+    async def aclose(self: Self) -> None:
+        try:
+            await self.stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self.usage.release()
+
+
+class _MeteredTransport(httpx.AsyncBaseTransport):
+    """Counts the requests in flight on the connection pool of a shared client, until their body is closed."""
+
+    def __init__(self: Self, transport: httpx.AsyncBaseTransport, usage: PoolUsage) -> None:
+        self.transport = transport
+        self.usage = usage
+
+    async def handle_async_request(self: Self, request: httpx.Request) -> httpx.Response:
+        self.usage.acquire()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except BaseException:
+            self.usage.release()
+            raise
+
+        response.stream = _MeteredStream(response.stream, self.usage)  # type: ignore[reportAttributeAccessIssue]
+        return response
+
+    async def aclose(self: Self) -> None:
+        await self.transport.aclose()
+
+
+def _engine_capacity(pool: Pool) -> int | None:
+    size = getattr(pool, "size", None)
+    if size is None:
+        # Static and singleton-thread pools hold a single connection.
+        return 1
+
+    max_overflow = getattr(pool, "_max_overflow", 0)
+    return None if max_overflow < 0 else size() + max_overflow
+
+
+def host_origin(url: str) -> str:
+    """Return the `scheme://host[:port]` origin of a URL, the identity of the host in shared pools."""
+    parsed = httpx.URL(url)
+    return f"{parsed.scheme}://{parsed.host}" + (f":{parsed.port}" if parsed.port else "")
+
+
+def _running_loop() -> asyncio.AbstractEventLoop:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        error_msg = "Shared connection pools can only be acquired from a running event loop."
+        raise RuntimeError(error_msg) from None
+
+
+class ConnectionPools(metaclass=SingletonMeta):
+    """Process-wide registry of the SQLAlchemy engines and httpx clients shared by all plugins and pipelines.
+
+    Resources are keyed by connection identity, so that every plugin instance connecting to the
+    same database or host reuses one pool of connections. The first request for an identity sets
+    its pool size. Async connections cannot be used outside the event loop that opened them,
+    therefore each event loop gets its own resources. They are disposed when the workflow ends.
+    """
+
+    _resources: ClassVar[weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[PoolKey, SharedResource]]] = (
+        weakref.WeakKeyDictionary()
+    )
+    _usage: ClassVar[dict[PoolKey, PoolUsage]] = {}
+
+    @classmethod
+    def _get_or_create(
+        cls: type[ConnectionPools],
+        key: PoolKey,
+        name: str,
+        options: dict[str, Any],
+        factory: Callable[[PoolUsage], SharedResource],
+    ) -> SharedResource:
+        resources = cls._resources.setdefault(_running_loop(), {})
+        if (resource := resources.get(key)) is not None:
+            usage = cls._usage[key]
+            if options != usage.options:
+                logging.warning(
+                    "Pool for `%s` already exists with options %s, ignoring options %s.", name, usage.options, options
+                )
+            return resource
+
+        usage = cls._usage.get(key)
+        if usage is None or options != usage.options:
+            usage = cls._usage[key] = PoolUsage(name, key[0], options)
+
+        logging.debug("Creating a shared %s pool for `%s` with options %s.", key[0], name, options)
+        resources[key] = resource = factory(usage)
+        return resource
+
+    @classmethod
+    def get_async_engine(
+        cls: type[ConnectionPools], url: str, pool_size: int | None = None, max_overflow: int | None = None
+    ) -> AsyncEngine:
+        """Return the engine shared by all users of the database URL.
+
+        Args:
+            url (str): The database URL, including the async driver.
+            pool_size (int | None, optional): Connections kept open in the pool. Defaults to the SQLAlchemy default.
+            max_overflow (int | None, optional): Connections opened beyond the pool size under load.
+                Defaults to the SQLAlchemy default.
+        """
+        options = {
+            name: value
+            for name, value in (("pool_size", pool_size), ("max_overflow", max_overflow))
+            if value is not None
+        }
+
+        def create_engine(usage: PoolUsage) -> AsyncEngine:
+            engine = create_async_engine(url, **options)
+            usage.capacity = _engine_capacity(engine.sync_engine.pool)
+            event.listen(engine.sync_engine, "checkout", lambda *_: usage.acquire())
+            event.listen(engine.sync_engine, "checkin", lambda *_: usage.release())
+            return engine
+
+        name = make_url(url).render_as_string(hide_password=True)
+        return cls._get_or_create(("engine", url), name, options, create_engine)  # type: ignore[reportReturnType]
+
+    @classmethod
+    def get_http_client(  # noqa: PLR0913
+        cls: type[ConnectionPools],
+        base_url: str,
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,  # noqa: FBT001, FBT002
+        http2_prior_knowledge: bool = False,  # noqa: FBT001, FBT002
+    ) -> httpx.AsyncClient:
+        """Return the client shared by all users of the host of the base URL.
+
+        The client must not be closed by its users, and it carries no per-plugin state such as
+        headers, timeouts or a base URL, which are passed with each request instead.
+
+        Args:
+            base_url (str): Any URL of the host, e.g. the base URL of the API.
+            max_connections (int | None, optional): Connections opened to the host at once,
+                None for no limit. Defaults to 100.
+            max_keepalive_connections (int | None, optional): Idle connections kept open for reuse. Defaults to 20.
+            keepalive_expiry (float | None, optional): Seconds an idle connection is kept open,
+                None to keep it until the server closes it. Defaults to 5.0.
+            http2 (bool, optional): Whether to negotiate HTTP/2, which multiplexes concurrent requests over
+                a single connection. It is negotiated by TLS, so cleartext `http://` hosts are called with HTTP/1.1.
+                Requires the `h2` package. Defaults to False.
+            http2_prior_knowledge (bool, optional): Whether to speak HTTP/2 without negotiating it, e.g. with
+                cleartext `http://` hosts known to support it. Implies `http2`. Defaults to False.
+        """
+        name = host_origin(base_url)
+        limit_options = {
+            "max_connections": max_connections,
+            "max_keepalive_connections": max_keepalive_connections,
+            "keepalive_expiry": keepalive_expiry,
+        }
+        options = {**limit_options, "http2": http2, "http2_prior_knowledge": http2_prior_knowledge}
+
+        def create_client(usage: PoolUsage) -> httpx.AsyncClient:
+            usage.capacity = max_connections
+            limits = httpx.Limits(**limit_options)
+            transport = httpx.AsyncHTTPTransport(
+                limits=limits, http1=not http2_prior_knowledge, http2=http2 or http2_prior_knowledge
+            )
+            return httpx.AsyncClient(transport=_MeteredTransport(transport, usage), limits=limits)
+
+        return cls._get_or_create(("http", name), name, options, create_client)  # type: ignore[reportReturnType]
+
+    @classmethod
+    def metrics(cls: type[ConnectionPools]) -> dict[str, dict[str, Any]]:
+        """Return the utilisation of every pool created since the last reset, keyed by connection identity."""
+        return {usage.name: usage.as_dict() for usage in cls._usage.values()}
+
+    @classmethod
+    async def dispose(cls: type[ConnectionPools]) -> None:
+        """Close the connections of the pools created by the running event loop."""
+        resources = cls._resources.pop(_running_loop(), {})
+        for (kind, _), resource in resources.items():
+            try:
+                if isinstance(resource, AsyncEngine):
+                    await resource.dispose()
+                else:
+                    await resource.aclose()
+            except Exception as e:  # noqa: BLE001 - A failing pool must not prevent closing the others.
+                logging.warning("Failed to close a shared %s pool: %s", kind, e)
+
+    @classmethod
+    def reset_metrics(cls: type[ConnectionPools]) -> None:
+        cls._usage.clear()
@@ -0,0 +1,75 @@
+# Standard Imports
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Self
+
+# Third Party Imports
+import aiofiles
+
+# Project Imports
+
+# Weight of the latest observation in the exponential moving average of a pipeline duration.
+SMOOTHING_FACTOR = 0.5
+
+# Duration assumed for pipelines that have never been recorded, when no history exists at all.
+DEFAULT_DURATION = 1.0
+
+
+class DurationHistory:
+    """Keeps an exponential moving average of pipeline durations across workflow runs.
+
+    The averages are persisted as JSON to `file_path` so that the orchestrator can prioritise
+    pipelines on the critical path of the next run. Without a `file_path` the history only
+    lives in memory.
+
+    Args:
+        file_path (str | None): The JSON file the durations are loaded from and saved to.
+    """
+
+    def __init__(self: Self, file_path: str | None = None) -> None:
+        self.file_path = file_path
+        self.durations: dict[str, float] = {}
+
+    async def load(self: Self) -> None:
+        """Load the recorded durations, ignoring a missing or corrupted file."""
+        if not self.file_path:
+            return
+
+        try:
+            async with aiofiles.open(self.file_path, encoding="utf-8") as file:
+                content = await file.read()
+        except FileNotFoundError:
+            logging.debug("No duration history found at `%s`.", self.file_path)
+            return
+
+        try:
+            self.durations = {name: float(value) for name, value in json.loads(content).items()}
+        except (ValueError, AttributeError):
+            logging.warning("Duration history `%s` is corrupted and will be overwritten.", self.file_path)
+            self.durations = {}
+
+    async def save(self: Self) -> None:
+        if not self.file_path:
+            return
+
+        Path(self.file_path).parent.mkdir(parents=True, exist_ok=True)
+        async with aiofiles.open(self.file_path, mode="w", encoding="utf-8") as file:
+            await file.write(json.dumps(self.durations, indent=2, sort_keys=True))
+
+    def record(self: Self, pipeline_name: str, duration: float) -> None:
+        previous = self.durations.get(pipeline_name)
+        if previous is None:
+            self.durations[pipeline_name] = duration
+        else:
+            self.durations[pipeline_name] = SMOOTHING_FACTOR * duration + (1 - SMOOTHING_FACTOR) * previous
+
+    def estimate(self: Self, pipeline_name: str) -> float:
+        """Return the expected duration, falling back to the mean of all recorded pipelines."""
+        if pipeline_name in self.durations:
+            return self.durations[pipeline_name]
+        if self.durations:
+            return sum(self.durations.values()) / len(self.durations)
+        return DEFAULT_DURATION
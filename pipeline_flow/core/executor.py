@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import logging
+import time
 from abc import ABCMeta, abstractmethod
-from functools import reduce
+from functools import partial, reduce
 from typing import TYPE_CHECKING, Any
 
 from pipeline_flow.common.exceptions import (
@@ -16,36 +18,106 @@ from pipeline_flow.common.exceptions import (
 
 # Third Party Imports
 # Local Imports
-from pipeline_flow.common.utils import async_time_it, sync_time_it
-from pipeline_flow.core.models.pipeline import Pipeline, PipelineType
+from pipeline_flow.core.extract_cache import ExtractCache
+from pipeline_flow.core.metrics import Metric, Metrics, measure, timed
+from pipeline_flow.core.models.phases import PipelinePhase
+from pipeline_flow.core.models.pipeline import Pipeline, PipelineType, TransformExecutorType
+from pipeline_flow.core.tracing import SpanKind, Tracer, span, traced
+from pipeline_flow.core.transform_executors import run_in_transform_executor
+from pipeline_flow.plugins.utils.fusion import explain_transform_steps, fuse_transform_steps
+from pipeline_flow.plugins.utils.pushdown import SupportsPushdown, build_pushdown_plan
 
 # Type Imports
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
     from pipeline_flow.common.type_def import ETLData, ExtractedData, TransformedData
+    from pipeline_flow.core.checkpoints import CheckpointStore
     from pipeline_flow.core.models.phases import (
         ExtractPhase,
         LoadPhase,
         TransformLoadPhase,
         TransformPhase,
     )
+    from pipeline_flow.core.tracing import AttributeValue
     from pipeline_flow.plugins import IPlugin
 
+# Marks the end of a stream of chunks passed between the streaming phases.
+_END_OF_STREAM = object()
+
+
+def plugin_attributes(plugin: IPlugin) -> dict[str, AttributeValue]:
+    return {"plugin.id": plugin.id, "plugin.name": plugin.plugin_name or type(plugin).__name__}
+
 
 def plugin_sync_executor(plugin: IPlugin, *pipeline_args: Any, **pipeline_kwargs: Any) -> ETLData:  # noqa: ANN401
     logging.debug("Executing plugin `%s`", plugin.id)
-    result = plugin(*pipeline_args, **pipeline_kwargs)
+    with (
+        measure(Metric.PLUGIN_DURATION, plugin=plugin.id),
+        span(plugin.id, SpanKind.PLUGIN, plugin_attributes(plugin)) as plugin_span,
+    ):
+        result = plugin(*pipeline_args, **pipeline_kwargs)
+        plugin_span.set_attribute("rows", Metrics.observe_rows(result))
     logging.debug("Finished executing plugin `%s`", plugin.id)
     return result
 
 
 async def plugin_async_executor(plugin: IPlugin, *pipeline_args: Any, **pipeline_kwargs: Any) -> ETLData:  # noqa: ANN401
     logging.debug("Executing plugin `%s`", plugin.id)
-    result = await plugin(*pipeline_args, **pipeline_kwargs)
+    with (
+        measure(Metric.PLUGIN_DURATION, plugin=plugin.id),
+        span(plugin.id, SpanKind.PLUGIN, plugin_attributes(plugin)) as plugin_span,
+    ):
+        result = await plugin(*pipeline_args, **pipeline_kwargs)
+        plugin_span.set_attribute("rows", Metrics.observe_rows(result))
     logging.debug("Finished executing plugin `%s`", plugin.id)
     return result
 
 
+async def plugin_stream_executor(plugin: IPlugin) -> AsyncIterator[ETLData]:
+    """Yield the chunks of an async generator plugin, or the whole result of a regular async plugin."""
+    logging.debug("Streaming plugin `%s`", plugin.id)
+    start = time.perf_counter()
+    # Labels and spans made current in a generator would leak into its consumer between chunks, so the
+    # plugin is labelled explicitly and its span is never current.
+    plugin_span = Tracer.start_span(plugin.id, SpanKind.PLUGIN, plugin_attributes(plugin))
+    rows = 0
+    try:
+        result = plugin()
+        if inspect.isasyncgen(result):
+            async for chunk in result:
+                rows += Metrics.observe_rows(chunk, plugin=plugin.id) or 0
+                yield chunk
+        else:
+            chunk = await result
+            rows += Metrics.observe_rows(chunk, plugin=plugin.id) or 0
+            yield chunk
+    except BaseException as e:
+        plugin_span.end(e)
+        raise
+
+    plugin_span.set_attribute("rows", rows)
+    plugin_span.end()
+    Metrics.observe(Metric.PLUGIN_DURATION, time.perf_counter() - start, plugin=plugin.id)
+    logging.debug("Finished streaming plugin `%s`", plugin.id)
+
+
+async def _put_chunk(queue: asyncio.Queue, chunk: ETLData, queue_name: str) -> None:
+    """Put a chunk on a streaming queue, recording how long a full queue held back its producer."""
+    start = time.perf_counter()
+    await queue.put(chunk)
+    Metrics.observe(Metric.QUEUE_WAIT, time.perf_counter() - start, queue=queue_name, operation="put")
+
+
+async def _get_chunk(queue: asyncio.Queue, queue_name: str) -> ETLData:
+    """Get a chunk from a streaming queue, recording how long an empty queue starved its consumer."""
+    start = time.perf_counter()
+    chunk = await queue.get()
+    Metrics.observe(Metric.QUEUE_WAIT, time.perf_counter() - start, queue=queue_name, operation="get")
+    return chunk
+
+
 async def task_group_executor(
     plugins: list[IPlugin],
     *pipeline_args: Any,  # noqa: ANN401
@@ -53,14 +125,28 @@ async def task_group_executor(
 ) -> dict[str, ETLData]:
     async with asyncio.TaskGroup() as group:
         tasks = {
-            plugin.id: group.create_task(plugin_async_executor(plugin, *pipeline_args, **pipeline_kwargs))
+            plugin.id: group.create_task(
+                plugin_async_executor(plugin, *pipeline_args, **pipeline_kwargs), name=plugin.id
+            )
+            for plugin in plugins
+        }
+
+    return {plugin_id: task.result() for plugin_id, task in tasks.items()}
+
+
+async def extract_task_group_executor(plugins: list[IPlugin]) -> dict[str, ExtractedData]:
+    """Execute the extract plugins concurrently, sharing the result of identical steps, see `ExtractCache`."""
+    async with asyncio.TaskGroup() as group:
+        tasks = {
+            plugin.id: group.create_task(ExtractCache.extract(plugin, plugin_async_executor), name=plugin.id)
             for plugin in plugins
         }
 
     return {plugin_id: task.result() for plugin_id, task in tasks.items()}
 
 
-@async_time_it
+@timed(Metric.PHASE_DURATION, phase=PipelinePhase.EXTRACT_PHASE)
+@traced(PipelinePhase.EXTRACT_PHASE, SpanKind.PHASE)
 async def run_extractor(extracts: ExtractPhase) -> ExtractedData:
     results = {}
 
@@ -68,7 +154,7 @@ async def run_extractor(extracts: ExtractPhase) -> ExtractedData:
         if extracts.pre:
             await task_group_executor(extracts.pre)
 
-        results = await task_group_executor(extracts.steps)
+        results = await extract_task_group_executor(extracts.steps)
 
         # Return the single result directly.
         if len(extracts.steps) == 1:
@@ -82,14 +168,34 @@ async def run_extractor(extracts: ExtractPhase) -> ExtractedData:
         raise ExtractError(error_message, e) from e
 
 
-@sync_time_it
+def push_down_transformations(extracts: ExtractPhase, transformations: TransformPhase) -> None:
+    """Let the extractor apply the filters and projections of the transform phase at the source."""
+    extractor = extracts.steps[0]
+    # Its result depends on the plan pushed down, so it is not shared with identical steps.
+    extractor.fingerprint = None
+    if not isinstance(extractor, SupportsPushdown):
+        logging.debug("Extractor `%s` does not support pushdown.", extractor.id)
+        return
+
+    plan = build_pushdown_plan(transformations.steps)
+    if plan:
+        logging.info("Pushing %s down into extractor `%s`.", plan, extractor.id)
+        extractor.push_down(plan)
+
+
 def run_transformer(data: ExtractedData, transformations: TransformPhase) -> TransformedData:
     if not transformations.steps:
         logging.info("No transformations to run")
         return data
 
+    steps = transformations.steps
+    if transformations.fuse:
+        steps = fuse_transform_steps(steps)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(explain_transform_steps(transformations.steps))
+
     try:
-        transformed_data = reduce(lambda data, plugin: plugin_sync_executor(plugin, data), transformations.steps, data)
+        transformed_data = reduce(lambda data, plugin: plugin_sync_executor(plugin, data), steps, data)
     except Exception as e:
         msg = "Transformation Phase Error"
         raise TransformError(msg, e) from e
@@ -97,8 +203,21 @@ def run_transformer(data: ExtractedData, transformations: TransformPhase) -> Tra
     return transformed_data
 
 
-@async_time_it
+async def run_transform_phase(
+    data: ExtractedData, transformations: TransformPhase, executor: TransformExecutorType
+) -> TransformedData:
+    """Run the transform phase with the executor of the pipeline, recording its duration on the event loop."""
+    with (
+        measure(Metric.PHASE_DURATION, phase=PipelinePhase.TRANSFORM_PHASE),
+        span(PipelinePhase.TRANSFORM_PHASE, SpanKind.PHASE),
+    ):
+        return await run_in_transform_executor(executor, run_transformer, data, transformations)
+
+
+@timed(Metric.PHASE_DURATION, phase=PipelinePhase.LOAD_PHASE)
+@traced(PipelinePhase.LOAD_PHASE, SpanKind.PHASE)
 async def run_loader(data: ExtractedData | TransformedData, destinations: LoadPhase) -> None:
+    Metrics.observe_rows(data)
     if destinations.pre:
         await task_group_executor(destinations.pre)
 
@@ -112,59 +231,200 @@ async def run_loader(data: ExtractedData | TransformedData, destinations: LoadPh
         raise LoadError(error_message, e) from e
 
 
-@sync_time_it
-def run_transformer_after_load(transformations: TransformLoadPhase) -> None:
-    try:
+async def plugin_off_loop_executor(plugin: IPlugin, *pipeline_args: Any, **pipeline_kwargs: Any) -> ETLData:  # noqa: ANN401
+    """Await async-native plugins and run synchronous ones in a worker thread, keeping the event loop free."""
+    if inspect.iscoroutinefunction(plugin.__call__):
+        return await plugin_async_executor(plugin, *pipeline_args, **pipeline_kwargs)
+
+    return await asyncio.to_thread(plugin_sync_executor, plugin, *pipeline_args, **pipeline_kwargs)
+
+
+async def _run_transform_load_graph(transformations: TransformLoadPhase) -> None:
+    """Start every step as soon as the steps it needs have completed."""
+    completed = {plugin.id: asyncio.Event() for plugin in transformations.steps}
+
+    async def run_step(plugin: IPlugin) -> None:
+        for need in transformations.needs.get(plugin.id, []):
+            await completed[need].wait()
+
+        await plugin_off_loop_executor(plugin)
+        completed[plugin.id].set()
+
+    async with asyncio.TaskGroup() as group:
         for plugin in transformations.steps:
-            plugin_sync_executor(plugin)
+            group.create_task(run_step(plugin))
+
+
+@timed(Metric.PHASE_DURATION, phase=PipelinePhase.TRANSFORM_AT_LOAD_PHASE)
+@traced(PipelinePhase.TRANSFORM_AT_LOAD_PHASE, SpanKind.PHASE)
+async def run_transformer_after_load(transformations: TransformLoadPhase) -> None:
+    try:
+        if transformations.needs:
+            await _run_transform_load_graph(transformations)
+        else:
+            for plugin in transformations.steps:
+                await plugin_off_loop_executor(plugin)
 
     except Exception as e:
         error_message = "Transform Load Phase Error"
         raise TransformLoadError(error_message, e) from e
 
 
+@timed(Metric.PHASE_DURATION, phase=PipelinePhase.EXTRACT_PHASE)
+@traced(PipelinePhase.EXTRACT_PHASE, SpanKind.PHASE)
+async def stream_extractor(extracts: ExtractPhase, queue: asyncio.Queue) -> None:
+    try:
+        if extracts.pre:
+            await task_group_executor(extracts.pre)
+
+        async for chunk in plugin_stream_executor(extracts.steps[0]):
+            await _put_chunk(queue, chunk, "extracted_chunks")
+
+    except Exception as e:
+        error_message = "Extraction Phase Error"
+        raise ExtractError(error_message, e) from e
+
+    await queue.put(_END_OF_STREAM)
+
+
+@timed(Metric.PHASE_DURATION, phase=PipelinePhase.TRANSFORM_PHASE)
+@traced(PipelinePhase.TRANSFORM_PHASE, SpanKind.PHASE)
+async def stream_transformer(
+    transformations: TransformPhase,
+    in_queue: asyncio.Queue,
+    out_queue: asyncio.Queue,
+    transform_executor: TransformExecutorType = TransformExecutorType.THREAD,
+) -> None:
+    while (chunk := await _get_chunk(in_queue, "extracted_chunks")) is not _END_OF_STREAM:
+        transformed_chunk = await run_in_transform_executor(transform_executor, run_transformer, chunk, transformations)
+        await _put_chunk(out_queue, transformed_chunk, "transformed_chunks")
+
+    await out_queue.put(_END_OF_STREAM)
+
+
+@timed(Metric.PHASE_DURATION, phase=PipelinePhase.LOAD_PHASE)
+@traced(PipelinePhase.LOAD_PHASE, SpanKind.PHASE)
+async def stream_loader(destinations: LoadPhase, queue: asyncio.Queue) -> None:
+    if destinations.pre:
+        await task_group_executor(destinations.pre)
+
+    try:
+        while (chunk := await _get_chunk(queue, "transformed_chunks")) is not _END_OF_STREAM:
+            Metrics.observe_rows(chunk)
+            await task_group_executor(destinations.steps, data=chunk)
+
+        if destinations.post:
+            await task_group_executor(destinations.post)
+    except Exception as e:
+        error_message = "Load Phase Error"
+        raise LoadError(error_message, e) from e
+
+
+async def run_streaming_etl(pipeline: Pipeline) -> None:
+    """Overlap the extract, transform and load phases of a pipeline chunk by chunk.
+
+    The phases are connected by queues bounded to `pipeline.stream_buffer_size` chunks, so a slow
+    consumer applies backpressure to its producer and at most a few chunks are held in memory.
+    The time each phase waits on the queues is recorded as `Metric.QUEUE_WAIT`.
+    """
+    extracted_chunks = asyncio.Queue(maxsize=pipeline.stream_buffer_size)
+    transformed_chunks = asyncio.Queue(maxsize=pipeline.stream_buffer_size)
+
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(stream_extractor(pipeline.extract, extracted_chunks))
+        tg.create_task(
+            stream_transformer(pipeline.transform, extracted_chunks, transformed_chunks, pipeline.transform_executor)
+        )
+        tg.create_task(stream_loader(pipeline.load, transformed_chunks))
+
+
 class PipelineStrategy(metaclass=ABCMeta):
+    """Runs the phases of a pipeline in the order of its type.
+
+    With a checkpoint store, each phase is restored from the run being resumed when its checkpoint is still
+    valid, and its input is only produced when it has to run, see `CheckpointStore`.
+
+    Args:
+        checkpoints (CheckpointStore | None, optional): The store of phase checkpoints. Defaults to None.
+    """
+
+    def __init__(self, checkpoints: CheckpointStore | None = None) -> None:
+        self.checkpoints = checkpoints
+
     @abstractmethod
     async def execute(self, pipeline: Pipeline) -> bool:
         raise NotImplementedError("This has to be implemented by the subclasses.")
 
+    async def run_phase(
+        self, pipeline: Pipeline, phase: PipelinePhase, run: Callable[[], Awaitable[ETLData]]
+    ) -> ETLData:
+        if self.checkpoints is None:
+            return await run()
+        return await self.checkpoints.run_phase(pipeline.name, phase, run)
+
+    async def extract(self, pipeline: Pipeline) -> ExtractedData:
+        return await self.run_phase(pipeline, PipelinePhase.EXTRACT_PHASE, partial(run_extractor, pipeline.extract))
+
+    async def transform(self, pipeline: Pipeline) -> TransformedData:
+        async def transform() -> TransformedData:
+            # Transform (CPU-bound work, so offload to the configured executor)
+            return await run_transform_phase(
+                await self.extract(pipeline), pipeline.transform, pipeline.transform_executor
+            )
+
+        return await self.run_phase(pipeline, PipelinePhase.TRANSFORM_PHASE, transform)
+
+    async def load(self, pipeline: Pipeline, data: Callable[[Pipeline], Awaitable[ETLData]]) -> None:
+        async def load() -> None:
+            await run_loader(await data(pipeline), pipeline.load)
+
+        await self.run_phase(pipeline, PipelinePhase.LOAD_PHASE, load)
+
+    async def stream(self, pipeline: Pipeline) -> None:
+        await self.run_phase(pipeline, PipelinePhase.LOAD_PHASE, partial(run_streaming_etl, pipeline))
+
+    async def transform_at_load(self, pipeline: Pipeline) -> None:
+        await self.run_phase(
+            pipeline,
+            PipelinePhase.TRANSFORM_AT_LOAD_PHASE,
+            partial(run_transformer_after_load, pipeline.load_transform),
+        )
+
 
 class ETLStrategy(PipelineStrategy):
     async def execute(self, pipeline: Pipeline) -> bool:
-        extracted_data = await run_extractor(pipeline.extract)
+        if pipeline.lazy:
+            push_down_transformations(pipeline.extract, pipeline.transform)
 
-        # Transform (CPU-bound work, so offload to executor)
-        transformed_data = await asyncio.get_running_loop().run_in_executor(
-            None, run_transformer, extracted_data, pipeline.transform
-        )
+        if pipeline.streaming:
+            await self.stream(pipeline)
+            return True
 
-        await run_loader(transformed_data, pipeline.load)
+        await self.load(pipeline, self.transform)
 
         return True
 
 
 class ELTStrategy(PipelineStrategy):
     async def execute(self, pipeline: Pipeline) -> bool:
-        extracted_data = await run_extractor(pipeline.extract)
-
-        await run_loader(extracted_data, pipeline.load)
+        await self.load(pipeline, self.extract)
 
-        run_transformer_after_load(pipeline.load_transform)
+        await self.transform_at_load(pipeline)
 
         return True
 
 
 class ETLTStrategy(PipelineStrategy):
     async def execute(self, pipeline: Pipeline) -> bool:
-        extracted_data = await run_extractor(pipeline.extract)
-
-        transformed_data = await asyncio.get_running_loop().run_in_executor(
-            None, run_transformer, extracted_data, pipeline.transform
-        )
+        if pipeline.lazy:
+            push_down_transformations(pipeline.extract, pipeline.transform)
 
-        await run_loader(transformed_data, pipeline.load)
+        if pipeline.streaming:
+            await self.stream(pipeline)
+        else:
+            await self.load(pipeline, self.transform)
 
-        run_transformer_after_load(pipeline.load_transform)
+        await self.transform_at_load(pipeline)
 
         return True
 
@@ -0,0 +1,101 @@
+# Standard Imports
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from collections import Counter
+from typing import TYPE_CHECKING, Any, ClassVar
+
+# Third Party Imports
+# Project Imports
+from pipeline_flow.common.utils import SingletonMeta
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from pipeline_flow.common.type_def import ExtractedData
+    from pipeline_flow.core.models.pipeline import Pipeline
+    from pipeline_flow.plugins import IPlugin
+
+
+class ExtractCache(metaclass=SingletonMeta):
+    """Single-flight memoisation of the extract steps declared more than once in a workflow.
+
+    Extract plugins instantiated from the same plugin name and parameters share a fingerprint. When
+    `expect` counts several non-streaming, non-lazy steps with the same fingerprint, the first of them
+    to run executes the plugin and every other step awaits the same result instead of extracting again.
+    A result is released once all the steps expecting it consumed it, and a failed extraction is
+    forgotten so that the steps running after it try again. Steps with a fingerprint seen once are
+    executed as usual and their result is not kept.
+
+    Consumers share the same object, so transforms must not modify extracted data in place. Steps of
+    non-deterministic sources opt out with `memoize: false`.
+    """
+
+    _flights: ClassVar[weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Task]]] = (
+        weakref.WeakKeyDictionary()
+    )
+    _expected: ClassVar[Counter[str]] = Counter()
+    _usage: ClassVar[dict[str, dict[str, Any]]] = {}
+
+    @classmethod
+    def expect(cls: type[ExtractCache], pipelines: list[Pipeline]) -> None:
+        """Count the steps extracting each fingerprint in the pipelines of the workflow."""
+        for pipeline in pipelines:
+            # Streaming steps yield chunks to a single consumer, lazy ones extract what their transforms push down.
+            if pipeline.streaming or pipeline.lazy:
+                continue
+            cls._expected.update(step.fingerprint for step in pipeline.extract.steps if step.fingerprint)
+
+    @classmethod
+    async def extract(
+        cls: type[ExtractCache], plugin: IPlugin, executor: Callable[[IPlugin], Awaitable[ExtractedData]]
+    ) -> ExtractedData:
+        """Execute the extract plugin, or await the result of an identical step extracting the same data."""
+        fingerprint = plugin.fingerprint
+        if fingerprint is None or cls._expected[fingerprint] < 2:  # noqa: PLR2004
+            return await executor(plugin)
+
+        flights = cls._flights.setdefault(asyncio.get_running_loop(), {})
+        usage = cls._usage.setdefault(fingerprint, {"plugin": plugin.id, "executions": 0, "shared": 0})
+        flight = flights.get(fingerprint)
+        if flight is None:
+            usage["executions"] += 1
+            flight = flights[fingerprint] = asyncio.create_task(executor(plugin))
+        else:
+            usage["shared"] += 1
+            logging.info("Extract step `%s` shares the result of `%s`.", plugin.id, usage["plugin"])
+
+        try:
+            # Shielded, so that a failing pipeline does not cancel the extraction shared with the others.
+            return await asyncio.shield(flight)
+        except BaseException:
+            if flights.get(fingerprint) is flight and flight.done():
+                del flights[fingerprint]
+            raise
+        finally:
+            cls._expected[fingerprint] -= 1
+            if cls._expected[fingerprint] < 1 and flights.get(fingerprint) is flight:
+                # No step is left to consume the result, even of an extraction its consumers stopped awaiting.
+                del flights[fingerprint]
+                flight.cancel()
+
+    @classmethod
+    def metrics(cls: type[ExtractCache]) -> dict[str, dict[str, Any]]:
+        """Return the executions and shared results of every memoised extraction, keyed by the step that ran it."""
+        return {
+            usage["plugin"]: {"executions": usage["executions"], "shared": usage["shared"]}
+            for usage in cls._usage.values()
+        }
+
+    @classmethod
+    def clear(cls: type[ExtractCache]) -> None:
+        """Forget the results and expected steps of the workflow, cancelling the extractions left running."""
+        for flight in cls._flights.pop(asyncio.get_running_loop(), {}).values():
+            flight.cancel()
+        cls._expected.clear()
+
+    @classmethod
+    def reset_metrics(cls: type[ExtractCache]) -> None:
+        cls._usage.clear()
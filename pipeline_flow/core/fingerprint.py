@@ -0,0 +1,15 @@
+# Standard Imports
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+# Third Party Imports
+# Project Imports
+
+
+def plugin_fingerprint(plugin_name: str, params: dict[str, Any]) -> str:
+    """Identify the invocations of a plugin with the same parameters, whatever the order of their keys."""
+    canonical = json.dumps({"plugin": plugin_name, "params": params}, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
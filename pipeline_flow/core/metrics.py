@@ -0,0 +1,371 @@
+# Standard Imports
+from __future__ import annotations
+
+import asyncio
+import bisect
+import contextvars
+import logging
+import math
+import os
+import threading
+import time
+from collections.abc import Mapping, Sized
+from contextlib import contextmanager
+from enum import StrEnum, unique
+from functools import wraps
+from http import HTTPStatus
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, Self
+
+# Third Party Imports
+import aiofiles
+
+# Project Imports
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator
+
+type Labels = tuple[tuple[str, str], ...]
+
+PROMETHEUS_PREFIX = "pipeline_flow_"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0)
+# Powers of ten, from a single row to a hundred million rows.
+ROW_BUCKETS = tuple(10.0**exponent for exponent in range(9))
+# Powers of four, from a kibibyte to a gibibyte.
+BYTE_BUCKETS = tuple(1024.0 * 4**exponent for exponent in range(11))
+SUMMARY_QUANTILES = (0.5, 0.95, 0.99)
+
+# The labels of the pipeline, phase and plugin running, set by `measure` and added to every observation.
+_labels: contextvars.ContextVar[dict[str, str]] = contextvars.ContextVar("metric_labels", default={})  # noqa: B039
+
+
+@unique
+class Metric(StrEnum):
+    PIPELINE_DURATION = "pipeline_duration_seconds"
+    PHASE_DURATION = "phase_duration_seconds"
+    PLUGIN_DURATION = "plugin_duration_seconds"
+    ROWS = "rows"
+    BYTES = "bytes"
+    QUEUE_WAIT = "queue_wait_seconds"
+    RETRIES = "retries_total"
+
+
+# The metrics recorded as histograms, with their bucket bounds. The others are counters.
+HISTOGRAM_BUCKETS = {
+    Metric.PIPELINE_DURATION: DURATION_BUCKETS,
+    Metric.PHASE_DURATION: DURATION_BUCKETS,
+    Metric.PLUGIN_DURATION: DURATION_BUCKETS,
+    Metric.ROWS: ROW_BUCKETS,
+    Metric.BYTES: BYTE_BUCKETS,
+    Metric.QUEUE_WAIT: DURATION_BUCKETS,
+}
+
+METRIC_DESCRIPTIONS = {
+    Metric.PIPELINE_DURATION: "Seconds taken to execute a pipeline.",
+    Metric.PHASE_DURATION: "Seconds taken by a phase of a pipeline.",
+    Metric.PLUGIN_DURATION: "Seconds taken by a call of a plugin.",
+    Metric.ROWS: "Rows returned by a plugin, or received by a load phase.",
+    Metric.BYTES: "Bytes downloaded by a plugin, per request.",
+    Metric.QUEUE_WAIT: "Seconds a pipeline waited for a worker, or a streaming phase for its neighbour.",
+    Metric.RETRIES: "Retried requests and batches.",
+}
+
+
+def count_rows(data: Any) -> int | None:  # noqa: ANN401
+    """Return the rows of tables, data frames, arrays and lists of records, or None for other data."""
+    shape = getattr(data, "shape", None)
+    if isinstance(shape, tuple) and shape:
+        return shape[0]
+    if isinstance(data, Sized) and not isinstance(data, str | bytes | Mapping):
+        return len(data)
+    return None
+
+
+class Histogram:
+    """Counts observations into cumulative buckets like a Prometheus histogram, keeping their minimum and maximum.
+
+    Args:
+        bounds (tuple[float, ...]): The inclusive upper bounds of the buckets, in ascending order.
+    """
+
+    __slots__ = ("bounds", "bucket_counts", "count", "max", "min", "sum")
+
+    def __init__(self: Self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        # The last bucket counts the observations above every bound.
+        self.bucket_counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def observe(self: Self, value: float) -> None:
+        self.bucket_counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def cumulative_counts(self: Self) -> list[tuple[float, int]]:
+        """Return the observations up to each bound, ending with the `+Inf` bound counting them all."""
+        counts, total = [], 0
+        for bound, count in zip((*self.bounds, math.inf), self.bucket_counts, strict=True):
+            total += count
+            counts.append((bound, total))
+        return counts
+
+    def quantile(self: Self, quantile: float) -> float | None:
+        """Estimate a quantile by interpolating within its bucket, like PromQL's `histogram_quantile`."""
+        if not self.count:
+            return None
+
+        rank = quantile * self.count
+        lower, below = self.min, 0
+        for bound, cumulative in self.cumulative_counts():
+            if cumulative >= rank:
+                upper = min(bound, self.max)
+                in_bucket = cumulative - below
+                estimate = lower + (upper - lower) * (rank - below) / in_bucket if in_bucket else upper
+                return min(max(estimate, self.min), self.max)
+            lower, below = max(bound, self.min), cumulative
+        return self.max
+
+    def as_dict(self: Self) -> dict[str, Any]:
+        summary = {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "min": round(self.min, 6),
+            "max": round(self.max, 6),
+            "mean": round(self.sum / self.count, 6),
+        }
+        for quantile in SUMMARY_QUANTILES:
+            summary[f"p{round(quantile * 100)}"] = round(self.quantile(quantile), 6)  # type: ignore[reportArgumentType]
+        return summary
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels | Mapping[str, str], **extra: str) -> str:
+    pairs = [*(labels.items() if isinstance(labels, Mapping) else labels), *extra.items()]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(str(value))}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metrics:
+    """Records the durations, rows, bytes, queue waits and retries of the workflow running.
+
+    Observations are labelled with the pipeline, phase and plugin running, as set by `measure` in the context
+    of the task recording them, and with the labels given explicitly. Histograms count the observations of each
+    set of labels into fixed buckets, so their memory does not grow with the observations. The metrics are
+    summarised with `metrics` and exported in the Prometheus text format with `to_prometheus`.
+    """
+
+    _histograms: ClassVar[dict[tuple[Metric, Labels], Histogram]] = {}
+    _counters: ClassVar[dict[tuple[Metric, Labels], float]] = {}
+    # Observations may come from plugins running in worker threads.
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @staticmethod
+    def _series(labels: dict[str, str]) -> Labels:
+        return tuple(sorted((name, str(value)) for name, value in {**_labels.get(), **labels}.items()))
+
+    @classmethod
+    def observe(cls: type[Metrics], metric: Metric, value: float, **labels: str) -> None:
+        """Record an observation of a histogram metric."""
+        key = (metric, cls._series(labels))
+        with cls._lock:
+            histogram = cls._histograms.get(key)
+            if histogram is None:
+                histogram = cls._histograms[key] = Histogram(HISTOGRAM_BUCKETS[metric])
+            histogram.observe(value)
+
+    @classmethod
+    def increment(cls: type[Metrics], metric: Metric, value: float = 1, **labels: str) -> None:
+        """Add to a counter metric."""
+        key = (metric, cls._series(labels))
+        with cls._lock:
+            cls._counters[key] = cls._counters.get(key, 0) + value
+
+    @classmethod
+    def observe_rows(cls: type[Metrics], data: Any, **labels: str) -> int | None:  # noqa: ANN401
+        """Record and return the rows of the data, unless its rows cannot be counted."""
+        rows = count_rows(data)
+        if rows is not None:
+            cls.observe(Metric.ROWS, rows, **labels)
+        return rows
+
+    @classmethod
+    def histogram(cls: type[Metrics], metric: Metric, **labels: str) -> Histogram | None:
+        """Return the histogram of a metric with exactly the labels given, if anything was observed."""
+        return cls._histograms.get((metric, tuple(sorted(labels.items()))))
+
+    @classmethod
+    def metrics(cls: type[Metrics]) -> dict[str, list[dict[str, Any]]]:
+        """Return the summary of every histogram and the value of every counter, keyed by metric."""
+        summary: dict[str, list[dict[str, Any]]] = {}
+        with cls._lock:
+            for (metric, labels), histogram in sorted(cls._histograms.items()):
+                summary.setdefault(metric.value, []).append({"labels": dict(labels), **histogram.as_dict()})
+            for (metric, labels), value in sorted(cls._counters.items()):
+                summary.setdefault(metric.value, []).append({"labels": dict(labels), "value": value})
+        return summary
+
+    @classmethod
+    def to_prometheus(
+        cls: type[Metrics], resources: Mapping[str, Mapping[str, Mapping[str, Any]]] | None = None
+    ) -> str:
+        """Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            resources (Mapping[str, Mapping[str, Mapping[str, Any]]], optional): The metrics of shared resources,
+                e.g. `ConnectionPools.metrics()`, keyed by resource kind then resource name. Their numeric values
+                are exported as gauges named after the kind and the value, labelled with the resource name.
+                Defaults to None.
+
+        Returns:
+            str: The metrics, one sample per line.
+        """
+        lines = []
+        with cls._lock:
+            histograms, counters = sorted(cls._histograms.items()), sorted(cls._counters.items())
+
+        for metric in Metric:
+            series = [
+                item for item in (histograms if metric in HISTOGRAM_BUCKETS else counters) if item[0][0] == metric
+            ]
+            if not series:
+                continue
+
+            name = PROMETHEUS_PREFIX + metric.value
+            kind = "histogram" if metric in HISTOGRAM_BUCKETS else "counter"
+            lines += [f"# HELP {name} {METRIC_DESCRIPTIONS[metric]}", f"# TYPE {name} {kind}"]
+            for (_, labels), value in series:
+                if isinstance(value, Histogram):
+                    lines += [
+                        f"{name}_bucket{_format_labels(labels, le=_format_value(bound))} {count}"
+                        for bound, count in value.cumulative_counts()
+                    ]
+                    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(value.sum)}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {value.count}")
+                else:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+        for kind, usages in (resources or {}).items():
+            gauges: dict[str, list[str]] = {}
+            for resource, usage in usages.items():
+                for field, value in usage.items():
+                    # Booleans are ints, but not values a gauge can chart.
+                    if isinstance(value, int | float) and not isinstance(value, bool):
+                        sample = f"{_format_labels({'name': resource})} {_format_value(value)}"
+                        gauges.setdefault(f"{PROMETHEUS_PREFIX}{kind}_{field}", []).append(sample)
+            for name, samples in gauges.items():
+                lines.append(f"# TYPE {name} gauge")
+                lines += [f"{name}{sample}" for sample in samples]
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+    @classmethod
+    def reset_metrics(cls: type[Metrics]) -> None:
+        with cls._lock:
+            cls._histograms.clear()
+            cls._counters.clear()
+
+
+@contextmanager
+def measure(metric: Metric, **labels: str) -> Iterator[None]:
+    """Record the seconds the block takes, with `labels` added to the observations made while it runs."""
+    token = _labels.set({**_labels.get(), **labels})
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        Metrics.observe(metric, elapsed)
+        _labels.reset(token)
+        logging.debug("%s %s took %.4f seconds.", metric.value, labels, elapsed)
+
+
+def timed[**P, R](metric: Metric, **labels: str) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Decorate a coroutine function to `measure` every call of it."""
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @wraps(func)
+        async def inner(*args: P.args, **kwargs: P.kwargs) -> R:
+            with measure(metric, **labels):
+                return await func(*args, **kwargs)
+
+        return inner
+
+    return decorator
+
+
+async def write_prometheus_file(file_path: str, text: str) -> None:
+    """Write the metrics for the textfile collector of the Prometheus node exporter, which never sees a partial file."""
+    path = Path(file_path)
+    temporary_path = path.with_suffix(path.suffix + ".tmp")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    async with aiofiles.open(temporary_path, mode="w", encoding="utf-8") as file:
+        await file.write(text)
+    os.replace(temporary_path, path)  # noqa: PTH105
+
+
+class MetricsServer:
+    """Serves the metrics in the Prometheus text format over HTTP while a workflow runs.
+
+    Every path answers a `GET` with the metrics, so the server can be scraped at `/metrics`.
+
+    Args:
+        render (Callable[[], str]): Renders the metrics, see `Metrics.to_prometheus`.
+        port (int): The port to listen on, 0 to pick a free port.
+        host (str, optional): The interface to listen on. Defaults to the loopback interface.
+    """
+
+    def __init__(self: Self, render: Callable[[], str], port: int, host: str = "127.0.0.1") -> None:
+        self.render = render
+        self.port = port
+        self.host = host
+        self._server: asyncio.Server | None = None
+
+    async def start(self: Self) -> None:
+        self._server = await asyncio.start_server(self._respond, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logging.info("Serving metrics at http://%s:%s/metrics", self.host, self.port)
+
+    async def _respond(self: Self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            method = (await reader.readline()).split(b" ", 1)[0]
+            # Skip the headers, the request has no body.
+            while (await reader.readline()).strip():
+                pass
+
+            status = HTTPStatus.OK if method in {b"GET", b"HEAD"} else HTTPStatus.METHOD_NOT_ALLOWED
+            body = self.render().encode() if status == HTTPStatus.OK else b""
+            head = (
+                f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                f"Content-Type: {PROMETHEUS_CONTENT_TYPE}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            )
+            writer.write(head.encode() + (b"" if method == b"HEAD" else body))
+            await writer.drain()
+        except ConnectionError as e:
+            logging.debug("Metrics scrape aborted: %s", e)
+        finally:
+            writer.close()
+
+    async def close(self: Self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from enum import StrEnum, unique
-from typing import Annotated, Self
+from typing import Annotated, Any, Self
 
 # Project Imports
 from pydantic import (
@@ -73,6 +73,8 @@ class TransformPhase(BaseModel):
         list[ITransformPlugin],
         BeforeValidator(serialize_plugins),
     ]
+    # Run consecutive fusible transforms, such as native filters and projections, in a single pass.
+    fuse: bool = True
 
 
 class LoadPhase(BaseModel):
@@ -99,4 +101,49 @@ class TransformLoadPhase(BaseModel):
         list[ITransformLoadPlugin],
         Field(min_length=1),
         BeforeValidator(serialize_plugins),
+        AfterValidator(unique_id_validator),
     ]
+
+    # Maps a step ID to the IDs of the steps it needs. When no step declares `needs`, the steps run
+    # sequentially; otherwise each step starts as soon as the steps it needs have completed.
+    needs: dict[str, list[str]] = Field(default_factory=dict)
+
+    @model_validator(mode="before")
+    @classmethod
+    def collect_step_needs(cls, data: Any) -> Any:  # noqa: ANN401
+        if not isinstance(data, dict) or not isinstance(data.get("steps"), list):
+            return data
+
+        needs = dict(data.get("needs") or {})
+        for step in data["steps"]:
+            if isinstance(step, dict) and "needs" in step:
+                step_needs = step.pop("needs")
+                if "id" not in step:
+                    raise ValueError("Validation Error! Steps declaring `needs` must have an explicit `id`.")
+                needs[step["id"]] = [step_needs] if isinstance(step_needs, str) else list(step_needs)
+
+        return {**data, "needs": needs}
+
+    @model_validator(mode="after")
+    def check_needs_condition(self: Self) -> Self:
+        step_ids = {step.id for step in self.steps}
+
+        for step_id, step_needs in self.needs.items():
+            unknown_ids = {step_id, *step_needs} - step_ids
+            if unknown_ids:
+                error_msg = f"Validation Error! Transform at load `needs` references unknown steps: {unknown_ids}."
+                raise ValueError(error_msg)
+
+        # Resolve the steps in dependency order to reject cycles, which would otherwise deadlock.
+        resolved: set[str] = set()
+        while len(resolved) < len(step_ids):
+            ready = {
+                step_id
+                for step_id in step_ids - resolved
+                if all(need in resolved for need in self.needs.get(step_id, []))
+            }
+            if not ready:
+                raise ValueError("Validation Error! Circular `needs` detected between transform at load steps.")
+            resolved |= ready
+
+        return self
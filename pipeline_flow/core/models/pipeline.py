@@ -1,9 +1,10 @@
 import logging
 from enum import StrEnum, unique
-from typing import Annotated, cast
+from typing import Annotated, Self, cast
 
-from pydantic import BaseModel, ConfigDict, ValidationInfo, field_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator, model_validator
 
+from pipeline_flow.common.utils import picklable_plugins_validator
 from pipeline_flow.core.models.phases import (
     ExtractPhase,
     LoadPhase,
@@ -43,6 +44,25 @@ MANDATORY_PHASES_BY_PIPELINE_TYPE = {
 }
 
 
+@unique
+class TransformExecutorType(StrEnum):
+    """Where the synchronous transform phase of a pipeline is executed."""
+
+    THREAD = "thread"
+    PROCESS = "process"
+    INLINE = "inline"
+
+
+# Pipeline types whose extract, transform and load phases can overlap chunk by chunk.
+STREAMING_PIPELINE_TYPES = {PipelineType.ETL, PipelineType.ETLT}
+
+# Pipeline types whose transform phase runs before loading and can therefore be planned before extraction.
+LAZY_PIPELINE_TYPES = {PipelineType.ETL, PipelineType.ETLT}
+
+# Maximum number of chunks buffered between two consecutive streaming phases.
+DEFAULT_STREAM_BUFFER_SIZE = 4
+
+
 class Pipeline(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -53,6 +73,14 @@ class Pipeline(BaseModel):
     # Optional
     description: str | None = None
     needs: str | list[str] | None = None
+    # Pipelines with a higher priority are dispatched first when more are ready than `concurrency` allows.
+    priority: int = 0
+    # Streaming pipelines pass extracted chunks through bounded queues instead of materialising the dataset.
+    streaming: bool = False
+    stream_buffer_size: Annotated[int, Field(gt=0)] = DEFAULT_STREAM_BUFFER_SIZE
+    transform_executor: TransformExecutorType = TransformExecutorType.THREAD
+    # Lazy pipelines push the filters and projections of the transform phase down into the extractor.
+    lazy: bool = False
 
     # Private
     _is_executed: bool = False
@@ -116,3 +144,48 @@ class Pipeline(BaseModel):
         msg = f"Phase validation successful for pipeline type '{pipeline_type}'"
         logging.info(msg)
         return phases
+
+    @model_validator(mode="after")
+    def validate_streaming(self: Self) -> Self:
+        if not self.streaming:
+            # Extractors yielding their pages are async generators, which only streaming pipelines consume.
+            if any(getattr(step, "stream_pages", False) is True for step in self.extract.steps):
+                error_msg = (
+                    f"Validation Error: `stream_pages` requires a streaming pipeline, set `streaming` on '{self.name}'."
+                )
+                raise ValueError(error_msg)
+            return self
+
+        if self.type not in STREAMING_PIPELINE_TYPES:
+            error_msg = f"Validation Error: Streaming is not supported for pipeline type '{self.type}'."
+            raise ValueError(error_msg)
+
+        if len(self.extract.steps) > 1:
+            raise ValueError("Validation Error: Streaming pipelines support exactly one extract step.")
+
+        # Each chunk would be staged and published on its own, e.g. a `replace` deleting the previous chunks.
+        if any(isinstance(getattr(step, "staged_load", None), str) for step in self.load.steps):
+            raise ValueError("Validation Error: Streaming pipelines do not support staged loads.")
+
+        return self
+
+    @model_validator(mode="after")
+    def validate_lazy(self: Self) -> Self:
+        if not self.lazy:
+            return self
+
+        if self.type not in LAZY_PIPELINE_TYPES:
+            error_msg = f"Validation Error: Lazy planning is not supported for pipeline type '{self.type}'."
+            raise ValueError(error_msg)
+
+        if len(self.extract.steps) > 1:
+            raise ValueError("Validation Error: Lazy pipelines support exactly one extract step.")
+
+        return self
+
+    @model_validator(mode="after")
+    def validate_transform_executor(self: Self) -> Self:
+        if self.transform_executor == TransformExecutorType.PROCESS and PipelinePhase.TRANSFORM_PHASE in self.phases:
+            picklable_plugins_validator(self.transform.steps)
+
+        return self
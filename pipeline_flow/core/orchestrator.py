@@ -1,75 +1,210 @@
 # Standard Imports
+from __future__ import annotations
+
 import asyncio
+import itertools
 import logging
+import time
+from typing import TYPE_CHECKING
 
 # Third Party Imports
 # Project Imports
+from pipeline_flow.core.duration_history import DurationHistory
 from pipeline_flow.core.executor import PIPELINE_STRATEGY_MAP
+from pipeline_flow.core.metrics import Metric, Metrics, measure
 from pipeline_flow.core.models.pipeline import Pipeline
-from pipeline_flow.core.parsers.yaml_parser import YamlConfig
+from pipeline_flow.core.tracing import SpanKind, span
+
+if TYPE_CHECKING:
+    from pipeline_flow.core.checkpoints import CheckpointStore
+    from pipeline_flow.core.parsers.yaml_parser import YamlConfig
+
+# Queue entry: (-priority, -critical path, insertion order), pipeline. `None` is the worker stop sentinel.
+type QueueItem = tuple[tuple[int, float, int], Pipeline | None]
 
 
 class PipelineOrchestrator:
-    """Emphasizes the role of the class in executing the pipelines."""
+    """Emphasizes the role of the class in executing the pipelines.
+
+    Pipelines are scheduled as a DAG: every pipeline keeps a counter of its unfinished `needs`
+    and is pushed onto the ready queue the moment that counter reaches zero. A fixed pool of
+    `concurrency` workers consumes the ready queue, so a slow pipeline only delays its own
+    dependents rather than every pipeline scheduled after it.
 
-    def __init__(self, config: YamlConfig) -> None:
+    When more pipelines are ready than there are workers, the ready queue hands out the pipeline
+    with the highest manual `priority` first and then the one with the longest remaining path to
+    a sink, weighted by the durations recorded in previous runs.
+
+    With a checkpoint store, pipelines that completed in the run being resumed are skipped, and the
+    others resume from the phases they checkpointed, see `CheckpointStore`.
+    """
+
+    def __init__(self, config: YamlConfig, checkpoints: CheckpointStore | None = None) -> None:
         self.concurrency = config.concurrency
-        self.pipeline_queue = asyncio.Queue()
-        self.semaphore = asyncio.Semaphore(config.concurrency)
+        self.pipeline_queue: asyncio.PriorityQueue[QueueItem] = asyncio.PriorityQueue()
+        self.history = DurationHistory(config.history_file)
+        self.checkpoints = checkpoints
+
+        self._pending_dependencies: dict[str, int] = {}
+        self._dependents: dict[str, list[Pipeline]] = {}
+        self._critical_paths: dict[str, float] = {}
+        self._executed_pipelines: set[str] = set()
+        self._insertion_order = itertools.count()
+        self._enqueued_at: dict[str, float] = {}
 
     @staticmethod
-    def _can_execute(pipeline: Pipeline, executed_pipelines: set[str]) -> bool:
-        """A function that checks if a given pipeline is executable or has an external dependency."""
+    def _get_dependencies(pipeline: Pipeline) -> list[str]:
+        """Normalises the `needs` attribute of a pipeline into a list of unique pipeline names."""
         if pipeline.needs is None:
-            return True
+            return []
         if isinstance(pipeline.needs, str):
-            return pipeline.needs in executed_pipelines
-        if isinstance(pipeline.needs, list):
-            return all(need in executed_pipelines for need in pipeline.needs)
-        return False
+            return [pipeline.needs]
+        return list(dict.fromkeys(pipeline.needs))
+
+    def _build_dependency_graph(self, pipelines: list[Pipeline]) -> None:
+        """Counts the dependencies of each pipeline and maps every pipeline to its dependents."""
+        pipeline_names = {pipeline.name for pipeline in pipelines}
+
+        self._pending_dependencies = {}
+        self._dependents = {pipeline.name: [] for pipeline in pipelines}
+
+        for pipeline in pipelines:
+            dependencies = self._get_dependencies(pipeline)
+
+            unknown_dependencies = [need for need in dependencies if need not in pipeline_names]
+            if unknown_dependencies:
+                error_msg = f"Pipeline `{pipeline.name}` depends on undefined pipelines: {unknown_dependencies}."
+                raise ValueError(error_msg)
+
+            self._pending_dependencies[pipeline.name] = len(dependencies)
+            for need in dependencies:
+                self._dependents[need].append(pipeline)
+
+    def _topological_order(self, pipelines: list[Pipeline]) -> list[Pipeline]:
+        """Orders the pipelines with Kahn's algorithm, rejecting cycles before anything runs."""
+        pending = self._pending_dependencies.copy()
+        ready = [pipeline for pipeline in pipelines if pending[pipeline.name] == 0]
+        order = []
+
+        while ready:
+            pipeline = ready.pop()
+            order.append(pipeline)
+            for dependent in self._dependents[pipeline.name]:
+                pending[dependent.name] -= 1
+                if pending[dependent.name] == 0:
+                    ready.append(dependent)
+
+        if len(order) != len(pipelines):
+            raise ValueError("Circular dependency detected!")
+
+        return order
+
+    def _compute_critical_paths(self, topological_order: list[Pipeline]) -> None:
+        """Computes the expected duration of the longest path from each pipeline to a sink."""
+        self._critical_paths = {}
+
+        for pipeline in reversed(topological_order):
+            longest_downstream = max(
+                (self._critical_paths[dependent.name] for dependent in self._dependents[pipeline.name]), default=0.0
+            )
+            self._critical_paths[pipeline.name] = self.history.estimate(pipeline.name) + longest_downstream
+
+    def _enqueue(self, pipeline: Pipeline) -> None:
+        self._enqueued_at[pipeline.name] = time.perf_counter()
+        sort_key = (-pipeline.priority, -self._critical_paths.get(pipeline.name, 0.0), next(self._insertion_order))
+        self.pipeline_queue.put_nowait((sort_key, pipeline))
 
     async def pipeline_queue_producer(self, pipelines: list[Pipeline]) -> None:
         for pipeline in pipelines:
             logging.debug("Adding %s to central pipeline queue", pipeline.name)
-            await self.pipeline_queue.put(pipeline)
+            self._enqueue(pipeline)
             logging.debug("Added %s to central pipeline queue", pipeline.name)
 
-    async def _execute_pipeline(self) -> None:
-        if self.pipeline_queue.empty():
-            return
-
-        async with self.semaphore:
-            while not self.pipeline_queue.empty():
-                pipeline = await self.pipeline_queue.get()
+    async def _execute_pipeline(self, pipeline: Pipeline) -> None:
+        logging.info("Executing: %s ", pipeline.name)
+        strategy = PIPELINE_STRATEGY_MAP[pipeline.type]
+        attributes = {"pipeline.name": pipeline.name, "pipeline.type": pipeline.type.value}
+        with (
+            measure(Metric.PIPELINE_DURATION, pipeline=pipeline.name),
+            span(pipeline.name, SpanKind.PIPELINE, attributes),
+        ):
+            pipeline.is_executed = await strategy(self.checkpoints).execute(pipeline)
+        if pipeline.is_executed and self.checkpoints is not None:
+            await self.checkpoints.complete(pipeline.name)
+        logging.info("Completed: %s", pipeline.name)
+
+    async def _restore_pipeline(self, pipeline: Pipeline) -> bool:
+        """Marks the pipeline as executed if it completed in the run being resumed."""
+        if self.checkpoints is None or not await self.checkpoints.is_completed(pipeline.name):
+            return False
+
+        logging.info("Skipping: %s, it completed in the run being resumed.", pipeline.name)
+        pipeline.is_executed = True
+        return True
+
+    def _release_dependents(self, pipeline: Pipeline) -> None:
+        """Decrements the dependency counters of the dependents and enqueues the ones that became ready."""
+        for dependent in self._dependents.get(pipeline.name, []):
+            self._pending_dependencies[dependent.name] -= 1
+
+            if self._pending_dependencies[dependent.name] == 0:
+                logging.debug("All dependencies of %s have completed", dependent.name)
+                self._enqueue(dependent)
+
+    async def _pipeline_worker(self) -> None:
+        """Consumes the ready queue until it receives the `None` stop sentinel."""
+        loop = asyncio.get_running_loop()
+
+        while (pipeline := (await self.pipeline_queue.get())[1]) is not None:
+            # The time a ready pipeline waited for a free worker.
+            if (enqueued_at := self._enqueued_at.pop(pipeline.name, None)) is not None:
+                wait = time.perf_counter() - enqueued_at
+                Metrics.observe(Metric.QUEUE_WAIT, wait, queue="ready_pipelines", pipeline=pipeline.name)
+            try:
+                if not await self._restore_pipeline(pipeline):
+                    start = loop.time()
+                    await self._execute_pipeline(pipeline)
+                    self.history.record(pipeline.name, loop.time() - start)
+
+                if pipeline.is_executed:
+                    self._executed_pipelines.add(pipeline.name)
+                    self._release_dependents(pipeline)
+                else:
+                    logging.warning("Pipeline %s did not complete, its dependents will be skipped.", pipeline.name)
+            finally:
+                self.pipeline_queue.task_done()
 
-                logging.info("Executing: %s ", pipeline.name)
-                strategy = PIPELINE_STRATEGY_MAP[pipeline.type]
-                pipeline.is_executed = await strategy().execute(pipeline)
-                logging.info("Completed: %s", pipeline.name)
+    async def _stop_workers_when_drained(self) -> None:
+        """Waits until every enqueued pipeline has been processed, then stops the workers."""
+        await self.pipeline_queue.join()
 
-                self.pipeline_queue.task_done()
+        for _ in range(self.concurrency):
+            self.pipeline_queue.put_nowait(((0, 0.0, next(self._insertion_order)), None))
 
     async def execute_pipelines(self, pipelines: list[Pipeline]) -> set[str]:
         """Asynchronously executes parsed jobs."""
         if not pipelines:
             raise ValueError("The Pipeline list is empty. There is nothing to execute.")
 
-        executed_pipelines = set()
-        while pipelines:
-            executable_pipelines = [
-                pipeline for pipeline in pipelines if self._can_execute(pipeline, executed_pipelines)
-            ]
+        self._build_dependency_graph(pipelines)
+        topological_order = self._topological_order(pipelines)
 
-            if not executable_pipelines:
-                raise ValueError("Circular dependency detected!")
+        await self.history.load()
+        self._compute_critical_paths(topological_order)
+        self._executed_pipelines = set()
 
-            # Produces a central queue of executable pipelines
-            await self.pipeline_queue_producer(executable_pipelines)
+        # Seed the ready queue with the pipelines without dependencies.
+        await self.pipeline_queue_producer(
+            [pipeline for pipeline in pipelines if self._pending_dependencies[pipeline.name] == 0]
+        )
 
+        try:
             async with asyncio.TaskGroup() as tg:
-                tasks = [tg.create_task(self._execute_pipeline()) for _ in range(self.concurrency)]  # noqa: F841
-
-            executed_pipelines.update(pipeline.name for pipeline in executable_pipelines)
-            pipelines = [pipeline for pipeline in pipelines if not pipeline.is_executed]
-
-        return executed_pipelines
+                for index in range(self.concurrency):
+                    # Named, as the lanes of the workers in traces.
+                    tg.create_task(self._pipeline_worker(), name=f"pipeline-worker-{index}")
+                tg.create_task(self._stop_workers_when_drained())
+        finally:
+            await self.history.save()
+
+        return self._executed_pipelines
@@ -20,18 +20,25 @@ PHASE_CLASS_MAP = {
 }
 
 
-def parse_pipelines(pipelines_data: dict[str, dict[str, Any]]) -> list[Pipeline]:
+def parse_pipelines(pipelines_data: dict[str, dict[str, Any]], transform_executor: str | None = None) -> list[Pipeline]:
+    """Parse the pipelines, applying the global `transform_executor` to pipelines that do not set their own."""
     if not pipelines_data:
         raise ValueError("No Pipelines detected.")
 
-    return [_create_pipeline(pipeline_name, pipeline_data) for pipeline_name, pipeline_data in pipelines_data.items()]
+    return [
+        _create_pipeline(pipeline_name, pipeline_data, transform_executor)
+        for pipeline_name, pipeline_data in pipelines_data.items()
+    ]
 
 
-def _create_pipeline(pipeline_name: str, phase_data: dict[str, Any]) -> Pipeline:
+def _create_pipeline(pipeline_name: str, phase_data: dict[str, Any], transform_executor: str | None = None) -> Pipeline:
     """Parse a single pipeline's data and return a pipeline instance."""
     if not phase_data:
         raise ValueError("Pipeline attributes are empty")
 
+    if transform_executor:
+        phase_data.setdefault("transform_executor", transform_executor)
+
     phases = {}
 
     if "phases" not in phase_data:
@@ -16,11 +16,13 @@ if TYPE_CHECKING:
     from pipeline_flow.common.type_def import PluginRegistryJSON
 
 from pipeline_flow.common.utils import SingletonMeta
+from pipeline_flow.core.tracing import TraceFormat
 
 type JSON_DATA = dict
 
 DEFAULT_CONCURRENCY = 2
 DEFAULT_ENGINE = "native"
+DEFAULT_TRANSFORM_EXECUTOR = "thread"
 
 
 class YamlAttribute(StrEnum):
@@ -28,12 +30,26 @@ class YamlAttribute(StrEnum):
     PLUGINS = "plugins"
     ENGINE = "engine"
     CONCURRENCY = "concurrency"
+    HISTORY_FILE = "history_file"
+    CHECKPOINT_DIR = "checkpoint_dir"
+    METRICS_FILE = "metrics_file"
+    METRICS_PORT = "metrics_port"
+    TRACE_FILE = "trace_file"
+    TRACE_FORMAT = "trace_format"
+    TRANSFORM_EXECUTOR = "transform_executor"
 
 
 @dataclass(frozen=True)
 class YamlConfig(metaclass=SingletonMeta):
     engine: str = DEFAULT_ENGINE
     concurrency: int = DEFAULT_CONCURRENCY
+    history_file: str | None = None
+    checkpoint_dir: str | None = None
+    metrics_file: str | None = None
+    metrics_port: int | None = None
+    trace_file: str | None = None
+    trace_format: TraceFormat = TraceFormat.CHROME
+    transform_executor: str = DEFAULT_TRANSFORM_EXECUTOR
 
 
 # Pattern for environment variables, e.g. ${{ env.HOME }}
@@ -127,6 +143,15 @@ class YamlParser:
         attrs_map = {
             YamlAttribute.ENGINE.value: self.content.get(YamlAttribute.ENGINE.value, DEFAULT_ENGINE),
             YamlAttribute.CONCURRENCY.value: self.content.get(YamlAttribute.CONCURRENCY.value, DEFAULT_CONCURRENCY),
+            YamlAttribute.HISTORY_FILE.value: self.content.get(YamlAttribute.HISTORY_FILE.value, None),
+            YamlAttribute.CHECKPOINT_DIR.value: self.content.get(YamlAttribute.CHECKPOINT_DIR.value, None),
+            YamlAttribute.METRICS_FILE.value: self.content.get(YamlAttribute.METRICS_FILE.value, None),
+            YamlAttribute.METRICS_PORT.value: self.content.get(YamlAttribute.METRICS_PORT.value, None),
+            YamlAttribute.TRACE_FILE.value: self.content.get(YamlAttribute.TRACE_FILE.value, None),
+            YamlAttribute.TRACE_FORMAT.value: self.content.get(YamlAttribute.TRACE_FORMAT.value, None),
+            YamlAttribute.TRANSFORM_EXECUTOR.value: self.content.get(
+                YamlAttribute.TRANSFORM_EXECUTOR.value, DEFAULT_TRANSFORM_EXECUTOR
+            ),
         }
 
         # Filter out the None values
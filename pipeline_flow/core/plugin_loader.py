@@ -7,9 +7,13 @@ import sys
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from types import ModuleType
+
     from pipeline_flow.common.type_def import PluginRegistryJSON
 
 from pipeline_flow.core.parsers import PluginParser
+from pipeline_flow.core.registry import PluginRegistry
+from pipeline_flow.plugins import IPlugin
 
 
 def load_plugins(engine: str, plugins_payload: PluginRegistryJSON | None) -> None:
@@ -36,6 +40,19 @@ def load_plugins(engine: str, plugins_payload: PluginRegistryJSON | None) -> Non
     logging.info("All plugins loaded successfully.")
 
 
+def _register_module_plugins(module: ModuleType) -> None:
+    """Registers the plugins of an already imported module that are missing from the registry."""
+    for attribute in vars(module).values():
+        if (
+            isinstance(attribute, type)
+            and issubclass(attribute, IPlugin)
+            and attribute.__module__ == module.__name__
+            and attribute.plugin_name
+            and not PluginRegistry.is_registered(attribute.plugin_name)
+        ):
+            PluginRegistry.register(attribute.plugin_name, attribute)
+
+
 def _load_plugin_from_file(plugin_file: str) -> None:
     # Get the module name from the file and remove .py extension
     if plugin_file.startswith("/"):
@@ -46,6 +63,7 @@ def _load_plugin_from_file(plugin_file: str) -> None:
     # Check if the module is already loaded to avoid re-importing
     if fq_module_name in sys.modules:
         logging.debug("Module %s has been re-loaded.", fq_module_name)
+        _register_module_plugins(sys.modules[fq_module_name])
         return
 
     try:
@@ -58,7 +76,14 @@ def _load_plugin_from_file(plugin_file: str) -> None:
             )
 
         plugin_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(plugin_module)  # type: ignore[reportOptionalMemberAccess]
+
+        # Registering the module lets its plugin classes be pickled, e.g. for the process transform executor.
+        sys.modules[fq_module_name] = plugin_module
+        try:
+            spec.loader.exec_module(plugin_module)  # type: ignore[reportOptionalMemberAccess]
+        except BaseException:
+            del sys.modules[fq_module_name]
+            raise
         logging.info("Loaded plugin from %s as %s", plugin_file, fq_module_name)
 
     except ImportError:
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any, ClassVar
 # Third Party Imports
 # Project Imports
 from pipeline_flow.common.utils import SingletonMeta
+from pipeline_flow.core.fingerprint import plugin_fingerprint
 
 if TYPE_CHECKING:
     from pipeline_flow.common.type_def import PluginName
@@ -34,6 +35,10 @@ class PluginRegistry(metaclass=SingletonMeta):
         cls._registry[plugin_name] = plugin_callable
         logging.debug("Plugin `%s` have been successfully registered. ", plugin_name)
 
+    @classmethod
+    def is_registered(cls: PluginRegistry, plugin_name: PluginName) -> bool:
+        return plugin_name in cls._registry
+
     @classmethod
     def get(cls: PluginRegistry, plugin_name: PluginName) -> IPlugin:
         """Retrieve a plugin from the registry."""
@@ -49,14 +54,20 @@ class PluginRegistry(metaclass=SingletonMeta):
 
     @classmethod
     def instantiate_plugin(cls: PluginRegistry, plugin_data: dict[str, Any]) -> IPlugin:
-        """Resolve and return a single plugin instance."""
+        """Resolve and return a single plugin instance.
+
+        The instance is fingerprinted by its plugin name and parameters, unless `memoize` is false.
+        """
         plugin_name = plugin_data.pop("plugin", None)
         if not plugin_name:
             raise ValueError("The attribute 'plugin' is empty.")
 
         plugin_factory: IPlugin = cls.get(plugin_name)
 
-        plugin_id = plugin_data.pop("id", None) or f"{plugin_name}_{uuid.uuid4().hex()[:16]}"
+        plugin_id = plugin_data.pop("id", None) or f"{plugin_name}_{uuid.uuid4().hex[:16]}"
         plugin_params = plugin_data.get("params", {})
 
-        return plugin_factory(plugin_id=plugin_id, **plugin_params)
+        plugin = plugin_factory(plugin_id=plugin_id, **plugin_params)
+        if plugin_data.get("memoize", True):
+            plugin.fingerprint = plugin_fingerprint(plugin_name, plugin_params)
+        return plugin
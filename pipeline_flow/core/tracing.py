@@ -0,0 +1,266 @@
+# Standard Imports
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import itertools
+import json
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from enum import StrEnum, unique
+from functools import wraps
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, Self
+
+# Third Party Imports
+import aiofiles
+
+# Project Imports
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator
+
+type AttributeValue = str | int | float | bool
+
+SERVICE_NAME = "pipeline-flow"
+# OTLP span kind of spans that neither serve nor send remote requests.
+OTLP_SPAN_KIND_INTERNAL = 1
+OTLP_STATUS_OK = 1
+OTLP_STATUS_ERROR = 2
+PIPELINE_ATTRIBUTE = "pipeline.name"
+
+# The span running in the current task or thread, the parent of the spans it starts.
+_current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar("current_span", default=None)
+
+
+@unique
+class SpanKind(StrEnum):
+    WORKFLOW = "workflow"
+    PIPELINE = "pipeline"
+    PHASE = "phase"
+    PLUGIN = "plugin"
+
+
+@unique
+class TraceFormat(StrEnum):
+    CHROME = "chrome"
+    OTLP = "otlp"
+
+
+def _lane() -> tuple[int, str]:
+    """Identify the task, or the thread outside of the event loop, a span runs in.
+
+    Spans of the same task are sequential or nested, so a timeline lane per task never overlaps.
+    """
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is not None:
+        return id(task), task.get_name()
+
+    thread = threading.current_thread()
+    return thread.ident or 0, thread.name
+
+
+class Span:
+    """A timed operation of the workflow, nested in the span that was running when it started.
+
+    Args:
+        name (str): The name of the operation, e.g. the pipeline name or the plugin id.
+        kind (SpanKind): Whether the span times the workflow, a pipeline, a phase or a plugin.
+        span_id (str): The 16 hex digits identifying the span within its trace.
+        parent (Span | None): The span it is nested in.
+        attributes (dict[str, AttributeValue] | None, optional): Describes the operation. Defaults to None.
+    """
+
+    __slots__ = ("attributes", "end_ns", "error", "kind", "lane", "name", "parent_id", "span_id", "start_ns")
+
+    def __init__(
+        self: Self,
+        name: str,
+        kind: SpanKind,
+        span_id: str,
+        parent: Span | None,
+        attributes: dict[str, AttributeValue] | None = None,
+    ) -> None:
+        self.name = name
+        self.kind = kind
+        self.span_id = span_id
+        self.parent_id = parent.span_id if parent is not None else None
+        self.attributes = attributes or {}
+        if parent is not None and PIPELINE_ATTRIBUTE in parent.attributes:
+            # Lets the spans of a pipeline be found in the lanes of the tasks it started.
+            self.attributes.setdefault(PIPELINE_ATTRIBUTE, parent.attributes[PIPELINE_ATTRIBUTE])
+        self.lane = _lane()
+        self.error: str | None = None
+        self.start_ns = time.time_ns()
+        self.end_ns: int | None = None
+
+    def set_attribute(self: Self, key: str, value: AttributeValue | None) -> None:
+        if value is not None:
+            self.attributes[key] = value
+
+    def end(self: Self, error: BaseException | None = None) -> None:
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+        self.end_ns = time.time_ns()
+
+
+def _otlp_value(value: AttributeValue) -> dict[str, Any]:
+    # Checked before int, as booleans are ints. 64-bit integers are strings in OTLP JSON.
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class Tracer:
+    """Records the spans of the workflow running, for timelines showing where the time of each pipeline goes.
+
+    Spans are only recorded between `start` and `reset`, so untraced workflows keep nothing in memory. They
+    are exported as Chrome trace events, opened with `chrome://tracing` or Perfetto, with a lane per task or
+    thread. Pipeline workers are lanes of their own, so the gaps between their pipelines are idle slots.
+    They are also exported as OTLP JSON, the payload of the OTLP/HTTP trace exporter, e.g. for Jaeger.
+    """
+
+    _spans: ClassVar[list[Span] | None] = None
+    _trace_id: ClassVar[str] = ""
+    _span_ids: ClassVar[itertools.count] = itertools.count(1)
+
+    @classmethod
+    def start(cls: type[Tracer]) -> None:
+        """Start recording the spans of a new trace."""
+        cls._spans = []
+        cls._trace_id = secrets.token_hex(16)
+        cls._span_ids = itertools.count(1)
+
+    @classmethod
+    def is_recording(cls: type[Tracer]) -> bool:
+        return cls._spans is not None
+
+    @classmethod
+    def start_span(
+        cls: type[Tracer], name: str, kind: SpanKind, attributes: dict[str, AttributeValue] | None = None
+    ) -> Span:
+        """Start a span nested in the current span, without making it current."""
+        started = Span(name, kind, f"{next(cls._span_ids):016x}", _current_span.get(), attributes)
+        if cls._spans is not None:
+            cls._spans.append(started)
+        return started
+
+    @classmethod
+    def spans(cls: type[Tracer]) -> list[Span]:
+        """Return the spans that ended, in the order they started."""
+        return [recorded for recorded in cls._spans or [] if recorded.end_ns is not None]
+
+    @classmethod
+    def to_chrome_trace(cls: type[Tracer]) -> dict[str, Any]:
+        """Return the spans as complete events of the Chrome trace event format, in microseconds."""
+        pid = os.getpid()
+        tids: dict[int, int] = {}
+        events: list[dict[str, Any]] = []
+        for recorded in cls.spans():
+            lane, lane_name = recorded.lane
+            if lane not in tids:
+                tids[lane] = len(tids) + 1
+                events.append(
+                    {"name": "thread_name", "ph": "M", "pid": pid, "tid": tids[lane], "args": {"name": lane_name}}
+                )
+
+            args: dict[str, Any] = {**recorded.attributes, "span_id": recorded.span_id}
+            if recorded.error is not None:
+                args["error"] = recorded.error
+            events.append(
+                {
+                    "name": recorded.name,
+                    "cat": recorded.kind.value,
+                    "ph": "X",
+                    "ts": recorded.start_ns / 1000,
+                    "dur": (recorded.end_ns - recorded.start_ns) / 1000,  # type: ignore[reportOptionalOperand]
+                    "pid": pid,
+                    "tid": tids[lane],
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    @classmethod
+    def to_otlp(cls: type[Tracer]) -> dict[str, Any]:
+        """Return the spans as an OTLP JSON `ExportTraceServiceRequest`."""
+        spans = []
+        for recorded in cls.spans():
+            otlp_span = {
+                "traceId": cls._trace_id,
+                "spanId": recorded.span_id,
+                "name": recorded.name,
+                "kind": OTLP_SPAN_KIND_INTERNAL,
+                "startTimeUnixNano": str(recorded.start_ns),
+                "endTimeUnixNano": str(recorded.end_ns),
+                "attributes": [
+                    {"key": key, "value": _otlp_value(value)}
+                    for key, value in {"span.kind": recorded.kind.value, **recorded.attributes}.items()
+                ],
+                "status": {"code": OTLP_STATUS_OK}
+                if recorded.error is None
+                else {"code": OTLP_STATUS_ERROR, "message": recorded.error},
+            }
+            if recorded.parent_id is not None:
+                otlp_span["parentSpanId"] = recorded.parent_id
+            spans.append(otlp_span)
+
+        resource = {"attributes": [{"key": "service.name", "value": {"stringValue": SERVICE_NAME}}]}
+        return {
+            "resourceSpans": [
+                {"resource": resource, "scopeSpans": [{"scope": {"name": "pipeline_flow"}, "spans": spans}]}
+            ]
+        }
+
+    @classmethod
+    async def export(cls: type[Tracer], file_path: str, trace_format: TraceFormat = TraceFormat.CHROME) -> None:
+        """Write the spans recorded to a JSON file in the given format."""
+        trace = cls.to_chrome_trace() if trace_format == TraceFormat.CHROME else cls.to_otlp()
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        async with aiofiles.open(file_path, mode="w", encoding="utf-8") as file:
+            await file.write(json.dumps(trace))
+
+    @classmethod
+    def reset(cls: type[Tracer]) -> None:
+        """Stop recording and forget the spans recorded."""
+        cls._spans = None
+
+
+@contextmanager
+def span(name: str, kind: SpanKind, attributes: dict[str, AttributeValue] | None = None) -> Iterator[Span]:
+    """Time the block as a span nested in the current span, and current for the spans started within it."""
+    current = Tracer.start_span(name, kind, attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.end(e)
+        raise
+    else:
+        current.end()
+    finally:
+        _current_span.reset(token)
+
+
+def traced[**P, R](name: str, kind: SpanKind) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Decorate a coroutine function to trace every call of it as a `span`."""
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @wraps(func)
+        async def inner(*args: P.args, **kwargs: P.kwargs) -> R:
+            with span(name, kind):
+                return await func(*args, **kwargs)
+
+        return inner
+
+    return decorator
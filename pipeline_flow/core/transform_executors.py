@@ -0,0 +1,63 @@
+# Standard Imports
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING
+
+# Third Party Imports
+# Project Imports
+from pipeline_flow.core.models.pipeline import TransformExecutorType
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_process_pool: ProcessPoolExecutor | None = None
+_process_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Return the process pool shared by all pipelines, creating it with one worker per core."""
+    global _process_pool  # noqa: PLW0603
+
+    with _process_pool_lock:
+        if _process_pool is None:
+            max_workers = os.cpu_count() or 1
+            logging.debug("Starting a transform process pool with %s workers.", max_workers)
+            _process_pool = ProcessPoolExecutor(max_workers=max_workers)
+
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    global _process_pool  # noqa: PLW0603
+
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=True, cancel_futures=True)
+            _process_pool = None
+
+
+async def run_in_transform_executor[**P, R](
+    executor_type: TransformExecutorType, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs
+) -> R:
+    """Run a synchronous transform function with the requested executor.
+
+    `inline` blocks the event loop and suits cheap transforms, `thread` offloads to the default
+    thread pool and suits transforms releasing the GIL (I/O, NumPy, pandas), while `process`
+    sidesteps the GIL for pure-Python CPU-bound transforms at the cost of pickling the data.
+    """
+    if executor_type == TransformExecutorType.INLINE:
+        return func(*args, **kwargs)
+
+    loop = asyncio.get_running_loop()
+    if executor_type == TransformExecutorType.PROCESS:
+        return await loop.run_in_executor(get_process_pool(), partial(func, *args, **kwargs))
+
+    # Like `asyncio.to_thread`, run in a copy of the context, so that metrics keep the labels of the caller.
+    return await loop.run_in_executor(None, partial(contextvars.copy_context().run, func, *args, **kwargs))
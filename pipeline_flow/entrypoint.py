@@ -1,14 +1,110 @@
 # Standard Imports
+import asyncio
 import logging
+import time
+from typing import Any
 
 # # Project Imports
 from pipeline_flow.common.utils import setup_logger
+from pipeline_flow.core.checkpoints import CheckpointStore
+from pipeline_flow.core.connection_pools import ConnectionPools
+from pipeline_flow.core.extract_cache import ExtractCache
+from pipeline_flow.core.metrics import Metrics, MetricsServer, write_prometheus_file
 from pipeline_flow.core.orchestrator import PipelineOrchestrator
 from pipeline_flow.core.parsers import YamlParser, parse_pipelines
+from pipeline_flow.core.parsers.yaml_parser import YamlConfig
 from pipeline_flow.core.plugin_loader import load_plugins
+from pipeline_flow.core.tracing import SpanKind, Tracer, span
+from pipeline_flow.core.transform_executors import shutdown_process_pool
+from pipeline_flow.plugins.utils.batch_sizing import BatchSizer
 
 
-async def start_workflow(yaml_text: str | None = None, file_path: str | None = None) -> bool:
+def create_checkpoint_store(
+    yaml_config: YamlConfig,
+    yaml_parser: YamlParser,
+    resume: bool,  # noqa: FBT001
+) -> CheckpointStore | None:
+    if yaml_config.checkpoint_dir:
+        return CheckpointStore(yaml_config.checkpoint_dir, yaml_parser.get_pipelines_dict(), resume=resume)
+    if resume:
+        raise ValueError("Resuming a workflow requires a `checkpoint_dir`.")
+    return None
+
+
+def resource_metrics() -> dict[str, dict[str, dict[str, Any]]]:
+    """Return the utilisation of the resources shared by the pipelines, keyed by resource kind then name."""
+    return {
+        "connection_pools": ConnectionPools.metrics(),
+        "batch_sizes": BatchSizer.metrics(),
+        "extract_cache": ExtractCache.metrics(),
+    }
+
+
+def render_metrics() -> str:
+    return Metrics.to_prometheus(resource_metrics())
+
+
+def run_summary(executed_pipelines: set[str], duration: float) -> dict[str, Any]:
+    """Summarise a workflow run as JSON: the pipelines executed, its metrics and the utilisation of its resources."""
+    return {
+        "pipelines": sorted(executed_pipelines),
+        "duration_seconds": round(duration, 6),
+        "metrics": Metrics.metrics(),
+        **resource_metrics(),
+    }
+
+
+async def start_metrics_server(yaml_config: YamlConfig) -> MetricsServer | None:
+    if yaml_config.metrics_port is None:
+        return None
+
+    server = MetricsServer(render_metrics, yaml_config.metrics_port)
+    await server.start()
+    return server
+
+
+async def report_metrics(yaml_config: YamlConfig) -> None:
+    """Log the utilisation of the shared resources, and export the metrics to the `metrics_file` if any."""
+    resources = resource_metrics()
+    for name, usage in resources["connection_pools"].items():
+        logging.info("Connection pool `%s` utilisation: %s", name, usage)
+    for name, sizes in resources["batch_sizes"].items():
+        logging.info("Loader `%s` batch sizes: %s", name, sizes)
+    for name, usage in resources["extract_cache"].items():
+        logging.info("Extract `%s` results shared: %s", name, usage)
+
+    if yaml_config.metrics_file:
+        await write_prometheus_file(yaml_config.metrics_file, Metrics.to_prometheus(resources))
+
+
+async def start_workflow(
+    yaml_text: str | None = None,
+    file_path: str | None = None,
+    resume: bool = False,  # noqa: FBT001, FBT002
+    summary: bool = False,  # noqa: FBT001, FBT002
+) -> bool | dict[str, Any]:
+    """Parses the YAML of a workflow and executes its pipelines.
+
+    With a `checkpoint_dir` in the YAML, the outputs of the phases are checkpointed as they complete. A workflow
+    failing part way can then be rerun with `resume`, skipping the pipelines and phases that completed, as long as
+    their configuration is unchanged. The checkpoints are deleted once a workflow completes, and before a run that
+    does not resume.
+
+    The durations, rows, bytes, queue waits and retries of the pipelines, phases and plugins are recorded, see
+    `Metrics`. With a `metrics_port` in the YAML, they are served in the Prometheus text format while the workflow
+    runs, and with a `metrics_file`, written in that format once it finished. With a `trace_file`, the spans of the
+    workflow, its pipelines, their phases and their plugins are written to it once it finished, see `Tracer`.
+
+    Args:
+        yaml_text (str | None, optional): The YAML of the workflow. Defaults to None.
+        file_path (str | None, optional): The path of the YAML file of the workflow. Defaults to None.
+        resume (bool, optional): Whether to resume from the checkpoints of a failed run. Defaults to False.
+        summary (bool, optional): Whether to return the JSON summary of the run, see `run_summary`, instead of
+            True. Defaults to False.
+
+    Returns:
+        bool | dict[str, Any]: True once every pipeline was executed, or the summary of the run with `summary`.
+    """
     # Set up the logger configuration
     setup_logger()
 
@@ -23,21 +119,51 @@ async def start_workflow(yaml_text: str | None = None, file_path: str | None = N
         raise ValueError("YamlParser could not be initialized.")
 
     yaml_config = yaml_parser.initialize_yaml_config()
+    checkpoints = create_checkpoint_store(yaml_config, yaml_parser, resume)
     plugins_payload = yaml_parser.get_plugins_dict()
 
     # Parse plugins directly within the load_plugins function
     load_plugins(yaml_config.engine, plugins_payload)
 
     # Parse pipelines and execute them using the orchestrator
-    pipelines = parse_pipelines(yaml_parser.get_pipelines_dict())
+    pipelines = parse_pipelines(yaml_parser.get_pipelines_dict(), yaml_config.transform_executor)
+    ExtractCache.expect(pipelines)
+    metrics_server = await start_metrics_server(yaml_config)
+    if yaml_config.trace_file:
+        Tracer.start()
+    start = time.perf_counter()
 
     try:
-        orchestrator = PipelineOrchestrator(yaml_config)
-        await orchestrator.execute_pipelines(pipelines)
+        if checkpoints is not None and not resume:
+            await checkpoints.clear()
+
+        orchestrator = PipelineOrchestrator(yaml_config, checkpoints)
+        with span("workflow", SpanKind.WORKFLOW, {"pipelines": len(pipelines)}):
+            executed_pipelines = await orchestrator.execute_pipelines(pipelines)
+
+        if checkpoints is not None:
+            await checkpoints.clear()
+
+        run = run_summary(executed_pipelines, time.perf_counter() - start) if summary else None
 
     except Exception as e:
         logging.error("The following error occurred: %s", e)
         logging.error("The original cause is: %s", e.__cause__)
         raise
     else:
-        return True
+        return run if run is not None else True
+    finally:
+        if metrics_server is not None:
+            await metrics_server.close()
+        await report_metrics(yaml_config)
+        if yaml_config.trace_file:
+            await Tracer.export(yaml_config.trace_file, yaml_config.trace_format)
+        Tracer.reset()
+        await ConnectionPools.dispose()
+        ConnectionPools.reset_metrics()
+        BatchSizer.reset_metrics()
+        ExtractCache.clear()
+        ExtractCache.reset_metrics()
+        Metrics.reset_metrics()
+        # Waits for the worker processes to exit, off the event loop.
+        await asyncio.to_thread(shutdown_process_pool)
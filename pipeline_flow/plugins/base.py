@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, ParamSpec, Self
+from typing import TYPE_CHECKING, Any, ClassVar, ParamSpec, Self
 
 # Third Party Imports
 # Local Imports
@@ -38,6 +38,10 @@ class AsyncAdapterMixin:
 class IPlugin:
     """Abstract base class for all plugins."""
 
+    plugin_name: ClassVar[str | None] = None
+    # Identifies the plugins instantiated from the same plugin name and parameters, see `ExtractCache`.
+    fingerprint: str | None = None
+
     def __init_subclass__(
         cls,
         *,
@@ -53,6 +57,7 @@ class IPlugin:
             raise ValueError("Plugin name must be provided for concrete classes.")
 
         # Register the plugin with the plugin registry.
+        cls.plugin_name = plugin_name
         PluginRegistry.register(plugin_name, cls)
 
     def __init__(self: Self, plugin_id: str) -> None:
@@ -64,7 +69,10 @@ class IExtractPlugin(ABC, IPlugin, interface=True):
 
     @abstractmethod
     async def __call__(self: Self) -> ExtractedData:
-        """Asynchronously extract data."""
+        """Asynchronously extract data.
+
+        Extractors used by streaming pipelines may instead be async generators yielding chunks of data.
+        """
         raise NotImplementedError("Extract plugins must implement __call__()")
 
 
@@ -100,7 +108,11 @@ class ITransformLoadPlugin(ABC, IPlugin, interface=True):
 
     @abstractmethod
     def __call__(self: Self) -> None:
-        """Sychronously transform data at the destination."""
+        """Sychronously transform data at the destination.
+
+        Synchronous implementations are executed in a worker thread. Plugins backed by an async driver
+        may implement `__call__` as a coroutine instead, which is awaited directly on the event loop.
+        """
         raise NotImplementedError("Transform-load plugins must implement __call__()")
 
 
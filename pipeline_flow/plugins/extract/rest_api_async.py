@@ -1,51 +1,298 @@
 # Standard Imports
 import asyncio
+import importlib.util
 import logging
 import os
+from collections.abc import AsyncIterator, Coroutine
+from contextlib import aclosing
 from http import HTTPStatus
 from typing import Any, Self
 
 # Third Party Imports
 import httpx
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random
+from tenacity import RetryCallState, retry, retry_if_exception, stop_after_attempt, wait_random
 
 # Local Imports
+from pipeline_flow.core.connection_pools import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    ConnectionPools,
+)
+from pipeline_flow.core.metrics import Metric, Metrics
 from pipeline_flow.plugins import IExtractPlugin
-from pipeline_flow.plugins.utils.pagination import PaginationStrategy, PaginationTypes, get_pagination_strategy
+from pipeline_flow.plugins.utils.http_cache import DEFAULT_MAX_SIZE, HttpCache
+from pipeline_flow.plugins.utils.json_stream import IncrementalJsonParser
+from pipeline_flow.plugins.utils.pagination import (
+    ConcurrentPaginationStrategy,
+    PaginationStrategy,
+    PaginationTypes,
+    get_pagination_strategy,
+    prefetch_in_order,
+)
+from pipeline_flow.plugins.utils.pushdown import PushdownPlan, SupportsPushdown
+from pipeline_flow.plugins.utils.rate_limiting import (
+    RETRYABLE_STATUS_CODES,
+    HostLimiter,
+    HostLimiters,
+    parse_retry_after,
+)
 
 JSON_DATA = dict[str, Any]
 
+# The content codings httpx can decode, the optional ones depending on their package being installed.
+SUPPORTED_ENCODINGS = [
+    encoding
+    for encoding, package in (("zstd", "zstandard"), ("br", "brotli"), ("gzip", None), ("deflate", None))
+    if package is None or importlib.util.find_spec(package) is not None
+]
+
 
 async def async_sleep(seconds: float) -> None:
     logging.debug("Retrying in %s seconds", seconds)
     await asyncio.sleep(seconds)
 
 
-class RestApiAsyncExtractor(IExtractPlugin, plugin_name="rest_api_extractor"):
+def _count_retry(retry_state: RetryCallState) -> None:  # noqa: ARG001
+    Metrics.increment(Metric.RETRIES)
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Only timeouts, dropped connections, overload and server errors are retried, a client error would fail again."""
+    if isinstance(error, httpx.TimeoutException | httpx.NetworkError | httpx.RemoteProtocolError):
+        return True
+    return isinstance(error, httpx.HTTPStatusError) and error.response.status_code in RETRYABLE_STATUS_CODES
+
+
+_wait_random = wait_random(min=1, max=4)
+
+
+def _wait_before_retry(retry_state: RetryCallState) -> float:
+    # A `Retry-After` pause is already applied to every request to the host by its limiter.
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(error, httpx.HTTPStatusError) and parse_retry_after(error.response.headers.get("Retry-After")):
+        return 0
+    return _wait_random(retry_state)
+
+
+class FetchedPage:
+    """The response of a page and its JSON, without the records when the body is parsed incrementally."""
+
+    __slots__ = ("document", "response")
+
+    def __init__(self: Self) -> None:
+        self.response: httpx.Response | None = None
+        self.document: dict | list | None = None
+
+
+class RequestContext:
+    """The shared client and limiter, the headers and the cap on requests in flight of an extraction."""
+
+    __slots__ = ("client", "headers", "in_flight", "limiter")
+
+    def __init__(
+        self: Self,
+        client: httpx.AsyncClient,
+        limiter: HostLimiter,
+        headers: dict[str, str],
+        in_flight: asyncio.Semaphore,
+    ) -> None:
+        self.client = client
+        self.limiter = limiter
+        self.headers = headers
+        self.in_flight = in_flight
+
+
+def _accept_encoding(encodings: list[str] | None) -> str:
+    if encodings is None:
+        return ", ".join(SUPPORTED_ENCODINGS)
+
+    if unsupported := [encoding for encoding in encodings if encoding not in {*SUPPORTED_ENCODINGS, "identity"}]:
+        error_msg = (
+            f"Unsupported content encodings {unsupported}, supported encodings are {SUPPORTED_ENCODINGS}. "
+            "Decoding `br` requires `brotli` and `zstd` requires `zstandard` to be installed."
+        )
+        raise ValueError(error_msg)
+    return ", ".join(encodings) or "identity"
+
+
+def _query_value(value: object) -> str:
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
+
+
+class RestApiAsyncExtractor(SupportsPushdown, IExtractPlugin, plugin_name="rest_api_extractor"):
     """Fetches data asychronously from an API endpoint using the HTTP GET method.
 
+    In lazy pipelines, equality and `in` filters on the columns of `pushdown_params` are sent as
+    query parameters of the first request, and the columns read by the transform phase as `fields_param`.
+
+    Pages are fetched and retried one by one. With `stream_pages`, the extractor is an async generator
+    yielding the records of each page as soon as it arrives, which lets streaming pipelines transform
+    and load the first pages while the next ones are fetched. With `incremental_json`, records are
+    decoded while the body is downloaded, so a large page is never buffered whole.
+
+    With the `offset` and `page_number` pagination types, every page after the first is requested
+    concurrently, with at most `concurrency_limit` pages in flight, and the records are returned in page order.
+
+    With multiple endpoints, given as a list or as a template filled with each of `endpoint_params`, the
+    endpoints are paginated concurrently, sharing the client and the cap of `concurrency_limit` requests in
+    flight. Their records are returned grouped by endpoint, in endpoint order, or streamed page by page in
+    order of arrival.
+
+    Requests are sent through an HTTP client shared by all extractors calling the same host, see `ConnectionPools`,
+    and throttled by a limiter shared the same way, see `HostLimiters`. The limiter spaces the requests to
+    `rate_limit` per second, holds them back while the host asks to wait with `Retry-After` or rate limit
+    headers and, with `adaptive_concurrency`, halves the requests in flight on 429 and 503 responses before
+    growing them back on success. Only timeouts, connection failures, 429 and server errors are retried.
+
+    The shared client negotiates HTTP/2 with `http2`, multiplexing the concurrent pages over a single connection,
+    and responses are compressed with the best of the `accept_encoding` codings supported by the server.
+
+    With `cache_dir`, responses carrying an `ETag` or `Last-Modified` header are cached on disk and
+    revalidated with conditional requests, so unchanged pages are served from the cache, see `HttpCache`.
+
     Args:
         plugin_id (str): The unique identifier of the plugin callabe. Often used for logging.
         base_url (str): The base URL of the API e.g. https://api.example.com/v1
-        endpoint (str): The endpoint to fetch data from e.g. /users
+        endpoint (str | list[str]): The endpoint to fetch data from e.g. /users, a list of endpoints, or a template
+            of endpoints filled with `endpoint_params`, e.g. customers/{customer_id}/orders.
         pagination_type (str, optional): The type of pagination strategy to use. Defaults to "page_based".
         headers (dict[str, str] | None, optional): An optional dict of headers. Defaults to None.
-
+        pushdown_params (dict[str, str] | None, optional): Columns mapped to the query parameter filtering them,
+            e.g. {"status": "status"}. Defaults to None.
+        fields_param (str | None, optional): The query parameter selecting the returned fields
+            as a comma-separated list, e.g. "fields". Defaults to None.
+        max_connections (int | None, optional): Connections opened to the host at once by the shared client,
+            None for no limit. Defaults to 100.
+        max_keepalive_connections (int | None, optional): Idle connections the shared client keeps open
+            for reuse. Defaults to 20.
+        pagination_params (dict[str, Any] | None, optional): Options of the pagination strategy,
+            e.g. {"limit": 500} for offset pagination. Defaults to None.
+        concurrency_limit (int, optional): The maximum number of pages requested at once, by concurrent
+            pagination strategies and across endpoints. Defaults to 10.
+        stream_pages (bool, optional): Whether to yield the records page by page instead of returning all of
+            them at once. Only allowed in streaming pipelines. Defaults to False.
+        incremental_json (bool, optional): Whether to decode the records of the `data` array, or of a top-level
+            array, while the body is downloaded instead of buffering and parsing whole pages. Defaults to False.
+        rate_limit (float | None, optional): The requests per second sent to the host by all extractors,
+            None for no limit. Defaults to None.
+        rate_limit_burst (int | None, optional): The requests sent at once after an idle period.
+            Defaults to the rate limit rounded up.
+        adaptive_concurrency (bool, optional): Whether to adapt the requests in flight to the host, up to
+            `max_connections`, to its overload responses. Defaults to True.
+        cache_dir (str | None, optional): The directory of the HTTP cache, None to disable it. Defaults to None.
+        cache_max_size (int, optional): The size in bytes above which the least recently used cached responses
+            are evicted. Defaults to 256 MiB.
+        http2 (bool, optional): Whether the shared client negotiates HTTP/2. Requires the `h2` package.
+            Defaults to False.
+        http2_prior_knowledge (bool, optional): Whether the shared client speaks HTTP/2 without negotiating it,
+            e.g. with a cleartext `http://` host known to support it. Implies `http2`. Defaults to False.
+        accept_encoding (list[str] | None, optional): The content codings accepted for compressed responses,
+            in order of preference, e.g. ["zstd", "gzip"]. Defaults to every coding that can be decoded:
+            zstd and br when `zstandard` and `brotli` are installed, gzip and deflate.
+        keepalive_expiry (float | None, optional): Seconds the shared client keeps an idle connection open,
+            None for no expiry. Defaults to 5.0.
+        timeout (float | None, optional): Seconds to wait for connecting, reading, writing or a pooled connection,
+            None to wait forever. Defaults to 5.0.
+        connect_timeout (float | None, optional): Seconds to wait for establishing a connection.
+            Defaults to `timeout`.
+        endpoint_params (list[dict[str, Any]] | None, optional): The values of the placeholders of the `endpoint`
+            template, one endpoint per dict, e.g. [{"customer_id": 1}, {"customer_id": 2}]. Defaults to None.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self: Self,
         plugin_id: str,
         base_url: str,
-        endpoint: str,
+        endpoint: str | list[str],
         pagination_type: str = PaginationTypes.PAGE_BASED,
         headers: dict[str, str] | None = None,
+        pushdown_params: dict[str, str] | None = None,
+        fields_param: str | None = None,
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        pagination_params: dict[str, Any] | None = None,
+        concurrency_limit: int = 10,
+        stream_pages: bool = False,  # noqa: FBT001, FBT002
+        incremental_json: bool = False,  # noqa: FBT001, FBT002
+        rate_limit: float | None = None,
+        rate_limit_burst: int | None = None,
+        adaptive_concurrency: bool = True,  # noqa: FBT001, FBT002
+        cache_dir: str | None = None,
+        cache_max_size: int = DEFAULT_MAX_SIZE,
+        http2: bool = False,  # noqa: FBT001, FBT002
+        http2_prior_knowledge: bool = False,  # noqa: FBT001, FBT002
+        accept_encoding: list[str] | None = None,
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        timeout: float | None = 5.0,
+        connect_timeout: float | None = None,
+        endpoint_params: list[dict[str, Any]] | None = None,
     ) -> None:
         super().__init__(plugin_id)
         self.base_url = base_url
         self.endpoint = endpoint
+        self.endpoints = self._resolve_endpoints(endpoint, endpoint_params)
         self.headers = headers
-        self.pagination_strategy: PaginationStrategy = get_pagination_strategy(pagination_type)
+        self.pagination_strategy: PaginationStrategy = get_pagination_strategy(
+            pagination_type, **(pagination_params or {})
+        )
+        self.concurrency_limit = concurrency_limit
+        self.stream_pages = stream_pages
+        self.incremental_json = incremental_json
+        self.pushdown_params = pushdown_params or {}
+        self.fields_param = fields_param
+        self.query_params: dict[str, str] = {}
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.rate_limit = rate_limit
+        self.rate_limit_burst = rate_limit_burst
+        self.adaptive_concurrency = adaptive_concurrency
+        self.cache_dir = cache_dir
+        self.cache_max_size = cache_max_size
+        self.http_cache: HttpCache | None = None
+        self.http2 = http2 or http2_prior_knowledge
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError("HTTP/2 requires the `h2` package to be installed, e.g. with `pip install httpx[http2]`.")
+        self.http2_prior_knowledge = http2_prior_knowledge
+        self.accept_encoding = _accept_encoding(accept_encoding)
+        self.keepalive_expiry = keepalive_expiry
+        self.timeout = httpx.Timeout(timeout, connect=timeout if connect_timeout is None else connect_timeout)
+
+    @staticmethod
+    def _resolve_endpoints(endpoint: str | list[str], endpoint_params: list[dict[str, Any]] | None) -> list[str]:
+        templates = [endpoint] if isinstance(endpoint, str) else endpoint
+        if endpoint_params is None:
+            endpoints = templates
+        else:
+            try:
+                endpoints = [template.format(**params) for params in endpoint_params for template in templates]
+            except KeyError as error:
+                error_msg = f"The endpoint parameters miss the placeholder {error} of the endpoint `{endpoint}`."
+                raise ValueError(error_msg) from error
+
+        if not endpoints:
+            raise ValueError("The REST API extractor requires at least one endpoint.")
+        return endpoints
+
+    def push_down(self: Self, plan: PushdownPlan) -> None:
+        query_params = {}
+        for predicate in plan.predicates:
+            param = self.pushdown_params.get(predicate.column)
+            if param is None:
+                continue
+
+            if predicate.operator == "==":
+                query_params[param] = _query_value(predicate.value)
+            elif predicate.operator == "in" and isinstance(predicate.value, list | tuple):
+                # `column in "abc"` is a substring test, which a comma-separated filter would not match.
+                query_params[param] = ",".join(_query_value(value) for value in predicate.value)
+
+        if self.fields_param and plan.columns is not None:
+            query_params[self.fields_param] = ",".join(plan.columns)
+
+        self.query_params = query_params
 
     @staticmethod
     def _extract_data(response_data: dict | list) -> list[JSON_DATA]:
@@ -70,24 +317,80 @@ class RestApiAsyncExtractor(IExtractPlugin, plugin_name="rest_api_extractor"):
             return response_data
         return []
 
+    @staticmethod
     @retry(
         sleep=async_sleep,
         stop=stop_after_attempt(3),
-        wait=wait_random(min=1, max=4),
-        retry=retry_if_exception_type(httpx.HTTPStatusError),
+        wait=_wait_before_retry,
+        retry=retry_if_exception(_is_retryable),
+        before_sleep=_count_retry,
         reraise=True,
     )
-    async def __call__(self) -> JSON_DATA:
-        """Fetches data from the API endpoin asynchronously.
+    async def _fetch_page(  # noqa: PLR0913
+        client: httpx.AsyncClient,
+        limiter: HostLimiter,
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, Any] | None,
+        stream: bool = False,  # noqa: FBT001, FBT002
+        cache: HttpCache | None = None,
+        request_timeout: httpx.Timeout | None = None,
+    ) -> httpx.Response:
+        """Fetches a single page, retrying retryable failures unless it succeeded within three attempts.
 
-        Returns:
-            list[JSON_DATA]: The extracted data from the API.
+        With `stream`, only the headers are read and the caller must read and close the body. With
+        `cache`, the request is conditional on the validators of the cached response, if any, which
+        is served from the cache when not modified.
         """
-        # TODO: Fix the return type to be a list of JSON_DATA
-        # TODO: Add supports for multiple endpoints with paginations async.
-        results = []
-        next_page_url = f"{self.base_url}/{self.endpoint}"
+        request = client.build_request(
+            "GET",
+            url,
+            headers=headers,
+            params=params,
+            timeout=httpx.USE_CLIENT_DEFAULT if request_timeout is None else request_timeout,
+        )
+        if cache is None:
+            response = await limiter.send(client, request, stream=stream)
+        else:
+            response = await RestApiAsyncExtractor._fetch_cached(client, limiter, request, headers, cache)
+
+        if response.status_code != HTTPStatus.OK:
+            await response.aclose()
+            logging.error("Failed to retrieve data. Status code: %s", response.status_code)
+            response.raise_for_status()
+
+        if cache is not None and not stream:
+            await response.aread()
+        return response
+
+    @staticmethod
+    async def _fetch_cached(
+        client: httpx.AsyncClient,
+        limiter: HostLimiter,
+        request: httpx.Request,
+        headers: dict[str, str],
+        cache: HttpCache,
+    ) -> httpx.Response:
+        """Sends a conditional request for a cached response, returning a response whose body is not read yet."""
+        key = cache.key(request, headers)
+        entry = await cache.lookup(key)
+        if entry is not None:
+            request.headers.update(entry.conditional_headers())
+
+        response = await limiter.send(client, request, stream=True)
+        if entry is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+            await response.aclose()
+            if (cached := await cache.replay(entry, request)) is not None:
+                return cached
+
+            # The entry was evicted meanwhile, request the page again unconditionally.
+            for name in entry.conditional_headers():
+                del request.headers[name]
+            response = await limiter.send(client, request, stream=True)
 
+        return cache.store(key, response)
+
+    def _build_headers(self: Self) -> dict[str, str]:
         # Fetch API KEY securely
         api_key = os.getenv("API_KEY", "")  # noqa: F841 # TODO: This needs to be changeable such that AuthPluginInterface could be used.
 
@@ -95,25 +398,199 @@ class RestApiAsyncExtractor(IExtractPlugin, plugin_name="rest_api_extractor"):
         default_headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
+            "Accept-Encoding": self.accept_encoding,
         }
 
         if self.headers:
             default_headers.update(self.headers)
+        return default_headers
 
-        async with httpx.AsyncClient() as client:
-            while next_page_url:
-                response = await client.get(url=next_page_url, headers=default_headers)
+    async def _read_page(
+        self: Self, context: RequestContext, url: str, params: dict[str, Any] | None, page: FetchedPage
+    ) -> AsyncIterator[list[JSON_DATA]]:
+        """Fetches a page and yields its records, storing the response and its JSON in `page` once read.
 
-                if response.status_code != HTTPStatus.OK:
-                    logging.error("Failed to retrieve data. Status code: %s", response.status_code)
-                    response.raise_for_status()
+        With `incremental_json`, the records are yielded in batches as they are decoded from the body.
+        """
+        client, limiter, headers = context.client, context.limiter, context.headers
+        async with context.in_flight:
+            if not self.incremental_json:
+                page.response = await self._fetch_page(
+                    client, limiter, url, headers, params, cache=self.http_cache, request_timeout=self.timeout
+                )
+                page.document = page.response.json()
+                Metrics.observe(Metric.BYTES, page.response.num_bytes_downloaded, plugin=self.id)
+                yield self._extract_data(page.document)
+                return
 
-                response_json = response.json()
-                results.extend(self._extract_data(response_json))
+            page.response = await self._fetch_page(
+                client, limiter, url, headers, params, stream=True, cache=self.http_cache, request_timeout=self.timeout
+            )
+            parser = IncrementalJsonParser()
+            try:
+                async for chunk in page.response.aiter_bytes():
+                    if records := parser.feed(chunk):
+                        yield records
+                if records := parser.close():
+                    yield records
+                Metrics.observe(Metric.BYTES, page.response.num_bytes_downloaded, plugin=self.id)
+            finally:
+                await page.response.aclose()
+            page.document = parser.document
 
-                # Handle Pagination
-                next_page_url = (
-                    self.pagination_strategy.get_next_page(response_json) if isinstance(response_json, dict) else None
-                )
+    async def _read_page_records(
+        self: Self, context: RequestContext, url: str, params: dict[str, Any] | None
+    ) -> list[JSON_DATA]:
+        records = []
+        async with aclosing(self._read_page(context, url, params, FetchedPage())) as batches:
+            async for batch in batches:
+                records.extend(batch)
+        return records
+
+    async def _fetch_pages_concurrently(
+        self: Self, context: RequestContext, url: str
+    ) -> AsyncIterator[list[JSON_DATA]]:
+        """Fetches the first page, then every remaining page planned by the strategy concurrently, in order."""
+        strategy: ConcurrentPaginationStrategy = self.pagination_strategy  # type: ignore[reportAssignmentType]
+
+        first_page = FetchedPage()
+        first_page_params = {**self.query_params, **strategy.first_page_params()}
+        async with aclosing(self._read_page(context, url, first_page_params, first_page)) as batches:
+            async for batch in batches:
+                yield batch
+        if not isinstance(first_page.document, dict):
+            return
+
+        async def fetch(page_params: dict[str, Any]) -> list[JSON_DATA]:
+            return await self._read_page_records(context, url, {**self.query_params, **page_params})
+
+        pages = strategy.remaining_page_params(first_page.document)
+        logging.debug("Fetching %s remaining pages of `%s` concurrently.", len(pages), url)
+
+        async with aclosing(prefetch_in_order(fetch, pages, self.concurrency_limit)) as records:
+            async for page_records in records:
+                yield page_records
+
+    async def _fetch_endpoint_pages(
+        self: Self, context: RequestContext, endpoint: str
+    ) -> AsyncIterator[list[JSON_DATA]]:
+        """Yields the records of every page of an endpoint, in page order."""
+        url = f"{self.base_url}/{endpoint}"
+        if isinstance(self.pagination_strategy, ConcurrentPaginationStrategy):
+            async with aclosing(self._fetch_pages_concurrently(context, url)) as pages:
+                async for page_records in pages:
+                    yield page_records
+            return
 
-            return results
+        # Next page URLs returned by the API already carry the query parameters of the first request.
+        next_page_url: str | None = url
+        query_params = self.query_params or None
+
+        while next_page_url:
+            page = FetchedPage()
+            async with aclosing(self._read_page(context, next_page_url, query_params, page)) as batches:
+                async for batch in batches:
+                    yield batch
+            query_params = None
+
+            # Handle Pagination
+            next_page_url = self.pagination_strategy.get_next_page(page.document, page.response)
+
+    async def _fan_out(self: Self, context: RequestContext) -> AsyncIterator[tuple[int, list[JSON_DATA]]]:
+        """Paginates the endpoints concurrently, yielding the records of each page with the index of its endpoint.
+
+        Up to `concurrency_limit` endpoints are paginated at once, and their pages are yielded as soon as
+        they arrive. The other endpoints are cancelled as soon as one of them fails.
+        """
+        endpoints = iter(enumerate(self.endpoints))
+        pages: asyncio.Queue[tuple[int, list[JSON_DATA]] | Exception | None] = asyncio.Queue(self.concurrency_limit)
+
+        async def paginate() -> None:
+            try:
+                # Workers share the iterator, each taking the next endpoint once done with the previous one.
+                for index, endpoint in endpoints:
+                    async with aclosing(self._fetch_endpoint_pages(context, endpoint)) as endpoint_pages:
+                        async for page_records in endpoint_pages:
+                            await pages.put((index, page_records))
+            except Exception as error:  # noqa: BLE001 - Raised by the consumer, which cancels the other workers.
+                await pages.put(error)
+            else:
+                await pages.put(None)
+
+        workers = [asyncio.create_task(paginate()) for _ in range(min(self.concurrency_limit, len(self.endpoints)))]
+        try:
+            running = len(workers)
+            while running:
+                item = await pages.get()
+                if item is None:
+                    running -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    def _open_context(self: Self) -> RequestContext:
+        client = ConnectionPools.get_http_client(
+            self.base_url,
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+            http2=self.http2,
+            http2_prior_knowledge=self.http2_prior_knowledge,
+        )
+        limiter = HostLimiters.get(
+            self.base_url,
+            rate_limit=self.rate_limit,
+            burst=self.rate_limit_burst,
+            # HTTP/2 multiplexes many requests over each connection.
+            max_concurrency=None if self.http2 else self.max_connections,
+            adaptive=self.adaptive_concurrency,
+        )
+        if self.cache_dir is not None:
+            self.http_cache = HttpCache.open(self.cache_dir, self.cache_max_size)
+
+        return RequestContext(client, limiter, self._build_headers(), asyncio.Semaphore(self.concurrency_limit))
+
+    async def fetch_pages(self: Self) -> AsyncIterator[list[JSON_DATA]]:
+        """Yields the records of every page as soon as it arrives.
+
+        The pages of an endpoint are yielded in page order, while the pages of multiple endpoints are
+        interleaved in their order of arrival. Only the pages in flight are held in memory, i.e. a
+        single page per endpoint for strategies following next page links and up to `concurrency_limit`
+        pages for concurrent strategies. With `incremental_json`, the records of a page are yielded
+        in batches as they are decoded.
+        """
+        context = self._open_context()
+
+        if len(self.endpoints) == 1:
+            async with aclosing(self._fetch_endpoint_pages(context, self.endpoints[0])) as pages:
+                async for page_records in pages:
+                    yield page_records
+            return
+
+        async with aclosing(self._fan_out(context)) as pages:
+            async for _, page_records in pages:
+                yield page_records
+
+    async def _collect_pages(self: Self) -> list[JSON_DATA]:
+        # The records are returned grouped by endpoint, in the order of the endpoints.
+        results: list[list[JSON_DATA]] = [[] for _ in self.endpoints]
+        async with aclosing(self._fan_out(self._open_context())) as pages:
+            async for index, page_records in pages:
+                results[index].extend(page_records)
+        return [record for endpoint_records in results for record in endpoint_records]
+
+    def __call__(self) -> Coroutine[Any, Any, list[JSON_DATA]] | AsyncIterator[list[JSON_DATA]]:
+        """Fetches data from the API endpoint asynchronously.
+
+        Returns:
+            Coroutine[Any, Any, list[JSON_DATA]] | AsyncIterator[list[JSON_DATA]]: A coroutine returning all records,
+                or an async generator yielding the records of each page if `stream_pages` is set.
+        """
+        if self.stream_pages:
+            return self.fetch_pages()
+        return self._collect_pages()
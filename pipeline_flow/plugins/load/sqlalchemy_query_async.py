@@ -2,50 +2,144 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import time
 from contextlib import asynccontextmanager
-from typing import TYPE_CHECKING, AsyncGenerator, Generator
+from functools import partial
+from itertools import chain
+from typing import TYPE_CHECKING, Any, AsyncGenerator
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
     from typing import Self
 
-    from pandas import DataFrame
+    import numpy as np
+    from sqlalchemy.engine import Dialect
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+    from sqlalchemy.sql.elements import ClauseElement
 
 # Third Party Imports
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import column, insert, text
+from sqlalchemy import table as table_clause
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 # Project Imports
+from pipeline_flow.core.connection_pools import ConnectionPools
 from pipeline_flow.plugins import ILoadPlugin
+from pipeline_flow.plugins.utils.batch_sizing import BatchSizer, is_batch_too_large
+from pipeline_flow.plugins.utils.bulk_load import (
+    LoadMode,
+    StagedLoad,
+    column_values,
+    copy_csv,
+    create_staging_table,
+    drop_table,
+    load_data_infile,
+    multi_row_insert,
+    publish_staged_table,
+    staging_table_name,
+    supports_load_mode,
+    supports_staged_load,
+    to_csv,
+)
+from pipeline_flow.plugins.utils.columnar import ColumnarTable, as_table
+
+DriverParameters = list[tuple] | list[dict[str, Any]]
+type BatchLoader = Callable[[list[str], list[np.ndarray]], Awaitable[None]]
 
 
 class AsyncSQLAlchemyQueryLoader(ILoadPlugin, plugin_name="sqlalchemy_query_loader"):
     """A plugin that loads data into a database using SQLAlchemy query asynchronously.
 
+    The data is loaded column by column: the query is compiled once for the driver, and each batch is
+    passed to the driver's `executemany` as one tuple per row, built from the column arrays without
+    materialising a dictionary per row. Drivers with named parameters still receive one dictionary
+    per row, holding only the parameters of the query.
+
+    `load_mode` selects a bulk protocol for loading the columns of `table` instead:
+
+    - `insert_many` sends multi-row `INSERT ... VALUES` statements, each holding as many rows as
+      the driver accepts parameters.
+    - `copy` streams each batch as an in-memory CSV buffer with PostgreSQL `COPY ... FROM STDIN`,
+      through asyncpg or psycopg.
+    - `load_data_infile` loads each batch as CSV with MySQL `LOAD DATA LOCAL INFILE`, which the
+      server must allow with `local_infile`.
+
+    Databases or drivers without the protocol fall back to the `executemany` of the query, or of an
+    `INSERT` into `table` generated when no query is given.
+
+    Every batch commits on its own, so a failing load leaves the batches loaded before it in `table`.
+    `staged_load` makes the load all-or-nothing instead: the batches are written concurrently, with
+    the load mode, into a staging table created next to `table`, and once all of them succeeded its
+    rows are moved into `table` in a single transaction:
+
+    - `append` inserts the rows into `table`.
+    - `replace` deletes the rows of `table` first, so that readers see either the old or the new rows.
+    - `merge` inserts the rows and updates those with the same `merge_keys` instead, which must be a
+      primary key or unique constraint of `table`. Supported by PostgreSQL, MySQL and SQLite.
+
+    The staging table is dropped whether the load succeeds or fails.
+
+    All loaders connecting to the same database share one engine and its connection pool,
+    see `ConnectionPools`.
+
     Args:
+        plugin_id (str): The unique identifier of the plugin callable.
         db_user (str):  The username for the database.
         db_password (str): The password for the database.
         db_host (str): The host for the database.
         db_port (str): PORT number for the database.
-        db_name (str): The name of the database.
-        query (str): The query to execute uses SQLAlchemy text syntax.
+        db_name (str): The name of the database, the path of the database file for SQLite.
+        query (str | None, optional): The query to execute uses SQLAlchemy text syntax, its `:name` parameters
+                                      are filled from the columns of the same name. Defaults to None, an
+                                      `INSERT` of the columns into `table`.
         concurrency_limit (int, optional): A sephomore limit on asyncio task concurrency. Defaults to 5.
         batch_size (int, optional): The batch size. Defaults to 100000.
         driver (str, optional): The database driver. Ensure that you are using asychronous driver.
                                 Defaults to "mysql+asyncmy".
+        pool_size (int | None, optional): Connections kept open in the shared pool. Defaults to None,
+                                          the SQLAlchemy default.
+        max_overflow (int | None, optional): Connections opened beyond the pool size under load.
+                                             Defaults to None, the SQLAlchemy default.
+        load_mode (str, optional): One of `query`, `insert_many`, `copy` or `load_data_infile`. Defaults to `query`.
+        table (str | None, optional): The table loaded without a query or with a bulk load mode, optionally
+                                      qualified by its schema. Defaults to None.
+        columns (list[str] | None, optional): The columns loaded into `table`. Defaults to None, all columns
+                                              of the data.
+        batch_bytes (int | None, optional): The size of a batch to aim for in bytes, sizing batches by the width
+                                            of the rows instead of `batch_size`. Defaults to None.
+        batch_latency (float | None, optional): The seconds loading a batch should take, shrinking batches sized
+                                                by `batch_bytes` that load slower. Defaults to None.
+        staged_load (str | None, optional): One of `append`, `replace` or `merge`, loading `table` through a
+                                            staging table. Not supported by streaming pipelines, which load
+                                            chunk by chunk. Defaults to None, batches loaded into `table`.
+        merge_keys (list[str] | None, optional): The columns identifying the rows updated by a `merge`.
+                                                 Defaults to None.
     """
 
     def __init__(  # noqa: PLR0913
         self: Self,
+        plugin_id: str,
         db_user: str,
         db_password: str,
         db_host: str,
         db_port: str,
         db_name: str,
-        query: str,
+        query: str | None = None,
         concurrency_limit: int = 5,
         batch_size: int = 100000,
         driver: str = "mysql+asyncmy",
+        pool_size: int | None = None,
+        max_overflow: int | None = None,
+        load_mode: str = LoadMode.QUERY,
+        table: str | None = None,
+        columns: list[str] | None = None,
+        batch_bytes: int | None = None,
+        batch_latency: float | None = None,
+        staged_load: str | None = None,
+        merge_keys: list[str] | None = None,
     ) -> None:
+        super().__init__(plugin_id)
         self.db_user = db_user
         self.db_password = db_password
 
@@ -56,21 +150,58 @@ class AsyncSQLAlchemyQueryLoader(ILoadPlugin, plugin_name="sqlalchemy_query_load
         self._query = query
         self._batch_size = batch_size
         self._driver = driver
+        self._pool_size = pool_size
+        self._max_overflow = max_overflow
+        self._load_mode = LoadMode(load_mode)
+        self._table = table
+        self._columns = columns
+        self._staged_load = StagedLoad(staged_load) if staged_load is not None else None
+        self._merge_keys = merge_keys or []
+
+        if self._load_mode is not LoadMode.QUERY and table is None:
+            error_msg = f"Load mode `{self._load_mode}` requires the `table` to load."
+            raise ValueError(error_msg)
+        if query is None and table is None:
+            raise ValueError("Either a `query` or a `table` to load must be provided.")
+        if self._staged_load is not None and (query is not None or table is None):
+            raise ValueError(
+                "Staged loads generate the `INSERT` into the staging table, provide a `table` but no `query`."
+            )
+        if self._staged_load is StagedLoad.MERGE and not self._merge_keys:
+            raise ValueError("Staged load `merge` requires the `merge_keys` identifying the rows to update.")
 
         self._semaphore = asyncio.Semaphore(concurrency_limit)
+        self._sizer = BatchSizer(plugin_id, batch_size, target_bytes=batch_bytes, target_latency=batch_latency)
 
-        self._session_maker = self._build_async_sessionmaker()
+    @property
+    def staged_load(self: Self) -> StagedLoad | None:
+        return self._staged_load
 
     def _build_connection_string(self: Self) -> str:
         """A helper method that builds the connection string for the database.
 
+        SQLite databases are files, their connection string holds only the path in `db_name`.
+
         Returns:
             str: The connection string.
         """
-        return f"{self._driver}://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
+        if self._driver.split("+")[0] == "sqlite":
+            return f"{self._driver}:///{self.db_name}"
+        url = f"{self._driver}://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
+        if self._load_mode is LoadMode.LOAD_DATA_INFILE:
+            # The MySQL drivers refuse local files unless the connection enables them.
+            url += "?local_infile=1"
+        return url
+
+    def _get_async_engine(self: Self) -> AsyncEngine:
+        return ConnectionPools.get_async_engine(
+            self._build_connection_string(), pool_size=self._pool_size, max_overflow=self._max_overflow
+        )
 
     def _build_async_sessionmaker(self: Self) -> async_sessionmaker[AsyncSession]:
-        """A helper method that builds an async session maker.
+        """A helper method that builds an async session maker bound to the shared engine of the database.
+
+        It must be called from the event loop running the load, as engines are not shared between loops.
 
         In this link you can find more information about async context managers:
             https://docs.sqlalchemy.org/en/20/orm/session_basics.html#when-do-i-make-a-sessionmaker
@@ -78,9 +209,7 @@ class AsyncSQLAlchemyQueryLoader(ILoadPlugin, plugin_name="sqlalchemy_query_load
         Returns:
             async_sessionmaker[AsyncSession]: An async session maker.
         """
-        database_url = self._build_connection_string()
-        engine = create_async_engine(database_url)
-        return async_sessionmaker(engine)
+        return async_sessionmaker(self._get_async_engine())
 
     @asynccontextmanager
     async def get_async_session(self: Self) -> AsyncGenerator[AsyncSession]:
@@ -89,7 +218,8 @@ class AsyncSQLAlchemyQueryLoader(ILoadPlugin, plugin_name="sqlalchemy_query_load
         Yields:
             Iterator[AsyncGenerator[AsyncSession, None]]: An async session.
         """
-        async with self._session_maker() as session:
+        session_maker = self._build_async_sessionmaker()
+        async with session_maker() as session:
             try:
                 yield session
             except Exception:
@@ -98,41 +228,252 @@ class AsyncSQLAlchemyQueryLoader(ILoadPlugin, plugin_name="sqlalchemy_query_load
             else:
                 await session.commit()
 
-    def chunk_dataframe(self: Self, df: DataFrame) -> Generator[list[dict]]:
-        """A generator that chunks a pandas DataFrame into smaller dataframes.
+    def _statement(self: Self, columns: list[str], table: str | None = None) -> ClauseElement:
+        if self._query is not None:
+            return text(self._query)
+
+        schema, _, name = (table or self._table).rpartition(".")  # type: ignore[reportOptionalMemberAccess]
+        return insert(table_clause(name, *(column(name) for name in columns), schema=schema or None))
 
-        The chunk size is defined by the `_batch_size` attribute of the class.
+    def compile_query(
+        self: Self, dialect: Dialect, columns: list[str] | None = None, table: str | None = None
+    ) -> tuple[str, list[str], bool]:
+        """Compiles the query, or the `INSERT` of the columns into the table, into the SQL string and
+        parameter style of the driver.
 
         Args:
-            df (pd.DataFrame): Extracted or transformed data.
+            dialect (Dialect): The dialect of the database engine.
+            columns (list[str] | None, optional): The columns inserted without a query. Defaults to None.
+            table (str | None, optional): The table inserted into without a query. Defaults to None, `table`.
 
-        Yields:
-            Generator[list[dict]]: A list of dictionaries containing the data.
+        Returns:
+            tuple[str, list[str], bool]: The SQL string, the names of its parameters, in order for
+                positional parameters, and whether the driver takes positional parameters.
+        """
+        compiled = self._statement(columns or [], table).compile(dialect=dialect)
+        if dialect.positional and compiled.positiontup is not None:
+            return compiled.string, list(compiled.positiontup), True
+        return compiled.string, list(compiled.params), False
+
+    @staticmethod
+    def batch_parameters(
+        names: list[str],
+        batch: list[np.ndarray],
+        positional: bool = True,  # noqa: FBT001, FBT002
+    ) -> DriverParameters:
+        """Converts the columns of a batch into driver parameters.
+
+        Args:
+            names (list[str]): The columns passed to the query, in the order of its parameters.
+            batch (list[np.ndarray]): The column arrays of the batch, in the order of `names`.
+            positional (bool, optional): Whether to return tuples rather than dictionaries. Defaults to True.
+
+        Returns:
+            DriverParameters: The rows of the batch as tuples, or as dictionaries of the parameters.
         """
-        for i in range(0, len(df), self._batch_size):
-            yield df.iloc[i : i + self._batch_size].to_dict("records")
+        rows = zip(*(column_values(values) for values in batch), strict=True)
+        return list(rows) if positional else [dict(zip(names, row, strict=True)) for row in rows]
 
-    async def execute_batch_query(self: Self, batch: list[dict]) -> None:
-        """Executes a batch query. As per the SQLAlchemy documentation, new AsyncSession
-        is created for each concurrent asyncio task.
+    @asynccontextmanager
+    async def _batch_connection(self: Self) -> AsyncGenerator[AsyncConnection]:
+        """Yields the connection of a new session for a batch.
+
+        As per the SQLAlchemy documentation, new AsyncSession is created for each concurrent asyncio task.
 
         Here is the link to the documentation:
             https://docs.sqlalchemy.org/en/20/orm/session_basics.html#is-the-session-thread-safe-is-asyncsession-safe-to-share-in-concurrent-tasks
+        """
+        async with self.get_async_session() as session:
+            yield await session.connection()
+
+    async def execute_batch_query(self: Self, statement: str, batch: DriverParameters) -> None:
+        """Executes a batch query with the `executemany` of the driver.
 
         Args:
-            batch (list[dict]): A batch of data from the DataFrame.
+            statement (str): The query compiled for the driver.
+            batch (DriverParameters): A batch of rows in the parameter style of the driver.
         """
-        async with self._semaphore:  # noqa: SIM117 - asyncio is exempt from this rule.
-            async with self.get_async_session() as session:
-                await session.execute(text(self._query), batch)
+        async with self._batch_connection() as connection:
+            await connection.exec_driver_sql(statement, batch)  # type: ignore[reportArgumentType]
 
-    async def __call__(self, data: DataFrame) -> None:
-        """A method that loads data into a database using SQLAlchemy using query.
+    async def query_batch(
+        self: Self,
+        statement: str,
+        positional: bool,  # noqa: FBT001
+        names: list[str],
+        batch: list[np.ndarray],
+    ) -> None:
+        """Executes the query for a batch with the `executemany` of the driver.
+
+        Args:
+            statement (str): The query compiled for the driver.
+            positional (bool): Whether the driver takes positional parameters.
+            names (list[str]): The parameters of the query, in order for positional parameters.
+            batch (list[np.ndarray]): The column arrays of the batch, in the order of `names`.
+        """
+        await self.execute_batch_query(statement, self.batch_parameters(names, batch, positional))
+
+    async def insert_many_batch(self: Self, table: str, names: list[str], batch: list[np.ndarray]) -> None:
+        """Inserts a batch with multi-row `INSERT` statements of as many rows as the driver accepts parameters.
+
+        Args:
+            table (str): The table to load, optionally qualified by its schema.
+            names (list[str]): The columns of the table to insert.
+            batch (list[np.ndarray]): The column arrays of the batch, in the order of `names`.
+        """
+        async with self._batch_connection() as connection:
+            dialect = connection.dialect
+            rows_per_statement = max(dialect.insertmanyvalues_max_parameters // len(names), 1)
+            statements: dict[int, str] = {}
+            for i in range(0, len(batch[0]), rows_per_statement):
+                columns = [column_values(values[i : i + rows_per_statement]) for values in batch]
+                rows = len(columns[0])
+                if rows not in statements:
+                    statements[rows] = multi_row_insert(dialect, table, names, rows)
+                parameters = tuple(chain.from_iterable(zip(*columns, strict=True)))
+                await connection.exec_driver_sql(statements[rows], parameters)
+
+    async def copy_batch(self: Self, table: str, names: list[str], batch: list[np.ndarray]) -> None:
+        """Streams a batch as an in-memory CSV buffer with PostgreSQL `COPY`.
 
         Args:
-            data (pd.DataFrame): Extracted or transformed data from the pipeline.
+            table (str): The table to load, optionally qualified by its schema.
+            names (list[str]): The columns of the table to load.
+            batch (list[np.ndarray]): The column arrays of the batch, in the order of `names`.
         """
+        data = to_csv(batch)
+        async with self._batch_connection() as connection:
+            await copy_csv(connection, table, names, data)
+
+    async def load_data_batch(self: Self, table: str, names: list[str], batch: list[np.ndarray]) -> None:
+        """Loads a batch as CSV with MySQL `LOAD DATA LOCAL INFILE`.
+
+        Args:
+            table (str): The table to load, optionally qualified by its schema.
+            names (list[str]): The columns of the table to load.
+            batch (list[np.ndarray]): The column arrays of the batch, in the order of `names`.
+        """
+        data = to_csv(batch)
+        async with self._batch_connection() as connection:
+            await load_data_infile(connection, table, names, data)
+
+    def resolve_load_mode(self: Self, dialect: Dialect) -> LoadMode:
+        """Return the load mode, or `query` if the database or driver do not support it."""
+        if supports_load_mode(self._load_mode, dialect):
+            return self._load_mode
+
+        logging.warning(
+            "Load mode `%s` is not supported by `%s+%s`, falling back to executemany.",
+            self._load_mode,
+            dialect.name,
+            dialect.driver,
+        )
+        return LoadMode.QUERY
+
+    @staticmethod
+    def _check_columns(table: ColumnarTable, names: list[str]) -> None:
+        missing = [name for name in dict.fromkeys(names) if name not in table.columns]
+        if missing:
+            error_msg = f"The columns {missing} are missing from the data. Available columns: {table.column_names}."
+            raise ValueError(error_msg)
+
+    async def _load_batch(self: Self, load_batch: BatchLoader, names: list[str], batch: list[np.ndarray]) -> None:
+        """Loads a batch and reports its size and duration, splitting it in halves while it is too large."""
+        rows = len(batch[0])
+        start = time.perf_counter()
+        try:
+            await load_batch(names, batch)
+        except Exception as error:
+            if rows < 2 or not is_batch_too_large(error):  # noqa: PLR2004
+                raise
+            self._sizer.on_too_large(rows)
+            half = rows // 2
+            await self._load_batch(load_batch, names, [values[:half] for values in batch])
+            await self._load_batch(load_batch, names, [values[half:] for values in batch])
+        else:
+            self._sizer.observe(rows, time.perf_counter() - start)
+
+    async def _load_batches(self: Self, table: ColumnarTable, names: list[str], load_batch: BatchLoader) -> None:
+        """Slices the table into batches as the concurrency limit allows, sized by the batch sizer."""
+        columns = [table[name] for name in names]
+        self._sizer.start([table[name] for name in dict.fromkeys(names)])
 
         async with asyncio.TaskGroup() as tg:
-            for batch in self.chunk_dataframe(data):
-                tg.create_task(self.execute_batch_query(batch))
+            offset = 0
+            while offset < table.num_rows:
+                await self._semaphore.acquire()
+                size = self._sizer.next_size()
+                task = tg.create_task(
+                    self._load_batch(load_batch, names, [values[offset : offset + size] for values in columns])
+                )
+                # Released even if the task is cancelled before it starts.
+                task.add_done_callback(lambda _: self._semaphore.release())
+                offset += size
+
+    async def _load_into(
+        self: Self, target: str | None, table: ColumnarTable, columns: list[str], load_mode: LoadMode, dialect: Dialect
+    ) -> None:
+        """Loads the columns of the data into the target table in concurrent batches, with the load mode."""
+        if load_mode is LoadMode.QUERY:
+            statement, names, positional = self.compile_query(dialect, columns, target)
+            self._check_columns(table, names)
+            await self._load_batches(table, names, partial(self.query_batch, statement, positional))
+            return
+
+        self._check_columns(table, columns)
+        load_batch = {
+            LoadMode.INSERT_MANY: self.insert_many_batch,
+            LoadMode.COPY: self.copy_batch,
+            LoadMode.LOAD_DATA_INFILE: self.load_data_batch,
+        }[load_mode]
+        await self._load_batches(table, columns, partial(load_batch, target))  # type: ignore[reportArgumentType]
+
+    async def _load_staged(self: Self, table: ColumnarTable, columns: list[str], load_mode: LoadMode) -> None:
+        """Loads the data into a staging table, then moves its rows into `table` in a single transaction."""
+        engine = self._get_async_engine()
+        dialect = engine.dialect
+        if not supports_staged_load(self._staged_load, dialect):  # type: ignore[reportArgumentType]
+            error_msg = f"Staged load `{self._staged_load}` is not supported by `{dialect.name}`."
+            raise ValueError(error_msg)
+        self._check_columns(table, columns)
+
+        staging = staging_table_name(self._table)  # type: ignore[reportArgumentType]
+        async with engine.begin() as connection:
+            await connection.exec_driver_sql(create_staging_table(dialect, self._table, staging, columns))  # type: ignore[reportArgumentType]
+        try:
+            await self._load_into(staging, table, columns, load_mode, dialect)
+            async with engine.begin() as connection:
+                for statement in publish_staged_table(
+                    dialect,
+                    self._staged_load,  # type: ignore[reportArgumentType]
+                    self._table,  # type: ignore[reportArgumentType]
+                    staging,
+                    columns,
+                    self._merge_keys,
+                ):
+                    await connection.exec_driver_sql(statement)
+        finally:
+            # Dropped outside of the publishing transaction, as MySQL commits implicitly on `DROP TABLE`.
+            async with engine.begin() as connection:
+                await connection.exec_driver_sql(drop_table(dialect, staging))
+
+    async def __call__(self, data: Any) -> None:  # noqa: ANN401
+        """A method that loads data into a database using SQLAlchemy using query.
+
+        Batches are sliced only when a slot of the concurrency limit is free, so that their size can adapt
+        to the batches loaded before them, see `BatchSizer`.
+
+        Args:
+            data (Any): Extracted or transformed data from the pipeline: a pandas DataFrame, a ColumnarTable,
+                a dict of columns or a list of row dicts.
+        """
+        table = as_table(data)
+        dialect = self._get_async_engine().dialect
+        load_mode = self.resolve_load_mode(dialect)
+        columns = self._columns or table.column_names
+
+        if self._staged_load is not None:
+            await self._load_staged(table, columns, load_mode)
+            return
+
+        await self._load_into(self._table, table, columns, load_mode, dialect)
@@ -0,0 +1,417 @@
+# Standard Imports
+from __future__ import annotations
+
+from enum import StrEnum, unique
+from typing import TYPE_CHECKING, Any, NamedTuple, Self
+
+# Third Party Imports
+import numpy as np
+
+# Local Imports
+from pipeline_flow.plugins import ITransformPlugin
+from pipeline_flow.plugins.utils.columnar import ColumnarTable, as_table, factorize, group_codes, sort_indices
+from pipeline_flow.plugins.utils.expressions import Expression
+from pipeline_flow.plugins.utils.fusion import FusibleTransform
+
+if TYPE_CHECKING:
+    from pipeline_flow.common.type_def import TransformedData, UnifiedExtractData
+    from pipeline_flow.plugins.utils.fusion import FusionPlan
+    from pipeline_flow.plugins.utils.pushdown import PushdownPlanner
+
+# Short type names accepted by `native_cast` in addition to any NumPy dtype name.
+CAST_TYPES: dict[str, type] = {
+    "str": np.str_,
+    "string": np.str_,
+    "int": np.int64,
+    "float": np.float64,
+    "bool": np.bool_,
+}
+
+
+@unique
+class AggregateFunction(StrEnum):
+    SUM = "sum"
+    MEAN = "mean"
+    MIN = "min"
+    MAX = "max"
+    COUNT = "count"
+    FIRST = "first"
+    LAST = "last"
+
+
+@unique
+class WindowFunction(StrEnum):
+    ROW_NUMBER = "row_number"
+    RANK = "rank"
+    DENSE_RANK = "dense_rank"
+    CUMSUM = "cumsum"
+    LAG = "lag"
+    LEAD = "lead"
+
+
+@unique
+class ConvertFormat(StrEnum):
+    RECORDS = "records"
+    PYDICT = "pydict"
+    PANDAS = "pandas"
+
+
+def _as_list(value: str | list[str] | None) -> list[str]:
+    if value is None:
+        return []
+    return [value] if isinstance(value, str) else list(value)
+
+
+def _descending_flags(descending: bool | list[bool], count: int) -> list[bool]:
+    if isinstance(descending, bool):
+        return [descending] * count
+    if len(descending) != count:
+        error_msg = f"Expected {count} `descending` flags, one per sort column, got {len(descending)}."
+        raise ValueError(error_msg)
+    return list(descending)
+
+
+class GroupIndex(NamedTuple):
+    """The number of rows and the first and last row of every group."""
+
+    counts: np.ndarray
+    first_rows: np.ndarray
+    last_rows: np.ndarray
+
+    @classmethod
+    def from_codes(cls, codes: np.ndarray, cardinality: int) -> GroupIndex:
+        rows = np.arange(len(codes))
+        first_rows = np.full(cardinality, len(codes), dtype=np.int64)
+        last_rows = np.zeros(cardinality, dtype=np.int64)
+        np.minimum.at(first_rows, codes, rows)
+        np.maximum.at(last_rows, codes, rows)
+        return cls(np.bincount(codes, minlength=cardinality), first_rows, last_rows)
+
+
+class NativeFilter(FusibleTransform, ITransformPlugin, plugin_name="native_filter"):
+    """Keeps the rows for which a boolean expression holds.
+
+    Args:
+        plugin_id (str): The unique identifier of the plugin callable.
+        condition (str): The boolean expression e.g. `amount > 100 and country == "PL"`.
+    """
+
+    def __init__(self: Self, plugin_id: str, condition: str) -> None:
+        super().__init__(plugin_id)
+        self.condition = Expression(condition)
+
+    def fuse_into(self: Self, plan: FusionPlan) -> None:
+        plan.filter(self.condition.evaluate(plan))
+
+    def plan_pushdown(self: Self, planner: PushdownPlanner) -> None:
+        planner.filter(self.condition)
+
+
+class NativeProject(FusibleTransform, ITransformPlugin, plugin_name="native_project"):
+    """Keeps only the given columns, in the given order.
+
+    Args:
+        plugin_id (str): The unique identifier of the plugin callable.
+        columns (list[str]): The columns to keep.
+    """
+
+    def __init__(self: Self, plugin_id: str, columns: list[str]) -> None:
+        super().__init__(plugin_id)
+        self.columns = _as_list(columns)
+
+    def fuse_into(self: Self, plan: FusionPlan) -> None:
+        plan.select(self.columns)
+
+    def plan_pushdown(self: Self, planner: PushdownPlanner) -> None:
+        planner.select(self.columns)
+
+
+class NativeRename(FusibleTransform, ITransformPlugin, plugin_name="native_rename"):
+    """Renames columns, keeping their position.
+
+    Args:
+        plugin_id (str): The unique identifier of the plugin callable.
+        columns (dict[str, str]): The current column names mapped to the new ones.
+    """
+
+    def __init__(self: Self, plugin_id: str, columns: dict[str, str]) -> None:
+        super().__init__(plugin_id)
+        self.columns = columns
+
+    def fuse_into(self: Self, plan: FusionPlan) -> None:
+        plan.rename(self.columns)
+
+    def plan_pushdown(self: Self, planner: PushdownPlanner) -> None:
+        planner.rename(self.columns)
+
+
+class NativeCast(FusibleTransform, ITransformPlugin, plugin_name="native_cast"):
+    """Converts columns to another data type.
+
+    Args:
+        plugin_id (str): The unique identifier of the plugin callable.
+        columns (dict[str, str]): Column names mapped to a type: `str`, `int`, `float`, `bool`
+            or any NumPy dtype name such as `int32` or `datetime64[s]`.
+    """
+
+    def __init__(self: Self, plugin_id: str, columns: dict[str, str]) -> None:
+        super().__init__(plugin_id)
+        self.dtypes = {name: np.dtype(CAST_TYPES.get(dtype, dtype)) for name, dtype in columns.items()}
+
+    def fuse_into(self: Self, plan: FusionPlan) -> None:
+        plan.cast(self.dtypes)
+
+    def plan_pushdown(self: Self, planner: PushdownPlanner) -> None:
+        for name in self.dtypes:
+            planner.assign(name, reads=[name])
+
+
+class NativeDerive(FusibleTransform, ITransformPlugin, plugin_name="native_derive"):
+    """Adds a column computed from an expression, or replaces it if it already exists.
+
+    Args:
+        plugin_id (str): The unique identifier of the plugin callable.
+        column (str): The name of the computed column.
+        expression (str): The expression e.g. `price * quantity`.
+    """
+
+    def __init__(self: Self, plugin_id: str, column: str, expression: str) -> None:
+        super().__init__(plugin_id)
+        self.column = column
+        self.expression = Expression(expression)
+
+    def fuse_into(self: Self, plan: FusionPlan) -> None:
+        plan.assign(self.column, self.expression.evaluate(plan))
+
+    def plan_pushdown(self: Self, planner: PushdownPlanner) -> None:
+        planner.assign(self.column, reads=self.expression.columns)
+
+
+class NativeDedupe(ITransformPlugin, plugin_name="native_dedupe"):
+    """Removes duplicated rows, keeping the original order of the remaining ones.
+
+    Args:
+        plugin_id (str): The unique identifier of the plugin callable.
+        columns (list[str] | None, optional): The columns identifying a duplicate. Defaults to all columns.
+        keep (str, optional): Whether to keep the `first` or the `last` duplicate. Defaults to "first".
+    """
+
+    def __init__(self: Self, plugin_id: str, columns: list[str] | None = None, keep: str = "first") -> None:
+        super().__init__(plugin_id)
+        if keep not in {"first", "last"}:
+            error_msg = f"Unsupported value for `keep`: {keep}. Supported values: first, last."
+            raise ValueError(error_msg)
+
+        self.columns = _as_list(columns)
+        self.keep = keep
+
+    def __call__(self: Self, data: UnifiedExtractData) -> TransformedData:
+        table = as_table(data)
+        codes, cardinality = group_codes(table, self.columns or table.column_names)
+        groups = GroupIndex.from_codes(codes, cardinality)
+
+        return table.take(np.sort(groups.first_rows if self.keep == "first" else groups.last_rows))
+
+
+class NativeGroupBy(ITransformPlugin, plugin_name="native_group_by"):
+    """Groups rows by key columns and aggregates every group into one row, sorted by the keys.
+
+    Args:
+        plugin_id (str): The unique identifier of the plugin callable.
+        keys (list[str]): The columns to group by.
+        aggregations (dict[str, dict[str, str]]): Output column names mapped to the aggregated `column`
+            and the aggregate `function`: sum, mean, min, max, count, first or last.
+    """
+
+    def __init__(self: Self, plugin_id: str, keys: list[str], aggregations: dict[str, dict[str, str]]) -> None:
+        super().__init__(plugin_id)
+        self.keys = _as_list(keys)
+        self.aggregations = {
+            output: (aggregation["column"], AggregateFunction(aggregation["function"]))
+            for output, aggregation in aggregations.items()
+        }
+
+    @staticmethod
+    def _aggregate(
+        values: np.ndarray, function: AggregateFunction, codes: np.ndarray, groups: GroupIndex
+    ) -> np.ndarray:
+        """Aggregate `values` per group with scatter kernels, in a single pass over the rows."""
+        match function:
+            case AggregateFunction.COUNT:
+                return groups.counts
+            case AggregateFunction.FIRST:
+                return values[groups.first_rows]
+            case AggregateFunction.LAST:
+                return values[groups.last_rows]
+            case AggregateFunction.SUM | AggregateFunction.MEAN if values.dtype.kind == "f":
+                totals = np.bincount(codes, weights=values, minlength=len(groups.counts))
+            case AggregateFunction.SUM | AggregateFunction.MEAN:
+                totals = np.zeros(len(groups.counts), dtype=np.result_type(values.dtype, np.int64))
+                np.add.at(totals, codes, values)
+            case AggregateFunction.MIN | AggregateFunction.MAX if values.dtype.kind in "iufb":
+                reduce = np.minimum if function == AggregateFunction.MIN else np.maximum
+                totals = values[groups.first_rows].copy()
+                reduce.at(totals, codes, values)
+                return totals
+            case AggregateFunction.MIN | AggregateFunction.MAX:
+                # Non-numeric values are reduced through their sort-order preserving codes.
+                uniques, value_codes = np.unique(values, return_inverse=True)
+                reduce = np.minimum if function == AggregateFunction.MIN else np.maximum
+                totals = value_codes[groups.first_rows].copy()
+                reduce.at(totals, codes, value_codes)
+                return uniques[totals]
+
+        return totals / groups.counts if function == AggregateFunction.MEAN else totals
+
+    def __call__(self: Self, data: UnifiedExtractData) -> TransformedData:
+        table = as_table(data)
+        codes, cardinality = group_codes(table, self.keys)
+        groups = GroupIndex.from_codes(codes, cardinality)
+
+        result = {key: table[key][groups.first_rows] for key in self.keys}
+        for output, (column, function) in self.aggregations.items():
+            result[output] = self._aggregate(table[column], function, codes, groups)
+
+        return ColumnarTable(result)
+
+
+class NativeSort(ITransformPlugin, plugin_name="native_sort"):
+    """Sorts the rows by one or more columns. The sort is stable.
+
+    Args:
+        plugin_id (str): The unique identifier of the plugin callable.
+        by (list[str]): The columns to sort by, the first one being the primary key.
+        descending (bool | list[bool], optional): The sort direction, for all columns or per column.
+            Defaults to False.
+    """
+
+    def __init__(self: Self, plugin_id: str, by: list[str], descending: bool | list[bool] = False) -> None:  # noqa: FBT002
+        super().__init__(plugin_id)
+        self.by = _as_list(by)
+        self.descending = _descending_flags(descending, len(self.by))
+
+    def __call__(self: Self, data: UnifiedExtractData) -> TransformedData:
+        table = as_table(data)
+        return table.take(sort_indices(table, self.by, self.descending))
+
+
+class NativeWindow(ITransformPlugin, plugin_name="native_window"):
+    """Adds a column computed over a window of rows, without changing the number or order of the rows.
+
+    Args:
+        plugin_id (str): The unique identifier of the plugin callable.
+        output (str): The name of the computed column.
+        function (str): row_number, rank, dense_rank, cumsum, lag or lead.
+        column (str | None, optional): The input column of `cumsum`, `lag` and `lead`. Defaults to None.
+        partition_by (list[str] | None, optional): The columns splitting the rows into windows. Defaults to None.
+        order_by (list[str] | None, optional): The columns ordering the rows of a window. Defaults to None.
+        descending (bool | list[bool], optional): The direction of `order_by`. Defaults to False.
+        offset (int, optional): How many rows `lag` and `lead` look back or ahead. Defaults to 1.
+        default (Any, optional): The `lag` and `lead` value when the offset falls outside the window.
+            Defaults to None, which is stored as NaN in numeric columns.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self: Self,
+        plugin_id: str,
+        output: str,
+        function: str,
+        column: str | None = None,
+        partition_by: list[str] | None = None,
+        order_by: list[str] | None = None,
+        descending: bool | list[bool] = False,  # noqa: FBT002
+        offset: int = 1,
+        default: Any = None,  # noqa: ANN401
+    ) -> None:
+        super().__init__(plugin_id)
+        self.output = output
+        self.function = WindowFunction(function)
+        self.column = column
+        self.partition_by = _as_list(partition_by)
+        self.order_by = _as_list(order_by)
+        self.descending = _descending_flags(descending, len(self.order_by))
+        self.offset = offset
+        self.default = default
+
+        if self.column is None and self.function in {WindowFunction.CUMSUM, WindowFunction.LAG, WindowFunction.LEAD}:
+            error_msg = f"The window function `{self.function}` requires a `column`."
+            raise ValueError(error_msg)
+
+    def _shift(self: Self, values: np.ndarray, shifted: np.ndarray, valid: np.ndarray) -> np.ndarray:
+        default = self.default
+        if default is None:
+            if values.dtype.kind in "iuf":
+                values, default = values.astype(np.float64), np.nan
+            else:
+                values = values.astype(object)
+
+        return np.where(valid, values[np.clip(shifted, 0, max(len(values) - 1, 0))], default)
+
+    def _compute(self: Self, table: ColumnarTable, order: np.ndarray, partitions: np.ndarray) -> np.ndarray:
+        """Compute the window function on rows sorted by partition and `order_by` columns."""
+        positions = np.arange(len(order))
+        is_start = np.concatenate(([True], partitions[1:] != partitions[:-1]))
+        starts = np.flatnonzero(is_start)
+        ends = np.append(starts[1:], len(order)) - 1
+        partition_index = np.cumsum(is_start) - 1
+        row_start, row_end = starts[partition_index], ends[partition_index]
+
+        match self.function:
+            case WindowFunction.ROW_NUMBER:
+                return positions - row_start + 1
+            case WindowFunction.RANK | WindowFunction.DENSE_RANK:
+                peers, _ = group_codes(table, self.order_by)
+                peers = peers[order]
+                is_new_peer = is_start | np.concatenate(([True], peers[1:] != peers[:-1]))
+                if self.function == WindowFunction.RANK:
+                    return np.maximum.accumulate(np.where(is_new_peer, positions, 0)) - row_start + 1
+                dense = np.cumsum(is_new_peer)
+                return dense - dense[row_start] + 1
+            case WindowFunction.CUMSUM:
+                values = table[self.column][order]
+                totals = np.cumsum(values)
+                return totals - totals[row_start] + values[row_start]
+            case WindowFunction.LAG:
+                shifted = positions - self.offset
+                return self._shift(table[self.column][order], shifted, shifted >= row_start)
+            case WindowFunction.LEAD:
+                shifted = positions + self.offset
+                return self._shift(table[self.column][order], shifted, shifted <= row_end)
+
+    def __call__(self: Self, data: UnifiedExtractData) -> TransformedData:
+        table = as_table(data)
+        if not table.num_rows:
+            return table.with_column(self.output, np.empty(0))
+
+        partitions, _ = group_codes(table, self.partition_by)
+        sort_keys = [(key, is_descending) for key, is_descending in zip(self.order_by, self.descending, strict=True)]
+        order_keys = [partitions, *(factorize(table[key])[0] * (-1 if desc else 1) for key, desc in sort_keys)]
+        order = np.lexsort(order_keys[::-1])
+
+        sorted_result = self._compute(table, order, partitions[order])
+        result = np.empty_like(sorted_result)
+        result[order] = sorted_result
+        return table.with_column(self.output, result)
+
+
+class NativeConvert(ITransformPlugin, plugin_name="native_convert"):
+    """Converts a ColumnarTable into the format expected by the next plugins.
+
+    Args:
+        plugin_id (str): The unique identifier of the plugin callable.
+        to (str, optional): `records` (list of dicts), `pydict` (dict of lists) or `pandas`. Defaults to "records".
+    """
+
+    def __init__(self: Self, plugin_id: str, to: str = "records") -> None:
+        super().__init__(plugin_id)
+        self.to = ConvertFormat(to)
+
+    def __call__(self: Self, data: UnifiedExtractData) -> TransformedData:
+        table = as_table(data)
+        match self.to:
+            case ConvertFormat.RECORDS:
+                return table.to_records()
+            case ConvertFormat.PYDICT:
+                return table.to_pydict()
+            case ConvertFormat.PANDAS:
+                return table.to_pandas()
@@ -0,0 +1,183 @@
+# Standard Imports
+from __future__ import annotations
+
+import logging
+import math
+from typing import TYPE_CHECKING, Any, ClassVar, Self
+
+# Third Party Imports
+# Local Imports
+from pipeline_flow.core.metrics import Metric, Metrics
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
+
+DEFAULT_MAX_ROWS = 1_000_000
+# Values sampled from each column of variable width to estimate the width of a row.
+SAMPLE_SIZE = 100
+# Bytes added to each value for delimiters, quotes and length prefixes on the wire.
+FIELD_OVERHEAD = 4
+# Weight of the latest batch in the moving average of the loading rate.
+RATE_SMOOTHING = 0.5
+
+# Messages of the errors raised when a batch is larger than the database or driver accept.
+BATCH_TOO_LARGE_MESSAGES = (
+    "max_allowed_packet",
+    "packet bigger than",
+    "too many sql variables",
+    "number of query arguments cannot exceed",
+    "number of parameters must be between",
+)
+
+
+def is_batch_too_large(error: BaseException) -> bool:
+    """Whether an error means the batch exceeded a size limit, e.g. MySQL's `max_allowed_packet`."""
+    message = str(error).lower()
+    return any(fragment in message for fragment in BATCH_TOO_LARGE_MESSAGES)
+
+
+def estimate_row_bytes(columns: Sequence[np.ndarray]) -> float:
+    """Estimate the bytes a row takes on the wire.
+
+    Fixed width columns take their item size, the others the average length of a sample of their values.
+    """
+    row_bytes = 0.0
+    for values in columns:
+        if values.dtype.kind in "biufcmM":
+            row_bytes += values.dtype.itemsize + FIELD_OVERHEAD
+            continue
+
+        sample = values[:: max(len(values) // SAMPLE_SIZE, 1)][:SAMPLE_SIZE]
+        lengths = [0 if value is None else len(str(value)) for value in sample.tolist()]
+        row_bytes += (sum(lengths) / len(lengths) if lengths else 0) + FIELD_OVERHEAD
+    return max(row_bytes, 1.0)
+
+
+class BatchSizer:
+    """Chooses the number of rows of each batch loaded by a loader, and records the sizes chosen.
+
+    Without `target_bytes`, every batch has `batch_size` rows. With it, batches start at the rows
+    fitting in `target_bytes`, estimated from the width of the rows, and adapt to the loads:
+
+    - With `target_latency`, batches shrink to the rows loaded in that many seconds at the rate
+      observed so far, and grow back at most twofold per batch, never beyond `target_bytes`.
+    - A batch rejected as too large, e.g. beyond MySQL's `max_allowed_packet`, lowers the bytes
+      allowed per batch to half of its size for the lifetime of the sizer.
+
+    Args:
+        name (str): The loader the sizes are reported for.
+        batch_size (int): The rows of each batch without `target_bytes`.
+        target_bytes (int | None, optional): The bytes of a batch to aim for. Defaults to None, fixed batches.
+        target_latency (float | None, optional): The seconds a batch should take to load. Defaults to None.
+        min_rows (int, optional): The fewest rows of an adaptive batch. Defaults to 1.
+        max_rows (int, optional): The most rows of an adaptive batch. Defaults to 1,000,000.
+    """
+
+    _sizers: ClassVar[dict[str, BatchSizer]] = {}
+
+    def __init__(  # noqa: PLR0913
+        self: Self,
+        name: str,
+        batch_size: int,
+        target_bytes: int | None = None,
+        target_latency: float | None = None,
+        min_rows: int = 1,
+        max_rows: int = DEFAULT_MAX_ROWS,
+    ) -> None:
+        if target_bytes is not None and target_bytes <= 0:
+            raise ValueError("The target size of a batch must be a positive number of bytes.")
+
+        self.name = name
+        self.batch_size = batch_size
+        self.target_bytes = target_bytes
+        self.target_latency = target_latency
+        self.min_rows = min_rows
+        self.max_rows = max_rows
+
+        self.max_bytes = target_bytes
+        self.row_bytes: float | None = None
+        self.rows_per_second: float | None = None
+        self.size = batch_size
+
+        self.batches = 0
+        self.rows = 0
+        self.min_size: int | None = None
+        self.max_size: int | None = None
+        self.too_large = 0
+
+    @property
+    def adaptive(self: Self) -> bool:
+        return self.target_bytes is not None
+
+    def _clamp(self: Self, rows: float) -> int:
+        return max(self.min_rows, min(self.max_rows, math.floor(rows)))
+
+    def _byte_limit(self: Self) -> float:
+        return self.max_bytes / self.row_bytes  # type: ignore[reportOptionalOperand]
+
+    def start(self: Self, columns: Sequence[np.ndarray]) -> None:
+        """Size the first batch of new data from the width of its rows."""
+        BatchSizer._sizers[self.name] = self
+        if not self.adaptive:
+            return
+
+        self.row_bytes = estimate_row_bytes(columns)
+        self.size = self._clamp(self._byte_limit())
+
+    def next_size(self: Self) -> int:
+        return self.size
+
+    def observe(self: Self, rows: int, seconds: float) -> None:
+        """Record a loaded batch, and adapt the next batches to the time it took."""
+        self.batches += 1
+        self.rows += rows
+        self.min_size = rows if self.min_size is None else min(self.min_size, rows)
+        self.max_size = rows if self.max_size is None else max(self.max_size, rows)
+
+        if not self.adaptive or self.target_latency is None or seconds <= 0:
+            return
+
+        rate = rows / seconds
+        if self.rows_per_second is not None:
+            rate = RATE_SMOOTHING * rate + (1 - RATE_SMOOTHING) * self.rows_per_second
+        self.rows_per_second = rate
+        self.size = self._clamp(min(rate * self.target_latency, self._byte_limit(), 2 * self.size))
+
+    def on_too_large(self: Self, rows: int) -> None:
+        """Lower the bytes allowed per batch below a batch of `rows` rows the database rejected."""
+        self.too_large += 1
+        Metrics.increment(Metric.RETRIES, plugin=self.name)
+        if self.adaptive:
+            self.max_bytes = min(self.max_bytes, math.ceil(rows * self.row_bytes / 2))  # type: ignore[reportArgumentType, reportOptionalOperand]
+        self.size = self._clamp(min(self.size, rows // 2))
+        logging.warning(
+            "Loader `%s` sent a batch of %s rows too large for the database, splitting it and batches of %s rows.",
+            self.name,
+            rows,
+            self.size,
+        )
+
+    def as_dict(self: Self) -> dict[str, Any]:
+        return {
+            "adaptive": self.adaptive,
+            "batches": self.batches,
+            "rows": self.rows,
+            "min_batch_rows": self.min_size,
+            "max_batch_rows": self.max_size,
+            "mean_batch_rows": round(self.rows / self.batches) if self.batches else None,
+            "next_batch_rows": self.size,
+            "estimated_row_bytes": round(self.row_bytes, 1) if self.row_bytes is not None else None,
+            "max_batch_bytes": self.max_bytes,
+            "too_large": self.too_large,
+        }
+
+    @classmethod
+    def metrics(cls: type[BatchSizer]) -> dict[str, dict[str, Any]]:
+        """Return the batch sizes chosen by every loader that ran since the last reset, keyed by loader."""
+        return {name: sizer.as_dict() for name, sizer in cls._sizers.items()}
+
+    @classmethod
+    def reset_metrics(cls: type[BatchSizer]) -> None:
+        cls._sizers.clear()
@@ -0,0 +1,250 @@
+# Standard Imports
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+import tempfile
+import uuid
+from enum import StrEnum, unique
+from typing import TYPE_CHECKING
+
+# Third Party Imports
+from sqlalchemy import table as table_clause
+
+# Local Imports
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
+    from sqlalchemy.engine import Dialect
+    from sqlalchemy.ext.asyncio import AsyncConnection
+
+# Placeholders of the positional parameter styles, formatted with the 1-based position of the parameter.
+# Drivers declaring `pyformat`, such as psycopg and PyMySQL, also take positional `%s` parameters.
+PLACEHOLDERS = {"qmark": "?", "format": "%s", "pyformat": "%s", "numeric": ":{}", "numeric_dollar": "${}"}
+COPY_DRIVERS = frozenset({("postgresql", "asyncpg"), ("postgresql", "psycopg")})
+LOAD_DATA_DRIVERS = frozenset(
+    {("mysql", "asyncmy"), ("mysql", "aiomysql"), ("mariadb", "asyncmy"), ("mariadb", "aiomysql")}
+)
+
+# The unquoted NULL marker of the CSV buffers, a quoted "NULL" is the string.
+CSV_NULL = "NULL"
+
+# Dialects merging with `INSERT ... ON CONFLICT`, and those with `INSERT ... ON DUPLICATE KEY UPDATE`.
+ON_CONFLICT_DIALECTS = frozenset({"postgresql", "sqlite"})
+ON_DUPLICATE_KEY_DIALECTS = frozenset({"mysql", "mariadb"})
+# Room left in identifiers, at most 63 characters in PostgreSQL, for the suffix of staging tables.
+STAGING_NAME_LENGTH = 40
+
+
+@unique
+class LoadMode(StrEnum):
+    QUERY = "query"
+    INSERT_MANY = "insert_many"
+    COPY = "copy"
+    LOAD_DATA_INFILE = "load_data_infile"
+
+
+@unique
+class StagedLoad(StrEnum):
+    APPEND = "append"
+    REPLACE = "replace"
+    MERGE = "merge"
+
+
+def supports_load_mode(mode: LoadMode, dialect: Dialect) -> bool:
+    """Whether the dialect and driver of a database support the load mode."""
+    match mode:
+        case LoadMode.QUERY:
+            return True
+        case LoadMode.INSERT_MANY:
+            return dialect.paramstyle in PLACEHOLDERS
+        case LoadMode.COPY:
+            return (dialect.name, dialect.driver) in COPY_DRIVERS
+        case LoadMode.LOAD_DATA_INFILE:
+            return (dialect.name, dialect.driver) in LOAD_DATA_DRIVERS
+
+
+def column_values(values: np.ndarray) -> list:
+    """Convert a column array into the Python values passed to the database driver.
+
+    NumPy returns datetimes of nanosecond precision as integers, they are converted with
+    microsecond precision instead, which is what Python datetimes and most databases hold.
+    """
+    if values.dtype.kind == "M":
+        values = values.astype("datetime64[us]")
+    return values.tolist()
+
+
+def quote_table(dialect: Dialect, table: str) -> str:
+    """Quote a table name, optionally qualified by its schema, for the dialect."""
+    schema, _, name = table.rpartition(".")
+    return dialect.identifier_preparer.format_table(table_clause(name, schema=schema or None))
+
+
+def quote_columns(dialect: Dialect, columns: Sequence[str]) -> str:
+    return ", ".join(dialect.identifier_preparer.quote(column) for column in columns)
+
+
+def multi_row_insert(dialect: Dialect, table: str, columns: Sequence[str], rows: int) -> str:
+    """Build an `INSERT` statement with a `VALUES` row of positional parameters for each of `rows` rows."""
+    placeholder = PLACEHOLDERS[dialect.paramstyle]
+    width = len(columns)
+    if "{}" in placeholder:
+        values = ", ".join(
+            "(" + ", ".join(placeholder.format(row * width + i + 1) for i in range(width)) + ")" for row in range(rows)
+        )
+    else:
+        values = ", ".join(["(" + ", ".join([placeholder] * width) + ")"] * rows)
+    # The table and columns are quoted identifiers, the values are parameters.
+    return f"INSERT INTO {quote_table(dialect, table)} ({quote_columns(dialect, columns)}) VALUES {values}"  # noqa: S608
+
+
+def _csv_field(value: object) -> str:
+    if value is None:
+        return CSV_NULL
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _csv_fields(values: np.ndarray) -> list[str]:
+    match values.dtype.kind:
+        case "i" | "u":
+            return list(map(str, values.tolist()))
+        case "b":
+            return ["1" if value else "0" for value in values.tolist()]
+        case "f":
+            # NaN marks missing values in pandas, and text formats have no portable NaN.
+            return [CSV_NULL if value != value else repr(value) for value in values.tolist()]  # noqa: PLR0124
+        case _:
+            return [_csv_field(value) for value in column_values(values)]
+
+
+def to_csv(columns: Sequence[np.ndarray]) -> bytes:
+    """Write columns into an in-memory CSV buffer understood by both `COPY` and `LOAD DATA`.
+
+    Values other than numbers are quoted with doubled inner quotes, and missing values are an
+    unquoted `NULL`. Booleans are written as 1 and 0.
+    """
+    buffer = io.StringIO()
+    for line in map(",".join, zip(*map(_csv_fields, columns), strict=True)):
+        buffer.write(line)
+        buffer.write("\n")
+    return buffer.getvalue().encode()
+
+
+async def copy_csv(connection: AsyncConnection, table: str, columns: Sequence[str], data: bytes) -> None:
+    """Stream a CSV buffer into a PostgreSQL table with `COPY ... FROM STDIN`, through asyncpg or psycopg."""
+    dialect = connection.dialect
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+
+    if dialect.driver == "asyncpg":
+        schema, _, name = table.rpartition(".")
+        await driver_connection.copy_to_table(  # type: ignore[reportOptionalMemberAccess]
+            name,
+            source=io.BytesIO(data),
+            columns=list(columns),
+            schema_name=schema or None,
+            format="csv",
+            null=CSV_NULL,
+        )
+        return
+
+    statement = (
+        f"COPY {quote_table(dialect, table)} ({quote_columns(dialect, columns)}) "
+        f"FROM STDIN (FORMAT csv, NULL '{CSV_NULL}')"
+    )
+    async with driver_connection.cursor() as cursor, cursor.copy(statement) as copy:  # type: ignore[reportOptionalMemberAccess]
+        await copy.write(data)
+
+
+async def load_data_infile(connection: AsyncConnection, table: str, columns: Sequence[str], data: bytes) -> None:
+    """Load a CSV buffer into a MySQL table with `LOAD DATA LOCAL INFILE`.
+
+    The MySQL drivers read local files by path only, so the buffer is written to a temporary file
+    first. The connection must allow local files, with `local_infile=1` in its URL.
+    """
+    dialect = connection.dialect
+    statement = (
+        f"LOAD DATA LOCAL INFILE %s INTO TABLE {quote_table(dialect, table)} CHARACTER SET utf8mb4 "
+        f"FIELDS TERMINATED BY ',' ENCLOSED BY '\"' ESCAPED BY '' LINES TERMINATED BY '\\n' "
+        f"({quote_columns(dialect, columns)})"
+    )
+    descriptor, path = tempfile.mkstemp(suffix=".csv")
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            await asyncio.to_thread(file.write, data)
+        await connection.exec_driver_sql(statement, (path,))
+    finally:
+        os.unlink(path)  # noqa: PTH108
+
+
+def staging_table_name(table: str) -> str:
+    """Return a unique name for a staging table of the table, in the same schema."""
+    schema, dot, name = table.rpartition(".")
+    return f"{schema}{dot}{name[:STAGING_NAME_LENGTH]}_staging_{uuid.uuid4().hex[:8]}"
+
+
+def create_staging_table(dialect: Dialect, table: str, staging: str, columns: Sequence[str]) -> str:
+    """Build the statement creating an empty staging table with the columns of the table.
+
+    The staging table has no constraints or indexes, which would slow down writing the batches,
+    and in PostgreSQL it is unlogged, as its content is lost on failure anyway.
+    """
+    unlogged = "UNLOGGED " if dialect.name == "postgresql" else ""
+    return (
+        f"CREATE {unlogged}TABLE {quote_table(dialect, staging)} AS "  # noqa: S608
+        f"SELECT {quote_columns(dialect, columns)} FROM {quote_table(dialect, table)} WHERE 1 = 0"
+    )
+
+
+def drop_table(dialect: Dialect, table: str) -> str:
+    return f"DROP TABLE IF EXISTS {quote_table(dialect, table)}"
+
+
+def supports_staged_load(staged_load: StagedLoad, dialect: Dialect) -> bool:
+    if staged_load is StagedLoad.MERGE:
+        return dialect.name in ON_CONFLICT_DIALECTS | ON_DUPLICATE_KEY_DIALECTS
+    return True
+
+
+def publish_staged_table(  # noqa: PLR0913
+    dialect: Dialect,
+    staged_load: StagedLoad,
+    table: str,
+    staging: str,
+    columns: Sequence[str],
+    merge_keys: Sequence[str] = (),
+) -> list[str]:
+    """Build the statements moving the rows of a staging table into the table, run in one transaction.
+
+    - `append` inserts the staged rows.
+    - `replace` deletes the rows of the table first, swapping its content while keeping its
+      constraints, indexes and grants.
+    - `merge` inserts the staged rows and updates the rows with the same `merge_keys` instead.
+    """
+    target, column_list = quote_table(dialect, table), quote_columns(dialect, columns)
+    insert = f"INSERT INTO {target} ({column_list}) SELECT {column_list} FROM {quote_table(dialect, staging)}"  # noqa: S608
+
+    match staged_load:
+        case StagedLoad.APPEND:
+            return [insert]
+        case StagedLoad.REPLACE:
+            return [f"DELETE FROM {target}", insert]  # noqa: S608
+
+    preparer = dialect.identifier_preparer
+    updated = [preparer.quote(column) for column in columns if column not in merge_keys]
+    if dialect.name in ON_DUPLICATE_KEY_DIALECTS:
+        # Without columns to update, a key assigned to itself keeps the existing rows.
+        assignments = [f"{column} = VALUES({column})" for column in updated] or [
+            f"{preparer.quote(merge_keys[0])} = {preparer.quote(merge_keys[0])}"
+        ]
+        return [f"{insert} ON DUPLICATE KEY UPDATE {', '.join(assignments)}"]
+
+    action = f"UPDATE SET {', '.join(f'{column} = excluded.{column}' for column in updated)}" if updated else "NOTHING"
+    # SQLite needs a WHERE clause to tell ON CONFLICT apart from a join constraint of the SELECT.
+    return [f"{insert} WHERE true ON CONFLICT ({quote_columns(dialect, merge_keys)}) DO {action}"]
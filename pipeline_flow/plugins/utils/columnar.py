@@ -0,0 +1,185 @@
+# Standard Imports
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Self
+
+# Third Party Imports
+import numpy as np
+
+# Local Imports
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pandas import DataFrame
+
+JSON_DATA = dict[str, Any]
+
+# Integer columns whose value range is at most this many times their length are factorized without sorting.
+DENSE_RANGE_FACTOR = 4
+
+
+class ColumnarTable:
+    """A table stored as one NumPy array per column, the data format of the native transform engine.
+
+    Operations on the table work on whole columns at once instead of on individual rows, and
+    return new tables that share the unchanged column arrays with the original one.
+
+    Args:
+        columns (Mapping[str, np.ndarray]): Column names mapped to arrays of equal length.
+    """
+
+    __slots__ = ("columns",)
+
+    def __init__(self: Self, columns: Mapping[str, np.ndarray]) -> None:
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            error_msg = f"All columns of a ColumnarTable must have the same length, got lengths: {lengths}."
+            raise ValueError(error_msg)
+
+        self.columns = dict(columns)
+
+    @classmethod
+    def from_pydict(cls, data: Mapping[str, Sequence | np.ndarray]) -> ColumnarTable:
+        return cls({name: np.asarray(values) for name, values in data.items()})
+
+    @classmethod
+    def from_records(cls, records: Sequence[JSON_DATA]) -> ColumnarTable:
+        """Build a table from row dictionaries. Missing keys become `None`."""
+        column_names = dict.fromkeys(key for record in records for key in record)
+        return cls({name: np.asarray([record.get(name) for record in records]) for name in column_names})
+
+    @classmethod
+    def from_dataframe(cls, df: DataFrame) -> ColumnarTable:
+        return cls({str(name): df[name].to_numpy() for name in df.columns})
+
+    @property
+    def num_rows(self: Self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    @property
+    def column_names(self: Self) -> list[str]:
+        return list(self.columns)
+
+    def __len__(self: Self) -> int:
+        return self.num_rows
+
+    def __getitem__(self: Self, name: str) -> np.ndarray:
+        try:
+            return self.columns[name]
+        except KeyError:
+            error_msg = f"Column `{name}` does not exist. Available columns: {self.column_names}."
+            raise KeyError(error_msg) from None
+
+    def __eq__(self: Self, other: object) -> bool:
+        if not isinstance(other, ColumnarTable):
+            return NotImplemented
+        return self.column_names == other.column_names and all(
+            np.array_equal(self.columns[name], other.columns[name]) for name in self.columns
+        )
+
+    __hash__ = None  # type: ignore[reportAssignmentType] - Tables are mutable containers.
+
+    def __repr__(self: Self) -> str:
+        return f"ColumnarTable(rows={self.num_rows}, columns={self.column_names})"
+
+    def select(self: Self, names: Iterable[str]) -> ColumnarTable:
+        return ColumnarTable({name: self[name] for name in names})
+
+    def with_column(self: Self, name: str, values: np.ndarray) -> ColumnarTable:
+        values = np.asarray(values)
+        if values.ndim == 0:
+            values = np.full(self.num_rows, values)
+        return ColumnarTable({**self.columns, name: values})
+
+    def take(self: Self, indices: np.ndarray) -> ColumnarTable:
+        """Return the rows at `indices`, or the rows where `indices` is True for a boolean mask."""
+        if indices.dtype == np.bool_:
+            # Resolve the mask once instead of once per column.
+            indices = np.flatnonzero(indices)
+        return ColumnarTable({name: values[indices] for name, values in self.columns.items()})
+
+    def to_pydict(self: Self) -> dict[str, list]:
+        return {name: values.tolist() for name, values in self.columns.items()}
+
+    def to_records(self: Self) -> list[JSON_DATA]:
+        names = self.column_names
+        return [
+            dict(zip(names, row, strict=True)) for row in zip(*(self.columns[n].tolist() for n in names), strict=True)
+        ]
+
+    def to_pandas(self: Self) -> DataFrame:
+        try:
+            import pandas as pd  # pandas is an optional dependency.
+        except ImportError as error:
+            raise ImportError("Converting a ColumnarTable to a DataFrame requires `pandas` to be installed.") from error
+
+        return pd.DataFrame(self.columns)
+
+
+def as_table(data: Any) -> ColumnarTable:  # noqa: ANN401
+    """Convert extracted or transformed data into a ColumnarTable.
+
+    Supports ColumnarTables, dicts of columns, lists of row dicts and pandas DataFrames.
+    """
+    if isinstance(data, ColumnarTable):
+        return data
+    if isinstance(data, Mapping):
+        return ColumnarTable.from_pydict(data)
+    if isinstance(data, Sequence) and not isinstance(data, str | bytes):
+        return ColumnarTable.from_records(data)
+    if hasattr(data, "columns") and hasattr(data, "to_numpy"):
+        return ColumnarTable.from_dataframe(data)
+
+    error_msg = f"Unsupported data type for the native transform engine: {type(data).__name__}."
+    raise TypeError(error_msg)
+
+
+def factorize(values: np.ndarray) -> tuple[np.ndarray, int]:
+    """Encode values as integer codes that preserve their sort order, and return the number of distinct values."""
+    values = np.asarray(values)
+
+    # Integers spanning a dense range are encoded in linear time instead of sorting them.
+    if values.dtype.kind in "iu" and len(values):
+        low, high = values.min(), values.max()
+        span = int(high) - int(low) + 1
+        if span <= DENSE_RANGE_FACTOR * len(values):
+            offsets = (values - low).astype(np.int64, copy=False)
+            present = np.bincount(offsets, minlength=span) > 0
+            lookup = np.cumsum(present) - 1
+            return lookup[offsets], int(lookup[-1]) + 1
+
+    uniques, codes = np.unique(values, return_inverse=True)
+    return codes.reshape(-1).astype(np.int64, copy=False), len(uniques)
+
+
+def group_codes(table: ColumnarTable, keys: Sequence[str]) -> tuple[np.ndarray, int]:
+    """Assign each row an integer group ID following the sort order of the key columns."""
+    if not keys:
+        return np.zeros(table.num_rows, dtype=np.int64), 1 if table.num_rows else 0
+
+    combined, cardinality = factorize(table[keys[0]])
+    if len(keys) == 1:
+        return combined, cardinality
+
+    for key in keys[1:]:
+        codes, key_cardinality = factorize(table[key])
+        if cardinality * key_cardinality >= np.iinfo(np.int64).max:
+            # Renumber the groups found so far to keep the mixed-radix key within int64.
+            combined, cardinality = factorize(combined)
+        combined = combined * key_cardinality + codes
+        cardinality *= key_cardinality
+
+    return factorize(combined)
+
+
+def sort_indices(table: ColumnarTable, keys: Sequence[str], descending: Sequence[bool]) -> np.ndarray:
+    """Return the stable row order sorting the table by `keys`."""
+    sort_keys = []
+    for key, is_descending in zip(keys, descending, strict=True):
+        codes, _ = factorize(table[key])
+        sort_keys.append(-codes if is_descending else codes)
+
+    # np.lexsort sorts by the last key first.
+    return np.lexsort(sort_keys[::-1]) if sort_keys else np.arange(table.num_rows)
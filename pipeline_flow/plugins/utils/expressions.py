@@ -0,0 +1,170 @@
+# Standard Imports
+from __future__ import annotations
+
+import ast
+import functools
+import operator
+from typing import TYPE_CHECKING, Any, Protocol, Self
+
+# Third Party Imports
+import numpy as np
+
+# Local Imports
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class ColumnSource(Protocol):
+    """Anything that returns a column by name, e.g. a ColumnarTable."""
+
+    def __getitem__(self: Self, name: str) -> np.ndarray: ...
+
+
+def _as_strings(values: np.ndarray) -> np.ndarray:
+    values = np.asarray(values)
+    return values if values.dtype.kind == "U" else values.astype(np.str_)
+
+
+def is_null(values: np.ndarray) -> np.ndarray:
+    values = np.asarray(values)
+    if values.dtype.kind in "fc":
+        return np.isnan(values)
+    if values.dtype.kind in "mM":
+        return np.isnat(values)
+    if values.dtype == object:
+        return np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+    return np.zeros(values.shape, dtype=bool)
+
+
+FUNCTIONS: dict[str, Callable[..., Any]] = {
+    "abs": np.abs,
+    "sqrt": np.sqrt,
+    "log": np.log,
+    "exp": np.exp,
+    "floor": np.floor,
+    "ceil": np.ceil,
+    "round": np.round,
+    "where": np.where,
+    "isnull": is_null,
+    "notnull": lambda values: ~is_null(values),
+    "lower": lambda values: np.strings.lower(_as_strings(values)),
+    "upper": lambda values: np.strings.upper(_as_strings(values)),
+    "length": lambda values: np.strings.str_len(_as_strings(values)),
+}
+
+BINARY_OPERATORS: dict[type[ast.operator], Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+    ast.BitAnd: operator.and_,
+    ast.BitOr: operator.or_,
+}
+
+UNARY_OPERATORS: dict[type[ast.unaryop], Callable[[Any], Any]] = {
+    ast.Not: np.logical_not,
+    ast.Invert: np.invert,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+COMPARISON_OPERATORS: dict[type[ast.cmpop], Callable[[Any, Any], Any]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.In: np.isin,
+    ast.NotIn: lambda values, options: ~np.isin(values, options),
+}
+
+
+class Expression:
+    """A column expression written in a restricted subset of Python syntax.
+
+    Expressions are evaluated on whole columns of a ColumnarTable at once. Bare names refer to
+    columns, `col("name")` refers to columns whose names are not valid identifiers, and only
+    literals, arithmetic, comparisons, `and`/`or`/`not`, `in` and the functions listed in
+    `FUNCTIONS` are allowed, e.g. `amount * 1.23` or `country in ("PL", "DE") and not isnull(email)`.
+
+    Args:
+        source (str): The expression source code.
+    """
+
+    def __init__(self: Self, source: str) -> None:
+        self.source = source
+
+        try:
+            self.tree = ast.parse(source.strip(), mode="eval").body
+        except SyntaxError as error:
+            error_msg = f"Invalid expression `{source}`: {error.msg}."
+            raise ValueError(error_msg) from error
+
+        self.columns = frozenset(self._validate(self.tree))
+
+    def __repr__(self: Self) -> str:
+        return f"Expression({self.source!r})"
+
+    def _validate(self: Self, node: ast.AST) -> set[str]:  # noqa: PLR0911 - One branch per supported syntax node.
+        """Reject unsupported syntax and return the names of the referenced columns."""
+        match node:
+            case ast.Constant():
+                return set()
+            case ast.Name(id=name):
+                return {name}
+            case ast.Call(func=ast.Name(id="col"), args=[ast.Constant(value=str(name))], keywords=[]):
+                return {name}
+            case ast.Call(func=ast.Name(id=name), args=args, keywords=[]) if name in FUNCTIONS:
+                return set().union(*(self._validate(arg) for arg in args))
+            case ast.List(elts=elements) | ast.Tuple(elts=elements):
+                return set().union(*(self._validate(element) for element in elements))
+            case ast.BoolOp(values=values):
+                return set().union(*(self._validate(value) for value in values))
+            case ast.UnaryOp(op=op, operand=operand) if type(op) in UNARY_OPERATORS:
+                return self._validate(operand)
+            case ast.BinOp(left=left, op=op, right=right) if type(op) in BINARY_OPERATORS:
+                return self._validate(left) | self._validate(right)
+            case ast.Compare(left=left, ops=ops, comparators=comparators) if all(
+                type(op) in COMPARISON_OPERATORS for op in ops
+            ):
+                return set().union(self._validate(left), *(self._validate(item) for item in comparators))
+
+        error_msg = f"Unsupported syntax `{ast.unparse(node)}` in expression `{self.source}`."
+        raise ValueError(error_msg)
+
+    def evaluate(self: Self, table: ColumnSource) -> Any:  # noqa: ANN401
+        """Evaluate the expression, returning an array with one value per row or a scalar."""
+        return self._evaluate(self.tree, table)
+
+    def _evaluate(self: Self, node: ast.AST, table: ColumnSource) -> Any:  # noqa: ANN401, PLR0911
+        match node:
+            case ast.Constant(value=value):
+                return value
+            case ast.Name(id=name) | ast.Call(func=ast.Name(id="col"), args=[ast.Constant(value=name)]):
+                return table[name]
+            case ast.Call(func=ast.Name(id=name), args=args):
+                return FUNCTIONS[name](*(self._evaluate(arg, table) for arg in args))
+            case ast.List(elts=elements) | ast.Tuple(elts=elements):
+                return [self._evaluate(element, table) for element in elements]
+            case ast.BoolOp(op=op, values=values):
+                combine = np.logical_and if isinstance(op, ast.And) else np.logical_or
+                return functools.reduce(combine, (self._evaluate(value, table) for value in values))
+            case ast.UnaryOp(op=op, operand=operand):
+                return UNARY_OPERATORS[type(op)](self._evaluate(operand, table))
+            case ast.BinOp(left=left, op=op, right=right):
+                return BINARY_OPERATORS[type(op)](self._evaluate(left, table), self._evaluate(right, table))
+            case ast.Compare(left=left, ops=ops, comparators=comparators):
+                # Chained comparisons such as `0 < amount <= 100` are combined with a logical and.
+                operands = [self._evaluate(left, table), *(self._evaluate(item, table) for item in comparators)]
+                results = (
+                    COMPARISON_OPERATORS[type(op)](operands[index], operands[index + 1]) for index, op in enumerate(ops)
+                )
+                return functools.reduce(np.logical_and, results)
+
+        error_msg = f"Unsupported syntax `{ast.unparse(node)}` in expression `{self.source}`."
+        raise ValueError(error_msg)
@@ -0,0 +1,179 @@
+# Standard Imports
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Self
+
+# Third Party Imports
+import numpy as np
+
+# Local Imports
+from pipeline_flow.plugins import ITransformPlugin
+from pipeline_flow.plugins.utils.columnar import ColumnarTable, as_table
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from pipeline_flow.common.type_def import TransformedData, UnifiedExtractData
+    from pipeline_flow.plugins.utils.pushdown import PushdownPlanner
+
+
+class FusionPlan:
+    """Applies a chain of fusible transforms to a table in a single pass.
+
+    Columns are materialised late: filters only narrow the selected row indices of the input
+    table, and a column is gathered for the selected rows when an expression reads it or when
+    the plan is materialised. Columns dropped by a projection are never copied at all.
+
+    Args:
+        table (ColumnarTable): The input table.
+    """
+
+    def __init__(self: Self, table: ColumnarTable) -> None:
+        self.table = table
+        self.rows: np.ndarray | None = None
+        # Output column names mapped to an input column name, or to values already at the selected rows.
+        self.sources: dict[str, str | np.ndarray] = {name: name for name in table.columns}
+
+    @property
+    def num_rows(self: Self) -> int:
+        return self.table.num_rows if self.rows is None else len(self.rows)
+
+    @property
+    def column_names(self: Self) -> list[str]:
+        return list(self.sources)
+
+    def __getitem__(self: Self, name: str) -> np.ndarray:
+        return self.column(name)
+
+    def column(self: Self, name: str) -> np.ndarray:
+        try:
+            source = self.sources[name]
+        except KeyError:
+            error_msg = f"Column `{name}` does not exist. Available columns: {self.column_names}."
+            raise KeyError(error_msg) from None
+
+        if isinstance(source, str):
+            values = self.table[source]
+            source = values if self.rows is None else values[self.rows]
+            self.sources[name] = source
+
+        return source
+
+    def filter(self: Self, mask: np.ndarray) -> None:
+        positions = np.flatnonzero(np.broadcast_to(np.asarray(mask, dtype=bool), (self.num_rows,)))
+        self.rows = positions if self.rows is None else self.rows[positions]
+        self.sources = {
+            name: source if isinstance(source, str) else source[positions] for name, source in self.sources.items()
+        }
+
+    def select(self: Self, names: Iterable[str]) -> None:
+        names = list(names)
+        missing_columns = [name for name in names if name not in self.sources]
+        if missing_columns:
+            error_msg = f"Columns do not exist: {missing_columns}. Available columns: {self.column_names}."
+            raise KeyError(error_msg)
+
+        self.sources = {name: self.sources[name] for name in names}
+
+    def rename(self: Self, columns: Mapping[str, str]) -> None:
+        missing_columns = [name for name in columns if name not in self.sources]
+        if missing_columns:
+            error_msg = f"Cannot rename columns that do not exist: {missing_columns}."
+            raise KeyError(error_msg)
+
+        self.sources = {columns.get(name, name): source for name, source in self.sources.items()}
+
+    def cast(self: Self, dtypes: Mapping[str, np.dtype]) -> None:
+        missing_columns = [name for name in dtypes if name not in self.sources]
+        if missing_columns:
+            error_msg = f"Cannot cast columns that do not exist: {missing_columns}."
+            raise KeyError(error_msg)
+
+        for name, dtype in dtypes.items():
+            self.assign(name, self.column(name).astype(dtype))
+
+    def assign(self: Self, name: str, values: np.ndarray) -> None:
+        values = np.asarray(values)
+        self.sources[name] = np.full(self.num_rows, values) if values.ndim == 0 else values
+
+    def materialize(self: Self) -> ColumnarTable:
+        return ColumnarTable({name: self.column(name) for name in list(self.sources)})
+
+
+class FusibleTransform(ABC):
+    """A row-wise transform that can be fused with its neighbours into a single pass over the data.
+
+    Consecutive fusible steps of a transform phase are replaced by a FusedTransform, so that
+    intermediate tables are not materialised between them. Lazy pipelines also push their
+    filters and projections down into the extractor.
+    """
+
+    @abstractmethod
+    def fuse_into(self: Self, plan: FusionPlan) -> None:
+        """Apply the transform to the plan."""
+        raise NotImplementedError("Fusible transforms must implement fuse_into()")
+
+    @abstractmethod
+    def plan_pushdown(self: Self, planner: PushdownPlanner) -> None:
+        """Report the columns the transform reads and writes, and the rows it keeps."""
+        raise NotImplementedError("Fusible transforms must implement plan_pushdown()")
+
+    def __call__(self: Self, data: UnifiedExtractData) -> TransformedData:
+        plan = FusionPlan(as_table(data))
+        self.fuse_into(plan)
+        return plan.materialize()
+
+
+class FusedTransform(ITransformPlugin, interface=True):
+    """Runs a chain of fusible transforms as a single step.
+
+    It is created by the executor rather than configured by users, hence it is not registered.
+
+    Args:
+        steps (list[ITransformPlugin]): The fusible transforms, in execution order.
+    """
+
+    def __init__(self: Self, steps: list[ITransformPlugin]) -> None:
+        super().__init__(plugin_id=f"fused[{' -> '.join(step.id for step in steps)}]")
+        self.steps = steps
+
+    def __call__(self: Self, data: UnifiedExtractData) -> TransformedData:
+        plan = FusionPlan(as_table(data))
+        for step in self.steps:
+            step.fuse_into(plan)  # type: ignore[reportAttributeAccessIssue] - Steps are FusibleTransforms.
+        return plan.materialize()
+
+
+def fuse_transform_steps(steps: list[ITransformPlugin]) -> list[ITransformPlugin]:
+    """Replace every run of two or more consecutive fusible transforms by a FusedTransform."""
+    fused_steps: list[ITransformPlugin] = []
+    run: list[ITransformPlugin] = []
+
+    for step in [*steps, None]:
+        if isinstance(step, FusibleTransform):
+            run.append(step)
+            continue
+
+        if len(run) > 1:
+            fused_steps.append(FusedTransform(run))
+        else:
+            fused_steps.extend(run)
+        run = []
+
+        if step is not None:
+            fused_steps.append(step)
+
+    return fused_steps
+
+
+def explain_transform_steps(steps: list[ITransformPlugin]) -> str:
+    """Describe how the transform steps are executed after fusion."""
+    lines = ["Transform plan:"]
+    for position, step in enumerate(fuse_transform_steps(steps), start=1):
+        if isinstance(step, FusedTransform):
+            lines.append(f"  {position}. fused pass over {len(step.steps)} steps:")
+            lines.extend(f"       - {inner.id} ({type(inner).__name__})" for inner in step.steps)
+        else:
+            lines.append(f"  {position}. {step.id} ({type(step).__name__})")
+    return "\n".join(lines)
@@ -0,0 +1,258 @@
+# Standard Imports
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import uuid
+from collections import OrderedDict
+from contextlib import suppress
+from http import HTTPStatus
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar, Self
+
+# Third Party Imports
+import aiofiles
+import aiofiles.os
+import httpx
+
+# Local Imports
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from aiofiles.threadpool.binary import AsyncBufferedIOBase, AsyncBufferedReader
+
+DEFAULT_MAX_SIZE = 256 * 2**20
+CHUNK_SIZE = 64 * 2**10
+
+# Headers describing the connection or the transfer rather than the cached representation.
+_UNCACHED_HEADERS = frozenset({"connection", "keep-alive", "transfer-encoding", "content-length", "set-cookie"})
+_ENTRY_SUFFIX = ".cache"
+
+_utime = aiofiles.os.wrap(os.utime)
+
+
+async def _unlink(path: Path) -> None:
+    with suppress(FileNotFoundError):
+        await aiofiles.os.unlink(path)
+
+
+class CacheEntry:
+    """The validators and headers of a cached response, whose raw body follows them in the entry file."""
+
+    __slots__ = ("etag", "headers", "key", "last_modified", "path")
+
+    def __init__(self: Self, key: str, path: Path, headers: list[tuple[str, str]]) -> None:
+        self.key = key
+        self.path = path
+        self.headers = headers
+        self.etag = next((value for name, value in headers if name.lower() == "etag"), None)
+        self.last_modified = next((value for name, value in headers if name.lower() == "last-modified"), None)
+
+    def conditional_headers(self: Self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class _CachedBodyStream(httpx.AsyncByteStream):
+    """Streams the body of a cache entry from disk in chunks."""
+
+    def __init__(self: Self, file: AsyncBufferedReader) -> None:
+        self.file = file
+
+    async def __aiter__(self: Self) -> AsyncIterator[bytes]:
+        while chunk := await self.file.read(CHUNK_SIZE):
+            yield chunk
+
+    async def aclose(self: Self) -> None:
+        await self.file.close()
+
+
+class _CachingStream(httpx.AsyncByteStream):
+    """Writes the raw body of a response to a new cache entry while it is read, committing it once read whole."""
+
+    def __init__(self: Self, stream: httpx.AsyncByteStream, cache: HttpCache, entry: CacheEntry) -> None:
+        self.stream = stream
+        self.cache = cache
+        self.entry = entry
+        self.size = 0
+        self.temp_path: Path | None = entry.path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        self.file: AsyncBufferedIOBase | None = None
+
+    async def _discard(self: Self) -> None:
+        if self.file is not None:
+            await self.file.close()
+            self.file = None
+        if self.temp_path is not None:
+            await _unlink(self.temp_path)
+            self.temp_path = None
+
+    async def __aiter__(self: Self) -> AsyncIterator[bytes]:
+        if self.temp_path is not None:
+            self.file = await aiofiles.open(self.temp_path, "wb")
+            await self.file.write(json.dumps(self.entry.headers).encode() + b"\n")
+
+        async for chunk in self.stream:
+            if self.file is not None:
+                self.size += len(chunk)
+                if self.size > self.cache.max_size:
+                    # Too large to ever fit in the cache.
+                    await self._discard()
+                else:
+                    await self.file.write(chunk)
+            yield chunk
+
+        if self.file is not None and self.temp_path is not None:
+            await self.file.close()
+            self.file = None
+            size = (await aiofiles.os.stat(self.temp_path)).st_size
+            await aiofiles.os.replace(self.temp_path, self.entry.path)
+            self.temp_path = None
+            await self.cache.add(self.entry, size)
+
+    async def aclose(self: Self) -> None:
+        # A body not read whole is not cached.
+        await self._discard()
+        await self.stream.aclose()
+
+
+class HttpCache:
+    """An on-disk cache of GET responses revalidated with conditional requests.
+
+    Responses carrying an `ETag` or `Last-Modified` validator are stored with their raw body,
+    keyed by the URL and the request headers. Later requests for the same key send the
+    validators as `If-None-Match` and `If-Modified-Since`, and a `304 Not Modified` answer is
+    served from the cache without transferring the body again. The least recently used entries
+    are evicted once the cache exceeds `max_size` bytes; recency survives restarts as the
+    modification time of the entry files.
+
+    Args:
+        directory (str | Path): The directory holding the cache entries, created if missing.
+        max_size (int, optional): The maximum size of the cache in bytes. Defaults to 256 MiB.
+    """
+
+    _caches: ClassVar[dict[Path, HttpCache]] = {}
+
+    def __init__(self: Self, directory: str | Path, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Entries left incomplete by an interrupted run.
+        for path in self.directory.glob("*.tmp"):
+            path.unlink(missing_ok=True)
+
+        self._sizes: OrderedDict[str, int] = OrderedDict()
+        entries = sorted(
+            (path.stat().st_mtime, path.stem, path.stat().st_size) for path in self.directory.glob(f"*{_ENTRY_SUFFIX}")
+        )
+        for _, key, size in entries:
+            self._sizes[key] = size
+        self.size = sum(self._sizes.values())
+        for path in self._evict():
+            path.unlink(missing_ok=True)
+
+    @classmethod
+    def open(cls: type[HttpCache], directory: str | Path, max_size: int = DEFAULT_MAX_SIZE) -> HttpCache:
+        """Return the cache of the directory, shared by every extractor using it in this process."""
+        path = Path(directory).resolve()
+        cache = cls._caches.get(path)
+        if cache is None:
+            cache = cls._caches[path] = cls(path, max_size)
+        elif cache.max_size != max_size:
+            logging.warning(
+                "HTTP cache `%s` already exists with size %s, ignoring size %s.", path, cache.max_size, max_size
+            )
+        return cache
+
+    @staticmethod
+    def key(request: httpx.Request, headers: dict[str, str] | None = None) -> str:
+        """Identifies a response by the method and URL of its request and the headers set by the caller."""
+        identity = [
+            request.method,
+            str(request.url),
+            sorted((name.lower(), value) for name, value in (headers or {}).items()),
+        ]
+        return hashlib.sha256(json.dumps(identity).encode()).hexdigest()
+
+    def _path(self: Self, key: str) -> Path:
+        return self.directory / f"{key}{_ENTRY_SUFFIX}"
+
+    async def lookup(self: Self, key: str) -> CacheEntry | None:
+        """Return the cached entry of the key, without its body."""
+        if key not in self._sizes:
+            return None
+
+        path = self._path(key)
+        try:
+            async with aiofiles.open(path, "rb") as file:
+                headers = [tuple(header) for header in json.loads(await file.readline())]
+        except (OSError, ValueError):
+            self._forget(key)
+            return None
+        return CacheEntry(key, path, headers)  # type: ignore[reportArgumentType]
+
+    async def replay(self: Self, entry: CacheEntry, request: httpx.Request) -> httpx.Response | None:
+        """Return the cached response of an entry confirmed by a `304 Not Modified`, or None if it was evicted."""
+        try:
+            file = await aiofiles.open(entry.path, "rb")
+        except OSError:
+            self._forget(entry.key)
+            return None
+
+        await file.readline()
+        await self._touch(entry.key)
+        logging.debug("Serving `%s` from the HTTP cache.", request.url)
+        return httpx.Response(HTTPStatus.OK, headers=entry.headers, stream=_CachedBodyStream(file), request=request)
+
+    def store(self: Self, key: str, response: httpx.Response) -> httpx.Response:
+        """Cache the body of a response with validators as it is read, the response must not have been read yet."""
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        if (
+            response.request.method != "GET"
+            or response.status_code != HTTPStatus.OK
+            or "no-store" in cache_control
+            or not ("ETag" in response.headers or "Last-Modified" in response.headers)
+        ):
+            return response
+
+        headers = [
+            (name, value) for name, value in response.headers.multi_items() if name.lower() not in _UNCACHED_HEADERS
+        ]
+        entry = CacheEntry(key, self._path(key), headers)
+        response.stream = _CachingStream(response.stream, self, entry)  # type: ignore[reportAttributeAccessIssue]
+        return response
+
+    async def add(self: Self, entry: CacheEntry, size: int) -> None:
+        self.size += size - self._sizes.pop(entry.key, 0)
+        self._sizes[entry.key] = size
+        for path in self._evict():
+            await _unlink(path)
+
+    async def _touch(self: Self, key: str) -> None:
+        if key not in self._sizes:
+            return
+
+        self._sizes.move_to_end(key)
+        try:
+            await _utime(self._path(key))
+        except OSError:
+            self._forget(key)
+
+    def _forget(self: Self, key: str) -> None:
+        self.size -= self._sizes.pop(key, 0)
+
+    def _evict(self: Self) -> list[Path]:
+        """Forget the least recently used entries until the cache fits, returning the files to delete."""
+        evicted = []
+        while self.size > self.max_size and self._sizes:
+            key, size = self._sizes.popitem(last=False)
+            self.size -= size
+            evicted.append(self._path(key))
+            logging.debug("Evicted `%s` from the HTTP cache.", key)
+        return evicted
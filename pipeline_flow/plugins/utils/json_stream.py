@@ -0,0 +1,187 @@
+# Standard Imports
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any, Self
+
+# Third Party Imports
+
+# Local Imports
+
+JSON_DATA = dict[str, Any]
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*")
+_INCOMPLETE = object()
+
+
+class IncrementalJsonParser:
+    """Decodes a JSON document fed in chunks, emitting the records of its records array as soon as they are complete.
+
+    The document is either an array of records, or an object whose `records_key` member is the
+    array of records. The other members of the object, e.g. the pagination metadata, are kept
+    in `document`. An object without the records member is emitted as a single record, once
+    complete. Only the records of the current chunk and the undecoded tail of the input are held
+    in memory, never the whole body nor its full object tree.
+
+    Args:
+        records_key (str, optional): The member of the top-level object holding the records. Defaults to "data".
+    """
+
+    def __init__(self: Self, records_key: str = "data") -> None:
+        self.records_key = records_key
+
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        # Decoding an incomplete value is only retried once the undecoded input has doubled,
+        # which keeps the work linear for values spanning many chunks.
+        self._retry_at = 0
+
+        self._state = "root"
+        self._in_object = False
+        self._has_records = False
+        self._key: str | None = None
+        self._members: JSON_DATA = {}
+        self._root: Any = None
+
+    @property
+    def document(self: Self) -> JSON_DATA | list | Any:  # noqa: ANN401
+        """The decoded document without its records, i.e. the other members of the object or an empty array."""
+        if self._in_object:
+            return self._members
+        return [] if self._has_records else self._root
+
+    def feed(self: Self, chunk: bytes) -> list[JSON_DATA]:
+        """Decode the next chunk of the body and return the records completed by it."""
+        self._buffer += self._text_decoder.decode(chunk)
+        return self._parse(final=False)
+
+    def close(self: Self) -> list[JSON_DATA]:
+        """Decode the end of the body and return the last records.
+
+        Raises:
+            json.JSONDecodeError: If the document is invalid or incomplete.
+        """
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        records = self._parse(final=True)
+
+        if self._state != "end":
+            raise json.JSONDecodeError("Unexpected end of JSON document", self._buffer, self._position)
+
+        if self._in_object and not self._has_records:
+            records.append(self._members)
+        return records
+
+    def _error(self: Self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._position)
+
+    def _decode(self: Self, final: bool) -> Any:  # noqa: ANN401, FBT001
+        if not final and len(self._buffer) < self._retry_at:
+            return _INCOMPLETE
+
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._position)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            self._retry_at = len(self._buffer) + (len(self._buffer) - self._position)
+            return _INCOMPLETE
+
+        # A number followed only by number characters, e.g. `12.` or `1e`, may continue in the next chunk.
+        if (
+            not final
+            and isinstance(value, int | float)
+            and not isinstance(value, bool)
+            and _NUMBER_TAIL.match(self._buffer, end).end() == len(self._buffer)  # type: ignore[reportOptionalMemberAccess]
+        ):
+            return _INCOMPLETE
+
+        self._position = end
+        self._retry_at = 0
+        return value
+
+    def _expect(self: Self, char: str, expected: str, next_state: str) -> None:
+        if char != expected:
+            message = f"Expecting '{expected}' delimiter"
+            raise self._error(message)
+        self._position += 1
+        self._state = next_state
+
+    def _parse(self: Self, final: bool) -> list[JSON_DATA]:  # noqa: C901, FBT001, PLR0912, PLR0915
+        records: list[JSON_DATA] = []
+
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()  # type: ignore[reportOptionalMemberAccess]
+            if self._position == len(self._buffer):
+                break
+
+            char = self._buffer[self._position]
+            match self._state:
+                case "root" if char == "{":
+                    self._in_object = True
+                    self._position += 1
+                    self._state = "first_key"
+                case "root" if char == "[":
+                    self._has_records = True
+                    self._position += 1
+                    self._state = "first_element"
+                case "root":
+                    if (value := self._decode(final)) is _INCOMPLETE:
+                        break
+                    self._root = value
+                    self._state = "end"
+
+                case "first_key" | "next_key" if char == "}":
+                    self._position += 1
+                    self._state = "end"
+                case "next_key":
+                    self._expect(char, ",", "key")
+                case "first_key" | "key":
+                    if (key := self._decode(final)) is _INCOMPLETE:
+                        break
+                    if not isinstance(key, str):
+                        raise self._error("Expecting property name enclosed in double quotes")
+                    self._key = key
+                    self._state = "colon"
+                case "colon":
+                    self._expect(char, ":", "member")
+                case "member" if self._key == self.records_key and char == "[":
+                    self._has_records = True
+                    self._position += 1
+                    self._state = "first_element"
+                case "member":
+                    if (value := self._decode(final)) is _INCOMPLETE:
+                        break
+                    if self._key == self.records_key:
+                        # A single record instead of an array of records.
+                        self._has_records = True
+                        records.extend([value] if isinstance(value, dict) else [])
+                    else:
+                        self._members[self._key] = value  # type: ignore[reportArgumentType]
+                    self._state = "next_key"
+
+                case "first_element" | "next_element" if char == "]":
+                    self._position += 1
+                    self._state = "next_key" if self._in_object else "end"
+                case "next_element":
+                    self._expect(char, ",", "element")
+                case "first_element" | "element":
+                    if (value := self._decode(final)) is _INCOMPLETE:
+                        break
+                    records.append(value)
+                    self._state = "next_element"
+
+                case _:
+                    raise self._error("Extra data")
+
+        # Drop the decoded input, keeping only the incomplete tail.
+        if self._position:
+            self._retry_at = max(self._retry_at - self._position, 0)
+            self._buffer = self._buffer[self._position :]
+            self._position = 0
+
+        return records
@@ -1,9 +1,14 @@
 # Standard Imports
+import asyncio
+import math
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 from enum import StrEnum
 from typing import Any
 
 # Third Party Imports
+import httpx
 
 # Local Imports
 
@@ -11,11 +16,29 @@ from typing import Any
 JSON_DATA = dict[str, Any]
 
 
+def _lookup(response: dict, key: str) -> Any:  # noqa: ANN401
+    """Returns the value of a dotted key, e.g. `meta.total`, or None if it is missing."""
+    value: Any = response
+    for part in key.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
 class PaginationStrategy(ABC):
     """A base class for pagination strategies."""
 
-    def get_next_page(self, response: dict) -> dict:
-        """A template method to extract the next page URL from the response."""
+    def get_next_page(self, response: dict | list, http_response: httpx.Response | None = None) -> str | None:  # noqa: ARG002
+        """A template method to extract the next page URL from the response.
+
+        Args:
+            response (dict | list): The parsed JSON of the response.
+            http_response (httpx.Response | None, optional): The response itself, for strategies reading
+                its headers or request URL. Defaults to None.
+        """
+        if not isinstance(response, dict):
+            return None
         return self.parse_next_page_from_response(response)
 
     @abstractmethod
@@ -40,9 +63,207 @@ class HATEOASPagination(PaginationStrategy):
         return links.get("next", None)
 
 
+class CursorPagination(PaginationStrategy):
+    """Pagination strategy for APIs returning an opaque cursor of the next page in the response body.
+
+    The next page is requested from the same URL, with the cursor set as a query parameter.
+    Pagination stops when the cursor is missing or empty.
+
+    Args:
+        cursor_key (str, optional): The dotted key of the next cursor in the response. Defaults to "next_cursor".
+        cursor_param (str, optional): The query parameter sending the cursor. Defaults to "cursor".
+    """
+
+    def __init__(self, cursor_key: str = "next_cursor", cursor_param: str = "cursor") -> None:
+        self.cursor_key = cursor_key
+        self.cursor_param = cursor_param
+
+    def get_next_page(self, response: dict | list, http_response: httpx.Response | None = None) -> str | None:
+        cursor = self.parse_next_page_from_response(response) if isinstance(response, dict) else None
+        if not cursor:
+            return None
+
+        if http_response is None:
+            raise ValueError("Cursor pagination needs the response to build the URL of the next page.")
+        return str(http_response.request.url.copy_set_param(self.cursor_param, cursor))
+
+    def parse_next_page_from_response(self, response: dict) -> str | None:
+        # Returns the cursor, which get_next_page turns into the URL of the next page.
+        cursor = _lookup(response, self.cursor_key)
+        return None if cursor is None else str(cursor)
+
+
+class LinkHeaderPagination(PaginationStrategy):
+    """Pagination strategy for APIs sending the next page URL in an RFC 5988 `Link` header, e.g. GitHub.
+
+    Relative links are resolved against the URL of the request.
+    """
+
+    def get_next_page(self, response: dict | list, http_response: httpx.Response | None = None) -> str | None:  # noqa: ARG002
+        if http_response is None:
+            raise ValueError("Link header pagination needs the response to read its headers.")
+
+        next_link = http_response.links.get("next", {}).get("url")
+        return str(http_response.request.url.join(next_link)) if next_link else None
+
+    def parse_next_page_from_response(self, response: dict) -> str | None:  # noqa: ARG002
+        # The next page is only ever advertised in the headers.
+        return None
+
+
+class ConcurrentPaginationStrategy(PaginationStrategy):
+    """A base class for strategies able to compute every page request from the first response.
+
+    Instead of following a next page link, the extractor fetches the first page, asks the strategy
+    for the query parameters of all remaining pages and requests them concurrently.
+    """
+
+    def parse_next_page_from_response(self, response: dict) -> str | None:  # noqa: ARG002
+        # Every page is planned from the first response, there are no links to follow.
+        return None
+
+    @abstractmethod
+    def first_page_params(self) -> dict[str, Any]:
+        """Returns the query parameters of the first page."""
+        raise NotImplementedError("Concurrent Pagination Strategy subclasses must implement this method.")
+
+    @abstractmethod
+    def remaining_page_params(self, response: dict) -> list[dict[str, Any]]:
+        """Returns the query parameters of every page after the first, in order."""
+        raise NotImplementedError("Concurrent Pagination Strategy subclasses must implement this method.")
+
+
+class OffsetPagination(ConcurrentPaginationStrategy):
+    """Pagination strategy for APIs accepting an offset and a limit, and returning the total number of records.
+
+    Args:
+        limit (int, optional): The number of records requested per page. Defaults to 100.
+        offset_param (str, optional): The query parameter of the offset. Defaults to "offset".
+        limit_param (str, optional): The query parameter of the limit. Defaults to "limit".
+        total_key (str, optional): The dotted key of the total number of records in the response. Defaults to "total".
+    """
+
+    def __init__(
+        self, limit: int = 100, offset_param: str = "offset", limit_param: str = "limit", total_key: str = "total"
+    ) -> None:
+        if limit < 1:
+            raise ValueError("The page limit must be a positive integer.")
+
+        self.limit = limit
+        self.offset_param = offset_param
+        self.limit_param = limit_param
+        self.total_key = total_key
+
+    def first_page_params(self) -> dict[str, Any]:
+        return {self.offset_param: 0, self.limit_param: self.limit}
+
+    def remaining_page_params(self, response: dict) -> list[dict[str, Any]]:
+        total = _lookup(response, self.total_key)
+        if not isinstance(total, int):
+            error_msg = f"The response does not contain the total number of records under `{self.total_key}`."
+            raise ValueError(error_msg)  # noqa: TRY004 - The response is invalid, not the argument type.
+
+        return [
+            {self.offset_param: offset, self.limit_param: self.limit} for offset in range(self.limit, total, self.limit)
+        ]
+
+
+class PageNumberPagination(ConcurrentPaginationStrategy):
+    """Pagination strategy for APIs accepting a page number and returning the total number of pages or records.
+
+    Args:
+        page_size (int | None, optional): The number of records requested per page, None to use the API default.
+            Required to compute the number of pages from the total number of records. Defaults to None.
+        page_param (str, optional): The query parameter of the page number. Defaults to "page".
+        page_size_param (str, optional): The query parameter of the page size. Defaults to "per_page".
+        total_pages_key (str, optional): The dotted key of the total number of pages in the response.
+            Defaults to "total_pages".
+        total_key (str, optional): The dotted key of the total number of records in the response,
+            used when the number of pages is missing. Defaults to "total".
+        first_page (int, optional): The number of the first page. Defaults to 1.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        page_size: int | None = None,
+        page_param: str = "page",
+        page_size_param: str = "per_page",
+        total_pages_key: str = "total_pages",
+        total_key: str = "total",
+        first_page: int = 1,
+    ) -> None:
+        if page_size is not None and page_size < 1:
+            raise ValueError("The page size must be a positive integer.")
+
+        self.page_size = page_size
+        self.page_param = page_param
+        self.page_size_param = page_size_param
+        self.total_pages_key = total_pages_key
+        self.total_key = total_key
+        self.first_page = first_page
+
+    def _page_params(self, page: int) -> dict[str, Any]:
+        if self.page_size is None:
+            return {self.page_param: page}
+        return {self.page_param: page, self.page_size_param: self.page_size}
+
+    def first_page_params(self) -> dict[str, Any]:
+        return self._page_params(self.first_page)
+
+    def remaining_page_params(self, response: dict) -> list[dict[str, Any]]:
+        total_pages = _lookup(response, self.total_pages_key)
+        if not isinstance(total_pages, int):
+            total = _lookup(response, self.total_key)
+            if not isinstance(total, int) or self.page_size is None:
+                error_msg = (
+                    f"The response does not contain the total number of pages under `{self.total_pages_key}`, "
+                    f"nor the total number of records under `{self.total_key}` with a configured page size."
+                )
+                raise ValueError(error_msg)
+            total_pages = math.ceil(total / self.page_size)
+
+        return [self._page_params(page) for page in range(self.first_page + 1, self.first_page + total_pages)]
+
+
+async def prefetch_in_order[T, R](
+    fetch: Callable[[T], Awaitable[R]], pages: Iterable[T], limit: int
+) -> AsyncIterator[R]:
+    """Fetches pages concurrently and yields their results in the order of the pages.
+
+    At most `limit` pages are requested or waiting to be yielded at any time, which bounds both
+    the load on the API and the memory held by pages that arrived ahead of their predecessors.
+    The remaining requests are cancelled if fetching a page fails or the consumer stops early.
+
+    Args:
+        fetch (Callable[[T], Awaitable[R]]): Fetches a single page.
+        pages (Iterable[T]): The pages to fetch, e.g. their query parameters.
+        limit (int): The maximum number of pages in flight.
+    """
+    if limit < 1:
+        raise ValueError("The in-flight page limit must be a positive integer.")
+
+    in_flight: deque[asyncio.Task[R]] = deque()
+    try:
+        for page in pages:
+            if len(in_flight) >= limit:
+                yield await in_flight.popleft()
+            in_flight.append(asyncio.create_task(fetch(page)))
+
+        while in_flight:
+            yield await in_flight.popleft()
+    finally:
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+
+
 class PaginationTypes(StrEnum):
     PAGE_BASED = "page_based"
     HATEOAS = "hateoas"
+    OFFSET = "offset"
+    PAGE_NUMBER = "page_number"
+    CURSOR = "cursor"
+    LINK_HEADER = "link_header"
 
     @classmethod
     def _missing_(cls, value: str) -> "PaginationTypes":
@@ -50,10 +271,18 @@ class PaginationTypes(StrEnum):
         raise ValueError(error_msg)
 
 
-def get_pagination_strategy(strategy: str) -> PaginationStrategy:
-    """Returns a pagination strategy based on the given string."""
+def get_pagination_strategy(strategy: str, **options: Any) -> PaginationStrategy:  # noqa: ANN401
+    """Returns a pagination strategy based on the given string, configured with the given options."""
     match PaginationTypes(strategy.lower()):
         case PaginationTypes.PAGE_BASED:
-            return PageBasedPagination()
+            return PageBasedPagination(**options)
         case PaginationTypes.HATEOAS:
-            return HATEOASPagination()
+            return HATEOASPagination(**options)
+        case PaginationTypes.OFFSET:
+            return OffsetPagination(**options)
+        case PaginationTypes.PAGE_NUMBER:
+            return PageNumberPagination(**options)
+        case PaginationTypes.CURSOR:
+            return CursorPagination(**options)
+        case PaginationTypes.LINK_HEADER:
+            return LinkHeaderPagination(**options)
@@ -0,0 +1,174 @@
+# Standard Imports
+from __future__ import annotations
+
+import ast
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, NamedTuple, Self
+
+# Third Party Imports
+# Local Imports
+from pipeline_flow.plugins.utils.fusion import FusibleTransform
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from pipeline_flow.plugins import ITransformPlugin
+    from pipeline_flow.plugins.utils.expressions import Expression
+
+COMPARISON_SYMBOLS: dict[type[ast.cmpop], str] = {
+    ast.Eq: "==",
+    ast.NotEq: "!=",
+    ast.Lt: "<",
+    ast.LtE: "<=",
+    ast.Gt: ">",
+    ast.GtE: ">=",
+    ast.In: "in",
+    ast.NotIn: "not in",
+}
+
+# The operator of a comparison written as `literal <op> column`, once rewritten as `column <op> literal`.
+FLIPPED_OPERATORS = {"==": "==", "!=": "!=", "<": ">", "<=": ">=", ">": "<", ">=": "<="}
+
+_NO_LITERAL = object()
+
+
+class Comparison(NamedTuple):
+    """A `column <operator> value` predicate that an extractor can evaluate at the source."""
+
+    column: str
+    operator: str
+    value: Any
+
+
+class PushdownPlan(NamedTuple):
+    """The predicates and columns of the transform phase that can be evaluated by the extractor.
+
+    Args:
+        predicates (list[Comparison]): Predicates every row of the transform phase output satisfies.
+        columns (list[str] | None): The only source columns read by the transform phase, or None if unknown.
+    """
+
+    predicates: list[Comparison]
+    columns: list[str] | None
+
+    def __bool__(self: Self) -> bool:
+        return bool(self.predicates) or self.columns is not None
+
+
+class SupportsPushdown(ABC):
+    """An extractor able to filter rows or select columns at the source.
+
+    Pushdown is best effort: the transform phase still runs every filter and projection, so an
+    extractor may apply any subset of the plan, e.g. only the predicates its API can express.
+    """
+
+    @abstractmethod
+    def push_down(self: Self, plan: PushdownPlan) -> None:
+        """Configure the next extraction to apply the plan, replacing any previously pushed plan."""
+        raise NotImplementedError("Pushdown extractors must implement push_down()")
+
+
+def _column_name(node: ast.expr) -> str | None:
+    match node:
+        case ast.Name(id=name) | ast.Call(func=ast.Name(id="col"), args=[ast.Constant(value=str(name))]):
+            return name
+    return None
+
+
+def _literal(node: ast.expr) -> Any:  # noqa: ANN401
+    match node:
+        case ast.Constant(value=value):
+            return value
+        case ast.UnaryOp(op=ast.USub(), operand=ast.Constant(value=int(value) | float(value))):
+            return -value
+        case ast.List(elts=elements) | ast.Tuple(elts=elements):
+            values = [_literal(element) for element in elements]
+            return _NO_LITERAL if _NO_LITERAL in values else values
+    return _NO_LITERAL
+
+
+def conjuncts(node: ast.expr) -> list[ast.expr]:
+    """Split a condition into the terms joined by `and`."""
+    if isinstance(node, ast.BoolOp) and isinstance(node.op, ast.And):
+        return [term for value in node.values for term in conjuncts(value)]
+    return [node]
+
+
+def as_comparison(node: ast.expr) -> Comparison | None:
+    """Return the condition as a Comparison if it compares a column with a literal."""
+    if not isinstance(node, ast.Compare) or len(node.ops) != 1 or type(node.ops[0]) not in COMPARISON_SYMBOLS:
+        return None
+
+    operator = COMPARISON_SYMBOLS[type(node.ops[0])]
+    left, right = node.left, node.comparators[0]
+
+    if (column := _column_name(left)) is not None and (value := _literal(right)) is not _NO_LITERAL:
+        return Comparison(column, operator, value)
+    if (
+        operator in FLIPPED_OPERATORS
+        and (column := _column_name(right)) is not None
+        and (value := _literal(left)) is not _NO_LITERAL
+    ):
+        return Comparison(column, FLIPPED_OPERATORS[operator], value)
+    return None
+
+
+class PushdownPlanner:
+    """Collects the predicates and columns of a chain of row-wise transforms in terms of source columns.
+
+    Every transform reports what it reads and writes, so that conditions on renamed columns are
+    translated back to the source column names and conditions on derived or cast columns, which
+    do not exist at the source, are left out.
+    """
+
+    def __init__(self: Self) -> None:
+        # Current column names mapped to their source column, or None when they are computed.
+        self.aliases: dict[str, str | None] = {}
+        self.referenced: dict[str, None] = {}
+        self.predicates: list[Comparison] = []
+        self.columns: list[str] | None = None
+
+    def source(self: Self, name: str) -> str | None:
+        return self.aliases.get(name, name)
+
+    def read(self: Self, names: Iterable[str]) -> None:
+        for name in names:
+            if (source := self.source(name)) is not None:
+                self.referenced[source] = None
+
+    def filter(self: Self, condition: Expression) -> None:
+        self.read(sorted(condition.columns))
+        for term in conjuncts(condition.tree):
+            comparison = as_comparison(term)
+            if comparison and (source := self.source(comparison.column)) is not None:
+                self.predicates.append(comparison._replace(column=source))
+
+    def assign(self: Self, name: str, reads: Iterable[str]) -> None:
+        self.read(sorted(reads))
+        self.aliases[name] = None
+
+    def rename(self: Self, columns: Mapping[str, str]) -> None:
+        sources = {new: self.source(old) for old, new in columns.items()}
+        self.aliases.update(dict.fromkeys(columns))
+        self.aliases.update(sources)
+
+    def select(self: Self, names: Iterable[str]) -> None:
+        if self.columns is not None:
+            # Later projections only narrow the columns that were already selected.
+            return
+
+        self.read(names)
+        self.columns = list(self.referenced)
+
+    def plan(self: Self) -> PushdownPlan:
+        return PushdownPlan(self.predicates, self.columns)
+
+
+def build_pushdown_plan(steps: list[ITransformPlugin]) -> PushdownPlan:
+    """Analyse the leading row-wise transforms of a transform phase, stopping at the first other step."""
+    planner = PushdownPlanner()
+    for step in steps:
+        if not isinstance(step, FusibleTransform):
+            break
+        step.plan_pushdown(planner)
+    return planner.plan()
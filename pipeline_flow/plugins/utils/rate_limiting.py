@@ -0,0 +1,321 @@
+# Standard Imports
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+import weakref
+from collections import deque
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from time import monotonic
+from typing import TYPE_CHECKING, Any, ClassVar, Self
+
+# Third Party Imports
+# Local Imports
+from pipeline_flow.core.connection_pools import host_origin
+
+if TYPE_CHECKING:
+    import httpx
+
+OVERLOAD_STATUS_CODES = frozenset({HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE})
+RETRYABLE_STATUS_CODES = frozenset(
+    {
+        HTTPStatus.REQUEST_TIMEOUT,
+        HTTPStatus.TOO_EARLY,
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    }
+)
+RATE_LIMIT_HEADERS = (
+    ("RateLimit-Remaining", "RateLimit-Reset"),
+    ("X-RateLimit-Remaining", "X-RateLimit-Reset"),
+)
+
+# Reset times above this are epoch timestamps, e.g. GitHub's, rather than seconds from now.
+_EPOCH_THRESHOLD = 10**9
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Returns the seconds to wait from a `Retry-After` header, given in seconds or as an HTTP date."""
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+def parse_rate_limit_reset(headers: httpx.Headers) -> float | None:
+    """Returns the seconds until the rate limit window resets, if the response exhausted it."""
+    for remaining_header, reset_header in RATE_LIMIT_HEADERS:
+        remaining, reset = headers.get(remaining_header), headers.get(reset_header)
+        if remaining is None or reset is None:
+            continue
+
+        try:
+            if int(remaining) > 0:
+                return None
+            seconds = float(reset)
+        except ValueError:
+            return None
+
+        if seconds > _EPOCH_THRESHOLD:
+            seconds -= time.time()
+        return max(seconds, 0.0)
+    return None
+
+
+class TokenBucket:
+    """Spaces requests to at most `rate` per second, allowing bursts of up to `burst` requests.
+
+    The bucket can also be paused, e.g. until the time given by a `Retry-After` header, in
+    which case every request waits for the pause to end, including those already waiting.
+
+    Args:
+        rate (float | None): The sustained requests per second, None for no limit.
+        burst (int | None, optional): The requests allowed at once after an idle period.
+            Defaults to the rate rounded up.
+    """
+
+    def __init__(self: Self, rate: float | None, burst: int | None = None) -> None:
+        if rate is not None and rate <= 0:
+            raise ValueError("The rate limit must be a positive number of requests per second.")
+
+        self.rate = rate
+        self.burst = burst or (max(math.ceil(rate), 1) if rate else 1)
+        self._tokens = float(self.burst)
+        self._updated = monotonic()
+        self._paused_until = 0.0
+
+    def pause(self: Self, seconds: float) -> None:
+        """Hold back every request for the next `seconds`."""
+        self._paused_until = max(self._paused_until, monotonic() + seconds)
+
+    def _reserve(self: Self) -> float:
+        """Takes a token, possibly borrowed from the future, and returns the seconds until it is available."""
+        if self.rate is None:
+            return 0.0
+
+        now = monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return max(-self._tokens / self.rate, 0.0)
+
+    async def acquire(self: Self) -> None:
+        delay = max(self._reserve(), self._paused_until - monotonic())
+        while delay > 0:
+            paused_until = self._paused_until
+            await asyncio.sleep(delay)
+            # The pause may have been extended by another response in the meantime.
+            delay = self._paused_until - monotonic() if self._paused_until > paused_until else 0
+
+
+class AdaptiveConcurrency:
+    """Limits the requests in flight with additive-increase, multiplicative-decrease (AIMD).
+
+    The limit is halved when the server signals overload, at most once per round trip, i.e. for
+    requests started before the previous decrease, and grows by one after a full window of
+    successful requests, up to `max_limit`. Without a limit, the first overload sets it to half
+    of the requests in flight.
+
+    Args:
+        max_limit (int | None): The highest limit, also the initial one, None for no limit.
+        min_limit (int, optional): The lowest limit. Defaults to 1.
+        decrease_factor (float, optional): The factor applied to the limit on overload. Defaults to 0.5.
+    """
+
+    def __init__(self: Self, max_limit: int | None, min_limit: int = 1, decrease_factor: float = 0.5) -> None:
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.decrease_factor = decrease_factor
+        self.limit = max_limit
+        self.in_flight = 0
+        self.generation = 0
+
+        self._successes = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    def _wake(self: Self) -> None:
+        free = len(self._waiters) if self.limit is None else self.limit - self.in_flight
+        for waiter in self._waiters:
+            if free <= 0:
+                break
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    async def acquire(self: Self) -> int:
+        """Waits for a free slot and returns the generation the request started in."""
+        while self.limit is not None and self.in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Pass on a wake-up this waiter may have received.
+                self._waiters.remove(waiter)
+                self._wake()
+                raise
+            self._waiters.remove(waiter)
+
+        self.in_flight += 1
+        return self.generation
+
+    def release(self: Self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    def on_success(self: Self) -> None:
+        if self.limit is None:
+            return
+
+        self._successes += 1
+        if self._successes >= self.limit:
+            self._successes = 0
+            if self.max_limit is None or self.limit < self.max_limit:
+                self.limit += 1
+                self._wake()
+
+    def on_overload(self: Self, generation: int) -> None:
+        if generation != self.generation:
+            return
+
+        current = self.in_flight if self.limit is None else self.limit
+        self.limit = max(self.min_limit, math.floor(current * self.decrease_factor))
+        self.generation += 1
+        self._successes = 0
+
+
+class HostLimiter:
+    """Throttles the requests sent to a host by every extractor calling it.
+
+    Requests wait for a slot of the adaptive concurrency limit, then for a token of the rate
+    limit. `Retry-After` headers and exhausted rate limit headers pause the host, and 429 and
+    503 responses reduce the concurrency limit.
+
+    Args:
+        name (str): The host origin, for logging.
+        rate_limit (float | None): The sustained requests per second, None for no limit.
+        burst (int | None): The requests allowed at once after an idle period. Defaults to the rate rounded up.
+        max_concurrency (int | None): The highest number of requests in flight, None for no limit.
+        adaptive (bool): Whether to reduce the concurrency on overload and grow it back on success.
+    """
+
+    def __init__(
+        self: Self,
+        name: str,
+        rate_limit: float | None,
+        burst: int | None,
+        max_concurrency: int | None,
+        adaptive: bool,  # noqa: FBT001
+    ) -> None:
+        self.name = name
+        self.bucket = TokenBucket(rate_limit, burst)
+        self.concurrency = AdaptiveConcurrency(max_concurrency) if adaptive else None
+
+    async def send(
+        self: Self,
+        client: httpx.AsyncClient,
+        request: httpx.Request,
+        stream: bool = False,  # noqa: FBT001, FBT002
+    ) -> httpx.Response:
+        """Sends the request once the host allows it, and adapts the throttling to the response.
+
+        With `stream`, the concurrency slot is released once the headers are read.
+        """
+        generation = await self.concurrency.acquire() if self.concurrency else 0
+        try:
+            await self.bucket.acquire()
+            response = await client.send(request, stream=stream)
+            self.observe(response, generation)
+        finally:
+            if self.concurrency:
+                self.concurrency.release()
+        return response
+
+    def observe(self: Self, response: httpx.Response, generation: int) -> None:
+        pause = parse_retry_after(response.headers.get("Retry-After"))
+        if pause is None:
+            pause = parse_rate_limit_reset(response.headers)
+        if pause:
+            logging.warning("Host `%s` asked to wait %.1f seconds, pausing its requests.", self.name, pause)
+            self.bucket.pause(pause)
+
+        if self.concurrency is None:
+            return
+
+        if response.status_code in OVERLOAD_STATUS_CODES:
+            self.concurrency.on_overload(generation)
+            logging.warning(
+                "Host `%s` is overloaded (status %s), concurrency limit is now %s.",
+                self.name,
+                response.status_code,
+                self.concurrency.limit,
+            )
+        elif response.status_code < HTTPStatus.BAD_REQUEST:
+            self.concurrency.on_success()
+
+
+class HostLimiters:
+    """Registry of the limiters shared by all extractors calling the same host.
+
+    The first extractor calling a host sets the options of its limiter. Like the shared HTTP
+    clients, limiters hold state bound to an event loop, therefore each loop gets its own.
+    """
+
+    _limiters: ClassVar[weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, HostLimiter]]] = (
+        weakref.WeakKeyDictionary()
+    )
+    _options: ClassVar[dict[str, dict[str, Any]]] = {}
+
+    @classmethod
+    def get(
+        cls: type[HostLimiters],
+        base_url: str,
+        rate_limit: float | None = None,
+        burst: int | None = None,
+        max_concurrency: int | None = None,
+        adaptive: bool = True,  # noqa: FBT001, FBT002
+    ) -> HostLimiter:
+        """Return the limiter of the host of the base URL.
+
+        Args:
+            base_url (str): Any URL of the host, e.g. the base URL of the API.
+            rate_limit (float | None, optional): The sustained requests per second, None for no limit.
+                Defaults to None.
+            burst (int | None, optional): The requests allowed at once after an idle period.
+                Defaults to the rate rounded up.
+            max_concurrency (int | None, optional): The highest number of requests in flight, None for no limit.
+                Defaults to None.
+            adaptive (bool, optional): Whether to adapt the concurrency to overload responses. Defaults to True.
+        """
+        name = host_origin(base_url)
+        options = {"rate_limit": rate_limit, "burst": burst, "max_concurrency": max_concurrency, "adaptive": adaptive}
+
+        limiters = cls._limiters.setdefault(asyncio.get_running_loop(), {})
+        if (limiter := limiters.get(name)) is not None:
+            if options != cls._options[name]:
+                logging.warning(
+                    "Limiter for `%s` already exists with options %s, ignoring options %s.",
+                    name,
+                    cls._options[name],
+                    options,
+                )
+            return limiter
+
+        cls._options[name] = options
+        limiters[name] = limiter = HostLimiter(name, **options)
+        return limiter
@@ -13,7 +13,8 @@ from pipeline_flow.core.models.phases import (
     TransformLoadPhase,
     TransformPhase,
 )
-from pipeline_flow.core.models.pipeline import Pipeline
+from pipeline_flow.core.models.pipeline import Pipeline, TransformExecutorType
+from pipeline_flow.core.transform_executors import shutdown_process_pool
 from tests.resources.plugins import (
     SimpleExtractorPlugin,
     SimpleLoaderPlugin,
@@ -153,3 +154,16 @@ async def test_etlt_strategy_with_delay() -> None:
 
     assert result is True
     assert 0.8 > total >= 0.7, "Delay Should be Extract (0.2) + Transform (0.1) + Load (0.2) + Transform at load (0.2) "
+
+
+@pytest.mark.asyncio
+async def test_etl_strategy_with_process_transform_executor(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    etl_pipeline = etl_pipeline_factory(name="Job1")
+    etl_pipeline.transform_executor = TransformExecutorType.PROCESS
+
+    try:
+        result = await ETLStrategy().execute(etl_pipeline)
+    finally:
+        shutdown_process_pool()
+
+    assert result is True
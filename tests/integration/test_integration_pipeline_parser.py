@@ -4,7 +4,7 @@
 import pytest
 
 # Project Imports
-from pipeline_flow.core.models.pipeline import Pipeline
+from pipeline_flow.core.models.pipeline import Pipeline, TransformExecutorType
 from pipeline_flow.core.parsers import parse_pipelines
 from pipeline_flow.core.registry import PluginRegistry
 from pipeline_flow.plugins import IPlugin
@@ -325,3 +325,34 @@ def test_parse_etlt_pipeline() -> None:
 
     assert len(pipelines[0].load_transform.steps) == 1
     assert isinstance(pipelines[0].load_transform.steps[0], SimpleTransformLoadPlugin)
+
+
+@pytest.mark.parametrize(
+    ("pipeline_executor", "expected_executor"),
+    [(None, TransformExecutorType.PROCESS), ("inline", TransformExecutorType.INLINE)],
+)
+def test_parse_pipelines_with_global_transform_executor(
+    pipeline_executor: str | None, expected_executor: TransformExecutorType
+) -> None:
+    plugins = [
+        ("extract_plugin1", SimpleExtractorPlugin),
+        ("transform_plugin1", SimpleTransformPlugin),
+        ("load_plugin", SimpleLoaderPlugin),
+    ]
+
+    setup_plugins(plugins)
+
+    pipeline_data = {
+        "type": "ETL",
+        "phases": {
+            "extract": {"steps": [{"id": "mock_extract1", "plugin": "extract_plugin1"}]},
+            "transform": {"steps": [{"id": "mock_transform1", "plugin": "transform_plugin1"}]},
+            "load": {"steps": [{"id": "mock_load1", "plugin": "load_plugin"}]},
+        },
+    }
+    if pipeline_executor:
+        pipeline_data["transform_executor"] = pipeline_executor
+
+    pipelines = parse_pipelines({"pipeline1": pipeline_data}, transform_executor="process")  # type: ignore[reportFunctionMemberAccess]
+
+    assert pipelines[0].transform_executor == expected_executor
@@ -0,0 +1,93 @@
+# Standard Imports
+
+# Third Party Imports
+import numpy as np
+import pytest
+
+# Local Imports
+from pipeline_flow.plugins.utils.batch_sizing import BatchSizer, estimate_row_bytes, is_batch_too_large
+
+
+def test_row_width_is_estimated_from_item_sizes_and_sampled_lengths() -> None:
+    columns = [np.arange(10, dtype=np.int32), np.array(["abcdef", None] * 5, dtype=object)]
+
+    # 4 bytes for the integer and 3 characters on average, each with 4 bytes of overhead.
+    assert estimate_row_bytes(columns) == 15
+
+
+def test_fixed_batches_report_their_sizes() -> None:
+    sizer = BatchSizer("loader", batch_size=1000)
+    sizer.start([np.arange(10)])
+
+    for rows in (1000, 1000, 200):
+        assert sizer.next_size() == 1000
+        sizer.observe(rows, seconds=5)
+
+    assert BatchSizer.metrics()["loader"] == {
+        "adaptive": False,
+        "batches": 3,
+        "rows": 2200,
+        "min_batch_rows": 200,
+        "max_batch_rows": 1000,
+        "mean_batch_rows": 733,
+        "next_batch_rows": 1000,
+        "estimated_row_bytes": None,
+        "max_batch_bytes": None,
+        "too_large": 0,
+    }
+
+
+def test_adaptive_batches_fit_the_target_bytes() -> None:
+    narrow = BatchSizer("narrow", batch_size=1000, target_bytes=1_200_000)
+    wide = BatchSizer("wide", batch_size=1000, target_bytes=1_200_000)
+
+    narrow.start([np.arange(10)])
+    wide.start([np.arange(10), np.array(["x" * 1184] * 10, dtype=object)])
+
+    assert (narrow.next_size(), wide.next_size()) == (100_000, 1000)
+
+
+def test_slow_batches_shrink_to_the_target_latency_and_grow_back_gradually() -> None:
+    sizer = BatchSizer("loader", batch_size=1000, target_bytes=1_200_000, target_latency=1.0)
+    sizer.start([np.arange(10)])
+
+    sizer.observe(100_000, seconds=10)
+    assert sizer.next_size() == 10_000
+
+    # The rate is averaged over batches, and batches at most double.
+    sizer.observe(10_000, seconds=0.01)
+    assert sizer.next_size() == 20_000
+
+    for _ in range(5):
+        sizer.observe(sizer.next_size(), seconds=0.01)
+    assert sizer.next_size() == 100_000
+
+
+def test_too_large_batches_lower_the_bytes_per_batch() -> None:
+    sizer = BatchSizer("loader", batch_size=1000, target_bytes=1_200_000)
+    sizer.start([np.arange(10)])
+
+    sizer.on_too_large(100_000)
+    assert (sizer.next_size(), sizer.max_bytes) == (50_000, 600_000)
+
+    # New data keeps the lowered limit.
+    sizer.start([np.arange(10), np.arange(10)])
+    assert sizer.next_size() == 25_000
+
+
+def test_invalid_target_bytes() -> None:
+    with pytest.raises(ValueError, match="positive number of bytes"):
+        BatchSizer("loader", batch_size=1000, target_bytes=0)
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        ("(1153, \"Got a packet bigger than 'max_allowed_packet' bytes\")", True),
+        ("too many SQL variables", True),
+        ("the number of query arguments cannot exceed 32767", True),
+        ("UNIQUE constraint failed: t1.id", False),
+    ],
+)
+def test_batch_too_large_errors(message: str, expected: bool) -> None:  # noqa: FBT001
+    assert is_batch_too_large(Exception(message)) is expected
@@ -0,0 +1,147 @@
+# Standard Imports
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+# Third Party Imports
+import numpy as np
+import pytest
+from sqlalchemy.dialects import mssql, mysql, postgresql, sqlite
+
+# Local Imports
+from pipeline_flow.plugins.utils.bulk_load import (
+    LoadMode,
+    StagedLoad,
+    copy_csv,
+    create_staging_table,
+    load_data_infile,
+    multi_row_insert,
+    publish_staged_table,
+    staging_table_name,
+    supports_load_mode,
+    supports_staged_load,
+    to_csv,
+)
+
+
+def test_csv_quotes_values_and_writes_missing_values_as_unquoted_null() -> None:
+    columns = [
+        np.array([1, 2]),
+        np.array([1.5, np.nan]),
+        np.array(['say "hi"', None], dtype=object),
+        np.array([True, False]),
+        np.array(["2026-01-01T08:00:00", "NaT"], dtype="datetime64[ns]"),
+    ]
+
+    assert to_csv(columns) == b'1,1.5,"say ""hi""",1,"2026-01-01 08:00:00"\n2,NULL,NULL,0,NULL\n'
+
+
+@pytest.mark.parametrize(
+    ("dialect", "expected"),
+    [
+        (sqlite.aiosqlite.dialect(), 'INSERT INTO sales."order" (id, name) VALUES (?, ?), (?, ?)'),
+        (mysql.asyncmy.dialect(), "INSERT INTO sales.`order` (id, name) VALUES (%s, %s), (%s, %s)"),
+        (postgresql.asyncpg.dialect(), 'INSERT INTO sales."order" (id, name) VALUES ($1, $2), ($3, $4)'),
+    ],
+)
+def test_multi_row_insert_uses_the_placeholders_of_the_driver(dialect: object, expected: str) -> None:
+    assert multi_row_insert(dialect, "sales.order", ["id", "name"], 2) == expected  # type: ignore[reportArgumentType]
+
+
+@pytest.mark.parametrize(
+    ("mode", "dialect", "expected"),
+    [
+        (LoadMode.COPY, postgresql.asyncpg.dialect(), True),
+        (LoadMode.COPY, postgresql.psycopg.dialect(), True),
+        (LoadMode.COPY, mysql.asyncmy.dialect(), False),
+        (LoadMode.LOAD_DATA_INFILE, mysql.aiomysql.dialect(), True),
+        (LoadMode.LOAD_DATA_INFILE, sqlite.aiosqlite.dialect(), False),
+        (LoadMode.INSERT_MANY, sqlite.aiosqlite.dialect(), True),
+        (LoadMode.INSERT_MANY, sqlite.aiosqlite.dialect(paramstyle="named"), False),
+        (LoadMode.QUERY, mssql.aioodbc.dialect(), True),
+    ],
+)
+def test_supported_load_modes(mode: LoadMode, dialect: object, expected: bool) -> None:  # noqa: FBT001
+    assert supports_load_mode(mode, dialect) is expected  # type: ignore[reportArgumentType]
+
+
+@pytest.mark.asyncio
+async def test_copy_streams_the_buffer_through_asyncpg() -> None:
+    driver_connection = MagicMock(copy_to_table=AsyncMock())
+    connection = MagicMock(dialect=postgresql.asyncpg.dialect())
+    connection.get_raw_connection = AsyncMock(return_value=MagicMock(driver_connection=driver_connection))
+
+    await copy_csv(connection, "sales.orders", ["id", "total"], b"1,2.5\n")
+
+    (table,), options = driver_connection.copy_to_table.call_args
+    assert (table, options["schema_name"], options["columns"]) == ("orders", "sales", ["id", "total"])
+    assert (options["format"], options["null"], options["source"].read()) == ("csv", "NULL", b"1,2.5\n")
+
+
+@pytest.mark.asyncio
+async def test_load_data_reads_the_buffer_from_a_temporary_file() -> None:
+    loaded = {}
+
+    async def exec_driver_sql(statement: str, parameters: tuple[str]) -> None:
+        path = Path(parameters[0])
+        loaded["statement"], loaded["path"], loaded["data"] = statement, path, path.read_bytes()
+
+    connection = MagicMock(dialect=mysql.asyncmy.dialect(), exec_driver_sql=exec_driver_sql)
+
+    await load_data_infile(connection, "orders", ["id", "total"], b"1,2.5\n")
+
+    assert loaded["statement"].startswith("LOAD DATA LOCAL INFILE %s INTO TABLE orders CHARACTER SET utf8mb4")
+    assert loaded["statement"].endswith("(id, total)")
+    assert loaded["data"] == b"1,2.5\n"
+    assert not loaded["path"].exists()
+
+
+def test_staging_tables_are_unique_and_in_the_schema_of_the_table() -> None:
+    first, second = staging_table_name("sales.orders"), staging_table_name("sales.orders")
+
+    assert first.startswith("sales.orders_staging_")
+    assert first != second
+
+
+def test_staging_tables_are_unlogged_in_postgresql() -> None:
+    assert create_staging_table(postgresql.asyncpg.dialect(), "sales.order", "sales.s", ["id", "name"]) == (
+        'CREATE UNLOGGED TABLE sales.s AS SELECT id, name FROM sales."order" WHERE 1 = 0'
+    )
+
+
+@pytest.mark.parametrize(
+    ("staged_load", "dialect", "expected"),
+    [
+        (StagedLoad.APPEND, mysql.asyncmy.dialect(), ["INSERT INTO t (id, name) SELECT id, name FROM s"]),
+        (
+            StagedLoad.REPLACE,
+            postgresql.asyncpg.dialect(),
+            ["DELETE FROM t", "INSERT INTO t (id, name) SELECT id, name FROM s"],
+        ),
+        (
+            StagedLoad.MERGE,
+            postgresql.asyncpg.dialect(),
+            [
+                (
+                    "INSERT INTO t (id, name) SELECT id, name FROM s WHERE true "
+                    "ON CONFLICT (id) DO UPDATE SET name = excluded.name"
+                )
+            ],
+        ),
+        (
+            StagedLoad.MERGE,
+            mysql.asyncmy.dialect(),
+            ["INSERT INTO t (id, name) SELECT id, name FROM s ON DUPLICATE KEY UPDATE name = VALUES(name)"],
+        ),
+    ],
+)
+def test_staged_tables_are_published_in_the_dialect(
+    staged_load: StagedLoad, dialect: object, expected: list[str]
+) -> None:
+    assert publish_staged_table(dialect, staged_load, "t", "s", ["id", "name"], ["id"]) == expected  # type: ignore[reportArgumentType]
+
+
+def test_merges_without_columns_to_update_keep_the_existing_rows() -> None:
+    assert publish_staged_table(sqlite.aiosqlite.dialect(), StagedLoad.MERGE, "t", "s", ["id"], ["id"]) == [
+        "INSERT INTO t (id) SELECT id FROM s WHERE true ON CONFLICT (id) DO NOTHING"
+    ]
+    assert supports_staged_load(StagedLoad.MERGE, mssql.aioodbc.dialect()) is False
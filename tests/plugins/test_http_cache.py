@@ -0,0 +1,155 @@
+# Standard Imports
+import os
+from pathlib import Path
+
+# Third Party Imports
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock, IteratorStream
+
+# Local Imports
+from pipeline_flow.plugins.extract import RestApiAsyncExtractor
+from pipeline_flow.plugins.utils.http_cache import HttpCache
+
+BASE_URL = "https://api.example.com/v1"
+
+
+async def cache_response(cache: HttpCache, url: str, body: bytes, **headers: str) -> str:
+    request = httpx.Request("GET", url)
+    key = cache.key(request)
+    response = httpx.Response(200, headers={"ETag": '"v1"', **headers}, stream=IteratorStream([body]), request=request)
+
+    await cache.store(key, response).aread()
+    return key
+
+
+@pytest.mark.asyncio
+async def test_unchanged_pages_are_served_from_the_cache(tmp_path: Path, httpx_mock: HTTPXMock) -> None:
+    api_client = RestApiAsyncExtractor("api", BASE_URL, "users", cache_dir=str(tmp_path))
+    httpx_mock.add_response(json={"data": [{"id": 1}]}, headers={"ETag": '"v1"'})
+    httpx_mock.add_response(status_code=304, match_headers={"If-None-Match": '"v1"'})
+
+    assert await api_client() == [{"id": 1}]
+    assert await api_client() == [{"id": 1}]
+
+
+@pytest.mark.asyncio
+async def test_last_modified_is_sent_as_if_modified_since(tmp_path: Path, httpx_mock: HTTPXMock) -> None:
+    last_modified = "Wed, 21 Oct 2026 07:28:00 GMT"
+    api_client = RestApiAsyncExtractor("api", BASE_URL, "users", cache_dir=str(tmp_path))
+    httpx_mock.add_response(json={"data": [{"id": 1}]}, headers={"Last-Modified": last_modified})
+    httpx_mock.add_response(status_code=304, match_headers={"If-Modified-Since": last_modified})
+
+    await api_client()
+
+    assert await api_client() == [{"id": 1}]
+
+
+@pytest.mark.asyncio
+async def test_modified_pages_replace_the_cached_response(tmp_path: Path, httpx_mock: HTTPXMock) -> None:
+    api_client = RestApiAsyncExtractor("api", BASE_URL, "users", cache_dir=str(tmp_path))
+    httpx_mock.add_response(json={"data": [{"id": 1}]}, headers={"ETag": '"v1"'})
+    httpx_mock.add_response(json={"data": [{"id": 2}]}, headers={"ETag": '"v2"'})
+    httpx_mock.add_response(status_code=304, match_headers={"If-None-Match": '"v2"'})
+
+    await api_client()
+
+    assert await api_client() == [{"id": 2}]
+    assert await api_client() == [{"id": 2}]
+    assert len(list(tmp_path.glob("*.cache"))) == 1
+
+
+@pytest.mark.asyncio
+async def test_responses_without_validators_are_not_cached(tmp_path: Path, httpx_mock: HTTPXMock) -> None:
+    api_client = RestApiAsyncExtractor("api", BASE_URL, "users", cache_dir=str(tmp_path))
+    httpx_mock.add_response(json={"data": [{"id": 1}]})
+    httpx_mock.add_response(json={"data": [{"id": 1}]}, headers={"ETag": '"v1"', "Cache-Control": "no-store"})
+
+    await api_client()
+    await api_client()
+
+    assert list(tmp_path.iterdir()) == []
+    assert "If-None-Match" not in httpx_mock.get_requests()[1].headers
+
+
+@pytest.mark.asyncio
+async def test_cached_pages_keep_their_headers_for_pagination(tmp_path: Path, httpx_mock: HTTPXMock) -> None:
+    api_client = RestApiAsyncExtractor("api", BASE_URL, "users", pagination_type="link_header", cache_dir=str(tmp_path))
+    link = f'<{BASE_URL}/users?page=2>; rel="next"'
+    httpx_mock.add_response(url=f"{BASE_URL}/users", json=[{"id": 1}], headers={"ETag": '"p1"', "Link": link})
+    httpx_mock.add_response(url=f"{BASE_URL}/users?page=2", json=[{"id": 2}], headers={"ETag": '"p2"'})
+    httpx_mock.add_response(status_code=304, is_reusable=True)
+
+    assert await api_client() == [{"id": 1}, {"id": 2}]
+    assert await api_client() == [{"id": 1}, {"id": 2}]
+
+
+@pytest.mark.asyncio
+async def test_incremental_json_caches_and_replays_streamed_bodies(tmp_path: Path, httpx_mock: HTTPXMock) -> None:
+    api_client = RestApiAsyncExtractor("api", BASE_URL, "users", incremental_json=True, cache_dir=str(tmp_path))
+    chunks = [b'{"data": [{"id": 1}, ', b'{"id": 2}]}']
+    httpx_mock.add_response(stream=IteratorStream(chunks), headers={"ETag": '"v1"'})
+    httpx_mock.add_response(status_code=304)
+
+    assert await api_client() == [{"id": 1}, {"id": 2}]
+    assert await api_client() == [{"id": 1}, {"id": 2}]
+
+
+@pytest.mark.asyncio
+async def test_cache_keys_include_the_request_headers(tmp_path: Path, httpx_mock: HTTPXMock) -> None:
+    first = RestApiAsyncExtractor("first", BASE_URL, "users", headers={"X-Tenant": "a"}, cache_dir=str(tmp_path))
+    second = RestApiAsyncExtractor("second", BASE_URL, "users", headers={"X-Tenant": "b"}, cache_dir=str(tmp_path))
+    httpx_mock.add_response(json={"data": [{"id": 1}]}, headers={"ETag": '"a"'})
+    httpx_mock.add_response(json={"data": [{"id": 2}]}, headers={"ETag": '"b"'})
+
+    await first()
+
+    assert await second() == [{"id": 2}]
+    assert "If-None-Match" not in httpx_mock.get_requests()[1].headers
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    cache = HttpCache(tmp_path, max_size=200)
+    first = await cache_response(cache, f"{BASE_URL}/a", b"a" * 50)
+    second = await cache_response(cache, f"{BASE_URL}/b", b"b" * 50)
+
+    # Serving the first entry makes the second the least recently used.
+    entry = await cache.lookup(first)
+    assert entry is not None
+    cached = await cache.replay(entry, httpx.Request("GET", f"{BASE_URL}/a"))
+    assert cached is not None
+    await cached.aclose()
+    third = await cache_response(cache, f"{BASE_URL}/c", b"c" * 50)
+
+    assert await cache.lookup(first) is not None
+    assert await cache.lookup(second) is None
+    assert await cache.lookup(third) is not None
+    assert cache.size <= cache.max_size
+
+
+@pytest.mark.asyncio
+async def test_recency_survives_reopening_the_cache(tmp_path: Path) -> None:
+    cache = HttpCache(tmp_path)
+    first = await cache_response(cache, f"{BASE_URL}/a", b"a" * 50)
+    second = await cache_response(cache, f"{BASE_URL}/b", b"b" * 50)
+    os.utime(tmp_path / f"{first}.cache", (2_000_000_000, 2_000_000_000))
+    size = cache.size
+
+    reopened = HttpCache(tmp_path, max_size=size - 1)
+
+    assert await reopened.lookup(first) is not None
+    assert await reopened.lookup(second) is None
+
+
+@pytest.mark.asyncio
+async def test_bodies_larger_than_the_cache_or_not_read_whole_are_not_cached(tmp_path: Path) -> None:
+    cache = HttpCache(tmp_path, max_size=100)
+    await cache_response(cache, f"{BASE_URL}/large", b"x" * 200)
+
+    request = httpx.Request("GET", f"{BASE_URL}/partial")
+    response = httpx.Response(200, headers={"ETag": '"v1"'}, stream=IteratorStream([b"a", b"b"]), request=request)
+    await cache.store(cache.key(request), response).aclose()
+
+    assert list(tmp_path.iterdir()) == []
+    assert cache.size == 0
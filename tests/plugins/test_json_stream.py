@@ -0,0 +1,89 @@
+# Standard Imports
+import json
+
+# Third Party Imports
+import pytest
+
+# Local Imports
+from pipeline_flow.plugins.utils.json_stream import IncrementalJsonParser
+
+
+def feed_in_chunks(parser: IncrementalJsonParser, body: bytes, size: int) -> list[list]:
+    batches = [parser.feed(body[start : start + size]) for start in range(0, len(body), size)]
+    return [*batches, parser.close()]
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 64, 4096])
+def test_records_are_emitted_as_soon_as_they_are_complete(size: int) -> None:
+    document = {
+        "meta": {"total": 3, "next": "https://api.example.com/users?page=2"},
+        "data": [{"id": 1, "name": "Zoë"}, {"id": 2, "score": -1.5e-3}, {"id": 3, "tags": ["a", "]"]}],
+        "has_more": True,
+    }
+    parser = IncrementalJsonParser()
+
+    batches = feed_in_chunks(parser, json.dumps(document, ensure_ascii=False, indent=2).encode(), size)
+
+    assert [record for batch in batches for record in batch] == document["data"]
+    assert parser.document == {"meta": document["meta"], "has_more": True}
+
+
+def test_records_are_emitted_before_the_end_of_the_body() -> None:
+    parser = IncrementalJsonParser()
+
+    assert parser.feed(b'{"data": [{"id": 1}, {"id": 2}, {"id"') == [{"id": 1}, {"id": 2}]
+    assert parser.feed(b": 3}]") == [{"id": 3}]
+    assert parser.feed(b', "next": null}') == []
+    assert parser.close() == []
+    assert parser.document == {"next": None}
+
+
+def test_numbers_split_across_chunks() -> None:
+    parser = IncrementalJsonParser()
+
+    assert parser.feed(b"[12") == []
+    assert parser.feed(b".5") == []
+    assert parser.feed(b"e2, 7") == [1250.0]
+    assert parser.feed(b"]") == [7]
+    assert parser.close() == []
+
+
+def test_multibyte_characters_split_across_chunks() -> None:
+    body = json.dumps([{"city": "Kraków"}], ensure_ascii=False).encode()
+    parser = IncrementalJsonParser()
+
+    batches = feed_in_chunks(parser, body, 1)
+
+    assert [record for batch in batches for record in batch] == [{"city": "Kraków"}]
+
+
+@pytest.mark.parametrize(
+    ("body", "records", "document"),
+    [
+        (b'[{"id": 1}, {"id": 2}]', [{"id": 1}, {"id": 2}], []),
+        (b'{"id": 1, "name": "Single"}', [{"id": 1, "name": "Single"}], {"id": 1, "name": "Single"}),
+        (b'{"items": [{"id": 1}], "data": {"id": 2}}', [{"id": 2}], {"items": [{"id": 1}]}),
+        (b"42", [], 42),
+    ],
+)
+def test_document_shapes(body: bytes, records: list, document: object) -> None:
+    parser = IncrementalJsonParser()
+
+    assert [record for batch in feed_in_chunks(parser, body, 5) for record in batch] == records
+    assert parser.document == document
+
+
+def test_custom_records_key() -> None:
+    parser = IncrementalJsonParser(records_key="items")
+
+    assert parser.feed(b'{"data": [1], "items": [{"id": 1}]}') == [{"id": 1}]
+    assert parser.close() == []
+    assert parser.document == {"data": [1]}
+
+
+@pytest.mark.parametrize("body", [b'{"data": [1, 2]', b'{"data": [1,}', b'{"a": 1} []', b'{"a" 1}', b"[1 2]", b""])
+def test_invalid_documents(body: bytes) -> None:
+    parser = IncrementalJsonParser()
+
+    with pytest.raises(json.JSONDecodeError):
+        parser.feed(body) + parser.close()
@@ -0,0 +1,283 @@
+# Standard Imports
+import math
+
+# Third Party Imports
+import numpy as np
+import pandas as pd
+import pytest
+
+# Local Imports
+from pipeline_flow.core import plugin_loader
+from pipeline_flow.core.executor import run_transformer
+from pipeline_flow.core.models.phases import TransformPhase
+from pipeline_flow.core.registry import PluginRegistry
+from pipeline_flow.plugins.transform.native import (
+    NativeCast,
+    NativeConvert,
+    NativeDedupe,
+    NativeDerive,
+    NativeFilter,
+    NativeGroupBy,
+    NativeProject,
+    NativeRename,
+    NativeSort,
+    NativeWindow,
+)
+from pipeline_flow.plugins.utils.columnar import ColumnarTable, as_table
+from pipeline_flow.plugins.utils.expressions import Expression
+
+
+@pytest.fixture
+def orders() -> ColumnarTable:
+    return ColumnarTable.from_pydict(
+        {
+            "order_id": [1, 2, 3, 4, 5, 6],
+            "customer": ["ann", "bob", "ann", "cid", "bob", "ann"],
+            "amount": [10.0, 25.0, 5.0, 40.0, 25.0, 15.0],
+            "quantity": [1, 2, 1, 4, 2, 3],
+        }
+    )
+
+
+def test_as_table_converts_supported_formats() -> None:
+    expected = ColumnarTable.from_pydict({"id": [1, 2], "name": ["a", "b"]})
+
+    assert as_table([{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]) == expected
+    assert as_table({"id": [1, 2], "name": ["a", "b"]}) == expected
+    assert as_table(pd.DataFrame({"id": [1, 2], "name": ["a", "b"]})) == expected
+    assert as_table(expected) is expected
+
+
+def test_as_table_unsupported_type() -> None:
+    with pytest.raises(TypeError, match=r"Unsupported data type for the native transform engine: int\."):
+        as_table(1)
+
+
+def test_columnar_table_rejects_unequal_columns() -> None:
+    with pytest.raises(ValueError, match="must have the same length"):
+        ColumnarTable({"a": np.array([1, 2]), "b": np.array([1])})
+
+
+def test_columnar_table_to_records() -> None:
+    table = ColumnarTable.from_pydict({"id": [1, 2], "name": ["a", "b"]})
+
+    assert table.to_records() == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+
+
+def test_expression_columns() -> None:
+    expression = Expression("amount * quantity > 10 and col('unit price') > 0")
+
+    assert expression.columns == {"amount", "quantity", "unit price"}
+
+
+@pytest.mark.parametrize(
+    "source",
+    ["__import__('os').system('ls')", "amount.real", "[x for x in amount]", "lambda: 1", "amount if quantity else 0"],
+)
+def test_expression_rejects_unsupported_syntax(source: str) -> None:
+    with pytest.raises(ValueError, match="Unsupported syntax"):
+        Expression(source)
+
+
+def test_expression_invalid_syntax() -> None:
+    with pytest.raises(ValueError, match="Invalid expression `amount >`"):
+        Expression("amount >")
+
+
+def test_expression_functions_and_chained_comparisons(orders: ColumnarTable) -> None:
+    assert Expression("10 <= amount < 25").evaluate(orders).tolist() == [True, False, False, False, False, True]
+    assert Expression("customer in ('ann', 'cid')").evaluate(orders).tolist() == [
+        True,
+        False,
+        True,
+        True,
+        False,
+        True,
+    ]
+    assert Expression("upper(customer)").evaluate(orders).tolist()[:2] == ["ANN", "BOB"]
+    assert Expression("where(quantity > 1, amount, 0)").evaluate(orders).tolist() == [0, 25, 0, 40, 25, 15]
+
+
+def test_native_filter(orders: ColumnarTable) -> None:
+    result = NativeFilter("filter", condition="amount >= 15 and not customer == 'cid'")(orders)
+
+    assert result["order_id"].tolist() == [2, 5, 6]
+
+
+def test_native_filter_accepts_records() -> None:
+    result = NativeFilter("filter", condition="id > 1")([{"id": 1}, {"id": 2}])
+
+    assert result.to_records() == [{"id": 2}]
+
+
+def test_native_project_and_rename(orders: ColumnarTable) -> None:
+    projected = NativeProject("project", columns=["amount", "order_id"])(orders)
+    renamed = NativeRename("rename", columns={"amount": "total"})(projected)
+
+    assert renamed.column_names == ["total", "order_id"]
+
+
+def test_native_rename_missing_column(orders: ColumnarTable) -> None:
+    with pytest.raises(KeyError, match="Cannot rename columns that do not exist"):
+        NativeRename("rename", columns={"missing": "other"})(orders)
+
+
+def test_native_cast(orders: ColumnarTable) -> None:
+    result = NativeCast("cast", columns={"amount": "int", "order_id": "str"})(orders)
+
+    assert result["amount"].dtype == np.int64
+    assert result["order_id"].tolist()[:2] == ["1", "2"]
+
+
+def test_native_cast_missing_column(orders: ColumnarTable) -> None:
+    with pytest.raises(KeyError, match="Cannot cast columns that do not exist"):
+        NativeCast("cast", columns={"ammount": "int"})(orders)
+
+
+def test_native_cast_unknown_type() -> None:
+    with pytest.raises(TypeError):
+        NativeCast("cast", columns={"amount": "not_a_type"})
+
+
+def test_native_derive(orders: ColumnarTable) -> None:
+    result = NativeDerive("derive", column="total", expression="amount * quantity")(orders)
+
+    assert result["total"].tolist() == [10.0, 50.0, 5.0, 160.0, 50.0, 45.0]
+
+
+def test_native_derive_constant(orders: ColumnarTable) -> None:
+    result = NativeDerive("derive", column="source", expression="'api'")(orders)
+
+    assert result["source"].tolist() == ["api"] * 6
+
+
+@pytest.mark.parametrize(("keep", "expected"), [("first", [1, 2, 4]), ("last", [4, 5, 6])])
+def test_native_dedupe(orders: ColumnarTable, keep: str, expected: list[int]) -> None:
+    result = NativeDedupe("dedupe", columns=["customer"], keep=keep)(orders)
+
+    assert result["order_id"].tolist() == expected
+
+
+def test_native_dedupe_all_columns() -> None:
+    table = ColumnarTable.from_pydict({"a": [1, 1, 1, 2], "b": ["x", "x", "y", "x"]})
+
+    assert NativeDedupe("dedupe")(table).to_pydict() == {"a": [1, 1, 2], "b": ["x", "y", "x"]}
+
+
+def test_native_group_by(orders: ColumnarTable) -> None:
+    result = NativeGroupBy(
+        "group_by",
+        keys=["customer"],
+        aggregations={
+            "orders": {"column": "order_id", "function": "count"},
+            "total": {"column": "amount", "function": "sum"},
+            "average": {"column": "amount", "function": "mean"},
+            "smallest": {"column": "amount", "function": "min"},
+            "largest": {"column": "quantity", "function": "max"},
+            "first_order": {"column": "order_id", "function": "first"},
+            "last_order": {"column": "order_id", "function": "last"},
+        },
+    )(orders)
+
+    assert result.to_pydict() == {
+        "customer": ["ann", "bob", "cid"],
+        "orders": [3, 2, 1],
+        "total": [30.0, 50.0, 40.0],
+        "average": [10.0, 25.0, 40.0],
+        "smallest": [5.0, 25.0, 40.0],
+        "largest": [3, 2, 4],
+        "first_order": [1, 2, 4],
+        "last_order": [6, 5, 4],
+    }
+
+
+def test_native_group_by_multiple_keys() -> None:
+    table = ColumnarTable.from_pydict({"a": [2, 1, 2, 1], "b": ["y", "x", "y", "z"], "v": [1, 2, 3, 4]})
+
+    result = NativeGroupBy("group_by", keys=["a", "b"], aggregations={"v": {"column": "v", "function": "sum"}})(table)
+
+    assert result.to_pydict() == {"a": [1, 1, 2], "b": ["x", "z", "y"], "v": [2, 4, 4]}
+
+
+def test_native_group_by_unknown_function() -> None:
+    with pytest.raises(ValueError, match="'median' is not a valid AggregateFunction"):
+        NativeGroupBy("group_by", keys=["a"], aggregations={"v": {"column": "v", "function": "median"}})
+
+
+def test_native_sort(orders: ColumnarTable) -> None:
+    result = NativeSort("sort", by=["customer", "amount"], descending=[False, True])(orders)
+
+    assert result["order_id"].tolist() == [6, 1, 3, 2, 5, 4]
+
+
+def test_native_sort_mismatched_descending_flags() -> None:
+    with pytest.raises(ValueError, match="Expected 2 `descending` flags"):
+        NativeSort("sort", by=["a", "b"], descending=[True])
+
+
+@pytest.mark.parametrize(
+    ("function", "expected"),
+    [
+        ("row_number", [1, 1, 2, 1, 2, 3]),
+        ("rank", [1, 1, 1, 1, 1, 3]),
+        ("dense_rank", [1, 1, 1, 1, 1, 2]),
+        ("cumsum", [10.0, 25.0, 15.0, 40.0, 50.0, 30.0]),
+    ],
+)
+def test_native_window(orders: ColumnarTable, function: str, expected: list) -> None:
+    orders = orders.with_column("day", np.array([1, 1, 1, 1, 1, 2]))
+
+    result = NativeWindow(
+        "window", output="out", function=function, column="amount", partition_by=["customer"], order_by=["day"]
+    )(orders)
+
+    assert result["out"].tolist() == expected
+    assert result["order_id"].tolist() == orders["order_id"].tolist()
+
+
+def test_native_window_lag_and_lead(orders: ColumnarTable) -> None:
+    lag = NativeWindow("lag", output="previous", function="lag", column="amount", partition_by=["customer"])(orders)
+    lead = NativeWindow("lead", output="next", function="lead", column="order_id", partition_by="customer", default=0)(
+        orders
+    )
+
+    assert [None if math.isnan(value) else value for value in lag["previous"].tolist()] == [
+        None,
+        None,
+        10.0,
+        None,
+        25.0,
+        5.0,
+    ]
+    assert lead["next"].tolist() == [3, 5, 6, 0, 0, 0]
+
+
+def test_native_window_requires_column() -> None:
+    with pytest.raises(ValueError, match=r"The window function `cumsum` requires a `column`\."):
+        NativeWindow("window", output="out", function="cumsum")
+
+
+@pytest.mark.parametrize(("to", "expected_type"), [("records", list), ("pydict", dict), ("pandas", pd.DataFrame)])
+def test_native_convert(orders: ColumnarTable, to: str, expected_type: type) -> None:
+    assert isinstance(NativeConvert("convert", to=to)(orders), expected_type)
+
+
+def test_native_transforms_configured_from_yaml_steps() -> None:
+    plugin_loader.load_core_engine_transformations("native")
+    steps = [
+        {"plugin": "native_filter", "params": {"condition": "quantity > 1"}},
+        {"plugin": "native_derive", "params": {"column": "total", "expression": "amount * quantity"}},
+        {
+            "plugin": "native_group_by",
+            "params": {"keys": ["customer"], "aggregations": {"total": {"column": "total", "function": "sum"}}},
+        },
+        {"plugin": "native_convert", "params": {"to": "records"}},
+    ]
+    transformations = TransformPhase.model_construct(steps=[PluginRegistry.instantiate_plugin(step) for step in steps])
+
+    result = run_transformer(
+        [{"customer": "ann", "amount": 2.0, "quantity": 3}, {"customer": "bob", "amount": 5.0, "quantity": 1}],
+        transformations,
+    )
+
+    assert result == [{"customer": "ann", "total": 6.0}]
@@ -0,0 +1,130 @@
+# Standard Imports
+import asyncio
+from contextlib import aclosing
+
+# Third Party Imports
+import httpx
+import pytest
+
+# Local Imports
+from pipeline_flow.plugins.utils.pagination import (
+    CursorPagination,
+    LinkHeaderPagination,
+    OffsetPagination,
+    PageNumberPagination,
+    get_pagination_strategy,
+    prefetch_in_order,
+)
+
+
+def test_offset_pagination_plans_remaining_pages() -> None:
+    strategy = OffsetPagination(limit=10, offset_param="skip", limit_param="take", total_key="meta.count")
+
+    assert strategy.first_page_params() == {"skip": 0, "take": 10}
+    assert strategy.remaining_page_params({"meta": {"count": 35}}) == [
+        {"skip": 10, "take": 10},
+        {"skip": 20, "take": 10},
+        {"skip": 30, "take": 10},
+    ]
+    assert strategy.remaining_page_params({"meta": {"count": 4}}) == []
+
+
+def test_offset_pagination_requires_total() -> None:
+    with pytest.raises(ValueError, match="total number of records under `total`"):
+        OffsetPagination().remaining_page_params({"data": []})
+
+
+@pytest.mark.parametrize(
+    ("response", "expected_pages"),
+    [
+        ({"total_pages": 3}, [2, 3]),
+        ({"total": 25}, [2, 3]),
+        ({"total_pages": 1, "total": 25}, []),
+    ],
+)
+def test_page_number_pagination_plans_remaining_pages(response: dict, expected_pages: list[int]) -> None:
+    strategy = PageNumberPagination(page_size=10)
+
+    assert strategy.first_page_params() == {"page": 1, "per_page": 10}
+    assert strategy.remaining_page_params(response) == [{"page": page, "per_page": 10} for page in expected_pages]
+
+
+def test_page_number_pagination_needs_page_size_to_use_total() -> None:
+    strategy = PageNumberPagination(first_page=0)
+
+    assert strategy.first_page_params() == {"page": 0}
+    assert strategy.remaining_page_params({"total_pages": 2}) == [{"page": 1}]
+    with pytest.raises(ValueError, match="with a configured page size"):
+        strategy.remaining_page_params({"total": 25})
+
+
+def test_get_pagination_strategy_with_options() -> None:
+    strategy = get_pagination_strategy("OFFSET", limit=50)
+
+    assert isinstance(strategy, OffsetPagination)
+    assert strategy.limit == 50
+
+
+@pytest.mark.asyncio
+async def test_prefetch_in_order_limits_pages_in_flight() -> None:
+    in_flight, peak = 0, 0
+
+    async def fetch(page: int) -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later pages complete first, the results must still come back in page order.
+        await asyncio.sleep(0.001 * (10 - page))
+        in_flight -= 1
+        return page
+
+    results = [page async for page in prefetch_in_order(fetch, range(10), limit=3)]
+
+    assert results == list(range(10))
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_prefetch_in_order_cancels_pending_pages_when_stopped() -> None:
+    started: list[int] = []
+
+    async def fetch(page: int) -> int:
+        started.append(page)
+        if page > 0:
+            await asyncio.sleep(10)
+        return page
+
+    async with aclosing(prefetch_in_order(fetch, range(100), limit=4)) as pages:
+        async for page in pages:
+            assert page == 0
+            break
+
+    assert started == [0, 1, 2, 3]
+    assert all(task.done() for task in asyncio.all_tasks() if task is not asyncio.current_task())
+
+
+def test_cursor_pagination_sets_cursor_on_request_url() -> None:
+    strategy = CursorPagination(cursor_param="after")
+    http_response = httpx.Response(200, request=httpx.Request("GET", "https://api.example.com/users?after=a&q=1"))
+
+    assert strategy.get_next_page({"next_cursor": "b"}, http_response) == "https://api.example.com/users?after=b&q=1"
+    assert strategy.get_next_page({"next_cursor": ""}, http_response) is None
+    assert strategy.get_next_page([{"id": 1}], http_response) is None
+
+
+@pytest.mark.parametrize(
+    ("link", "expected"),
+    [
+        ('<https://api.example.com/users?page=2>; rel="next"', "https://api.example.com/users?page=2"),
+        ('</users?page=3>; rel="next", </users?page=1>; rel="prev"', "https://api.example.com/users?page=3"),
+        ('</users?page=1>; rel="prev"', None),
+        (None, None),
+    ],
+)
+def test_link_header_pagination(link: str | None, expected: str | None) -> None:
+    headers = {"Link": link} if link else {}
+    http_response = httpx.Response(
+        200, headers=headers, request=httpx.Request("GET", "https://api.example.com/users?page=2")
+    )
+
+    assert LinkHeaderPagination().get_next_page([], http_response) == expected
@@ -0,0 +1,104 @@
+# Standard Imports
+import ast
+
+# Third Party Imports
+import pytest
+
+# Local Imports
+from pipeline_flow.plugins.transform.native import (
+    NativeCast,
+    NativeDerive,
+    NativeFilter,
+    NativeProject,
+    NativeRename,
+    NativeSort,
+)
+from pipeline_flow.plugins.utils.pushdown import (
+    Comparison,
+    PushdownPlan,
+    as_comparison,
+    build_pushdown_plan,
+    conjuncts,
+)
+
+
+@pytest.mark.parametrize(
+    ("condition", "expected"),
+    [
+        ("status == 'paid'", Comparison("status", "==", "paid")),
+        ("10 < amount", Comparison("amount", ">", 10)),
+        ("amount >= -5", Comparison("amount", ">=", -5)),
+        ("country in ('PL', 'DE')", Comparison("country", "in", ["PL", "DE"])),
+        ("col('unit price') != 0", Comparison("unit price", "!=", 0)),
+        ("amount * 2 > 10", None),
+        ("amount > price", None),
+        ("0 < amount < 10", None),
+        ("isnull(email)", None),
+    ],
+)
+def test_as_comparison(condition: str, expected: Comparison | None) -> None:
+    assert as_comparison(ast.parse(condition, mode="eval").body) == expected
+
+
+def test_conjuncts() -> None:
+    terms = conjuncts(ast.parse("a == 1 and (b == 2 and c == 3) and (d == 4 or e == 5)", mode="eval").body)
+
+    assert [ast.unparse(term) for term in terms] == ["a == 1", "b == 2", "c == 3", "d == 4 or e == 5"]
+
+
+def test_build_pushdown_plan_without_pushable_steps() -> None:
+    plan = build_pushdown_plan([NativeSort("sort", by=["id"]), NativeFilter("filter", condition="id > 1")])
+
+    assert plan == PushdownPlan([], None)
+    assert not plan
+
+
+def test_build_pushdown_plan_collects_predicates_and_columns() -> None:
+    plan = build_pushdown_plan(
+        [
+            NativeFilter("filter", condition="status == 'paid' and amount * quantity > 100"),
+            NativeProject("project", columns=["id", "amount"]),
+            NativeFilter("filter_amount", condition="amount < 500"),
+        ]
+    )
+
+    assert plan.predicates == [Comparison("status", "==", "paid"), Comparison("amount", "<", 500)]
+    assert plan.columns == ["amount", "quantity", "status", "id"]
+
+
+def test_build_pushdown_plan_translates_renamed_columns() -> None:
+    plan = build_pushdown_plan(
+        [
+            NativeRename("rename", columns={"st": "status"}),
+            NativeFilter("filter", condition="status == 'paid'"),
+            NativeProject("project", columns=["status"]),
+        ]
+    )
+
+    assert plan == PushdownPlan([Comparison("st", "==", "paid")], ["st"])
+
+
+def test_build_pushdown_plan_skips_computed_columns() -> None:
+    plan = build_pushdown_plan(
+        [
+            NativeDerive("derive", column="total", expression="price * quantity"),
+            NativeCast("cast", columns={"price": "int"}),
+            NativeFilter("filter", condition="total > 10 and price > 1 and id > 0"),
+            NativeProject("project", columns=["id", "total", "price"]),
+        ]
+    )
+
+    assert plan == PushdownPlan([Comparison("id", ">", 0)], ["price", "quantity", "id"])
+
+
+def test_build_pushdown_plan_stops_at_non_row_wise_step() -> None:
+    plan = build_pushdown_plan(
+        [
+            NativeFilter("filter", condition="id > 0"),
+            NativeSort("sort", by=["id"]),
+            NativeFilter("filter_after_sort", condition="id < 10"),
+            NativeProject("project", columns=["id"]),
+        ]
+    )
+
+    assert plan == PushdownPlan([Comparison("id", ">", 0)], None)
@@ -0,0 +1,153 @@
+# Standard Imports
+import asyncio
+from email.utils import formatdate
+from unittest.mock import AsyncMock
+
+# Third Party Imports
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+# Local Imports
+from pipeline_flow.plugins.utils.rate_limiting import (
+    AdaptiveConcurrency,
+    HostLimiters,
+    TokenBucket,
+    parse_rate_limit_reset,
+    parse_retry_after,
+)
+
+
+@pytest.fixture
+def sleeps(mocker: MockerFixture) -> list[float]:
+    """Replaces the monotonic clock with a fake one advanced by `asyncio.sleep`, and records the sleeps."""
+    now = 1000.0
+    delays = []
+
+    async def sleep(delay: float) -> None:
+        nonlocal now
+        delays.append(delay)
+        now += delay
+
+    mocker.patch("pipeline_flow.plugins.utils.rate_limiting.monotonic", side_effect=lambda: now)
+    mocker.patch("asyncio.sleep", AsyncMock(side_effect=sleep))
+    return delays
+
+
+def test_parse_retry_after_seconds() -> None:
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after("-5") == 0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+
+def test_parse_retry_after_http_date(mocker: MockerFixture) -> None:
+    mocker.patch("pipeline_flow.plugins.utils.rate_limiting.time.time", return_value=1_700_000_000)
+
+    assert parse_retry_after(formatdate(1_700_000_030, usegmt=True)) == 30
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({"RateLimit-Remaining": "0", "RateLimit-Reset": "12"}, 12),
+        ({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1700000045"}, 45),
+        ({"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "12"}, None),
+        ({"X-RateLimit-Remaining": "0"}, None),
+        ({}, None),
+    ],
+)
+def test_parse_rate_limit_reset(headers: dict[str, str], expected: float | None, mocker: MockerFixture) -> None:
+    mocker.patch("pipeline_flow.plugins.utils.rate_limiting.time.time", return_value=1_700_000_000)
+
+    assert parse_rate_limit_reset(httpx.Headers(headers)) == expected
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_a_burst_then_spaces_requests(sleeps: list[float]) -> None:
+    bucket = TokenBucket(rate=2, burst=3)
+
+    for _ in range(5):
+        await bucket.acquire()
+
+    # The burst is free, then requests are spaced half a second apart.
+    assert sleeps == [0.5, 0.5]
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_pause_holds_back_requests(sleeps: list[float]) -> None:
+    bucket = TokenBucket(rate=None)
+    bucket.pause(30)
+
+    await bucket.acquire()
+    await bucket.acquire()
+
+    assert sleeps == [30]
+
+
+def test_token_bucket_rejects_invalid_rate() -> None:
+    with pytest.raises(ValueError, match="positive number"):
+        TokenBucket(rate=0)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_decreases_once_per_round_trip() -> None:
+    concurrency = AdaptiveConcurrency(max_limit=8)
+    generations = [await concurrency.acquire() for _ in range(8)]
+
+    for generation in generations:
+        concurrency.on_overload(generation)
+
+    assert concurrency.limit == 4
+
+    # Requests started after the decrease can decrease it again.
+    for _ in range(8):
+        concurrency.release()
+    concurrency.on_overload(await concurrency.acquire())
+
+    assert concurrency.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_grows_back_after_a_window_of_successes() -> None:
+    concurrency = AdaptiveConcurrency(max_limit=3)
+    concurrency.on_overload(concurrency.generation)
+    assert concurrency.limit == 1
+
+    for expected in (2, 3, 3):
+        for _ in range(concurrency.limit):  # type: ignore[reportArgumentType]
+            concurrency.on_success()
+        assert concurrency.limit == expected
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_waits_for_a_free_slot() -> None:
+    concurrency = AdaptiveConcurrency(max_limit=1)
+    await concurrency.acquire()
+
+    waiting = asyncio.create_task(concurrency.acquire())
+    await asyncio.sleep(0)
+    assert not waiting.done()
+
+    concurrency.release()
+    await waiting
+    assert concurrency.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_without_limit_halves_the_requests_in_flight() -> None:
+    concurrency = AdaptiveConcurrency(max_limit=None)
+    generations = [await concurrency.acquire() for _ in range(6)]
+
+    concurrency.on_overload(generations[0])
+
+    assert concurrency.limit == 3
+
+
+@pytest.mark.asyncio
+async def test_limiters_are_shared_by_host() -> None:
+    limiter = HostLimiters.get("https://api.example.com/v1", rate_limit=5)
+
+    assert HostLimiters.get("https://api.example.com/v2", rate_limit=5) is limiter
+    assert HostLimiters.get("https://other.example.com", rate_limit=5) is not limiter
+    assert limiter.bucket.rate == 5
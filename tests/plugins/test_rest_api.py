@@ -1,14 +1,20 @@
 # Standad Imports
+import asyncio
+import gzip
+import json
 
 # Third Party Imports
+import httpx
 import pytest
 from httpx import HTTPStatusError
-from pytest_httpx import HTTPXMock
+from pytest_httpx import HTTPXMock, IteratorStream
 from pytest_mock import MockerFixture
 
 # Local Imports
 from pipeline_flow.plugins import IPlugin
 from pipeline_flow.plugins.extract import RestApiAsyncExtractor
+from pipeline_flow.plugins.utils.pushdown import Comparison, PushdownPlan
+from pipeline_flow.plugins.utils.rate_limiting import HostLimiters
 
 
 @pytest.fixture
@@ -85,7 +91,7 @@ async def test_pagination_multiple_pages(api_client: IPlugin, httpx_mock: HTTPXM
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("status_code", [(403), (404), (429), (500), (502), (503), (504)])
+@pytest.mark.parametrize("status_code", [(408), (429), (500), (502), (503), (504)])
 async def test_api_failure(status_code: int, api_client: IPlugin, httpx_mock: HTTPXMock, mocker: MockerFixture) -> None:
     asyncio_sleep = mocker.patch("asyncio.sleep")
     httpx_mock.add_response(status_code=status_code, is_reusable=True)
@@ -94,3 +100,426 @@ async def test_api_failure(status_code: int, api_client: IPlugin, httpx_mock: HT
         await api_client()
 
     assert asyncio_sleep.call_count == 2, "The setting is set till 3 retries, so it should be 2"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error",
+    [httpx.ConnectTimeout("timed out"), httpx.ReadTimeout("timed out"), httpx.ConnectError("refused")],
+)
+async def test_transport_errors_are_retried(
+    error: httpx.TransportError, api_client: IPlugin, httpx_mock: HTTPXMock, mocker: MockerFixture
+) -> None:
+    asyncio_sleep = mocker.patch("asyncio.sleep")
+    httpx_mock.add_exception(error)
+    httpx_mock.add_response(json={"data": [{"id": 1}]})
+
+    assert await api_client() == [{"id": 1}]
+    assert asyncio_sleep.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_unsupported_protocol_is_not_retried(
+    api_client: IPlugin, httpx_mock: HTTPXMock, mocker: MockerFixture
+) -> None:
+    asyncio_sleep = mocker.patch("asyncio.sleep")
+    httpx_mock.add_exception(httpx.UnsupportedProtocol("unsupported"))
+
+    with pytest.raises(httpx.UnsupportedProtocol):
+        await api_client()
+
+    assert asyncio_sleep.call_count == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code", [(400), (401), (403), (404)])
+async def test_client_errors_are_not_retried(
+    status_code: int, api_client: IPlugin, httpx_mock: HTTPXMock, mocker: MockerFixture
+) -> None:
+    asyncio_sleep = mocker.patch("asyncio.sleep")
+    httpx_mock.add_response(status_code=status_code)
+
+    with pytest.raises(HTTPStatusError):
+        await api_client()
+
+    assert asyncio_sleep.call_count == 0
+    assert len(httpx_mock.get_requests()) == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_the_host(base_url: str, httpx_mock: HTTPXMock, mocker: MockerFixture) -> None:
+    asyncio_sleep = mocker.patch("asyncio.sleep")
+    api_client = RestApiAsyncExtractor("api", base_url, "users")
+    httpx_mock.add_response(status_code=429, headers={"Retry-After": "7"})
+    httpx_mock.add_response(json={"data": [{"id": 1}]})
+
+    assert await api_client() == [{"id": 1}]
+
+    # The limiter waits for `Retry-After`, instead of the random wait between attempts.
+    delays = [call.args[0] for call in asyncio_sleep.call_args_list]
+    assert delays[0] == 0
+    assert 6 < delays[1] <= 7
+
+
+@pytest.mark.asyncio
+async def test_overload_halves_the_concurrency_to_the_host(
+    base_url: str, httpx_mock: HTTPXMock, mocker: MockerFixture
+) -> None:
+    mocker.patch("asyncio.sleep")
+    api_client = RestApiAsyncExtractor(
+        "api", base_url, "users", pagination_type="page_number", max_connections=8, concurrency_limit=8
+    )
+    httpx_mock.add_response(url=f"{base_url}/users?page=1", json={"data": [{"id": 1}], "total_pages": 4})
+    httpx_mock.add_response(url=f"{base_url}/users?page=2", status_code=503)
+    for page in range(2, 5):
+        httpx_mock.add_response(url=f"{base_url}/users?page={page}", json={"data": [{"id": page}]})
+
+    assert await api_client() == [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}]
+
+    limiter = HostLimiters.get(base_url)
+    assert limiter.concurrency.limit == 4  # type: ignore[reportOptionalMemberAccess]
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_spaces_requests(base_url: str, httpx_mock: HTTPXMock, mocker: MockerFixture) -> None:
+    asyncio_sleep = mocker.patch("asyncio.sleep")
+    api_client = RestApiAsyncExtractor("api", base_url, "users", pagination_type="cursor", rate_limit=1)
+    httpx_mock.add_response(url=f"{base_url}/users", json={"data": [{"id": 1}], "next_cursor": "2"})
+    httpx_mock.add_response(url=f"{base_url}/users?cursor=2", json={"data": [{"id": 2}]})
+
+    assert await api_client() == [{"id": 1}, {"id": 2}]
+    assert asyncio_sleep.call_count == 1
+    assert 0 < asyncio_sleep.call_args.args[0] <= 1
+
+
+@pytest.mark.asyncio
+async def test_push_down_sends_query_params_on_first_request(base_url: str, httpx_mock: HTTPXMock) -> None:
+    api_client = RestApiAsyncExtractor(
+        "api", base_url, "users", pushdown_params={"status": "status", "role": "roles"}, fields_param="fields"
+    )
+    api_client.push_down(
+        PushdownPlan(
+            [
+                Comparison("status", "==", "active"),
+                Comparison("role", "in", ["admin", "owner"]),
+                Comparison("age", ">", 18),
+                Comparison("status", "!=", "deleted"),
+            ],
+            ["id", "status"],
+        )
+    )
+    httpx_mock.add_response(
+        url=f"{base_url}/users?status=active&roles=admin%2Cowner&fields=id%2Cstatus",
+        json={"data": [{"id": 1}], "pagination": {"has_more": True, "next_page": f"{base_url}/users?page=2"}},
+    )
+    httpx_mock.add_response(url=f"{base_url}/users?page=2", json={"data": [{"id": 2}]})
+
+    result = await api_client()
+
+    assert result == [{"id": 1}, {"id": 2}]
+
+
+def test_push_down_replaces_previous_plan(base_url: str) -> None:
+    api_client = RestApiAsyncExtractor("api", base_url, "users", pushdown_params={"active": "active"})
+
+    api_client.push_down(PushdownPlan([Comparison("active", "==", value=True)], None))
+    assert api_client.query_params == {"active": "true"}
+
+    api_client.push_down(PushdownPlan([], ["id"]))
+    assert api_client.query_params == {}
+
+
+def test_push_down_skips_membership_in_a_string(base_url: str) -> None:
+    api_client = RestApiAsyncExtractor("api", base_url, "users", pushdown_params={"role": "role"})
+
+    api_client.push_down(PushdownPlan([Comparison("role", "in", "admin")], None))
+
+    assert api_client.query_params == {}
+
+
+@pytest.mark.asyncio
+async def test_offset_pagination_fetches_pages_concurrently_in_order(base_url: str, httpx_mock: HTTPXMock) -> None:
+    api_client = RestApiAsyncExtractor(
+        "api", base_url, "users", pagination_type="offset", pagination_params={"limit": 2}, concurrency_limit=2
+    )
+    httpx_mock.add_response(url=f"{base_url}/users?offset=0&limit=2", json={"data": [{"id": 1}, {"id": 2}], "total": 7})
+    for offset in (2, 4, 6):
+        ids = range(offset + 1, min(offset + 2, 7) + 1)
+        httpx_mock.add_response(
+            url=f"{base_url}/users?offset={offset}&limit=2", json={"data": [{"id": i} for i in ids]}
+        )
+
+    result = await api_client()
+
+    assert result == [{"id": i} for i in range(1, 8)]
+
+
+@pytest.mark.asyncio
+async def test_page_number_pagination_keeps_pushed_down_params(base_url: str, httpx_mock: HTTPXMock) -> None:
+    api_client = RestApiAsyncExtractor(
+        "api",
+        base_url,
+        "users",
+        pagination_type="page_number",
+        pagination_params={"page_size": 1, "total_key": "meta.total"},
+        pushdown_params={"status": "status"},
+    )
+    api_client.push_down(PushdownPlan([Comparison("status", "==", "active")], None))
+    httpx_mock.add_response(
+        url=f"{base_url}/users?status=active&page=1&per_page=1", json={"data": [{"id": 1}], "meta": {"total": 2}}
+    )
+    httpx_mock.add_response(url=f"{base_url}/users?status=active&page=2&per_page=1", json={"data": [{"id": 2}]})
+
+    result = await api_client()
+
+    assert result == [{"id": 1}, {"id": 2}]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_pagination_failure_cancels_remaining_pages(
+    base_url: str, httpx_mock: HTTPXMock, mocker: MockerFixture
+) -> None:
+    mocker.patch("asyncio.sleep")
+    api_client = RestApiAsyncExtractor("api", base_url, "users", pagination_type="page_number")
+    httpx_mock.add_response(url=f"{base_url}/users?page=1", json={"data": [], "total_pages": 3}, is_reusable=True)
+    httpx_mock.add_response(url=f"{base_url}/users?page=2", status_code=500, is_reusable=True)
+    httpx_mock.add_response(url=f"{base_url}/users?page=3", json={"data": []}, is_optional=True, is_reusable=True)
+
+    with pytest.raises(HTTPStatusError):
+        await api_client()
+
+
+@pytest.mark.asyncio
+async def test_cursor_pagination(base_url: str, httpx_mock: HTTPXMock) -> None:
+    api_client = RestApiAsyncExtractor(
+        "api", base_url, "users", pagination_type="cursor", pagination_params={"cursor_key": "meta.next"}
+    )
+    httpx_mock.add_response(url=f"{base_url}/users", json={"data": [{"id": 1}], "meta": {"next": "abc"}})
+    httpx_mock.add_response(url=f"{base_url}/users?cursor=abc", json={"data": [{"id": 2}], "meta": {"next": None}})
+
+    result = await api_client()
+
+    assert result == [{"id": 1}, {"id": 2}]
+
+
+@pytest.mark.asyncio
+async def test_link_header_pagination(base_url: str, httpx_mock: HTTPXMock) -> None:
+    api_client = RestApiAsyncExtractor("api", base_url, "users", pagination_type="link_header")
+    httpx_mock.add_response(
+        url=f"{base_url}/users",
+        json=[{"id": 1}],
+        headers={"Link": '</v1/users?page=2>; rel="next", </v1/users?page=9>; rel="last"'},
+    )
+    httpx_mock.add_response(url=f"{base_url}/users?page=2", json=[{"id": 2}])
+
+    result = await api_client()
+
+    assert result == [{"id": 1}, {"id": 2}]
+
+
+@pytest.mark.asyncio
+async def test_stream_pages_yields_records_page_by_page(base_url: str, httpx_mock: HTTPXMock) -> None:
+    api_client = RestApiAsyncExtractor("api", base_url, "users", pagination_type="cursor", stream_pages=True)
+    httpx_mock.add_response(url=f"{base_url}/users", json={"data": [{"id": 1}, {"id": 2}], "next_cursor": "2"})
+    httpx_mock.add_response(url=f"{base_url}/users?cursor=2", json={"data": [{"id": 3}]})
+
+    pages = api_client()
+    first_page = await anext(pages)
+
+    assert first_page == [{"id": 1}, {"id": 2}]
+    assert len(httpx_mock.get_requests()) == 1, "The next page must only be requested once the first is consumed"
+    assert [page async for page in pages] == [[{"id": 3}]]
+
+
+@pytest.mark.asyncio
+async def test_stream_pages_with_concurrent_pagination(base_url: str, httpx_mock: HTTPXMock) -> None:
+    api_client = RestApiAsyncExtractor(
+        "api", base_url, "users", pagination_type="page_number", stream_pages=True, concurrency_limit=2
+    )
+    httpx_mock.add_response(url=f"{base_url}/users?page=1", json={"data": [{"id": 1}], "total_pages": 3})
+    httpx_mock.add_response(url=f"{base_url}/users?page=2", json={"data": [{"id": 2}]})
+    httpx_mock.add_response(url=f"{base_url}/users?page=3", json={"data": [{"id": 3}]})
+
+    assert [page async for page in api_client()] == [[{"id": 1}], [{"id": 2}], [{"id": 3}]]
+
+
+@pytest.mark.asyncio
+async def test_failed_page_is_retried_alone(base_url: str, httpx_mock: HTTPXMock, mocker: MockerFixture) -> None:
+    mocker.patch("asyncio.sleep")
+    api_client = RestApiAsyncExtractor("api", base_url, "users", pagination_type="cursor")
+    httpx_mock.add_response(url=f"{base_url}/users", json={"data": [{"id": 1}], "next_cursor": "2"})
+    httpx_mock.add_response(url=f"{base_url}/users?cursor=2", status_code=503)
+    httpx_mock.add_response(url=f"{base_url}/users?cursor=2", json={"data": [{"id": 2}]})
+
+    result = await api_client()
+
+    assert result == [{"id": 1}, {"id": 2}]
+    assert len(httpx_mock.get_requests()) == 3
+
+
+@pytest.mark.asyncio
+async def test_incremental_json_yields_records_while_downloading(base_url: str, httpx_mock: HTTPXMock) -> None:
+    api_client = RestApiAsyncExtractor("api", base_url, "users", stream_pages=True, incremental_json=True)
+    httpx_mock.add_response(
+        url=f"{base_url}/users",
+        stream=IteratorStream(
+            [
+                b'{"data": [{"id": 1}, {"id": 2}, {"i',
+                b'd": 3}], "pagination": {"has_more": true, "next_page": "' + f"{base_url}/users?page=2".encode(),
+                b'"}}',
+            ]
+        ),
+    )
+    httpx_mock.add_response(url=f"{base_url}/users?page=2", json={"data": [{"id": 4}]})
+
+    batches = [batch async for batch in api_client()]
+
+    assert batches == [[{"id": 1}, {"id": 2}], [{"id": 3}], [{"id": 4}]]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("pagination_type", ["page_number", "link_header"])
+async def test_incremental_json_matches_buffered_parsing(
+    base_url: str, httpx_mock: HTTPXMock, pagination_type: str
+) -> None:
+    first_page = {"data": [{"id": 1}, {"id": 2}], "total_pages": 2}
+    httpx_mock.add_response(
+        url=f"{base_url}/users?page=1" if pagination_type == "page_number" else f"{base_url}/users",
+        json=first_page,
+        headers={"Link": f'<{base_url}/users?page=2>; rel="next"'},
+        is_reusable=True,
+    )
+    httpx_mock.add_response(url=f"{base_url}/users?page=2", json=[{"id": 3}], is_reusable=True)
+
+    results = [
+        await RestApiAsyncExtractor("api", base_url, "users", pagination_type, incremental_json=incremental)()
+        for incremental in (False, True)
+    ]
+
+    assert results[0] == results[1] == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+@pytest.mark.asyncio
+async def test_compressed_responses_are_decoded(base_url: str, httpx_mock: HTTPXMock) -> None:
+    api_client = RestApiAsyncExtractor("api", base_url, "users", accept_encoding=["gzip"])
+    body = gzip.compress(json.dumps({"data": [{"id": 1}]}).encode())
+    httpx_mock.add_response(
+        stream=IteratorStream([body]), headers={"Content-Encoding": "gzip"}, match_headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert await api_client() == [{"id": 1}]
+
+
+def test_accept_encoding_defaults_to_every_decodable_coding(base_url: str) -> None:
+    api_client = RestApiAsyncExtractor("api", base_url, "users")
+
+    assert api_client.accept_encoding.endswith("gzip, deflate")
+
+
+def test_unsupported_accept_encoding_is_rejected(base_url: str) -> None:
+    with pytest.raises(ValueError, match="Unsupported content encodings \\['compress'\\]"):
+        RestApiAsyncExtractor("api", base_url, "users", accept_encoding=["gzip", "compress"])
+
+
+def test_http2_requires_h2(base_url: str, mocker: MockerFixture) -> None:
+    mocker.patch("importlib.util.find_spec", return_value=None)
+
+    with pytest.raises(ImportError, match="`h2`"):
+        RestApiAsyncExtractor("api", base_url, "users", http2=True)
+
+
+def test_http2_prior_knowledge_implies_http2(base_url: str, mocker: MockerFixture) -> None:
+    mocker.patch("importlib.util.find_spec", return_value=None)
+
+    with pytest.raises(ImportError, match="`h2`"):
+        RestApiAsyncExtractor("api", base_url, "users", http2_prior_knowledge=True)
+
+
+@pytest.mark.asyncio
+async def test_timeouts_are_set_per_request(base_url: str, httpx_mock: HTTPXMock) -> None:
+    api_client = RestApiAsyncExtractor("api", base_url, "users", timeout=30, connect_timeout=2)
+    httpx_mock.add_response(json={"data": []})
+
+    await api_client()
+
+    assert httpx_mock.get_request().extensions["timeout"] == {"connect": 2, "read": 30, "write": 30, "pool": 30}  # type: ignore[reportOptionalMemberAccess]
+
+
+@pytest.mark.asyncio
+async def test_endpoints_are_fanned_out_and_returned_in_endpoint_order(base_url: str, httpx_mock: HTTPXMock) -> None:
+    api_client = RestApiAsyncExtractor("api", base_url, ["customers", "orders"], pagination_type="cursor")
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        # The first endpoint answers last.
+        if request.url.path.endswith("customers"):
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"data": [{"customer": 1}]})
+        cursor = request.url.params.get("cursor")
+        return httpx.Response(200, json={"data": [{"order": cursor or "1"}], "next_cursor": None if cursor else "2"})
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+
+    assert await api_client() == [{"customer": 1}, {"order": "1"}, {"order": "2"}]
+
+
+@pytest.mark.asyncio
+async def test_endpoint_template_is_filled_with_endpoint_params(base_url: str, httpx_mock: HTTPXMock) -> None:
+    api_client = RestApiAsyncExtractor(
+        "api",
+        base_url,
+        "customers/{customer_id}/orders",
+        endpoint_params=[{"customer_id": customer_id} for customer_id in range(1, 4)],
+        stream_pages=True,
+    )
+    for customer_id in range(1, 4):
+        httpx_mock.add_response(
+            url=f"{base_url}/customers/{customer_id}/orders", json={"data": [{"customer_id": customer_id}]}
+        )
+
+    pages = [page async for page in api_client()]
+
+    assert sorted(record["customer_id"] for page in pages for record in page) == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_fan_out_shares_the_cap_on_requests_in_flight(base_url: str, httpx_mock: HTTPXMock) -> None:
+    in_flight = peak = 0
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"data": [{"path": request.url.path}], "total_pages": 3})
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+    api_client = RestApiAsyncExtractor(
+        "api", base_url, [f"items/{item}" for item in range(6)], pagination_type="page_number", concurrency_limit=3
+    )
+
+    records = await api_client()
+
+    assert len(records) == 18
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_failing_endpoint_fails_the_fan_out(base_url: str, httpx_mock: HTTPXMock) -> None:
+    api_client = RestApiAsyncExtractor("api", base_url, ["customers", "orders"])
+    httpx_mock.add_response(url=f"{base_url}/customers", json={"data": []}, is_optional=True)
+    httpx_mock.add_response(url=f"{base_url}/orders", status_code=404)
+
+    with pytest.raises(HTTPStatusError):
+        await api_client()
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "endpoint_params", "match"),
+    [("customers/{customer_id}", [{"id": 1}], "placeholder 'customer_id'"), ([], None, "at least one endpoint")],
+)
+def test_invalid_endpoints_are_rejected(
+    base_url: str, endpoint: str | list[str], endpoint_params: list[dict] | None, match: str
+) -> None:
+    with pytest.raises(ValueError, match=match):
+        RestApiAsyncExtractor("api", base_url, endpoint, endpoint_params=endpoint_params)
@@ -2,15 +2,29 @@
 from __future__ import annotations
 
 import random
+import sqlite3
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 # Third Party Imports
+import numpy as np
 import pandas as pd
 import pytest
+import pytest_asyncio
 from sqlalchemy import Column, MetaData, String, Table, text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 # Project Imports
+from pipeline_flow.core.connection_pools import ConnectionPools
 from pipeline_flow.plugins.load import AsyncSQLAlchemyQueryLoader
+from pipeline_flow.plugins.utils.batch_sizing import BatchSizer
+from pipeline_flow.plugins.utils.columnar import ColumnarTable
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from pytest_mock import MockerFixture
 
 
 def generate_pandas_data(total: int) -> pd.DataFrame:
@@ -64,6 +78,7 @@ async def test_async_sqlalchemy_loader(
 
     # Initialize the async SQLAlchemy loader
     load = AsyncSQLAlchemyQueryLoader(
+        plugin_id="sqlalchemy_loader",
         db_user=db_config["db_user"],
         db_password=db_config["db_password"],
         db_host=db_config["db_host"],
@@ -81,3 +96,298 @@ async def test_async_sqlalchemy_loader(
         result = await session.execute(text("SELECT COUNT(*) FROM t1"))
         row_count = result.scalar()
         assert row_count == 100000
+
+
+def sqlite_loader(database: Path, query: str, **options: int) -> AsyncSQLAlchemyQueryLoader:
+    return AsyncSQLAlchemyQueryLoader(
+        "sqlite_loader", "", "", "", "", str(database), query, driver="sqlite+aiosqlite", **options
+    )
+
+
+@pytest_asyncio.fixture
+async def sqlite_engine(tmp_path: Path) -> AsyncGenerator[AsyncEngine]:
+    engine = ConnectionPools.get_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql("CREATE TABLE t1 (id INTEGER, name TEXT, score REAL, created_at TIMESTAMP)")
+    yield engine
+    await ConnectionPools.dispose()
+
+
+async def fetch_rows(engine: AsyncEngine) -> list[tuple]:
+    async with engine.connect() as conn:
+        result = await conn.exec_driver_sql("SELECT id, name, score, created_at FROM t1 ORDER BY id")
+        return [tuple(row) for row in result]
+
+
+@pytest.mark.asyncio
+async def test_dataframe_columns_are_loaded_in_batches(tmp_path: Path, sqlite_engine: AsyncEngine) -> None:
+    load = sqlite_loader(
+        tmp_path / "test.db",
+        "INSERT INTO t1 (id, name, score, created_at) VALUES (:id, :name, :score, :created_at)",
+        batch_size=2,
+        concurrency_limit=1,
+    )
+    data = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "name": ["a", None, "c"],
+            "score": [0.5, 1.5, 2.5],
+            "created_at": pd.to_datetime(["2026-01-01 08:00:00", "2026-01-02 09:30:00.250000", None], format="ISO8601"),
+            "unused": [0, 0, 0],
+        }
+    )
+
+    await load(data)
+
+    assert await fetch_rows(sqlite_engine) == [
+        (1, "a", 0.5, "2026-01-01 08:00:00"),
+        (2, None, 1.5, "2026-01-02 09:30:00.250000"),
+        (3, "c", 2.5, None),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_columnar_tables_and_records_are_loaded(tmp_path: Path, sqlite_engine: AsyncEngine) -> None:
+    load = sqlite_loader(tmp_path / "test.db", "INSERT INTO t1 (id, name) VALUES (:id, :name)", concurrency_limit=1)
+
+    await load(ColumnarTable({"id": np.arange(1, 3), "name": np.array(["a", "b"], dtype=object)}))
+    await load([{"id": 3, "name": "c"}])
+
+    assert [row[:2] for row in await fetch_rows(sqlite_engine)] == [(1, "a"), (2, "b"), (3, "c")]
+
+
+@pytest.mark.asyncio
+async def test_repeated_parameters_are_passed_at_each_position(tmp_path: Path, sqlite_engine: AsyncEngine) -> None:
+    load = sqlite_loader(tmp_path / "test.db", "INSERT INTO t1 (id, name, score) VALUES (:id, :name, :id * 10)")
+
+    await load(pd.DataFrame({"id": [1], "name": ["a"]}))
+
+    assert (await fetch_rows(sqlite_engine))[0][:3] == (1, "a", 10)
+
+
+@pytest.mark.asyncio
+async def test_parameters_without_a_column_fail(tmp_path: Path, sqlite_engine: AsyncEngine) -> None:  # noqa: ARG001
+    load = sqlite_loader(tmp_path / "test.db", "INSERT INTO t1 (id, name) VALUES (:id, :name)")
+
+    with pytest.raises(ValueError, match=r"\['name'\] are missing from the data"):
+        await load(pd.DataFrame({"id": [1]}))
+
+
+def test_batch_parameters_use_the_parameter_style_of_the_driver() -> None:
+    load = sqlite_loader(Path("unused.db"), "INSERT INTO t1 (id, name) VALUES (:id, :name)")
+    table = ColumnarTable({"name": np.array(["a", "b", "c"]), "id": np.array([1, 2, 3])})
+
+    statement, names, positional = load.compile_query(postgresql.psycopg.dialect())  # type: ignore[reportArgumentType]
+
+    assert statement == "INSERT INTO t1 (id, name) VALUES (%(id)s, %(name)s)"
+    assert load.batch_parameters(names, [table[name] for name in names], positional) == [
+        {"id": 1, "name": "a"},
+        {"id": 2, "name": "b"},
+        {"id": 3, "name": "c"},
+    ]
+
+    statement, names, positional = load.compile_query(postgresql.asyncpg.dialect())  # type: ignore[reportArgumentType]
+
+    assert statement == "INSERT INTO t1 (id, name) VALUES ($1, $2)"
+    assert load.batch_parameters(names, [table[name] for name in names], positional) == [(1, "a"), (2, "b"), (3, "c")]
+
+
+@pytest.mark.asyncio
+async def test_insert_many_sends_multi_row_statements(
+    tmp_path: Path, sqlite_engine: AsyncEngine, mocker: MockerFixture
+) -> None:
+    load = AsyncSQLAlchemyQueryLoader(
+        "sqlite_loader",
+        "",
+        "",
+        "",
+        "",
+        str(tmp_path / "test.db"),
+        driver="sqlite+aiosqlite",
+        load_mode="insert_many",
+        table="t1",
+        columns=["id", "name"],
+        batch_size=5,
+        concurrency_limit=1,
+    )
+    mocker.patch.object(sqlite_engine.dialect, "insertmanyvalues_max_parameters", 4)
+    executed = mocker.spy(AsyncConnection, "exec_driver_sql")
+
+    await load(pd.DataFrame({"id": range(1, 8), "name": list("abcdefg"), "unused": 0}))
+
+    # Batches of 5 and 2 rows, split into statements of at most 4 parameters, i.e. 2 rows.
+    assert [call.args[2] for call in executed.call_args_list] == [
+        (1, "a", 2, "b"),
+        (3, "c", 4, "d"),
+        (5, "e"),
+        (6, "f", 7, "g"),
+    ]
+    assert [row[:2] for row in await fetch_rows(sqlite_engine)] == [(i, name) for i, name in enumerate("abcdefg", 1)]
+
+
+@pytest.mark.asyncio
+async def test_unsupported_load_modes_fall_back_to_executemany(
+    tmp_path: Path, sqlite_engine: AsyncEngine, caplog: pytest.LogCaptureFixture
+) -> None:
+    load = AsyncSQLAlchemyQueryLoader(
+        "sqlite_loader",
+        "",
+        "",
+        "",
+        "",
+        str(tmp_path / "test.db"),
+        driver="sqlite+aiosqlite",
+        load_mode="copy",
+        table="t1",
+    )
+
+    await load(ColumnarTable({"id": np.array([1, 2]), "score": np.array([0.5, 1.5])}))
+
+    assert "Load mode `copy` is not supported by `sqlite+aiosqlite`, falling back to executemany." in caplog.text
+    assert [(row[0], row[2]) for row in await fetch_rows(sqlite_engine)] == [(1, 0.5), (2, 1.5)]
+
+
+def test_bulk_load_modes_require_a_table() -> None:
+    with pytest.raises(ValueError, match="requires the `table`"):
+        AsyncSQLAlchemyQueryLoader("loader", "", "", "", "", "db", "INSERT INTO t1 (id) VALUES (:id)", load_mode="copy")
+    with pytest.raises(ValueError, match="Either a `query` or a `table`"):
+        AsyncSQLAlchemyQueryLoader("loader", "", "", "", "", "db")
+
+
+def test_load_data_infile_enables_local_files() -> None:
+    load = AsyncSQLAlchemyQueryLoader(
+        "loader", "user", "pw", "localhost", "3306", "db", load_mode="load_data_infile", table="t1"
+    )
+
+    assert load._build_connection_string() == "mysql+asyncmy://user:pw@localhost:3306/db?local_infile=1"
+
+
+@pytest.mark.asyncio
+async def test_batches_are_sized_by_bytes_and_split_when_too_large(
+    tmp_path: Path, sqlite_engine: AsyncEngine, mocker: MockerFixture
+) -> None:
+    # SQLite rejects statements with more parameters than its limit, i.e. batches of more rows than half of it.
+    rows = sqlite3.connect(":memory:").getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    load = AsyncSQLAlchemyQueryLoader(
+        "sqlite_loader",
+        "",
+        "",
+        "",
+        "",
+        str(tmp_path / "test.db"),
+        driver="sqlite+aiosqlite",
+        load_mode="insert_many",
+        table="t1",
+        # Rows of two 8 byte values and their overhead take 24 bytes, all rows fit in one batch.
+        batch_bytes=rows * 24,
+        concurrency_limit=1,
+    )
+    mocker.patch.object(sqlite_engine.dialect, "insertmanyvalues_max_parameters", 10**9)
+
+    await load(ColumnarTable({"id": np.arange(rows), "score": np.zeros(rows)}))
+
+    metrics = BatchSizer.metrics()["sqlite_loader"]
+    assert metrics["estimated_row_bytes"] == 24
+    assert (metrics["rows"], metrics["too_large"], metrics["batches"]) == (rows, 1, 2)
+    assert metrics["max_batch_bytes"] == rows * 12
+    async with sqlite_engine.connect() as conn:
+        assert (await conn.exec_driver_sql("SELECT COUNT(*) FROM t1")).scalar() == rows
+
+
+def staged_loader(database: Path, staged_load: str, **options: Any) -> AsyncSQLAlchemyQueryLoader:  # noqa: ANN401
+    return AsyncSQLAlchemyQueryLoader(
+        "sqlite_loader",
+        "",
+        "",
+        "",
+        "",
+        str(database),
+        driver="sqlite+aiosqlite",
+        table="t1",
+        staged_load=staged_load,
+        batch_size=2,
+        **options,
+    )
+
+
+async def fetch_tables(engine: AsyncEngine) -> list[str]:
+    async with engine.connect() as conn:
+        result = await conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name")
+        return [row[0] for row in result]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("load_mode", ["query", "insert_many"])
+async def test_staged_append_loads_batches_through_a_staging_table(
+    tmp_path: Path, sqlite_engine: AsyncEngine, mocker: MockerFixture, load_mode: str
+) -> None:
+    load = staged_loader(tmp_path / "test.db", "append", load_mode=load_mode, concurrency_limit=1)
+    load_into = mocker.spy(load, "_load_into")
+
+    await load(pd.DataFrame({"id": range(1, 6), "name": list("abcde")}))
+
+    assert load_into.call_args.args[0].startswith("t1_staging_")
+    assert [row[:2] for row in await fetch_rows(sqlite_engine)] == [(i, name) for i, name in enumerate("abcde", 1)]
+    assert await fetch_tables(sqlite_engine) == ["t1"]
+
+
+@pytest.mark.asyncio
+async def test_failed_staged_load_leaves_the_table_untouched(
+    tmp_path: Path, sqlite_engine: AsyncEngine, mocker: MockerFixture
+) -> None:
+    async with sqlite_engine.begin() as conn:
+        await conn.exec_driver_sql("INSERT INTO t1 (id, name) VALUES (1, 'old')")
+    load = staged_loader(tmp_path / "test.db", "replace", concurrency_limit=1)
+    execute = load.execute_batch_query
+    calls = 0
+
+    async def fail_third_batch(statement: str, batch: list[tuple]) -> None:
+        nonlocal calls
+        calls += 1
+        if calls == 3:
+            raise RuntimeError("Connection lost")
+        await execute(statement, batch)
+
+    mocker.patch.object(load, "execute_batch_query", side_effect=fail_third_batch)
+
+    with pytest.raises(ExceptionGroup):
+        await load(pd.DataFrame({"id": range(1, 8), "name": list("abcdefg")}))
+
+    assert [row[:2] for row in await fetch_rows(sqlite_engine)] == [(1, "old")]
+    assert await fetch_tables(sqlite_engine) == ["t1"]
+
+
+@pytest.mark.asyncio
+async def test_staged_replace_swaps_the_rows_of_the_table(tmp_path: Path, sqlite_engine: AsyncEngine) -> None:
+    async with sqlite_engine.begin() as conn:
+        await conn.exec_driver_sql("INSERT INTO t1 (id, name) VALUES (1, 'old'), (9, 'old')")
+    load = staged_loader(tmp_path / "test.db", "replace", concurrency_limit=2)
+
+    await load(pd.DataFrame({"id": range(1, 6), "name": list("abcde")}))
+
+    assert [row[:2] for row in await fetch_rows(sqlite_engine)] == [(i, name) for i, name in enumerate("abcde", 1)]
+
+
+@pytest.mark.asyncio
+async def test_staged_merge_updates_rows_with_the_same_keys(tmp_path: Path) -> None:
+    engine = ConnectionPools.get_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql("CREATE TABLE t1 (id INTEGER PRIMARY KEY, name TEXT, score REAL)")
+        await conn.exec_driver_sql("INSERT INTO t1 VALUES (1, 'old', 0.5), (9, 'old', 1.5)")
+    load = staged_loader(tmp_path / "test.db", "merge", merge_keys=["id"], columns=["id", "name"])
+
+    await load(pd.DataFrame({"id": [1, 2], "name": ["new", "new"], "score": [3.0, 3.0]}))
+
+    async with engine.connect() as conn:
+        rows = [tuple(row) for row in await conn.exec_driver_sql("SELECT * FROM t1 ORDER BY id")]
+    await ConnectionPools.dispose()
+    assert rows == [(1, "new", 0.5), (2, "new", None), (9, "old", 1.5)]
+
+
+def test_staged_loads_require_a_table_without_a_query() -> None:
+    with pytest.raises(ValueError, match="provide a `table` but no `query`"):
+        AsyncSQLAlchemyQueryLoader(
+            "loader", "", "", "", "", "db", "INSERT INTO t1 (id) VALUES (:id)", staged_load="append"
+        )
+    with pytest.raises(ValueError, match="requires the `merge_keys`"):
+        AsyncSQLAlchemyQueryLoader("loader", "", "", "", "", "db", table="t1", staged_load="merge")
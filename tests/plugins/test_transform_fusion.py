@@ -0,0 +1,134 @@
+# Standard Imports
+
+# Third Party Imports
+import numpy as np
+import pytest
+from pytest_mock import MockerFixture
+
+# Local Imports
+from pipeline_flow.core.executor import run_transformer
+from pipeline_flow.core.models.phases import TransformPhase
+from pipeline_flow.plugins.transform.native import (
+    NativeCast,
+    NativeDerive,
+    NativeFilter,
+    NativeProject,
+    NativeRename,
+    NativeSort,
+)
+from pipeline_flow.plugins.utils.columnar import ColumnarTable
+from pipeline_flow.plugins.utils.fusion import FusedTransform, FusionPlan, explain_transform_steps, fuse_transform_steps
+
+
+@pytest.fixture
+def table() -> ColumnarTable:
+    return ColumnarTable.from_pydict(
+        {
+            "id": [1, 2, 3, 4, 5],
+            "price": [10.0, 20.0, 30.0, 40.0, 50.0],
+            "quantity": [1, 0, 3, 2, 5],
+            "comment": ["a", "b", "c", "d", "e"],
+        }
+    )
+
+
+@pytest.fixture
+def steps() -> list:
+    return [
+        NativeFilter("in_stock", condition="quantity > 0"),
+        NativeDerive("total", column="total", expression="price * quantity"),
+        NativeFilter("large", condition="total >= 60"),
+        NativeCast("cast", columns={"total": "int"}),
+        NativeRename("rename", columns={"total": "revenue"}),
+        NativeProject("project", columns=["id", "revenue"]),
+    ]
+
+
+def test_fuse_transform_steps_groups_consecutive_fusible_steps() -> None:
+    first, second = NativeFilter("f1", condition="a > 0"), NativeProject("p1", columns=["a"])
+    sort = NativeSort("sort", by=["a"])
+    single = NativeFilter("f2", condition="a > 1")
+
+    fused = fuse_transform_steps([first, second, sort, single])
+
+    assert len(fused) == 3
+    assert isinstance(fused[0], FusedTransform)
+    assert fused[0].steps == [first, second]
+    assert fused[0].id == "fused[f1 -> p1]"
+    assert fused[1:] == [sort, single]
+
+
+def test_fused_pass_matches_step_by_step_execution(table: ColumnarTable, steps: list) -> None:
+    expected = table
+    for step in steps:
+        expected = step(expected)
+
+    result = FusedTransform(steps)(table)
+
+    assert result == expected
+    assert result.to_pydict() == {"id": [3, 4, 5], "revenue": [90, 80, 250]}
+
+
+def test_fusion_plan_does_not_copy_projected_columns(table: ColumnarTable) -> None:
+    plan = FusionPlan(table)
+    NativeProject("project", columns=["price"]).fuse_into(plan)
+    NativeDerive("double", column="double", expression="price * 2").fuse_into(plan)
+
+    result = plan.materialize()
+
+    assert result["price"] is table["price"]
+    assert result.column_names == ["price", "double"]
+
+
+def test_fusion_plan_only_gathers_referenced_columns(table: ColumnarTable) -> None:
+    plan = FusionPlan(table)
+    NativeFilter("filter", condition="quantity > 0").fuse_into(plan)
+    NativeFilter("filter", condition="price > 20").fuse_into(plan)
+
+    assert plan.rows.tolist() == [2, 3, 4]
+    assert isinstance(plan.sources["comment"], str)
+    assert plan.materialize()["comment"].tolist() == ["c", "d", "e"]
+
+
+def test_fused_pass_reports_missing_columns(table: ColumnarTable) -> None:
+    fused = FusedTransform([NativeFilter("filter", condition="id > 1"), NativeProject("project", columns=["missing"])])
+
+    with pytest.raises(KeyError, match="Columns do not exist: \\['missing'\\]"):
+        fused(table)
+
+
+def test_explain_transform_steps(steps: list) -> None:
+    explanation = explain_transform_steps([*steps[:2], NativeSort("sort", by=["id"]), steps[2]])
+
+    assert explanation == (
+        "Transform plan:\n"
+        "  1. fused pass over 2 steps:\n"
+        "       - in_stock (NativeFilter)\n"
+        "       - total (NativeDerive)\n"
+        "  2. sort (NativeSort)\n"
+        "  3. large (NativeFilter)"
+    )
+
+
+@pytest.mark.parametrize("fuse", [True, False])
+def test_run_transformer_with_and_without_fusion(
+    mocker: MockerFixture, table: ColumnarTable, steps: list, *, fuse: bool
+) -> None:
+    spy = mocker.spy(FusedTransform, "__call__")
+    transformations = TransformPhase.model_construct(steps=steps, fuse=fuse)
+
+    result = run_transformer(table, transformations)
+
+    assert result.to_pydict() == {"id": [3, 4, 5], "revenue": [90, 80, 250]}
+    assert spy.call_count == (1 if fuse else 0)
+
+
+def test_fused_pass_keeps_unfused_semantics_for_filtered_rows() -> None:
+    # Casting the filtered-out "n/a" value would fail, the fused pass must filter before casting.
+    table = ColumnarTable.from_pydict({"value": ["1", "n/a", "3"]})
+    fused = FusedTransform(
+        [NativeFilter("filter", condition="value != 'n/a'"), NativeCast("cast", columns={"value": "int"})]
+    )
+
+    assert fused(table)["value"].tolist() == [1, 3]
+    assert fused(table)["value"].dtype == np.int64
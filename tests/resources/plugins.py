@@ -1,6 +1,7 @@
 # Standard Imports
 import asyncio
 import time
+from collections.abc import AsyncGenerator
 from typing import Self
 
 # Third-party Imports
@@ -14,6 +15,7 @@ from pipeline_flow.plugins import (
     ITransformLoadPlugin,
     ITransformPlugin,
 )
+from pipeline_flow.plugins.utils.pushdown import PushdownPlan, SupportsPushdown
 
 
 class SimpleDummyPlugin(IPlugin, plugin_name="simple_dummy_plugin"):
@@ -31,6 +33,30 @@ class SimpleExtractorPlugin(IExtractPlugin, plugin_name="simple_extractor_plugin
         return "extracted_data"
 
 
+class SimpleStreamingExtractorPlugin(IExtractPlugin, plugin_name="simple_streaming_extractor_plugin"):
+    def __init__(self: Self, plugin_id: str, chunks: int = 3, delay: float = 0) -> None:
+        super().__init__(plugin_id)
+        self.chunks = chunks
+        self.delay = delay
+
+    async def __call__(self: Self) -> AsyncGenerator[str]:
+        for index in range(self.chunks):
+            await asyncio.sleep(self.delay)
+            yield f"chunk_{index}"
+
+
+class SimplePushdownExtractorPlugin(SupportsPushdown, IExtractPlugin, plugin_name="simple_pushdown_extractor_plugin"):
+    def __init__(self: Self, plugin_id: str) -> None:
+        super().__init__(plugin_id)
+        self.plan: PushdownPlan | None = None
+
+    def push_down(self: Self, plan: PushdownPlan) -> None:
+        self.plan = plan
+
+    async def __call__(self: Self) -> list[dict]:
+        return [{"id": 1, "status": "paid", "amount": 10}, {"id": 2, "status": "open", "amount": 20}]
+
+
 class SimpleMergePlugin(IMergeExtractPlugin, plugin_name="simple_merge_plugin"):
     def __call__(self: Self, extracted_data: dict) -> str:  # noqa: ARG002
         return "merged_data"
@@ -65,6 +91,16 @@ class SimpleTransformLoadPlugin(ITransformLoadPlugin, plugin_name="simple_transf
         time.sleep(self.delay)  # Stimulating a transformation at load phase where data is transformed on
 
 
+class SimpleAsyncTransformLoadPlugin(ITransformLoadPlugin, plugin_name="simple_async_transform_load_plugin"):
+    def __init__(self: Self, plugin_id: str, query: str, delay: float = 0) -> None:
+        super().__init__(plugin_id)
+        self.delay = delay
+        self.query = query
+
+    async def __call__(self: Self) -> None:
+        await asyncio.sleep(self.delay)  # Stimulating an async-native transformation at load phase
+
+
 class SimpleAsyncPrePlugin(IPreProcessPlugin, plugin_name="simple_async_pre_plugin"):
     def __init__(self: Self, plugin_id: str, delay: float = 0) -> None:
         super().__init__(plugin_id)
@@ -0,0 +1,155 @@
+# Standard Imports
+from collections.abc import Callable
+from pathlib import Path
+
+# Third Party Imports
+import pytest
+from pytest_mock import MockerFixture
+
+# Project Imports
+from pipeline_flow.common.exceptions import LoadError, TransformLoadError
+from pipeline_flow.common.utils import SingletonMeta
+from pipeline_flow.core.checkpoints import PIPELINE_COMPLETED, CheckpointStore
+from pipeline_flow.core.executor import ETLStrategy, ETLTStrategy
+from pipeline_flow.core.models.pipeline import Pipeline
+from pipeline_flow.core.orchestrator import PipelineOrchestrator
+from pipeline_flow.core.parsers.yaml_parser import YamlConfig
+from pipeline_flow.entrypoint import start_workflow
+from tests.resources.plugins import SimpleExtractorPlugin, SimpleLoaderPlugin, SimpleTransformLoadPlugin
+
+PIPELINES_CONFIG = {
+    "Job1": {
+        "type": "ETL",
+        "phases": {
+            "extract": {"steps": [{"plugin": "extractor", "params": {"table": "orders"}}]},
+            "transform": {"steps": [{"plugin": "transformer"}]},
+            "load": {"steps": [{"plugin": "loader"}]},
+        },
+    },
+    "Job2": {"type": "ELT", "needs": "Job1", "phases": {"extract": {"steps": [{"plugin": "extractor"}]}}},
+}
+
+
+def change_phase(phase: str, **params: str) -> dict:
+    config = {name: {**pipeline, "phases": dict(pipeline["phases"])} for name, pipeline in PIPELINES_CONFIG.items()}
+    config["Job1"]["phases"][phase] = {"steps": [{"plugin": phase, "params": params}]}
+    return config
+
+
+def test_changed_phases_invalidate_their_keys_and_the_keys_after_them() -> None:
+    keys = CheckpointStore("checkpoints", PIPELINES_CONFIG).phase_keys("Job1")
+    changed = CheckpointStore("checkpoints", change_phase("transform", column="total")).phase_keys("Job1")
+
+    assert changed["extract"] == keys["extract"]
+    assert [changed[phase] != keys[phase] for phase in ("transform", "load", PIPELINE_COMPLETED)] == [True] * 3
+
+
+def test_keys_cover_the_plugins_popped_when_they_are_instantiated() -> None:
+    config = change_phase("extract")
+    store = CheckpointStore("checkpoints", config)
+
+    config["Job1"]["phases"]["extract"]["steps"][0].pop("plugin")
+
+    assert store.phase_keys("Job1") == CheckpointStore("checkpoints", change_phase("extract")).phase_keys("Job1")
+    assert store.phase_keys("Job1")["extract"] != CheckpointStore("checkpoints", config).phase_keys("Job1")["extract"]
+
+
+def test_changed_pipelines_invalidate_the_keys_of_their_dependents() -> None:
+    keys = CheckpointStore("checkpoints", PIPELINES_CONFIG).phase_keys("Job2")
+    changed = CheckpointStore("checkpoints", change_phase("load", table="totals")).phase_keys("Job2")
+
+    assert changed["extract"] != keys["extract"]
+
+
+@pytest.mark.asyncio
+async def test_checkpoints_are_restored_only_when_resuming(tmp_path: Path) -> None:
+    await CheckpointStore(str(tmp_path), PIPELINES_CONFIG).save("Job1", "extract", {"id": [1, 2]})
+
+    assert await CheckpointStore(str(tmp_path), PIPELINES_CONFIG).restore("Job1", "extract") == (False, None)
+    assert await CheckpointStore(str(tmp_path), PIPELINES_CONFIG, resume=True).restore("Job1", "extract") == (
+        True,
+        {"id": [1, 2]},
+    )
+
+
+@pytest.mark.asyncio
+async def test_stale_or_corrupted_checkpoints_are_ignored(tmp_path: Path) -> None:
+    await CheckpointStore(str(tmp_path), PIPELINES_CONFIG).save("Job1", "extract", "extracted_data")
+    await CheckpointStore(str(tmp_path), PIPELINES_CONFIG).save("Job1", "transform", "transformed_data")
+
+    stale = CheckpointStore(str(tmp_path), change_phase("extract", table="refunds"), resume=True)
+    assert await stale.restore("Job1", "transform") == (False, None)
+
+    (tmp_path / "Job1" / "extract.pkl").write_bytes(b"corrupted")
+    assert await CheckpointStore(str(tmp_path), PIPELINES_CONFIG, resume=True).restore("Job1", "extract") == (
+        False,
+        None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_clear_deletes_every_checkpoint(tmp_path: Path) -> None:
+    store = CheckpointStore(str(tmp_path / "checkpoints"), PIPELINES_CONFIG, resume=True)
+    await store.complete("Job1")
+
+    await store.clear()
+
+    assert not (tmp_path / "checkpoints").exists()
+    assert await store.is_completed("Job1") is False
+
+
+@pytest.mark.asyncio
+async def test_resumed_pipeline_skips_the_phases_that_completed(
+    tmp_path: Path, etl_pipeline_factory: Callable[..., Pipeline], mocker: MockerFixture
+) -> None:
+    pipeline = etl_pipeline_factory(name="Job1")
+    config = {"Job1": PIPELINES_CONFIG["Job1"]}
+    load = mocker.patch.object(SimpleLoaderPlugin, "__call__", side_effect=[ConnectionError("Lost"), None])
+    extract = mocker.spy(SimpleExtractorPlugin, "__call__")
+
+    with pytest.raises(LoadError):
+        await ETLStrategy(CheckpointStore(str(tmp_path), config)).execute(pipeline)
+    assert await ETLStrategy(CheckpointStore(str(tmp_path), config, resume=True)).execute(pipeline) is True
+
+    assert extract.call_count == 1
+    assert load.call_args_list[1].kwargs == {"data": "transformed_extracted_data"}
+
+
+@pytest.mark.asyncio
+async def test_resumed_pipeline_does_not_reload_before_transforming_at_load(
+    tmp_path: Path, etlt_pipeline_factory: Callable[..., Pipeline], mocker: MockerFixture
+) -> None:
+    pipeline = etlt_pipeline_factory(name="Job1")
+    config = {"Job1": PIPELINES_CONFIG["Job1"]}
+    mocker.patch.object(SimpleTransformLoadPlugin, "__call__", side_effect=[ConnectionError("Lost"), None])
+    load = mocker.spy(SimpleLoaderPlugin, "__call__")
+
+    with pytest.raises(TransformLoadError):
+        await ETLTStrategy(CheckpointStore(str(tmp_path), config)).execute(pipeline)
+    assert await ETLTStrategy(CheckpointStore(str(tmp_path), config, resume=True)).execute(pipeline) is True
+
+    assert load.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_skips_pipelines_completed_in_the_resumed_run(
+    tmp_path: Path, etl_pipeline_factory: Callable[..., Pipeline], mocker: MockerFixture
+) -> None:
+    job1, job2 = etl_pipeline_factory(name="Job1"), etl_pipeline_factory(name="Job2", needs="Job1")
+    await CheckpointStore(str(tmp_path), PIPELINES_CONFIG).complete("Job1")
+    execute = mocker.patch.object(ETLStrategy, "execute", return_value=True)
+
+    orchestrator = PipelineOrchestrator(YamlConfig(), CheckpointStore(str(tmp_path), PIPELINES_CONFIG, resume=True))
+    executed = await orchestrator.execute_pipelines([job1, job2])
+
+    assert executed == {"Job1", "Job2"}
+    assert [call.args[0].name for call in execute.call_args_list] == ["Job2"]
+    assert "Job1" not in orchestrator.history.durations
+
+
+@pytest.mark.asyncio
+async def test_resuming_requires_a_checkpoint_dir(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(SingletonMeta, "_instances", {})
+
+    with pytest.raises(ValueError, match="requires a `checkpoint_dir`"):
+        await start_workflow(yaml_text="pipelines: {}", resume=True)
@@ -0,0 +1,81 @@
+# Standard Imports
+import json
+from pathlib import Path
+
+# Third Party Imports
+import pytest
+
+# Project Imports
+from pipeline_flow.core.duration_history import DEFAULT_DURATION, DurationHistory
+
+
+def test_record_first_observation() -> None:
+    history = DurationHistory()
+
+    history.record("Job1", 4.0)
+
+    assert history.durations == {"Job1": 4.0}
+
+
+def test_record_smooths_observations() -> None:
+    history = DurationHistory()
+
+    history.record("Job1", 4.0)
+    history.record("Job1", 2.0)
+
+    assert history.durations == {"Job1": 3.0}
+
+
+def test_estimate_without_history() -> None:
+    assert DurationHistory().estimate("Job1") == DEFAULT_DURATION
+
+
+def test_estimate_unknown_pipeline_uses_mean() -> None:
+    history = DurationHistory()
+    history.durations = {"Job1": 1.0, "Job2": 3.0}
+
+    assert history.estimate("Job1") == 1.0
+    assert history.estimate("Job3") == 2.0
+
+
+@pytest.mark.asyncio
+async def test_save_and_load_round_trip(tmp_path: Path) -> None:
+    file_path = str(tmp_path / "history" / "durations.json")
+    history = DurationHistory(file_path)
+    history.record("Job1", 1.5)
+
+    await history.save()
+
+    loaded_history = DurationHistory(file_path)
+    await loaded_history.load()
+    assert loaded_history.durations == {"Job1": 1.5}
+
+
+@pytest.mark.asyncio
+async def test_load_missing_file(tmp_path: Path) -> None:
+    history = DurationHistory(str(tmp_path / "missing.json"))
+
+    await history.load()
+
+    assert history.durations == {}
+
+
+@pytest.mark.asyncio
+async def test_load_corrupted_file(tmp_path: Path) -> None:
+    file_path = tmp_path / "durations.json"
+    file_path.write_text(json.dumps(["not", "a", "mapping"]))
+    history = DurationHistory(str(file_path))
+
+    await history.load()
+
+    assert history.durations == {}
+
+
+@pytest.mark.asyncio
+async def test_save_without_file_path_is_noop(tmp_path: Path) -> None:
+    history = DurationHistory()
+    history.record("Job1", 1.0)
+
+    await history.save()
+
+    assert list(tmp_path.iterdir()) == []
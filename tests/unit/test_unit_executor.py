@@ -1,4 +1,5 @@
 # Standard Imports
+import threading
 from collections.abc import Callable
 from unittest.mock import AsyncMock, Mock
 
@@ -7,6 +8,7 @@ import pytest
 from pytest_mock import MockerFixture
 
 # Project Imports
+from pipeline_flow.common.exceptions import ExtractError, TransformLoadError
 from pipeline_flow.core import executor
 from pipeline_flow.core.models import Pipeline
 from pipeline_flow.core.models.phases import (
@@ -15,10 +17,15 @@ from pipeline_flow.core.models.phases import (
     TransformLoadPhase,
     TransformPhase,
 )
+from pipeline_flow.plugins.transform.native import NativeFilter, NativeProject
+from pipeline_flow.plugins.utils.pushdown import Comparison, PushdownPlan
 from tests.resources.plugins import (
+    SimpleAsyncTransformLoadPlugin,
     SimpleExtractorPlugin,
     SimpleLoaderPlugin,
     SimpleMergePlugin,
+    SimplePushdownExtractorPlugin,
+    SimpleStreamingExtractorPlugin,
     SimpleTransformLoadPlugin,
     SimpleTransformPlugin,
 )
@@ -105,7 +112,8 @@ async def test_run_loader_multiple_without_delay(mocker: MockerFixture) -> None:
     assert spy.call_count == 2, "Both loaders should be called"
 
 
-def test_run_transformer_after_load(mocker: MockerFixture) -> None:
+@pytest.mark.asyncio
+async def test_run_transformer_after_load(mocker: MockerFixture) -> None:
     tf_load_plugin = SimpleTransformLoadPlugin(plugin_id="transform_loader_id", query="SELECT 1")
 
     spy = mocker.spy(SimpleTransformLoadPlugin, "__call__")
@@ -115,12 +123,13 @@ def test_run_transformer_after_load(mocker: MockerFixture) -> None:
             tf_load_plugin,
         ]
     )
-    executor.run_transformer_after_load(transformations)
+    await executor.run_transformer_after_load(transformations)
 
     spy.assert_called_once_with(tf_load_plugin)  # tf_load_plugin operates as "self" in the call
 
 
-def test_run_transformer_after_load_multiple(mocker: MockerFixture) -> None:
+@pytest.mark.asyncio
+async def test_run_transformer_after_load_multiple(mocker: MockerFixture) -> None:
     tf_load_plugin1 = SimpleTransformLoadPlugin(plugin_id="transform_loader_id", query="SELECT 1")
     tf_load_plugin2 = SimpleTransformLoadPlugin(plugin_id="transform_loader_id_2", query="SELECT 1")
 
@@ -132,7 +141,7 @@ def test_run_transformer_after_load_multiple(mocker: MockerFixture) -> None:
             tf_load_plugin2,
         ]
     )
-    executor.run_transformer_after_load(transformations)
+    await executor.run_transformer_after_load(transformations)
 
     assert spy.call_count == 2
 
@@ -158,7 +167,7 @@ async def test_execution_etl_pipeline(mocker: MockerFixture, etl_pipeline_factor
 async def test_execution_elt_pipeline(mocker: MockerFixture, elt_pipeline_factory: Callable[..., Pipeline]) -> None:
     extract_mock = mocker.patch.object(executor, "run_extractor", new_callable=AsyncMock, return_value="extracted_data")
     load_mock = mocker.patch.object(executor, "run_loader", new_callable=AsyncMock)
-    tf_load_mock = mocker.patch.object(executor, "run_transformer_after_load", new_callable=Mock)
+    tf_load_mock = mocker.patch.object(executor, "run_transformer_after_load", new_callable=AsyncMock)
 
     elt_pipeline = elt_pipeline_factory(name="Job1")
 
@@ -166,7 +175,7 @@ async def test_execution_elt_pipeline(mocker: MockerFixture, elt_pipeline_factor
 
     extract_mock.assert_called_once_with(elt_pipeline.extract)
     load_mock.assert_called_once_with("extracted_data", elt_pipeline.load)
-    tf_load_mock.assert_called_once_with(elt_pipeline.load_transform)
+    tf_load_mock.assert_awaited_once_with(elt_pipeline.load_transform)
 
     assert result is True
 
@@ -176,7 +185,7 @@ async def test_execution_etlt_strategy(mocker: MockerFixture, etlt_pipeline_fact
     extract_mock = mocker.patch.object(executor, "run_extractor", new_callable=AsyncMock, return_value="extracted_data")
     tf_mock = mocker.patch.object(executor, "run_transformer", new_callable=Mock, return_value="transformed_data")
     load_mock = mocker.patch.object(executor, "run_loader", new_callable=AsyncMock)
-    tf_load_mock = mocker.patch.object(executor, "run_transformer_after_load", new_callable=Mock)
+    tf_load_mock = mocker.patch.object(executor, "run_transformer_after_load", new_callable=AsyncMock)
 
     etlt_pipeline = etlt_pipeline_factory(name="Job1")
     result = await executor.ETLTStrategy().execute(etlt_pipeline)
@@ -184,6 +193,172 @@ async def test_execution_etlt_strategy(mocker: MockerFixture, etlt_pipeline_fact
     extract_mock.assert_called_once_with(etlt_pipeline.extract)
     tf_mock.assert_called_once_with("extracted_data", etlt_pipeline.transform)
     load_mock.assert_called_once_with("transformed_data", etlt_pipeline.load)
-    tf_load_mock.assert_called_once_with(etlt_pipeline.load_transform)
+    tf_load_mock.assert_awaited_once_with(etlt_pipeline.load_transform)
+
+    assert result is True
+
+
+@pytest.mark.asyncio
+async def test_plugin_stream_executor_with_async_generator() -> None:
+    plugin = SimpleStreamingExtractorPlugin(plugin_id="streaming_extractor_id", chunks=3)
+
+    chunks = [chunk async for chunk in executor.plugin_stream_executor(plugin)]
+
+    assert chunks == ["chunk_0", "chunk_1", "chunk_2"]
+
+
+@pytest.mark.asyncio
+async def test_plugin_stream_executor_with_regular_extractor() -> None:
+    plugin = SimpleExtractorPlugin(plugin_id="extractor_id")
+
+    chunks = [chunk async for chunk in executor.plugin_stream_executor(plugin)]
+
+    assert chunks == ["extracted_data"]
+
+
+@pytest.mark.asyncio
+async def test_run_streaming_etl(mocker: MockerFixture, etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    pipeline = etl_pipeline_factory(
+        name="Job1", extract=[SimpleStreamingExtractorPlugin(plugin_id="streaming_extractor_id", chunks=3)]
+    )
+    pipeline.streaming = True
+    spy = mocker.spy(SimpleLoaderPlugin, "__call__")
+
+    await executor.run_streaming_etl(pipeline)
+
+    assert [call.kwargs["data"] for call in spy.call_args_list] == [
+        "transformed_chunk_0",
+        "transformed_chunk_1",
+        "transformed_chunk_2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_streaming_etl_extract_error(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    failing_extractor = Mock(id="failing_extractor", side_effect=ValueError("boom"))
+    pipeline = etl_pipeline_factory(name="Job1", extract=[failing_extractor])
+    pipeline.streaming = True
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        await executor.run_streaming_etl(pipeline)
+
+    assert exc_info.group_contains(ExtractError)
+
+
+@pytest.mark.asyncio
+async def test_execution_streaming_etl_pipeline(
+    mocker: MockerFixture, etl_pipeline_factory: Callable[..., Pipeline]
+) -> None:
+    streaming_mock = mocker.patch.object(executor, "run_streaming_etl", new_callable=AsyncMock)
+    extract_mock = mocker.patch.object(executor, "run_extractor", new_callable=AsyncMock)
+
+    etl_pipeline = etl_pipeline_factory(name="Job1")
+    etl_pipeline.streaming = True
+
+    result = await executor.ETLStrategy().execute(etl_pipeline)
+
+    streaming_mock.assert_awaited_once_with(etl_pipeline)
+    extract_mock.assert_not_called()
+    assert result is True
+
+
+@pytest.mark.asyncio
+async def test_execution_streaming_etlt_pipeline(
+    mocker: MockerFixture, etlt_pipeline_factory: Callable[..., Pipeline]
+) -> None:
+    streaming_mock = mocker.patch.object(executor, "run_streaming_etl", new_callable=AsyncMock)
+    tf_load_mock = mocker.patch.object(executor, "run_transformer_after_load", new_callable=AsyncMock)
+
+    etlt_pipeline = etlt_pipeline_factory(name="Job1")
+    etlt_pipeline.streaming = True
+
+    result = await executor.ETLTStrategy().execute(etlt_pipeline)
 
+    streaming_mock.assert_awaited_once_with(etlt_pipeline)
+    tf_load_mock.assert_awaited_once_with(etlt_pipeline.load_transform)
     assert result is True
+
+
+@pytest.mark.asyncio
+async def test_plugin_off_loop_executor_runs_sync_plugin_in_thread() -> None:
+    thread_ids = []
+    plugin = Mock(id="transform_loader_id", side_effect=lambda: thread_ids.append(threading.get_ident()))
+
+    await executor.plugin_off_loop_executor(plugin)
+
+    plugin.assert_called_once_with()
+    assert thread_ids != [threading.get_ident()]
+
+
+@pytest.mark.asyncio
+async def test_plugin_off_loop_executor_awaits_async_plugin(mocker: MockerFixture) -> None:
+    plugin = SimpleAsyncTransformLoadPlugin(plugin_id="transform_loader_id", query="SELECT 1")
+    to_thread_spy = mocker.spy(executor.asyncio, "to_thread")
+    spy = mocker.spy(SimpleAsyncTransformLoadPlugin, "__call__")
+
+    await executor.plugin_off_loop_executor(plugin)
+
+    spy.assert_awaited_once_with(plugin)
+    to_thread_spy.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_transformer_after_load_with_needs() -> None:
+    execution_order = []
+
+    def step(step_id: str) -> Mock:
+        return Mock(id=step_id, side_effect=lambda: execution_order.append(step_id))
+
+    transformations = TransformLoadPhase.model_construct(
+        steps=[step("report"), step("staging"), step("cleanup")],
+        needs={"report": ["staging"], "cleanup": ["report"]},
+    )
+
+    await executor.run_transformer_after_load(transformations)
+
+    assert execution_order == ["staging", "report", "cleanup"]
+
+
+@pytest.mark.asyncio
+async def test_run_transformer_after_load_error() -> None:
+    failing_plugin = Mock(id="transform_loader_id", side_effect=ValueError("boom"))
+    transformations = TransformLoadPhase.model_construct(steps=[failing_plugin], needs={})
+
+    with pytest.raises(TransformLoadError, match="Transform Load Phase Error"):
+        await executor.run_transformer_after_load(transformations)
+
+
+def test_push_down_transformations() -> None:
+    extractor = SimplePushdownExtractorPlugin(plugin_id="extractor_id")
+    transformations = TransformPhase.model_construct(
+        steps=[
+            NativeFilter("filter", condition="status == 'paid' and amount * 2 > 10"),
+            NativeProject("project", columns=["id", "status"]),
+        ]
+    )
+
+    executor.push_down_transformations(ExtractPhase.model_construct(steps=[extractor]), transformations)
+
+    assert extractor.plan == PushdownPlan([Comparison("status", "==", "paid")], ["amount", "status", "id"])
+
+
+def test_push_down_transformations_unsupported_extractor(mocker: MockerFixture) -> None:
+    build_plan = mocker.spy(executor, "build_pushdown_plan")
+    extracts = ExtractPhase.model_construct(steps=[SimpleExtractorPlugin(plugin_id="extractor_id")])
+
+    executor.push_down_transformations(extracts, TransformPhase.model_construct(steps=[]))
+
+    build_plan.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execution_lazy_etl_pipeline(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    extractor = SimplePushdownExtractorPlugin(plugin_id="extractor_id")
+    pipeline = etl_pipeline_factory(
+        name="Job1", extract=[extractor], transform=[NativeFilter("filter", condition="status == 'paid'")]
+    )
+    pipeline.lazy = True
+
+    await executor.ETLStrategy().execute(pipeline)
+
+    assert extractor.plan == PushdownPlan([Comparison("status", "==", "paid")], None)
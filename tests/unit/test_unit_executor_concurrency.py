@@ -1,6 +1,7 @@
 # Standard Imports
 import asyncio
 import time
+from collections.abc import AsyncGenerator, Callable
 from unittest.mock import call
 
 # Third-party Imports
@@ -9,8 +10,11 @@ from pytest_mock import MockerFixture
 
 # Project Imports
 from pipeline_flow.core.executor import (
+    ELTStrategy,
+    ETLStrategy,
     run_extractor,
     run_loader,
+    run_streaming_etl,
     run_transformer,
     run_transformer_after_load,
     task_group_executor,
@@ -21,11 +25,13 @@ from pipeline_flow.core.models.phases import (
     TransformLoadPhase,
     TransformPhase,
 )
+from pipeline_flow.core.models.pipeline import Pipeline
 from tests.resources.plugins import (
     SimpleAsyncPrePlugin,
     SimpleExtractorPlugin,
     SimpleLoaderPlugin,
     SimpleMergePlugin,
+    SimpleStreamingExtractorPlugin,
     SimpleTransformLoadPlugin,
     SimpleTransformPlugin,
 )
@@ -203,7 +209,8 @@ def test_concurrency_with_multiple_transformations(mocker: MockerFixture) -> Non
     assert 0.4 > total >= 0.3, "Delay Should be 0.3 seconds for sychronous transformations."
 
 
-def test_concurrency_with_multiple_load_transformtions(mocker: MockerFixture) -> None:
+@pytest.mark.asyncio
+async def test_concurrency_with_multiple_load_transformtions(mocker: MockerFixture) -> None:
     tf = TransformLoadPhase.model_construct(
         steps=[
             SimpleTransformLoadPlugin(plugin_id="transform_loader_id", query="SELECT 1", delay=0.1),
@@ -214,7 +221,7 @@ def test_concurrency_with_multiple_load_transformtions(mocker: MockerFixture) ->
     spy = mocker.spy(SimpleTransformLoadPlugin, "__call__")
 
     start = time.time()
-    run_transformer_after_load(tf)
+    await run_transformer_after_load(tf)
     total = time.time() - start
 
     # Behaviour validation
@@ -222,3 +229,105 @@ def test_concurrency_with_multiple_load_transformtions(mocker: MockerFixture) ->
 
     # Concurrency Validation
     assert 0.4 > total >= 0.3, "Delay Should be 0.3 seconds for sychronous transformations."
+
+
+@pytest.mark.asyncio
+async def test_concurrency_with_streaming_etl(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    pipeline = etl_pipeline_factory(
+        name="Job1",
+        extract=[SimpleStreamingExtractorPlugin(plugin_id="streaming_extractor_id", chunks=4, delay=0.1)],
+        load=[SimpleLoaderPlugin(plugin_id="loader_id", delay=0.1)],
+    )
+    pipeline.streaming = True
+
+    start = asyncio.get_running_loop().time()
+    await run_streaming_etl(pipeline)
+    total = asyncio.get_running_loop().time() - start
+
+    # Concurrency validation
+    assert 0.6 > total >= 0.5, "Delay Should be (4 * 0.1) Extract + (0.1) Load of the last chunk"
+
+
+@pytest.mark.asyncio
+async def test_streaming_etl_backpressure(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    produced = []
+    consumed = []
+    max_in_flight = 0
+
+    class CountingExtractor(SimpleStreamingExtractorPlugin, plugin_name="counting_streaming_extractor"):
+        async def __call__(self) -> AsyncGenerator[str]:
+            async for chunk in super().__call__():
+                produced.append(chunk)
+                yield chunk
+
+    class SlowLoader(SimpleLoaderPlugin, plugin_name="slow_counting_loader"):
+        async def __call__(self, data: str) -> None:
+            nonlocal max_in_flight
+            max_in_flight = max(max_in_flight, len(produced) - len(consumed))
+            await asyncio.sleep(0.01)
+            consumed.append(data)
+
+    pipeline = etl_pipeline_factory(
+        name="Job1",
+        extract=[CountingExtractor(plugin_id="streaming_extractor_id", chunks=50)],
+        load=[SlowLoader(plugin_id="loader_id")],
+    )
+    pipeline.streaming = True
+    pipeline.stream_buffer_size = 2
+
+    await run_streaming_etl(pipeline)
+
+    # Behaviour validation
+    assert len(consumed) == 50
+
+    # Two bounded queues, plus one chunk held by each of the three stages.
+    assert max_in_flight <= 2 * pipeline.stream_buffer_size + 3
+
+
+@pytest.mark.asyncio
+async def test_concurrency_with_independent_load_transformations() -> None:
+    tf = TransformLoadPhase.model_construct(
+        steps=[
+            SimpleTransformLoadPlugin(plugin_id="transform_loader_id", query="SELECT 1", delay=0.2),
+            SimpleTransformLoadPlugin(plugin_id="transform_loader_id_2", query="SELECT 2", delay=0.2),
+            SimpleTransformLoadPlugin(plugin_id="transform_loader_id_3", query="SELECT 3", delay=0.1),
+        ],
+        needs={"transform_loader_id_3": ["transform_loader_id"]},
+    )
+
+    start = asyncio.get_running_loop().time()
+    await run_transformer_after_load(tf)
+    total = asyncio.get_running_loop().time() - start
+
+    # Concurrency Validation
+    assert 0.4 > total >= 0.3, "Delay Should be (0.2) for the independent steps + (0.1) for the dependent step."
+
+
+@pytest.mark.asyncio
+async def test_load_transformation_does_not_block_other_pipelines(
+    elt_pipeline_factory: Callable[..., Pipeline], etl_pipeline_factory: Callable[..., Pipeline]
+) -> None:
+    slow_pipeline = elt_pipeline_factory(
+        name="Slow",
+        transform_at_load=[SimpleTransformLoadPlugin(plugin_id="transform_loader_id", query="SELECT 1", delay=0.4)],
+    )
+    fast_pipeline = etl_pipeline_factory(
+        name="Fast",
+        extract=[SimpleExtractorPlugin(plugin_id="extractor_id", delay=0.1)],
+        load=[SimpleLoaderPlugin(plugin_id="loader_id", delay=0.1)],
+    )
+    loop = asyncio.get_running_loop()
+    completion_times = {}
+
+    async def execute(strategy: ELTStrategy | ETLStrategy, pipeline: Pipeline) -> None:
+        await strategy.execute(pipeline)
+        completion_times[pipeline.name] = loop.time() - start
+
+    start = loop.time()
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(execute(ELTStrategy(), slow_pipeline))
+        tg.create_task(execute(ETLStrategy(), fast_pipeline))
+
+    # The blocking transform at load runs in a worker thread, so the other pipeline keeps progressing.
+    assert completion_times["Fast"] < 0.3
+    assert completion_times["Slow"] >= 0.4
@@ -0,0 +1,115 @@
+# Standard Imports
+import asyncio
+from collections.abc import Callable, Generator
+
+# Third Party Imports
+import pytest
+from pytest_mock import MockerFixture
+
+# Project Imports
+from pipeline_flow.common.exceptions import ExtractError
+from pipeline_flow.core.executor import push_down_transformations, run_extractor
+from pipeline_flow.core.extract_cache import ExtractCache
+from pipeline_flow.core.fingerprint import plugin_fingerprint
+from pipeline_flow.core.models.pipeline import Pipeline
+from pipeline_flow.core.registry import PluginRegistry
+from tests.resources.plugins import SimpleExtractorPlugin, SimplePushdownExtractorPlugin
+
+
+@pytest.fixture(autouse=True)
+def extract_cache() -> Generator[None]:
+    yield
+    ExtractCache._expected.clear()
+    ExtractCache.reset_metrics()
+
+
+def identical_pipelines(factory: Callable[..., Pipeline], count: int = 2, **options: object) -> list[Pipeline]:
+    pipelines = [
+        factory(name=f"Job{index}", extract=[SimpleExtractorPlugin(plugin_id=f"extract_{index}", delay=0.01)])
+        for index in range(count)
+    ]
+    for pipeline in pipelines:
+        pipeline.extract.steps[0].fingerprint = plugin_fingerprint("simple_extractor_plugin", {"delay": 0.01})
+        for name, value in options.items():
+            setattr(pipeline, name, value)
+    return pipelines
+
+
+def test_fingerprints_ignore_the_order_of_the_parameters() -> None:
+    fingerprint = plugin_fingerprint("rest_api_extractor", {"url": "https://api", "params": {"a": 1, "b": 2}})
+
+    assert fingerprint == plugin_fingerprint("rest_api_extractor", {"params": {"b": 2, "a": 1}, "url": "https://api"})
+    assert fingerprint != plugin_fingerprint("rest_api_extractor", {"url": "https://api", "params": {"a": 1}})
+    assert fingerprint != plugin_fingerprint("sqlite_extractor", {"url": "https://api", "params": {"a": 1, "b": 2}})
+
+
+def test_instantiated_plugins_are_fingerprinted_unless_memoize_is_false() -> None:
+    PluginRegistry.register("simple_extractor_plugin", SimpleExtractorPlugin)
+
+    plugin = PluginRegistry.instantiate_plugin({"plugin": "simple_extractor_plugin", "params": {"delay": 0}})
+    opted_out = PluginRegistry.instantiate_plugin(
+        {"plugin": "simple_extractor_plugin", "params": {"delay": 0}, "memoize": False}
+    )
+
+    assert plugin.fingerprint == plugin_fingerprint("simple_extractor_plugin", {"delay": 0})
+    assert opted_out.fingerprint is None
+
+
+@pytest.mark.asyncio
+async def test_identical_extract_steps_run_once_and_share_the_result(
+    etl_pipeline_factory: Callable[..., Pipeline], mocker: MockerFixture
+) -> None:
+    pipelines = identical_pipelines(etl_pipeline_factory, count=3)
+    extract = mocker.spy(SimpleExtractorPlugin, "__call__")
+    ExtractCache.expect(pipelines)
+
+    results = await asyncio.gather(*(run_extractor(pipeline.extract) for pipeline in pipelines))
+
+    assert results == ["extracted_data"] * 3
+    assert extract.call_count == 1
+    assert ExtractCache.metrics() == {"extract_0": {"executions": 1, "shared": 2}}
+    # The result is released once every step expecting it consumed it.
+    assert not ExtractCache._flights.get(asyncio.get_running_loop())
+
+
+@pytest.mark.asyncio
+async def test_extract_steps_declared_once_are_not_memoised(
+    etl_pipeline_factory: Callable[..., Pipeline], mocker: MockerFixture
+) -> None:
+    pipelines = identical_pipelines(etl_pipeline_factory, count=2, streaming=True)
+    extract = mocker.spy(SimpleExtractorPlugin, "__call__")
+    ExtractCache.expect(pipelines[:1])
+
+    for pipeline in pipelines:
+        await run_extractor(pipeline.extract)
+
+    assert extract.call_count == 2
+    assert ExtractCache.metrics() == {}
+
+
+@pytest.mark.asyncio
+async def test_failed_extractions_are_shared_then_forgotten(
+    etl_pipeline_factory: Callable[..., Pipeline], mocker: MockerFixture
+) -> None:
+    pipelines = identical_pipelines(etl_pipeline_factory, count=3)
+    extract = mocker.patch.object(
+        SimpleExtractorPlugin, "__call__", side_effect=[ConnectionError("Lost"), "extracted_data"]
+    )
+    ExtractCache.expect(pipelines)
+
+    failures = await asyncio.gather(
+        *(run_extractor(pipeline.extract) for pipeline in pipelines[:2]), return_exceptions=True
+    )
+
+    assert [type(failure) for failure in failures] == [ExtractError, ExtractError]
+    assert await run_extractor(pipelines[2].extract) == "extracted_data"
+    assert extract.call_count == 2
+
+
+def test_pushed_down_extract_steps_are_not_shared(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    pipeline = etl_pipeline_factory(name="Job1", extract=[SimplePushdownExtractorPlugin(plugin_id="extract")])
+    pipeline.extract.steps[0].fingerprint = "fingerprint"
+
+    push_down_transformations(pipeline.extract, pipeline.transform)
+
+    assert pipeline.extract.steps[0].fingerprint is None
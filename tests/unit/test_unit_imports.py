@@ -0,0 +1,26 @@
+# Standard Imports
+import pkgutil
+import subprocess
+import sys
+
+# Third-party Imports
+import pytest
+
+# Project Imports
+import pipeline_flow.core
+
+CORE_MODULES = sorted(
+    module.name for module in pkgutil.walk_packages(pipeline_flow.core.__path__, "pipeline_flow.core.")
+)
+
+
+@pytest.mark.parametrize(
+    "module", [*CORE_MODULES, "pipeline_flow.common.utils", "pipeline_flow.plugins", "pipeline_flow.entrypoint"]
+)
+def test_module_imports_first_in_a_fresh_interpreter(module: str) -> None:
+    # Import cycles only show up when a module of the cycle is the first one imported.
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", f"import {module}"], capture_output=True, text=True, check=False
+    )
+
+    assert result.returncode == 0, result.stderr
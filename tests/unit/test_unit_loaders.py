@@ -36,4 +36,14 @@ def test_load_core_engine_transformations() -> None:
     assert len(PluginRegistry._registry) == 0
     plugin_loader.load_core_engine_transformations("native")
 
-    # assert len(PluginRegistry._registry) > 0 # noqa: ERA001 - Temporarily disabled as there are no native tf plugins
+    assert PluginRegistry.is_registered("native_filter")
+
+
+def test_load_already_imported_module_registers_missing_plugins() -> None:
+    plugin_loader.load_core_engine_transformations("native")
+    PluginRegistry._registry = {}
+
+    plugin_loader.load_core_engine_transformations("native")
+
+    assert PluginRegistry.is_registered("native_filter")
+    assert PluginRegistry.is_registered("native_window")
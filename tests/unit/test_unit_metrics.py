@@ -0,0 +1,166 @@
+# Standard Imports
+import asyncio
+import json
+from collections.abc import Callable, Generator
+from pathlib import Path
+
+# Third Party Imports
+import pytest
+from pytest_mock import MockerFixture
+
+# Project Imports
+from pipeline_flow.common.utils import SingletonMeta
+from pipeline_flow.core.executor import ETLStrategy
+from pipeline_flow.core.metrics import Histogram, Metric, Metrics, MetricsServer, count_rows, measure
+from pipeline_flow.core.models.pipeline import Pipeline
+from pipeline_flow.entrypoint import start_workflow
+from tests.resources.plugins import SimpleExtractorPlugin, SimpleStreamingExtractorPlugin
+
+WORKFLOW = """
+metrics_file: {metrics_file}
+plugins:
+  custom:
+    files:
+      - tests/resources/plugins.py
+pipelines:
+  Job1:
+    type: ETL
+    phases:
+      extract:
+        steps:
+          - id: extract
+            plugin: simple_extractor_plugin
+      transform:
+        steps:
+          - id: transform
+            plugin: simple_transform_plugin
+      load:
+        steps:
+          - id: load
+            plugin: simple_loader_plugin
+"""
+
+
+@pytest.fixture(autouse=True)
+def metrics() -> Generator[None]:
+    yield
+    Metrics.reset_metrics()
+
+
+def test_histograms_count_observations_into_cumulative_buckets() -> None:
+    histogram = Histogram((1.0, 10.0, 100.0))
+    for value in (0.5, 1.0, 5.0, 50.0, 500.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative_counts() == [(1.0, 2), (10.0, 3), (100.0, 4), (float("inf"), 5)]
+    assert {name: histogram.as_dict()[name] for name in ("count", "sum", "min", "max", "mean")} == {
+        "count": 5,
+        "sum": 556.5,
+        "min": 0.5,
+        "max": 500.0,
+        "mean": 111.3,
+    }
+    # The median falls in the (1, 10] bucket, and the quantiles of the last bucket never exceed the maximum.
+    assert 1.0 < histogram.quantile(0.5) <= 10.0  # type: ignore[reportOptionalOperand]
+    assert histogram.quantile(0.99) <= 500.0  # type: ignore[reportOptionalOperand]
+
+
+@pytest.mark.parametrize(
+    ("data", "rows"),
+    [([{"id": 1}, {"id": 2}], 2), ({"id": [1, 2, 3]}, None), ("extracted_data", None), (None, None)],
+)
+def test_rows_are_only_counted_for_tabular_data(data: object, rows: int | None) -> None:
+    assert count_rows(data) == rows
+
+
+@pytest.mark.asyncio
+async def test_observations_are_labelled_with_the_pipeline_phase_and_plugin_running(
+    etl_pipeline_factory: Callable[..., Pipeline],
+) -> None:
+    pipeline = etl_pipeline_factory(name="Job1")
+
+    with measure(Metric.PIPELINE_DURATION, pipeline="Job1"):
+        await ETLStrategy().execute(pipeline)
+
+    assert Metrics.histogram(Metric.PIPELINE_DURATION, pipeline="Job1").count == 1  # type: ignore[reportOptionalMemberAccess]
+    for phase in ("extract", "transform", "load"):
+        assert Metrics.histogram(Metric.PHASE_DURATION, pipeline="Job1", phase=phase).count == 1  # type: ignore[reportOptionalMemberAccess]
+    extract = Metrics.histogram(Metric.PLUGIN_DURATION, pipeline="Job1", phase="extract", plugin="mock_extractor")
+    assert extract.count == 1  # type: ignore[reportOptionalMemberAccess]
+    # The transform ran in a worker thread.
+    transform = Metrics.histogram(Metric.PLUGIN_DURATION, pipeline="Job1", phase="transform", plugin="mock_transformer")
+    assert transform.count == 1  # type: ignore[reportOptionalMemberAccess]
+
+
+@pytest.mark.asyncio
+async def test_streaming_pipelines_record_the_time_phases_wait_on_their_queues(
+    etl_pipeline_factory: Callable[..., Pipeline],
+) -> None:
+    pipeline = etl_pipeline_factory(name="Job1", extract=[SimpleStreamingExtractorPlugin(plugin_id="extract")])
+    pipeline.streaming = True
+
+    await ETLStrategy().execute(pipeline)
+
+    waits = {
+        (series["labels"]["queue"], series["labels"]["operation"]) for series in Metrics.metrics()["queue_wait_seconds"]
+    }
+    assert waits == {
+        ("extracted_chunks", "put"),
+        ("extracted_chunks", "get"),
+        ("transformed_chunks", "put"),
+        ("transformed_chunks", "get"),
+    }
+
+
+def test_prometheus_text_exports_histograms_counters_and_resources() -> None:
+    Metrics.observe(Metric.ROWS, 5, plugin='say "hi"')
+    Metrics.increment(Metric.RETRIES, plugin="api")
+    Metrics.increment(Metric.RETRIES, plugin="api")
+
+    text = Metrics.to_prometheus({"connection_pools": {"https://api": {"kind": "http", "peak_in_use": 3}}})
+
+    assert "# TYPE pipeline_flow_rows histogram" in text
+    assert 'pipeline_flow_rows_bucket{plugin="say \\"hi\\"",le="1.0"} 0' in text
+    assert 'pipeline_flow_rows_bucket{plugin="say \\"hi\\"",le="10.0"} 1' in text
+    assert 'pipeline_flow_rows_bucket{plugin="say \\"hi\\"",le="+Inf"} 1' in text
+    assert 'pipeline_flow_rows_count{plugin="say \\"hi\\""} 1' in text
+    assert '# TYPE pipeline_flow_retries_total counter\npipeline_flow_retries_total{plugin="api"} 2' in text
+    assert 'pipeline_flow_connection_pools_peak_in_use{name="https://api"} 3' in text
+    assert "pipeline_flow_connection_pools_kind" not in text
+
+
+@pytest.mark.asyncio
+async def test_metrics_server_serves_the_prometheus_text() -> None:
+    server = MetricsServer(lambda: "pipeline_flow_rows_count 1\n", port=0)
+    await server.start()
+    try:
+        reader, writer = await asyncio.open_connection(server.host, server.port)
+        writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        response = await reader.read()
+        writer.close()
+    finally:
+        await server.close()
+
+    assert response.startswith(b"HTTP/1.1 200 OK\r\n")
+    assert response.endswith(b"\r\n\r\npipeline_flow_rows_count 1\n")
+
+
+@pytest.mark.asyncio
+async def test_workflow_returns_its_summary_and_writes_its_metrics_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+) -> None:
+    monkeypatch.setattr(SingletonMeta, "_instances", {})
+    mocker.patch.object(SimpleExtractorPlugin, "__call__", return_value=[{"id": 1}, {"id": 2}])
+    metrics_file = tmp_path / "metrics" / "pipeline_flow.prom"
+
+    summary = await start_workflow(yaml_text=WORKFLOW.format(metrics_file=metrics_file), summary=True)
+
+    assert summary["pipelines"] == ["Job1"]  # type: ignore[reportIndexIssue]
+    assert json.loads(json.dumps(summary)) == summary
+    # The transformed data is a string, so only the extracted rows are counted.
+    [rows] = summary["metrics"]["rows"]  # type: ignore[reportIndexIssue]
+    assert rows["labels"] == {"phase": "extract", "pipeline": "Job1", "plugin": "extract"}
+    assert (rows["count"], rows["sum"]) == (1, 2)
+    assert 'pipeline_flow_pipeline_duration_seconds_count{pipeline="Job1"} 1' in metrics_file.read_text()
+    # The metrics are reset for the next workflow.
+    assert Metrics.metrics() == {}
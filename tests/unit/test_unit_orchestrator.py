@@ -20,65 +20,83 @@ def orchestrator() -> PipelineOrchestrator:
     return PipelineOrchestrator(config=config)
 
 
-def test_can_execute_no_depedency(
+def test_get_dependencies_no_depedency(
     orchestrator: PipelineOrchestrator, etl_pipeline_factory: Callable[..., Pipeline]
 ) -> None:
     job1 = etl_pipeline_factory(name="Job1")
-    executed_jobs = set()
 
-    result = orchestrator._can_execute(  # pylint: disable=protected-access
-        job1, executed_jobs
-    )
-    assert result is True
+    assert orchestrator._get_dependencies(job1) == []
 
 
-def test_can_execute_one_depedency(
+def test_get_dependencies_one_depedency(
     orchestrator: PipelineOrchestrator, etl_pipeline_factory: Callable[..., Pipeline]
 ) -> None:
-    job1 = etl_pipeline_factory(name="Job2", needs="Job1")
-    executed_jobs = {"Job1"}
+    job2 = etl_pipeline_factory(name="Job2", needs="Job1")
 
-    result = orchestrator._can_execute(  # pylint: disable=protected-access
-        job1, executed_jobs
-    )
-    assert result is True
+    assert orchestrator._get_dependencies(job2) == ["Job1"]
 
 
-def test_can_execute_multiple_depedencies(
+def test_get_dependencies_multiple_depedencies(
     orchestrator: PipelineOrchestrator, etl_pipeline_factory: Callable[..., Pipeline]
 ) -> None:
-    job1 = etl_pipeline_factory(name="Job3", needs=["Job1", "Job2"])
-    executed_jobs = {"Job1", "Job2"}
+    job3 = etl_pipeline_factory(name="Job3", needs=["Job1", "Job2", "Job1"])
 
-    result = orchestrator._can_execute(  # pylint: disable=protected-access
-        job1, executed_jobs
-    )
-    assert result is True
+    assert orchestrator._get_dependencies(job3) == ["Job1", "Job2"]
+
+
+def test_build_dependency_graph(
+    orchestrator: PipelineOrchestrator, etl_pipeline_factory: Callable[..., Pipeline]
+) -> None:
+    job1 = etl_pipeline_factory(name="Job1")
+    job2 = etl_pipeline_factory(name="Job2", needs="Job1")
+    job3 = etl_pipeline_factory(name="Job3", needs=["Job1", "Job2"])
+
+    orchestrator._build_dependency_graph([job1, job2, job3])
+
+    assert orchestrator._pending_dependencies == {"Job1": 0, "Job2": 1, "Job3": 2}
+    assert orchestrator._dependents == {"Job1": [job2, job3], "Job2": [job3], "Job3": []}
+
+
+def test_compute_critical_paths(
+    orchestrator: PipelineOrchestrator, etl_pipeline_factory: Callable[..., Pipeline]
+) -> None:
+    job1 = etl_pipeline_factory(name="Job1")
+    job2 = etl_pipeline_factory(name="Job2", needs="Job1")
+    job3 = etl_pipeline_factory(name="Job3", needs="Job1")
+    jobs = [job1, job2, job3]
+    orchestrator.history.durations = {"Job1": 1.0, "Job2": 5.0, "Job3": 2.0}
+
+    orchestrator._build_dependency_graph(jobs)
+    orchestrator._compute_critical_paths(orchestrator._topological_order(jobs))
+
+    assert orchestrator._critical_paths == {"Job1": 6.0, "Job2": 5.0, "Job3": 2.0}
 
 
-def test_can_execute_one_job_dependency_failure(
+def test_build_dependency_graph_unknown_dependency(
     orchestrator: PipelineOrchestrator, etl_pipeline_factory: Callable[..., Pipeline]
 ) -> None:
     job1 = etl_pipeline_factory(name="Job1", needs=["Job2"])
-    executed_jobs = {}
 
-    result = orchestrator._can_execute(  # pylint: disable=protected-access
-        job1,
-        executed_jobs,  # type: ignore[reportArgumentType]
-    )
-    assert result is False
+    with pytest.raises(ValueError, match="Pipeline `Job1` depends on undefined pipelines"):
+        orchestrator._build_dependency_graph([job1])
 
 
-def test_can_execute_multiple_job_dependencies_failure(
+@pytest.mark.asyncio
+async def test_release_dependents(
     orchestrator: PipelineOrchestrator, etl_pipeline_factory: Callable[..., Pipeline]
 ) -> None:
-    job1 = etl_pipeline_factory(name="Job3", needs=["Job1", "Job2"])
-    executed_jobs = {"Job1"}
+    job1 = etl_pipeline_factory(name="Job1")
+    job2 = etl_pipeline_factory(name="Job2")
+    job3 = etl_pipeline_factory(name="Job3", needs=["Job1", "Job2"])
+    orchestrator._build_dependency_graph([job1, job2, job3])
 
-    result = orchestrator._can_execute(  # pylint: disable=protected-access
-        job1, executed_jobs
-    )
-    assert result is False
+    orchestrator._release_dependents(job1)
+    assert orchestrator.pipeline_queue.qsize() == 0
+
+    orchestrator._release_dependents(job2)
+    assert orchestrator.pipeline_queue.qsize() == 1
+    _, queued_pipeline = await orchestrator.pipeline_queue.get()
+    assert queued_pipeline is job3
 
 
 @pytest.mark.asyncio
@@ -111,14 +129,12 @@ async def test_execute_pipeline_exception(
 
     etl_pipeline = etl_pipeline_factory(name="Job1")
 
-    await orchestrator.pipeline_queue_producer([etl_pipeline])
-
     # When
     with pytest.raises(ExtractError):
-        await orchestrator._execute_pipeline()
+        await orchestrator._execute_pipeline(etl_pipeline)
 
     # Then
-    assert orchestrator.pipeline_queue.qsize() == 0
+    assert etl_pipeline.is_executed is False
     execute_mock.assert_awaited_once_with(etl_pipeline)
 
 
@@ -131,13 +147,10 @@ async def test_etl_pipeline_execution(
 
     etl_pipeline = etl_pipeline_factory(name="Job1")
 
-    await orchestrator.pipeline_queue_producer([etl_pipeline])
-
     # When
-    await orchestrator._execute_pipeline()
+    await orchestrator._execute_pipeline(etl_pipeline)
 
     # THen
-    assert orchestrator.pipeline_queue.qsize() == 0
     assert execute_mock.await_count == 1
     assert etl_pipeline.is_executed is True
 
@@ -152,24 +165,129 @@ async def test_execute_pipelines_success(
     job2 = etl_pipeline_factory(name="Job2")
     job3 = etl_pipeline_factory(name="Job3", needs=["Job1", "Job2"])
     jobs = [job1, job2, job3]
+    execution_order = []
 
-    async def execute_pipeline_mock() -> None:
-        if jobs:
-            current_job = jobs.pop(0)  # Get the first job
-            await asyncio.sleep(0.1)  # Simulate asynchronous work
-            current_job.is_executed = True  # Modify the job
-            return
+    async def execute_pipeline_mock(pipeline: Pipeline) -> None:
+        await asyncio.sleep(0.1)  # Simulate asynchronous work
+        execution_order.append(pipeline.name)
+        pipeline.is_executed = True
 
     mocker.patch.object(PipelineOrchestrator, "_execute_pipeline", side_effect=execute_pipeline_mock)
 
     executed = await orchestrator.execute_pipelines(pipelines=jobs)
 
     assert executed == {"Job1", "Job2", "Job3"}
+    assert execution_order[-1] == "Job3"
     assert job1.is_executed is True
     assert job2.is_executed is True
     assert job3.is_executed is True
 
 
+@pytest.mark.asyncio
+async def test_execute_pipelines_dispatches_dependents_without_waiting_for_siblings(
+    mocker: MockerFixture, orchestrator: PipelineOrchestrator, etl_pipeline_factory: Callable[..., Pipeline]
+) -> None:
+    slow_job = etl_pipeline_factory(name="Slow")
+    fast_job = etl_pipeline_factory(name="Fast")
+    dependent_job = etl_pipeline_factory(name="Dependent", needs="Fast")
+    durations = {"Slow": 0.3, "Fast": 0.05, "Dependent": 0.05}
+    completion_order = []
+
+    async def execute_mock(pipeline: Pipeline) -> bool:
+        await asyncio.sleep(durations[pipeline.name])
+        completion_order.append(pipeline.name)
+        return True
+
+    mocker.patch.object(ETLStrategy, "execute", side_effect=execute_mock)
+
+    start = asyncio.get_running_loop().time()
+    await orchestrator.execute_pipelines(pipelines=[slow_job, fast_job, dependent_job])
+    total_execution_time = asyncio.get_running_loop().time() - start
+
+    # A wave-based scheduler would only start `Dependent` after `Slow` finished (0.35s).
+    assert completion_order == ["Fast", "Dependent", "Slow"]
+    assert 0.35 > total_execution_time >= 0.3
+
+
+@pytest.mark.asyncio
+async def test_execute_pipelines_prioritises_critical_path(
+    mocker: MockerFixture, orchestrator: PipelineOrchestrator, etl_pipeline_factory: Callable[..., Pipeline]
+) -> None:
+    jobs = [
+        etl_pipeline_factory(name="Short1"),
+        etl_pipeline_factory(name="Short2"),
+        etl_pipeline_factory(name="Head"),
+        etl_pipeline_factory(name="Tail", needs="Head"),
+    ]
+    orchestrator.history.durations = {"Short1": 0.1, "Short2": 0.1, "Head": 0.1, "Tail": 0.2}
+    start_order = []
+
+    async def execute_mock(pipeline: Pipeline) -> bool:
+        start_order.append(pipeline.name)
+        await asyncio.sleep(orchestrator.history.durations[pipeline.name])
+        return True
+
+    mocker.patch.object(ETLStrategy, "execute", side_effect=execute_mock)
+
+    await orchestrator.execute_pipelines(pipelines=jobs)
+
+    # `Head` unlocks the longest remaining path, so it starts before the YAML-ordered short pipelines.
+    assert start_order[0] == "Head"
+
+
+@pytest.mark.asyncio
+async def test_execute_pipelines_manual_priority_overrides_critical_path(
+    mocker: MockerFixture, orchestrator: PipelineOrchestrator, etl_pipeline_factory: Callable[..., Pipeline]
+) -> None:
+    jobs = [
+        etl_pipeline_factory(name="Job1"),
+        etl_pipeline_factory(name="Job2"),
+        etl_pipeline_factory(name="Job3"),
+    ]
+    jobs[2].priority = 10
+    orchestrator.history.durations = {"Job1": 5.0, "Job2": 1.0, "Job3": 0.1}
+    start_order = []
+
+    async def execute_mock(pipeline: Pipeline) -> bool:
+        start_order.append(pipeline.name)
+        await asyncio.sleep(0.01)
+        return True
+
+    mocker.patch.object(ETLStrategy, "execute", side_effect=execute_mock)
+
+    await orchestrator.execute_pipelines(pipelines=jobs)
+
+    assert start_order == ["Job3", "Job1", "Job2"]
+
+
+@pytest.mark.asyncio
+async def test_execute_pipelines_records_durations(
+    mocker: MockerFixture, orchestrator: PipelineOrchestrator, etl_pipeline_factory: Callable[..., Pipeline]
+) -> None:
+    save_mock = mocker.patch.object(orchestrator.history, "save", new_callable=mocker.AsyncMock)
+    mocker.patch.object(ETLStrategy, "execute", return_value=True)
+
+    await orchestrator.execute_pipelines(pipelines=[etl_pipeline_factory(name="Job1")])
+
+    assert "Job1" in orchestrator.history.durations
+    save_mock.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_execute_pipelines_skips_dependents_of_incomplete_pipeline(
+    mocker: MockerFixture, orchestrator: PipelineOrchestrator, etl_pipeline_factory: Callable[..., Pipeline]
+) -> None:
+    job1 = etl_pipeline_factory(name="Job1")
+    job2 = etl_pipeline_factory(name="Job2", needs="Job1")
+
+    mocker.patch.object(ETLStrategy, "execute", return_value=False)
+
+    executed = await orchestrator.execute_pipelines(pipelines=[job1, job2])
+
+    assert executed == set()
+    assert job2.is_executed is False
+
+
 @pytest.mark.asyncio
 async def test_execute_pipelines_circular_dependency(
     orchestrator: PipelineOrchestrator, etl_pipeline_factory: Callable[..., Pipeline]
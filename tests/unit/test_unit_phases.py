@@ -247,3 +247,50 @@ def test_create_phase_transform_at_load(mocker: MockerFixture) -> None:
     assert isinstance(tf_load, TransformLoadPhase)
     assert isinstance(tf_load.steps[0], SimpleTransformLoadPlugin)
     assert tf_load.steps[0].id == "mock_transform_loader_id"
+
+
+def test_create_phase_transform_at_load_with_needs(mocker: MockerFixture) -> None:
+    mocker.patch.object(PluginRegistry, "get", return_value=SimpleTransformLoadPlugin)
+
+    tf_load = TransformLoadPhase(
+        steps=[  # type: ignore[reportArgumentType] - The dict is parsed into Plugin object
+            {"id": "staging", "plugin": "mock_transformer_loader", "params": {"query": "SELECT 1"}},
+            {"id": "report", "plugin": "mock_transformer_loader", "params": {"query": "SELECT 2"}, "needs": "staging"},
+        ]
+    )
+
+    assert tf_load.needs == {"report": ["staging"]}
+
+
+def test_transform_at_load_rejects_unknown_needs(mocker: MockerFixture) -> None:
+    mocker.patch.object(PluginRegistry, "get", return_value=SimpleTransformLoadPlugin)
+
+    with pytest.raises(ValidationError, match="references unknown steps"):
+        TransformLoadPhase(
+            steps=[  # type: ignore[reportArgumentType] - The dict is parsed into Plugin object
+                {"id": "report", "plugin": "mock_transformer_loader", "params": {"query": "SELECT 1"}, "needs": ["x"]},
+            ]
+        )
+
+
+def test_transform_at_load_rejects_circular_needs(mocker: MockerFixture) -> None:
+    mocker.patch.object(PluginRegistry, "get", return_value=SimpleTransformLoadPlugin)
+
+    with pytest.raises(ValidationError, match="Circular `needs` detected"):
+        TransformLoadPhase(
+            steps=[  # type: ignore[reportArgumentType] - The dict is parsed into Plugin object
+                {"id": "a", "plugin": "mock_transformer_loader", "params": {"query": "SELECT 1"}, "needs": ["b"]},
+                {"id": "b", "plugin": "mock_transformer_loader", "params": {"query": "SELECT 2"}, "needs": ["a"]},
+            ]
+        )
+
+
+def test_transform_at_load_needs_requires_explicit_id(mocker: MockerFixture) -> None:
+    mocker.patch.object(PluginRegistry, "get", return_value=SimpleTransformLoadPlugin)
+
+    with pytest.raises(ValidationError, match="must have an explicit `id`"):
+        TransformLoadPhase(
+            steps=[  # type: ignore[reportArgumentType] - The dict is parsed into Plugin object
+                {"plugin": "mock_transformer_loader", "params": {"query": "SELECT 1"}, "needs": []},
+            ]
+        )
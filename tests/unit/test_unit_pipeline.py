@@ -2,9 +2,15 @@
 from collections.abc import Callable
 
 # Third-party Imports
+import pytest
+
 # Project Imports
-from pipeline_flow.core.models.pipeline import Pipeline, PipelineType
+from pipeline_flow.core.models.phases import ExtractPhase, LoadPhase, PipelinePhase
+from pipeline_flow.core.models.pipeline import Pipeline, PipelineType, TransformExecutorType
 from pipeline_flow.plugins import IExtractPlugin, ILoadPlugin, ITransformLoadPlugin, ITransformPlugin
+from pipeline_flow.plugins.extract import RestApiAsyncExtractor
+from pipeline_flow.plugins.load import AsyncSQLAlchemyQueryLoader
+from tests.resources.plugins import SimpleExtractorPlugin, SimpleMergePlugin, SimpleTransformPlugin
 
 
 def test_etl_pipeline_init_success(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
@@ -61,3 +67,100 @@ def test_etlt_pipeline_init_success(etlt_pipeline_factory: Callable[..., Pipelin
     assert isinstance(pipeline.load_transform.steps[0], ITransformLoadPlugin)
 
     assert not pipeline.is_executed
+
+
+def test_streaming_pipeline_init_success(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    pipeline = etl_pipeline_factory(name="ETL Pipeline")
+
+    streaming_pipeline = Pipeline(
+        name="Streaming Pipeline", type=PipelineType.ETL, phases=pipeline.phases, streaming=True, stream_buffer_size=8
+    )
+
+    assert streaming_pipeline.streaming is True
+    assert streaming_pipeline.stream_buffer_size == 8
+
+
+def test_streaming_pipeline_unsupported_type(elt_pipeline_factory: Callable[..., Pipeline]) -> None:
+    pipeline = elt_pipeline_factory(name="ELT Pipeline")
+
+    with pytest.raises(ValueError, match="Streaming is not supported for pipeline type 'ELT'"):
+        Pipeline(name="Streaming Pipeline", type=PipelineType.ELT, phases=pipeline.phases, streaming=True)
+
+
+def test_streaming_pipeline_multiple_extract_steps(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    pipeline = etl_pipeline_factory(name="ETL Pipeline")
+    phases = pipeline.phases | {
+        PipelinePhase.EXTRACT_PHASE: ExtractPhase.model_construct(
+            steps=[SimpleExtractorPlugin(plugin_id="extractor_id"), SimpleExtractorPlugin(plugin_id="extractor_id_2")],
+            merge=SimpleMergePlugin(plugin_id="merge_id"),
+        )
+    }
+
+    with pytest.raises(ValueError, match="Streaming pipelines support exactly one extract step"):
+        Pipeline(name="Streaming Pipeline", type=PipelineType.ETL, phases=phases, streaming=True)
+
+
+def test_stream_pages_requires_a_streaming_pipeline(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    pipeline = etl_pipeline_factory(name="ETL Pipeline")
+    extractor = RestApiAsyncExtractor("api", "https://api.example.com", "users", stream_pages=True)
+    phases = pipeline.phases | {PipelinePhase.EXTRACT_PHASE: ExtractPhase.model_construct(steps=[extractor])}
+
+    with pytest.raises(ValueError, match="`stream_pages` requires a streaming pipeline"):
+        Pipeline(name="Batch Pipeline", type=PipelineType.ETL, phases=phases)
+
+    assert Pipeline(name="Streaming Pipeline", type=PipelineType.ETL, phases=phases, streaming=True).streaming
+
+
+def test_streaming_pipeline_staged_load(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    pipeline = etl_pipeline_factory(name="ETL Pipeline")
+    loader = AsyncSQLAlchemyQueryLoader("loader", "", "", "", "", "db", table="orders", staged_load="replace")
+    phases = pipeline.phases | {PipelinePhase.LOAD_PHASE: LoadPhase.model_construct(steps=[loader])}
+
+    with pytest.raises(ValueError, match="Streaming pipelines do not support staged loads"):
+        Pipeline(name="Streaming Pipeline", type=PipelineType.ETL, phases=phases, streaming=True)
+
+    assert not Pipeline(name="Batch Pipeline", type=PipelineType.ETL, phases=phases).streaming
+
+
+def test_lazy_pipeline_unsupported_type(elt_pipeline_factory: Callable[..., Pipeline]) -> None:
+    pipeline = elt_pipeline_factory(name="ELT Pipeline")
+
+    with pytest.raises(ValueError, match="Lazy planning is not supported for pipeline type 'ELT'"):
+        Pipeline(name="Lazy Pipeline", type=PipelineType.ELT, phases=pipeline.phases, lazy=True)
+
+
+def test_lazy_pipeline_multiple_extract_steps(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    pipeline = etl_pipeline_factory(name="ETL Pipeline")
+    phases = pipeline.phases | {
+        PipelinePhase.EXTRACT_PHASE: ExtractPhase.model_construct(
+            steps=[SimpleExtractorPlugin(plugin_id="extractor_id"), SimpleExtractorPlugin(plugin_id="extractor_id_2")],
+            merge=SimpleMergePlugin(plugin_id="merge_id"),
+        )
+    }
+
+    with pytest.raises(ValueError, match="Lazy pipelines support exactly one extract step"):
+        Pipeline(name="Lazy Pipeline", type=PipelineType.ETL, phases=phases, lazy=True)
+
+
+def test_process_transform_executor_with_unpicklable_plugin(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    unpicklable_plugin = SimpleTransformPlugin(plugin_id="transformer_id")
+    unpicklable_plugin.callback = lambda data: data  # type: ignore[reportAttributeAccessIssue]
+    pipeline = etl_pipeline_factory(name="ETL Pipeline", transform=[unpicklable_plugin])
+
+    with pytest.raises(ValueError, match="Plugin `transformer_id` cannot be pickled"):
+        Pipeline(
+            name="Process Pipeline",
+            type=PipelineType.ETL,
+            phases=pipeline.phases,
+            transform_executor=TransformExecutorType.PROCESS,
+        )
+
+
+def test_process_transform_executor_with_picklable_plugin(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    pipeline = etl_pipeline_factory(name="ETL Pipeline")
+
+    process_pipeline = Pipeline(
+        name="Process Pipeline", type=PipelineType.ETL, phases=pipeline.phases, transform_executor="process"
+    )
+
+    assert process_pipeline.transform_executor == TransformExecutorType.PROCESS
@@ -0,0 +1,157 @@
+# Standard Imports
+import json
+from collections.abc import Callable, Generator
+from pathlib import Path
+
+# Third Party Imports
+import pytest
+from pytest_mock import MockerFixture
+
+# Project Imports
+from pipeline_flow.common.exceptions import LoadError
+from pipeline_flow.common.utils import SingletonMeta
+from pipeline_flow.core.executor import ETLStrategy
+from pipeline_flow.core.models.pipeline import Pipeline
+from pipeline_flow.core.orchestrator import PipelineOrchestrator
+from pipeline_flow.core.parsers.yaml_parser import YamlConfig
+from pipeline_flow.core.tracing import Span, SpanKind, Tracer, span
+from pipeline_flow.entrypoint import start_workflow
+from tests.resources.plugins import SimpleExtractorPlugin, SimpleLoaderPlugin
+
+WORKFLOW = """
+trace_file: {trace_file}
+trace_format: otlp
+plugins:
+  custom:
+    files:
+      - tests/resources/plugins.py
+pipelines:
+  Job1:
+    type: ETL
+    phases:
+      extract:
+        steps:
+          - id: extract_orders
+            plugin: simple_extractor_plugin
+      transform:
+        steps:
+          - id: transform_orders
+            plugin: simple_transform_plugin
+      load:
+        steps:
+          - id: load_orders
+            plugin: simple_loader_plugin
+"""
+
+
+@pytest.fixture(autouse=True)
+def tracer() -> Generator[None]:
+    Tracer.start()
+    yield
+    Tracer.reset()
+
+
+def spans_by_name() -> dict[str, Span]:
+    return {recorded.name: recorded for recorded in Tracer.spans()}
+
+
+@pytest.mark.asyncio
+async def test_pipelines_phases_and_plugins_are_traced_as_nested_spans(
+    etl_pipeline_factory: Callable[..., Pipeline], mocker: MockerFixture
+) -> None:
+    mocker.patch.object(SimpleExtractorPlugin, "__call__", return_value=[{"id": 1}, {"id": 2}])
+    orchestrator = PipelineOrchestrator(YamlConfig())
+
+    await orchestrator.execute_pipelines([etl_pipeline_factory(name="Job1"), etl_pipeline_factory(name="Job2")])
+
+    spans = [recorded for recorded in Tracer.spans() if recorded.attributes.get("pipeline.name") == "Job1"]
+    by_id = {recorded.span_id: recorded for recorded in spans}
+    parents = {recorded.name: by_id[recorded.parent_id].name for recorded in spans if recorded.parent_id in by_id}
+    assert parents == {
+        "extract": "Job1",
+        "mock_extractor": "extract",
+        "transform": "Job1",
+        "mock_transformer": "transform",
+        "load": "Job1",
+        "mock_loader": "load",
+    }
+    extractor = next(recorded for recorded in spans if recorded.name == "mock_extractor")
+    assert extractor.attributes == {
+        "plugin.id": "mock_extractor",
+        "plugin.name": "simple_extractor_plugin",
+        "pipeline.name": "Job1",
+        "rows": 2,
+    }
+    # Each pipeline worker is a lane of its own.
+    lanes = {recorded.lane[1] for recorded in Tracer.spans() if recorded.kind == SpanKind.PIPELINE}
+    assert lanes <= {"pipeline-worker-0", "pipeline-worker-1"}
+
+
+@pytest.mark.asyncio
+async def test_failed_spans_record_their_error(
+    etl_pipeline_factory: Callable[..., Pipeline], mocker: MockerFixture
+) -> None:
+    mocker.patch.object(SimpleLoaderPlugin, "__call__", side_effect=ConnectionError("Lost"))
+
+    with pytest.raises(LoadError):
+        await ETLStrategy().execute(etl_pipeline_factory(name="Job1"))
+
+    spans = spans_by_name()
+    assert spans["mock_loader"].error == "ConnectionError: Lost"
+    assert spans["load"].error is not None
+    assert spans["extract"].error is None
+
+
+def test_chrome_trace_has_a_named_lane_per_task_or_thread() -> None:
+    with span("workflow", SpanKind.WORKFLOW), span("Job1", SpanKind.PIPELINE, {"pipeline.name": "Job1"}):
+        pass
+
+    events = Tracer.to_chrome_trace()["traceEvents"]
+
+    assert [event["ph"] for event in events] == ["M", "X", "X"]
+    assert events[0]["args"] == {"name": "MainThread"}
+    assert [(event["name"], event["cat"], event["tid"]) for event in events[1:]] == [
+        ("workflow", "workflow", 1),
+        ("Job1", "pipeline", 1),
+    ]
+    assert events[1]["ts"] <= events[2]["ts"]
+    assert events[2]["ts"] + events[2]["dur"] <= events[1]["ts"] + events[1]["dur"]
+
+
+def test_spans_are_not_recorded_unless_the_tracer_started() -> None:
+    Tracer.reset()
+
+    with span("workflow", SpanKind.WORKFLOW):
+        pass
+
+    assert Tracer.spans() == []
+
+
+@pytest.mark.asyncio
+async def test_workflow_writes_its_spans_as_otlp_json(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(SingletonMeta, "_instances", {})
+    Tracer.reset()
+    trace_file = tmp_path / "trace.json"
+
+    await start_workflow(yaml_text=WORKFLOW.format(trace_file=trace_file))
+
+    [resource_spans] = json.loads(trace_file.read_text())["resourceSpans"]
+    spans = {otlp_span["name"]: otlp_span for otlp_span in resource_spans["scopeSpans"][0]["spans"]}
+    assert set(spans) == {
+        "workflow",
+        "Job1",
+        "extract",
+        "extract_orders",
+        "transform",
+        "transform_orders",
+        "load",
+        "load_orders",
+    }
+    assert spans["Job1"]["parentSpanId"] == spans["workflow"]["spanId"]
+    assert "parentSpanId" not in spans["workflow"]
+    assert len({otlp_span["traceId"] for otlp_span in spans.values()}) == 1
+    assert spans["extract_orders"]["parentSpanId"] == spans["extract"]["spanId"]
+    assert {"key": "pipeline.name", "value": {"stringValue": "Job1"}} in spans["extract_orders"]["attributes"]
+    assert spans["Job1"]["status"] == {"code": 1}
+    # The tracer stops recording once the workflow finished.
+    assert not Tracer.is_recording()
@@ -0,0 +1,67 @@
+# Standard Imports
+import os
+import threading
+from collections.abc import Generator
+
+# Third-party Imports
+import pytest
+
+# Project Imports
+from pipeline_flow.core import transform_executors
+from pipeline_flow.core.models.pipeline import TransformExecutorType
+
+
+def current_thread_and_process(data: str) -> tuple[str, int, int]:
+    return data, threading.get_ident(), os.getpid()
+
+
+@pytest.fixture(autouse=True)
+def process_pool_teardown() -> Generator[None]:
+    yield
+    transform_executors.shutdown_process_pool()
+
+
+@pytest.mark.asyncio
+async def test_run_in_inline_executor() -> None:
+    result = await transform_executors.run_in_transform_executor(
+        TransformExecutorType.INLINE, current_thread_and_process, "data"
+    )
+
+    assert result == ("data", threading.get_ident(), os.getpid())
+
+
+@pytest.mark.asyncio
+async def test_run_in_thread_executor() -> None:
+    data, thread_id, process_id = await transform_executors.run_in_transform_executor(
+        TransformExecutorType.THREAD, current_thread_and_process, data="data"
+    )
+
+    assert data == "data"
+    assert thread_id != threading.get_ident()
+    assert process_id == os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_run_in_process_executor() -> None:
+    data, _, process_id = await transform_executors.run_in_transform_executor(
+        TransformExecutorType.PROCESS, current_thread_and_process, "data"
+    )
+
+    assert data == "data"
+    assert process_id != os.getpid()
+
+
+def test_process_pool_is_shared() -> None:
+    pool = transform_executors.get_process_pool()
+
+    assert transform_executors.get_process_pool() is pool
+    assert pool._max_workers == os.cpu_count()
+
+
+def test_shutdown_process_pool() -> None:
+    pool = transform_executors.get_process_pool()
+
+    transform_executors.shutdown_process_pool()
+
+    assert transform_executors._process_pool is None
+    assert transform_executors.get_process_pool() is not pool